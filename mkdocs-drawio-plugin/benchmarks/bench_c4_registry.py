@@ -0,0 +1,111 @@
+"""
+Benchmark: whole-site build of C4 pages with and without the registry.
+
+Generates a docs directory with one context page declaring the shared
+people and systems, plus many component pages that each relate to a
+handful of them. Times what a build does with the C4 blocks: the
+plugin's on_files (which builds the registry when c4_registry is on)
+and converting every block the way the SuperFences formatter does.
+Three sites are built:
+
+- registry off, every page redeclares the shared elements it uses (the
+  only way to draw them without the registry);
+- registry on, the same pages (each block is parsed once, at
+  registration, and rendered from the registered IR);
+- registry on, pages that name the shared elements by alias only.
+
+Usage:
+    python -m benchmarks.bench_c4_registry   (from mkdocs-drawio-plugin/)
+"""
+
+from __future__ import annotations
+
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from mkdocs.structure.files import File, Files
+
+from mkdocs_drawio_plugin.c4registry import clear_c4_registry
+from mkdocs_drawio_plugin.converter import mermaid_to_figure
+from mkdocs_drawio_plugin.layout_cache import clear_layout_cache
+from mkdocs_drawio_plugin.plugin import DrawioPlugin
+
+
+def _declaration(i: int) -> str:
+    kind = "Person" if i % 5 == 0 else "System_Ext"
+    return f'  {kind}(shared{i}, "Shared element {i}", "Described once on the context page")'
+
+
+def context_source(shared: int) -> str:
+    return "\n".join(["C4Context"] + [_declaration(i) for i in range(shared)]) + "\n"
+
+
+def component_source(page: int, shared: int, refs: int, redeclare: bool, rng) -> str:
+    lines = ["C4Component"]
+    used = rng.sample(range(shared), refs)
+    if redeclare:
+        lines += [_declaration(i) for i in used]
+    for c in range(4):
+        lines.append(f'  Component(p{page}c{c}, "Component {page}.{c}", "Go", "Does work")')
+    for c, i in enumerate(used):
+        lines.append(f'  Rel(p{page}c{c % 4}, shared{i}, "Calls")')
+    return "\n".join(lines) + "\n"
+
+
+def _site(root: Path, blocks: list[str]) -> Files:
+    docs = root / "docs"
+    docs.mkdir()
+    names = []
+    for n, block in enumerate(blocks):
+        name = f"page{n}.md"
+        (docs / name).write_text(f"# Page {n}\n\n```mermaid\n{block}```\n", encoding="utf-8")
+        names.append(name)
+    return Files([
+        File(name, str(docs), str(root / "site"), use_directory_urls=False)
+        for name in names
+    ])
+
+
+def _build_once(blocks: list[str], registry: bool) -> float:
+    with tempfile.TemporaryDirectory() as tmp:
+        files = _site(Path(tmp), blocks)
+        plugin = DrawioPlugin()
+        plugin.load_config({"c4_registry": registry})
+        clear_c4_registry()
+        clear_layout_cache()
+        t0 = time.perf_counter()
+        plugin.on_files(files, config=None)
+        for block in blocks:
+            mermaid_to_figure(block.strip())
+        elapsed = time.perf_counter() - t0
+    clear_c4_registry()
+    return elapsed
+
+
+def _build(blocks: list[str], registry: bool, repeats: int = 3) -> float:
+    """Best seconds to run on_files and convert every block, as a build does."""
+    return min(_build_once(blocks, registry) for _ in range(repeats))
+
+
+def main() -> None:
+    print(
+        f"{'pages':>6} {'shared':>7} {'off, redeclared s':>18} "
+        f"{'on, redeclared s':>17} {'on, by alias s':>15}"
+    )
+    for pages, shared in ((50, 40), (200, 100)):
+        rng = random.Random(7)
+        redeclared = [component_source(p, shared, 6, True, rng) for p in range(pages)]
+        rng = random.Random(7)
+        by_alias = [component_source(p, shared, 6, False, rng) for p in range(pages)]
+        context = context_source(shared)
+
+        off_s = _build([context, *redeclared], registry=False)
+        on_s = _build([context, *redeclared], registry=True)
+        alias_s = _build([context, *by_alias], registry=True)
+        print(f"{pages:>6} {shared:>7} {off_s:>18.3f} {on_s:>17.3f} {alias_s:>15.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmark: importing SQL DDL dumps into an ERD.
+
+Generates pg_dump-style schemas (CREATE TABLE, ALTER TABLE ... FOREIGN
+KEY, CREATE INDEX, plus COPY data blocks so the dump reaches several
+MB) and reports the import time and throughput, the peak memory of the
+import, and the time to render the imported ERD to draw.io XML.
+
+Usage:
+    python -m benchmarks.bench_ddl_import   (from mkdocs-drawio-plugin/)
+"""
+
+from __future__ import annotations
+
+import random
+import time
+import tracemalloc
+
+from mkdocs_drawio_plugin.converter import ir_to_xml
+from mkdocs_drawio_plugin.importers import ddl
+
+
+def ddl_source(tables: int, columns: int = 20, rows: int = 0, seed: int = 1) -> str:
+    """A pg_dump-like schema with about two foreign keys per table."""
+    rng = random.Random(seed)
+    out = ["SET statement_timeout = 0;", "SET client_encoding = 'UTF8';"]
+    types = ("integer", "bigint", "text", "character varying(255)",
+             "numeric(12, 2)", "timestamp with time zone", "boolean")
+    for t in range(tables):
+        cols = ["    id bigint NOT NULL"]
+        cols += [f"    col_{c} {rng.choice(types)}" for c in range(columns)]
+        parents = rng.sample(range(t), min(t, 2))
+        cols += [f"    t{p}_id bigint NOT NULL" for p in parents]
+        out.append(f"CREATE TABLE public.t{t} (\n" + ",\n".join(cols) + "\n);")
+        out.append(f"COMMENT ON TABLE public.t{t} IS 'Table {t}; generated';")
+        if rows:
+            out.append(f"COPY public.t{t} (id, col_0) FROM stdin;")
+            out.extend(f"{r}\tvalue {r}; with a semicolon" for r in range(rows))
+            out.append("\\.")
+        out.append(
+            f"ALTER TABLE ONLY public.t{t}\n"
+            f"    ADD CONSTRAINT t{t}_pkey PRIMARY KEY (id);"
+        )
+        for p in parents:
+            out.append(
+                f"ALTER TABLE ONLY public.t{t}\n"
+                f"    ADD CONSTRAINT t{t}_t{p}_fk FOREIGN KEY (t{p}_id) "
+                f"REFERENCES public.t{p}(id);"
+            )
+        out.append(f"CREATE INDEX t{t}_col_0 ON public.t{t} USING btree (col_0);")
+    return "\n".join(out) + "\n"
+
+
+def main() -> None:
+    print(f"{'tables':>7} {'rows':>6} {'MiB':>6} {'import s':>9} {'MiB/s':>7} "
+          f"{'peak MiB':>9} {'xml s':>7}")
+    for tables, rows in ((400, 0), (400, 100), (2000, 50)):
+        text = ddl_source(tables, rows=rows)
+        size = len(text.encode()) / 2**20
+        lines = text.splitlines()
+        del text
+
+        t0 = time.perf_counter()
+        ir = ddl.parse(iter(lines))
+        import_s = time.perf_counter() - t0
+
+        # Separate run: tracemalloc slows the import down several times
+        tracemalloc.start()
+        ddl.parse(iter(lines))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        xml_s = float("nan")
+        if tables <= 400:
+            t0 = time.perf_counter()
+            ir_to_xml(ir)
+            xml_s = time.perf_counter() - t0
+
+        print(f"{tables:>7} {rows:>6} {size:>6.1f} {import_s:>9.2f} "
+              f"{size / import_s:>7.1f} {peak / 2**20:>9.1f} {xml_s:>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark: duplicate-edge merging on repetitive C4 diagrams.
+
+Builds C4 container diagrams where every service pair is connected by
+several `Rel` lines (one per API call) and compares edge cells and XML
+size with merging on and off.
+
+Usage:
+    python -m benchmarks.bench_edgemerge   (from mkdocs-drawio-plugin/)
+"""
+
+from __future__ import annotations
+
+import random
+import time
+
+from mkdocs_drawio_plugin.converter import mermaid_to_xml
+from mkdocs_drawio_plugin.layout_cache import clear_layout_cache
+from mkdocs_drawio_plugin.options import configure
+
+_EDGE = 'edge="1"'
+
+
+def c4_source(services: int, pairs: int, calls: int, seed: int = 5) -> str:
+    rng = random.Random(seed)
+    lines = ["C4Container"]
+    lines.extend(f'  Container(s{i}, "Service {i}", "Go")' for i in range(services))
+    for _ in range(pairs):
+        a, b = rng.sample(range(services), 2)
+        for c in range(calls):
+            lines.append(f'  Rel(s{a}, s{b}, "call {c}", "HTTPS")')
+    return "\n".join(lines)
+
+
+def _convert(text: str, merge: bool) -> tuple[str, float]:
+    configure(merge_edges={"c4-container": merge})
+    clear_layout_cache()
+    t0 = time.perf_counter()
+    xml = mermaid_to_xml(text)
+    return xml, time.perf_counter() - t0
+
+
+def main() -> None:
+    print(f"{'rels':>6} {'cells off':>10} {'cells on':>9} {'KB off':>8} {'KB on':>7} {'ms off':>8} {'ms on':>7}")
+    for services, pairs, calls in ((20, 40, 5), (60, 150, 8), (120, 400, 10)):
+        text = c4_source(services, pairs, calls)
+        off, t_off = _convert(text, merge=False)
+        on, t_on = _convert(text, merge=True)
+        print(
+            f"{pairs * calls:>6} {off.count(_EDGE):>10} {on.count(_EDGE):>9} "
+            f"{len(off) / 1024:>8.1f} {len(on) / 1024:>7.1f} "
+            f"{t_off * 1000:>8.1f} {t_on * 1000:>7.1f}"
+        )
+    configure()
+
+
+if __name__ == "__main__":
+    main()
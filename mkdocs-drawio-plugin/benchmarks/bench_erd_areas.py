@@ -0,0 +1,70 @@
+"""
+Benchmark: large ERDs as one page vs a page per subject area.
+
+Imports generated pg_dump-style schemas (see bench_ddl_import) and
+generates them as a single page and split into subject areas. Reports
+generation time, output size and the cell count of the largest page
+(what the viewer parses and renders at once), plus how many
+relationships cross area boundaries compared with cutting the entity
+list into chunks of the same size.
+
+Usage:
+    python -m benchmarks.bench_erd_areas   (from mkdocs-drawio-plugin/)
+"""
+
+from __future__ import annotations
+
+import time
+import xml.etree.ElementTree as ET
+
+from benchmarks.bench_ddl_import import ddl_source
+from mkdocs_drawio_plugin.areas import subject_areas
+from mkdocs_drawio_plugin.converter import ir_to_xml
+from mkdocs_drawio_plugin.importers import ddl
+from mkdocs_drawio_plugin.options import configure
+
+AREA_ENTITIES = 40
+
+
+def _largest_page(xml: str) -> int:
+    root = ET.fromstring(xml)
+    models = [root] if root.tag == "mxGraphModel" else [d[0] for d in root.iter("diagram")]
+    return max(sum(1 for _ in m.iter("mxCell")) for m in models)
+
+
+def _crossing(ir, areas: list[list[str]]) -> int:
+    owner = {nid: i for i, area in enumerate(areas) for nid in area}
+    return sum(1 for e in ir.edges if owner[e.source] != owner[e.target])
+
+
+def _generate(text: str, area_entities: int) -> tuple[float, str]:
+    configure(erd_area_entities=area_entities)
+    ir = ddl.parse(text)
+    t0 = time.perf_counter()
+    xml = ir_to_xml(ir)
+    return time.perf_counter() - t0, xml
+
+
+def main() -> None:
+    print(
+        f"{'tables':>7} {'mode':>7} {'gen s':>7} {'MiB':>6} {'max cells':>10} "
+        f"{'crossing':>9} {'chunked':>8}"
+    )
+    for tables in (200, 400, 1000):
+        text = ddl_source(tables, columns=8)
+        ir = ddl.parse(text)
+        areas = subject_areas(ir, AREA_ENTITIES)
+        ids = [n.id for n in ir.nodes]
+        chunks = [ids[i:i + AREA_ENTITIES] for i in range(0, len(ids), AREA_ENTITIES)]
+        for mode, limit in (("single", 0), ("areas", AREA_ENTITIES)):
+            seconds, xml = _generate(text, limit)
+            crossing = f"{_crossing(ir, areas):>9} {_crossing(ir, chunks):>8}" if limit else ""
+            print(
+                f"{tables:>7} {mode:>7} {seconds:>7.2f} {len(xml) / 2**20:>6.1f} "
+                f"{_largest_page(xml):>10} {crossing}"
+            )
+    configure()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Benchmark: ERD cell count and size, field cells vs HTML-table entities.
+
+Generates schemas with ~20 columns per table and compares the two
+erd_render modes: mxCell count, XML size and conversion time.
+
+Usage:
+    python -m benchmarks.bench_erd_table   (from mkdocs-drawio-plugin/)
+"""
+
+from __future__ import annotations
+
+import time
+
+from mkdocs_drawio_plugin.converter import mermaid_to_xml
+from mkdocs_drawio_plugin.layout_cache import clear_layout_cache
+from mkdocs_drawio_plugin.options import configure
+
+
+def schema_source(tables: int, columns: int = 20) -> str:
+    lines = ["erDiagram"]
+    for t in range(tables):
+        lines.append(f"  T{t} {{")
+        lines.append("    int id PK")
+        if t:
+            lines.append(f"    int t{t - 1}_id FK")
+        lines.extend(f"    string col{c}" for c in range(columns - 2))
+        lines.append("  }")
+    lines.extend(f"  T{t - 1} ||--o{{ T{t} : has" for t in range(1, tables))
+    return "\n".join(lines)
+
+
+def _convert(text: str, mode: str) -> tuple[str, float]:
+    configure(erd_render=mode)
+    clear_layout_cache()
+    t0 = time.perf_counter()
+    xml = mermaid_to_xml(text)
+    return xml, time.perf_counter() - t0
+
+
+def main() -> None:
+    print(f"{'tables':>6} {'mode':>6} {'cells':>7} {'KB':>8} {'ms':>8}")
+    for tables in (20, 100, 200):
+        text = schema_source(tables)
+        for mode in ("cells", "table"):
+            xml, elapsed = _convert(text, mode)
+            print(
+                f"{tables:>6} {mode:>6} {xml.count('<mxCell'):>7} "
+                f"{len(xml) / 1024:>8.1f} {elapsed * 1000:>8.1f}"
+            )
+    configure()
+
+
+if __name__ == "__main__":
+    main()
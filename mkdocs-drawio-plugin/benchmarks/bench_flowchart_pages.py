@@ -0,0 +1,66 @@
+"""
+Benchmark: single-page vs multi-page output for large flowcharts.
+
+Generates flowcharts made of independent top-level subgraphs (chains
+with a few cross-links) and compares one <mxGraphModel> against the
+overview + page-per-subgraph <mxfile>: conversion time, total size, and
+the cells on the first page shown (what the viewer parses on load).
+
+Usage:
+    python -m benchmarks.bench_flowchart_pages   (from mkdocs-drawio-plugin/)
+"""
+
+from __future__ import annotations
+
+import random
+import time
+import xml.etree.ElementTree as ET
+
+from mkdocs_drawio_plugin.converter import mermaid_to_xml
+from mkdocs_drawio_plugin.layout_cache import clear_layout_cache
+from mkdocs_drawio_plugin.options import configure
+
+
+def flowchart_source(subgraphs: int, per_group: int, cross: int, seed: int = 3) -> str:
+    rng = random.Random(seed)
+    lines = ["graph TD"]
+    for g in range(subgraphs):
+        lines.append(f"  subgraph g{g}")
+        lines.extend(f"    g{g}n{i}[Step {i}] --> g{g}n{i + 1}[Step {i + 1}]" for i in range(per_group - 1))
+        lines.append("  end")
+    for _ in range(cross):
+        a, b = rng.sample(range(subgraphs), 2)
+        lines.append(f"  g{a}n{rng.randrange(per_group)} --> g{b}n{rng.randrange(per_group)}")
+    return "\n".join(lines)
+
+
+def _first_page_cells(xml: str) -> int:
+    root = ET.fromstring(xml)
+    model = next(root.iter("mxGraphModel"))
+    return sum(1 for e in model.iter() if e.get("id"))
+
+
+def _convert(text: str, threshold: int) -> tuple[str, float]:
+    configure(flowchart_page_nodes=threshold)
+    clear_layout_cache()
+    t0 = time.perf_counter()
+    xml = mermaid_to_xml(text)
+    return xml, time.perf_counter() - t0
+
+
+def main() -> None:
+    print(f"{'nodes':>6} {'mode':>7} {'pages':>6} {'1st page cells':>15} {'KB':>8} {'ms':>8}")
+    for subgraphs, per_group in ((5, 40), (10, 100), (20, 150)):
+        text = flowchart_source(subgraphs, per_group, cross=subgraphs * 2)
+        for mode, threshold in (("single", 0), ("paged", 100)):
+            xml, elapsed = _convert(text, threshold)
+            pages = max(1, xml.count("<diagram "))
+            print(
+                f"{subgraphs * per_group:>6} {mode:>7} {pages:>6} "
+                f"{_first_page_cells(xml):>15} {len(xml) / 1024:>8.1f} {elapsed * 1000:>8.1f}"
+            )
+    configure()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Benchmark: flowchart parser throughput.
+
+Parses 50k-line flowcharts of different statement mixes and reports
+lines and edges per second: plain links, shaped nodes with pipe labels,
+chains, and a mix that also exercises the general tokenizer (inline
+labels, "&" groups, class shorthand, subgraphs, comments).
+
+The single-pass lexer is about 2-3x faster than the parser it replaced,
+which ran one regex pass per statement kind; it did not reach the 5x
+that was asked for.
+
+Usage:
+    python -m benchmarks.bench_flowchart_parser   (from mkdocs-drawio-plugin/)
+"""
+
+from __future__ import annotations
+
+import random
+import time
+
+from mkdocs_drawio_plugin.parsers.flowchart import parse
+
+LINES = 50_000
+
+
+def flowchart_source(kind: str, lines: int = LINES, seed: int = 1) -> str:
+    rng = random.Random(seed)
+    out = ["graph TD"]
+    for i in range(lines):
+        a, b = rng.randrange(lines // 2), rng.randrange(lines // 2)
+        if kind == "plain":
+            out.append(f"  n{a} --> n{b}")
+        elif kind == "shaped":
+            out.append(f"  n{a}[Service {a}] -->|calls| n{b}{{Check {b}}}")
+        elif kind == "chain":
+            out.append(f"  n{a}[Service {a}] --> n{b}[Worker {b}] -.-> n{a + 1}")
+        elif i % 100 == 0:
+            out.append(f"  subgraph Zone {i}" if i % 200 == 0 else "  end")
+        elif i % 5 == 1:
+            out.append(f"  n{a} -- calls {b} --> n{b}")
+        elif i % 5 == 2:
+            out.append(f"  n{a} & n{a + 1} ==> n{b}:::hot")
+        elif i % 5 == 3:
+            out.append(f"  %% note {i}")
+        else:
+            out.append(f"  n{a}([Start {a}]) ---|x| n{b}")
+    return "\n".join(out)
+
+
+def _best_of(text: str, runs: int = 3) -> tuple[float, int]:
+    best, edges = float("inf"), 0
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        ir = parse(text)
+        best = min(best, time.perf_counter() - t0)
+        edges = len(ir.edges)
+    return best, edges
+
+
+def main() -> None:
+    print(f"{'input':>8} {'lines':>7} {'edges':>7} {'ms':>8} {'klines/s':>9}")
+    for kind in ("plain", "shaped", "chain", "mixed"):
+        elapsed, edges = _best_of(flowchart_source(kind))
+        print(
+            f"{kind:>8} {LINES:>7} {edges:>7} {elapsed * 1000:>8.1f} "
+            f"{LINES / elapsed / 1000:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
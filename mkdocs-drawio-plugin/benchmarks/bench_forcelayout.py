@@ -0,0 +1,47 @@
+"""
+Benchmark: force-directed (Barnes–Hut) layout up to 5k nodes.
+
+Uses small-world graphs (ring lattice with random shortcuts, like C4
+context diagrams) and reports total time and time per iteration. With the
+quadtree, per-iteration cost should grow close to n log n.
+
+Usage:
+    python -m benchmarks.bench_forcelayout   (from mkdocs-drawio-plugin/)
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from math import log2
+
+from mkdocs_drawio_plugin.forcelayout import force_layout
+from mkdocs_drawio_plugin.parsers.base import DiagramEdge, DiagramNode
+
+ITERATIONS = 20
+
+
+def small_world(n: int, seed: int = 11) -> tuple[list[DiagramNode], list[DiagramEdge]]:
+    rng = random.Random(seed)
+    nodes = [DiagramNode(id=f"n{i}", label=f"n{i}") for i in range(n)]
+    edges = []
+    for i in range(n):
+        edges.append(DiagramEdge(id=f"e{len(edges)}", source=f"n{i}", target=f"n{(i + 1) % n}"))
+        if rng.random() < 0.2:
+            j = rng.randrange(n)
+            edges.append(DiagramEdge(id=f"e{len(edges)}", source=f"n{i}", target=f"n{j}"))
+    return nodes, edges
+
+
+def main() -> None:
+    print(f"{'nodes':>6} {'ms/iter':>9} {'us/(n log n)':>13}")
+    for n in (100, 500, 1000, 2500, 5000):
+        nodes, edges = small_world(n)
+        t0 = time.perf_counter()
+        force_layout(nodes, edges, iterations=ITERATIONS)
+        per_iter = (time.perf_counter() - t0) / ITERATIONS
+        print(f"{n:>6} {per_iter * 1000:>9.1f} {per_iter / (n * log2(n)) * 1e6:>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Benchmark: component layout, serial vs. worker processes.
+
+Builds a large disconnected graph (many small chains plus isolated
+nodes, the shape of a big ERD or event catalog) and times layout_nodes()
+with and without the process pool.
+
+Usage:
+    python -m benchmarks.bench_layout   (from mkdocs-drawio-plugin/)
+"""
+
+from __future__ import annotations
+
+import time
+
+from mkdocs_drawio_plugin import layout
+from mkdocs_drawio_plugin.parsers.base import (
+    DiagramEdge,
+    DiagramIR,
+    DiagramNode,
+    DiagramType,
+)
+
+
+def build_forest(components: int, size: int) -> DiagramIR:
+    nodes, edges = [], []
+    for c in range(components):
+        ids = [f"c{c}_{i}" for i in range(size)]
+        nodes.extend(DiagramNode(id=nid, label=nid) for nid in ids)
+        for a, b in zip(ids, ids[1:]):
+            edges.append(DiagramEdge(id=f"e{len(edges)}", source=a, target=b))
+    return DiagramIR(diagram_type=DiagramType.ERD, nodes=nodes, edges=edges)
+
+
+def _time(components: int, size: int, threshold: int) -> float:
+    ir = build_forest(components, size)
+    layout.PARALLEL_LAYOUT_MIN_NODES = threshold
+    t0 = time.perf_counter()
+    layout.layout_nodes(ir)
+    return time.perf_counter() - t0
+
+
+def main() -> None:
+    print(f"{'nodes':>8} {'serial ms':>10} {'parallel ms':>12}")
+    for components, size in ((500, 10), (2000, 10), (5000, 20)):
+        serial = _time(components, size, threshold=10**9)
+        parallel = _time(components, size, threshold=1)
+        print(f"{components * size:>8} {serial * 1000:>10.1f} {parallel * 1000:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
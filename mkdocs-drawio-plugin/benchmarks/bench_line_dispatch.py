@@ -0,0 +1,120 @@
+"""
+Benchmark: keyword-dispatched line parsing (sequence, C4, ERD).
+
+For each parser, times a full parse of a large generated diagram, and
+the line classification alone two ways: LineDispatcher (first token
+selects the pattern) against trying every pattern in turn, which is what
+the parsers did before.
+
+Usage:
+    python -m benchmarks.bench_line_dispatch   (from mkdocs-drawio-plugin/)
+"""
+
+from __future__ import annotations
+
+import random
+import time
+
+from mkdocs_drawio_plugin.parsers import c4, erd, sequence
+from mkdocs_drawio_plugin.parsers.base import LineDispatcher
+
+
+def sequence_source(messages: int, seed: int = 1) -> str:
+    rng = random.Random(seed)
+    names = [f"Svc{i}" for i in range(12)]
+    lines = ["sequenceDiagram"] + [f"  participant {n}" for n in names]
+    for i in range(messages):
+        if i % 20 == 0:
+            lines.append(f"  loop Batch {i}")
+        a, b = rng.sample(names, 2)
+        lines.append(f"  {a}->>{b}: call {i}")
+        lines.append(f"  {b}-->>{a}: reply {i}")
+        if i % 7 == 0:
+            lines.append(f"  Note over {a}: step {i}")
+        if i % 20 == 19:
+            lines.append("  end")
+    return "\n".join(lines)
+
+
+def c4_source(elements: int, seed: int = 1) -> str:
+    rng = random.Random(seed)
+    lines = ["C4Container"]
+    for i in range(elements):
+        if i % 25 == 0:
+            if i:
+                lines.append("  }")
+            lines.append(f'  System_Boundary(b{i}, "Boundary {i}") {{')
+        lines.append(f'    Container(c{i}, "Service {i}", "Go", "Handles {i}")')
+    lines.append("  }")
+    for i in range(elements * 2):
+        a, b = rng.randrange(elements), rng.randrange(elements)
+        lines.append(f'  Rel(c{a}, c{b}, "Calls", "gRPC")')
+    return "\n".join(lines)
+
+
+def erd_source(entities: int, seed: int = 1) -> str:
+    rng = random.Random(seed)
+    lines = ["erDiagram"]
+    for i in range(entities):
+        lines.append(f"  TABLE_{i} {{")
+        lines.append("    int id PK")
+        lines.extend(f'    string col_{j} "column {j}"' for j in range(6))
+        lines.append("  }")
+    for i in range(entities * 2):
+        a, b = rng.randrange(entities), rng.randrange(entities)
+        lines.append(f"  TABLE_{a} ||--o{{ TABLE_{b} : refs")
+    return "\n".join(lines)
+
+
+def _in_turn(rules, line):
+    for kind, pattern in rules:
+        m = pattern.match(line)
+        if m is not None:
+            return kind, m
+    return None, None
+
+
+def _all_rules(dispatcher: LineDispatcher):
+    """Every distinct rule, keyword rules first (the old checking order)."""
+    rules = []
+    for chain in dispatcher.rules.values():
+        rules.extend(rule for rule in chain if rule not in rules)
+    rules.extend(rule for rule in dispatcher.fallback if rule not in rules)
+    return rules
+
+
+def _time(fn, *args, runs: int = 3) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> None:
+    cases = (
+        ("sequence", sequence, sequence_source(20_000)),
+        ("c4", c4, c4_source(10_000)),
+        ("erd", erd, erd_source(4_000)),
+    )
+    print(
+        f"{'parser':>9} {'lines':>7} {'parse ms':>9} {'klines/s':>9} "
+        f"{'classify ms':>12} {'in turn ms':>11}"
+    )
+    for name, module, text in cases:
+        lines = [line.strip() for line in text.splitlines()[1:]]
+        dispatcher = module._LINES
+        rules = _all_rules(dispatcher)
+        parse_s = _time(module.parse, text)
+        dispatch_s = _time(lambda: [dispatcher.match(line) for line in lines])
+        in_turn_s = _time(lambda: [_in_turn(rules, line) for line in lines])
+        print(
+            f"{name:>9} {len(lines):>7} {parse_s * 1000:>9.1f} "
+            f"{len(lines) / parse_s / 1000:>9.1f} {dispatch_s * 1000:>12.1f} "
+            f"{in_turn_s * 1000:>11.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark: layout metrics on large laid-out diagrams.
+
+Lays out random sparse graphs with the rank engine, then times
+measure_layout() and checks the result has no overlapping nodes.
+Metric cost should grow roughly linearly with diagram size.
+
+Usage:
+    python -m benchmarks.bench_metrics   (from mkdocs-drawio-plugin/)
+"""
+
+from __future__ import annotations
+
+import random
+import time
+
+from mkdocs_drawio_plugin.layout import layout_nodes
+from mkdocs_drawio_plugin.metrics import measure_layout
+from mkdocs_drawio_plugin.parsers.base import (
+    DiagramEdge,
+    DiagramIR,
+    DiagramNode,
+    DiagramType,
+)
+from mkdocs_drawio_plugin.routing import route_edges
+
+
+def sparse_graph(n: int, seed: int = 3) -> DiagramIR:
+    rng = random.Random(seed)
+    nodes = [DiagramNode(id=f"n{i}", label=f"n{i}") for i in range(n)]
+    edges = [
+        DiagramEdge(id=f"e{i}", source=f"n{rng.randrange(i)}", target=f"n{i}")
+        for i in range(1, n)
+        if rng.random() < 0.7
+    ]
+    return DiagramIR(diagram_type=DiagramType.FLOWCHART, nodes=nodes, edges=edges)
+
+
+def main() -> None:
+    print(f"{'nodes':>7} {'metrics ms':>11} {'us/node':>8} {'crossings':>10} {'aspect':>7}")
+    for n in (1_000, 5_000, 20_000):
+        ir = sparse_graph(n)
+        layout_nodes(ir)
+        route_edges(ir)
+
+        t0 = time.perf_counter()
+        metrics = measure_layout(ir)
+        elapsed = time.perf_counter() - t0
+
+        assert not metrics.overlaps, metrics.problems()[:5]
+        print(
+            f"{n:>7} {elapsed * 1000:>11.1f} {elapsed / n * 1e6:>8.1f} "
+            f"{metrics.edge_crossings:>10} {metrics.aspect_ratio:>7.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Benchmark: page weight of HTML embeds with the minified XML profile.
+
+Converts generated flowchart, sequence, C4 and ERD diagrams to the
+figure markup a page embeds, in the default profile, minified, and
+minified with named styles, and reports the kilobytes each adds to a
+page (raw and gzip, as served).
+
+Usage:
+    python -m benchmarks.bench_minify   (from mkdocs-drawio-plugin/)
+"""
+
+from __future__ import annotations
+
+import gzip
+
+from mkdocs_drawio_plugin.converter import mermaid_to_figure
+from mkdocs_drawio_plugin.options import configure
+
+from .bench_stylesheet import c4_source, erd_source, flowchart_source
+
+PROFILES = (
+    ("default", {}),
+    ("minified", {"minify_xml": True}),
+    ("min+named", {"minify_xml": True, "named_styles": True}),
+)
+
+
+def sequence_source(n: int) -> str:
+    lines = ["sequenceDiagram"]
+    lines.extend(f"  participant Service{i}" for i in range(6))
+    lines.extend(f"  Service{i % 6}->>Service{(i + 1) % 6}: request {i}" for i in range(n))
+    return "\n".join(lines)
+
+
+def _weight(text: str, overrides: dict) -> tuple[float, float]:
+    configure(**overrides)
+    html = mermaid_to_figure(text).encode("utf-8")
+    return len(html) / 1024, len(gzip.compress(html)) / 1024
+
+
+def main() -> None:
+    header = " ".join(f"{name:>19}" for name, _ in PROFILES)
+    print(f"{'diagram':<10} {header}   (KB raw / gzip)")
+    for name, text in (
+        ("flowchart", flowchart_source(200)),
+        ("sequence", sequence_source(150)),
+        ("c4", c4_source(100)),
+        ("erd", erd_source(40)),
+    ):
+        cols = []
+        for _, overrides in PROFILES:
+            raw, packed = _weight(text, overrides)
+            cols.append(f"{raw:>9.1f} / {packed:>7.1f}")
+        print(f"{name:<10} {' '.join(cols)}")
+    configure()
+
+
+if __name__ == "__main__":
+    main()
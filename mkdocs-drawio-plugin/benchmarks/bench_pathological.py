@@ -0,0 +1,85 @@
+"""
+Benchmark: parser time on pathological lines of growing length.
+
+Each case is a malformed line of the kind that made the old regexes
+backtrack (unclosed shapes, stray inline-label openers, long blank runs
+around optional parts, repeated arrows). Every parser must stay linear:
+the time per character at the longest line may be at most
+MAX_SLOWDOWN times the time per character at the shortest one, and the
+script exits non-zero when a case exceeds it.
+
+Usage:
+    python -m benchmarks.bench_pathological   (from mkdocs-drawio-plugin/)
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from mkdocs_drawio_plugin.parsers import c4, class_diagram, erd, flowchart, sequence, state
+
+LENGTHS = (2_000, 8_000, 32_000)
+# Allowed growth in time per character from the shortest to the longest
+# line: linear parsing stays near 1, quadratic parsing reaches 16
+MAX_SLOWDOWN = 4.0
+
+CASES = {
+    "flowchart unclosed shapes": (flowchart.parse, "graph TD\n", lambda n: "A[" * (n // 2)),
+    "flowchart unclosed circles": (flowchart.parse, "graph TD\n", lambda n: "A((" * (n // 3)),
+    "flowchart inline openers": (flowchart.parse, "graph TD\n", lambda n: "A " + "-- " * (n // 3)),
+    "flowchart dotted openers": (flowchart.parse, "graph TD\n", lambda n: "A " + "-. " * (n // 3)),
+    "flowchart pipes": (flowchart.parse, "graph TD\n", lambda n: "A -->|" + "x|" * (n // 2)),
+    "flowchart chain": (flowchart.parse, "graph TD\n", lambda n: "A --> " * (n // 6) + "!"),
+    "flowchart subgraph blanks": (
+        flowchart.parse, "graph TD\n", lambda n: "subgraph a" + " " * n + "b",
+    ),
+    "sequence arrows": (sequence.parse, "sequenceDiagram\n", lambda n: "A" + "->>A" * (n // 4)),
+    "sequence note": (sequence.parse, "sequenceDiagram\n", lambda n: "note over " + "a," * (n // 2)),
+    "sequence participant": (
+        sequence.parse, "sequenceDiagram\n", lambda n: "participant A" + " " * n + "b",
+    ),
+    "c4 element": (c4.parse, "C4Context\n", lambda n: "Person(" + ")x" * (n // 2)),
+    "c4 boundary": (c4.parse, "C4Context\n", lambda n: "Boundary(a," + " " * n + "x"),
+    "erd relationship": (
+        erd.parse, "erDiagram\n", lambda n: "A ||--o{ B :" + " " * n + 'x"y',
+    ),
+    "erd field": (erd.parse, "erDiagram\nA {\n", lambda n: "t n" + " " * n + "x"),
+    "state hyphens": (state.parse, "stateDiagram-v2\n", lambda n: "a-" * (n // 2) + "x"),
+    "state arrows": (state.parse, "stateDiagram-v2\n", lambda n: "a" + "-->a" * (n // 4) + "-"),
+    "class relation": (
+        class_diagram.parse, "classDiagram\n", lambda n: 'A "' + "x" * n + " --> B",
+    ),
+    "class generics": (class_diagram.parse, "classDiagram\n", lambda n: "A" + "~" * n + "x"),
+}
+
+
+def _best_of(parse, text: str, runs: int = 3) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        parse(text)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main() -> int:
+    header = " ".join(f"{n:>9}" for n in LENGTHS)
+    print(f"{'case':>28} {header}  (ns/char)  slowdown")
+    failures = []
+    for name, (parse, head, make_line) in CASES.items():
+        per_char = [_best_of(parse, head + make_line(n)) / n * 1e9 for n in LENGTHS]
+        slowdown = per_char[-1] / per_char[0]
+        row = " ".join(f"{t:>9.1f}" for t in per_char)
+        flag = "" if slowdown <= MAX_SLOWDOWN else "  FAIL"
+        print(f"{name:>28} {row}  {slowdown:>19.1f}{flag}")
+        if flag:
+            failures.append(name)
+    if failures:
+        print(f"superlinear: {', '.join(failures)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
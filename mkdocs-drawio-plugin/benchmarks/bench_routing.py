@@ -0,0 +1,54 @@
+"""
+Benchmark: orthogonal edge routing time vs. diagram size.
+
+Builds layered random DAGs of increasing size, runs the rank layout, then
+times route_edges() alone. Per-edge cost should stay roughly flat as the
+diagram grows (spatial index keeps obstacle lookups local).
+
+Usage:
+    python -m benchmarks.bench_routing   (from mkdocs-drawio-plugin/)
+"""
+
+from __future__ import annotations
+
+import random
+import time
+
+from mkdocs_drawio_plugin.layout import layout_nodes
+from mkdocs_drawio_plugin.parsers.base import (
+    DiagramEdge,
+    DiagramIR,
+    DiagramNode,
+    DiagramType,
+)
+from mkdocs_drawio_plugin.routing import route_edges
+
+
+def build_dag(n: int, seed: int = 7) -> DiagramIR:
+    """Random DAG with ~2 edges per node, edges pointing to later nodes."""
+    rng = random.Random(seed)
+    nodes = [DiagramNode(id=f"n{i}", label=f"n{i}") for i in range(n)]
+    edges = []
+    for i in range(1, n):
+        for _ in range(2):
+            j = rng.randrange(max(0, i - 40), i)
+            edges.append(DiagramEdge(id=f"e{len(edges)}", source=f"n{j}", target=f"n{i}"))
+    return DiagramIR(diagram_type=DiagramType.FLOWCHART, nodes=nodes, edges=edges)
+
+
+def main() -> None:
+    print(f"{'nodes':>7} {'edges':>7} {'route ms':>10} {'us/edge':>9}")
+    for n in (250, 500, 1000, 2000, 4000):
+        ir = build_dag(n)
+        layout_nodes(ir)
+        t0 = time.perf_counter()
+        route_edges(ir)
+        elapsed = time.perf_counter() - t0
+        print(
+            f"{n:>7} {len(ir.edges):>7} {elapsed * 1000:>10.1f} "
+            f"{elapsed / len(ir.edges) * 1e6:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
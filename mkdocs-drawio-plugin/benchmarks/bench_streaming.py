@@ -0,0 +1,74 @@
+"""
+Benchmark: peak memory of parsing a large .mmd file, read whole vs streamed.
+
+Writes generated flowchart, sequence and ERD sources to a temporary
+directory, then parses each file two ways under tracemalloc: reading the
+text first (f.read(), as the CLI used to) and passing the open file so
+lines are read as they are parsed. Reports the file size, the peak
+allocation of each way, and the time.
+
+Usage:
+    python -m benchmarks.bench_streaming   (from mkdocs-drawio-plugin/)
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.bench_flowchart_parser import flowchart_source
+from benchmarks.bench_line_dispatch import erd_source, sequence_source
+from mkdocs_drawio_plugin.converter import mermaid_to_ir
+
+
+def _read_whole(path: str):
+    with open(path, encoding="utf-8") as f:
+        return mermaid_to_ir(f.read())
+
+
+def _streamed(path: str):
+    with open(path, encoding="utf-8") as f:
+        return mermaid_to_ir(f)
+
+
+def _measure(fn, path: str) -> tuple[float, float]:
+    """(peak MiB, seconds) of one parse."""
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    ir = fn(path)
+    elapsed = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del ir
+    return peak / 2**20, elapsed
+
+
+def main() -> None:
+    sources = (
+        ("flowchart", flowchart_source("shaped", 100_000)),
+        ("sequence", sequence_source(50_000)),
+        ("erd", erd_source(10_000)),
+    )
+    print(
+        f"{'input':>10} {'file MiB':>9} {'read MiB':>9} {'stream MiB':>11} "
+        f"{'read s':>7} {'stream s':>9}"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, text in sources:
+            path = os.path.join(tmp, f"{name}.mmd")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+            del text
+            size = os.path.getsize(path) / 2**20
+            read_peak, read_s = _measure(_read_whole, path)
+            stream_peak, stream_s = _measure(_streamed, path)
+            print(
+                f"{name:>10} {size:>9.1f} {read_peak:>9.1f} {stream_peak:>11.1f} "
+                f"{read_s:>7.2f} {stream_s:>9.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark: XML bytes per cell with inline vs named styles.
+
+Converts generated flowchart, C4 and ERD diagrams with named_styles off
+and on, and reports the average bytes each cell takes in the output.
+
+Usage:
+    python -m benchmarks.bench_stylesheet   (from mkdocs-drawio-plugin/)
+"""
+
+from __future__ import annotations
+
+from mkdocs_drawio_plugin.converter import mermaid_to_xml
+from mkdocs_drawio_plugin.options import configure
+from mkdocs_drawio_plugin.stylesheet import stylesheet_js
+
+
+def flowchart_source(n: int) -> str:
+    lines = ["graph TD"]
+    lines.extend(f"  n{i}[Step {i}] --> n{i + 1}{{Check {i + 1}}}" for i in range(0, n, 2))
+    return "\n".join(lines)
+
+
+def c4_source(n: int) -> str:
+    lines = ["C4Container"]
+    lines.extend(f'  Container(s{i}, "Service {i}", "Go")' for i in range(n))
+    lines.extend(f'  Rel(s{i}, s{i + 1}, "calls", "HTTPS")' for i in range(n - 1))
+    return "\n".join(lines)
+
+
+def erd_source(n: int) -> str:
+    lines = ["erDiagram"]
+    for i in range(n):
+        lines.append(f"  T{i} {{")
+        lines.extend(f"    int col{c}" for c in range(5))
+        lines.append("  }")
+    lines.extend(f"  T{i} ||--o{{ T{i + 1} : has" for i in range(n - 1))
+    return "\n".join(lines)
+
+
+def _bytes_per_cell(text: str, named: bool) -> tuple[float, int]:
+    configure(named_styles=named)
+    xml = mermaid_to_xml(text)
+    return len(xml) / xml.count("<mxCell"), len(xml)
+
+
+def main() -> None:
+    print(f"{'diagram':<10} {'B/cell inline':>14} {'B/cell named':>13} {'saved':>6}")
+    for name, text in (
+        ("flowchart", flowchart_source(200)),
+        ("c4", c4_source(100)),
+        ("erd", erd_source(40)),
+    ):
+        inline, _ = _bytes_per_cell(text, named=False)
+        named, _ = _bytes_per_cell(text, named=True)
+        print(f"{name:<10} {inline:>14.1f} {named:>13.1f} {1 - named / inline:>6.0%}")
+    print(f"stylesheet script (once per site): {len(stylesheet_js())} bytes")
+    configure()
+
+
+if __name__ == "__main__":
+    main()
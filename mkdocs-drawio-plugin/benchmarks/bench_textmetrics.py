@@ -0,0 +1,57 @@
+"""
+Benchmark: label measurement throughput.
+
+Measures distinct (uncached) labels, then the same labels again from the
+memo cache. Target: >= 100k labels/second uncached.
+
+Usage:
+    python -m benchmarks.bench_textmetrics   (from mkdocs-drawio-plugin/)
+"""
+
+from __future__ import annotations
+
+import random
+import time
+
+from mkdocs_drawio_plugin.textmetrics import measure_label
+
+_WORDS = (
+    "order payment service gateway user account queue worker cache "
+    "database api handler notification invoice ledger audit"
+).split()
+
+
+def make_labels(n: int, seed: int = 3) -> list[str]:
+    rng = random.Random(seed)
+    labels = []
+    for i in range(n):
+        words = " ".join(rng.choice(_WORDS).title() for _ in range(rng.randint(1, 4)))
+        if i % 5 == 0:
+            # C4-style multi-line label
+            labels.append(f"<b>{words} {i}</b>&#xa;[Python]&#xa;Handles {words.lower()}")
+        else:
+            labels.append(f"{words} {i}")
+    return labels
+
+
+def main() -> None:
+    n = 100_000
+    labels = make_labels(n)
+
+    measure_label.cache_clear()
+    t0 = time.perf_counter()
+    for label in labels:
+        measure_label(label, 12)
+    cold = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for label in labels[-65536:]:
+        measure_label(label, 12)
+    warm = time.perf_counter() - t0
+
+    print(f"uncached: {n / cold:>12,.0f} labels/s")
+    print(f"cached:   {65536 / warm:>12,.0f} labels/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Benchmark: importing OpenTelemetry span files into a sequence diagram.
+
+Streams generated OTLP JSON Lines (one export batch per service and
+trace, as the collector's file exporter writes them) into the trace
+importer without holding the file in memory. Traces follow a few
+request shapes with loops of varying length and occasional errors.
+Reports throughput and the peak memory traced during the import, which
+should stay flat as the span count grows, plus the resulting message
+and block counts.
+
+Usage:
+    python -m benchmarks.bench_trace_import   (from mkdocs-drawio-plugin/)
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import time
+import tracemalloc
+from typing import Iterator
+
+from mkdocs_drawio_plugin.importers import trace
+
+
+def _batch(service: str, spans: list[dict]) -> str:
+    return json.dumps({"resourceSpans": [{
+        "resource": {"attributes": [
+            {"key": "service.name", "value": {"stringValue": service}},
+        ]},
+        "scopeSpans": [{"spans": spans}],
+    }]})
+
+
+def span_lines(spans: int, seed: int = 3) -> Iterator[str]:
+    """JSON Lines for about ``spans`` spans, generated lazily."""
+    rng = random.Random(seed)
+    emitted = 0
+    t = 0
+    n = 0
+    while emitted < spans:
+        n += 1
+        tid = f"{n:032x}"
+        t += 1_000_000
+        root = {"traceId": tid, "spanId": f"{n}r", "name": "POST /checkout",
+                "kind": 2, "startTimeUnixNano": str(t), "endTimeUnixNano": str(t + 900_000)}
+        by_service: dict[str, list[dict]] = {"frontend": [root]}
+        clock = t + 1000
+        items = rng.randint(1, 12)
+        for i in range(items):
+            by_service.setdefault("inventory", []).append({
+                "traceId": tid, "spanId": f"{n}i{i}", "parentSpanId": f"{n}r",
+                "name": "GET /item", "kind": 2,
+                "startTimeUnixNano": str(clock), "endTimeUnixNano": str(clock + 500),
+            })
+            clock += 1000
+        if rng.random() < 0.5:
+            by_service["payments"] = [{
+                "traceId": tid, "spanId": f"{n}p", "parentSpanId": f"{n}r",
+                "name": "charge", "kind": 2,
+                "startTimeUnixNano": str(clock), "endTimeUnixNano": str(clock + 5000),
+                "status": {"code": 2 if rng.random() < 0.05 else 0},
+            }]
+            clock += 6000
+        by_service.setdefault("orders-db", []).append({
+            "traceId": tid, "spanId": f"{n}d", "parentSpanId": f"{n}r",
+            "name": "INSERT orders", "kind": 3,
+            "startTimeUnixNano": str(clock), "endTimeUnixNano": str(clock + 300),
+        })
+        # Children end (and are exported) before their parent
+        for service in reversed(list(by_service)):
+            emitted += len(by_service[service])
+            yield _batch(service, by_service[service])
+
+
+def main() -> None:
+    print(f"{'spans':>9} {'import s':>9} {'spans/s':>9} {'peak MiB':>9} "
+          f"{'messages':>9} {'blocks':>7}")
+    for spans in (10_000, 100_000, 1_000_000):
+        t0 = time.perf_counter()
+        ir = trace.parse(span_lines(spans))
+        seconds = time.perf_counter() - t0
+
+        # tracemalloc slows the import down, so the peak is a second run
+        tracemalloc.start()
+        trace.parse(span_lines(spans))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(f"{spans:>9} {seconds:>9.1f} {spans / seconds:>9.0f} "
+              f"{peak / 2**20:>9.1f} {len(ir.edges):>9} {len(ir.groups):>7}")
+
+
+if __name__ == "__main__":
+    main()
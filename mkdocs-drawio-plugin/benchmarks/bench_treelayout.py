@@ -0,0 +1,54 @@
+"""
+Benchmark: tidy tree layout vs. generic ranking on tree-shaped graphs.
+
+Builds random trees (bounded fan-out, mixed node widths) and times the
+tree layout alone and the generic rank layout on the same input, to show
+the tree path stays linear as the tree grows.
+
+Usage:
+    python -m benchmarks.bench_treelayout   (from mkdocs-drawio-plugin/)
+"""
+
+from __future__ import annotations
+
+import random
+import time
+
+from mkdocs_drawio_plugin import layout
+from mkdocs_drawio_plugin.parsers.base import DiagramEdge, DiagramNode, LayoutDirection
+from mkdocs_drawio_plugin.treelayout import tree_children, tree_layout
+
+
+def build_tree(n: int, seed: int = 0) -> tuple[list[DiagramNode], list[DiagramEdge]]:
+    rng = random.Random(seed)
+    nodes = [DiagramNode(id=f"n{i}", label=f"n{i}", width=80 + 40 * (i % 4)) for i in range(n)]
+    edges = [
+        DiagramEdge(id=f"e{i}", source=f"n{rng.randrange(max(0, i - 20), i)}", target=f"n{i}")
+        for i in range(1, n)
+    ]
+    return nodes, edges
+
+
+def main() -> None:
+    print(f"{'nodes':>8} {'tree ms':>9} {'us/node':>8} {'rank ms':>9}")
+    for n in (1_000, 10_000, 50_000):
+        nodes, edges = build_tree(n)
+
+        t0 = time.perf_counter()
+        root, children = tree_children(nodes, edges)
+        tree_layout(nodes, root, children, LayoutDirection.TB)
+        tree_s = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        ranks = layout._topological_ranks(nodes, edges)
+        layout._layout_tb(layout._group_by_rank(nodes, ranks), 0.0, 0.0)
+        rank_s = time.perf_counter() - t0
+
+        print(
+            f"{n:>8} {tree_s * 1000:>9.1f} {tree_s / n * 1e6:>8.2f} "
+            f"{rank_s * 1000:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
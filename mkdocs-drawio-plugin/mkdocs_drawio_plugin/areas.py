@@ -0,0 +1,116 @@
+"""
+Subject areas: bounded, connected parts of a large entity graph.
+
+The ERD generator (see ConvertOptions.erd_area_entities) emits one page
+per area plus an area-level overview. Areas follow relationship (foreign
+key) connectivity:
+
+1. Connected components larger than the limit are grown into areas one
+   at a time. Each starts from the best-connected remaining entity and
+   repeatedly takes the neighbour whose links into the area most
+   outnumber its links elsewhere (ties: input order), so few
+   relationships cross area boundaries, until the area is full or has
+   no neighbours left.
+2. Components that fit, and grown areas that ended up short, are packed
+   together largest-first into areas of at most the limit, so lookup
+   tables and isolated entities do not each get a page of their own.
+
+Every entity lands in exactly one area. Areas are ordered by their
+first entity and list their entities in input order.
+"""
+
+from __future__ import annotations
+
+from .parsers.base import DiagramIR
+
+
+def _adjacency(ir: DiagramIR) -> dict[str, dict[str, int]]:
+    """Node ID -> {neighbour ID: number of edges between them}."""
+    adjacency: dict[str, dict[str, int]] = {n.id: {} for n in ir.nodes}
+    for e in ir.edges:
+        if e.source == e.target or e.source not in adjacency or e.target not in adjacency:
+            continue
+        for a, b in ((e.source, e.target), (e.target, e.source)):
+            adjacency[a][b] = adjacency[a].get(b, 0) + 1
+    return adjacency
+
+
+def _components(order: list[str], adjacency: dict[str, dict[str, int]]) -> list[list[str]]:
+    seen: set[str] = set()
+    components = []
+    for start in order:
+        if start in seen:
+            continue
+        seen.add(start)
+        component = [start]
+        stack = [start]
+        while stack:
+            for nb in adjacency[stack.pop()]:
+                if nb not in seen:
+                    seen.add(nb)
+                    component.append(nb)
+                    stack.append(nb)
+        components.append(component)
+    return components
+
+
+def _grow(
+    component: list[str],
+    adjacency: dict[str, dict[str, int]],
+    index: dict[str, int],
+    max_entities: int,
+) -> list[list[str]]:
+    """Split a component into connected areas of at most max_entities."""
+    degree = {n: sum(adjacency[n].values()) for n in component}
+    remaining = set(component)
+    areas = []
+    while remaining:
+        seed = max(remaining, key=lambda n: (degree[n], -index[n]))
+        remaining.discard(seed)
+        area = [seed]
+        # Candidate -> links into the area
+        links: dict[str, int] = {}
+        frontier = seed
+        while True:
+            for nb, count in adjacency[frontier].items():
+                if nb in remaining:
+                    links[nb] = links.get(nb, 0) + count
+            if not links or len(area) >= max_entities:
+                break
+            # Links gained inside minus links left crossing the boundary
+            frontier = max(links, key=lambda n: (2 * links[n] - degree[n], -index[n]))
+            del links[frontier]
+            remaining.discard(frontier)
+            area.append(frontier)
+        areas.append(area)
+    return areas
+
+
+def subject_areas(ir: DiagramIR, max_entities: int) -> list[list[str]]:
+    """Partition the IR's node IDs into areas of at most max_entities."""
+    order = [n.id for n in ir.nodes]
+    index = {nid: i for i, nid in enumerate(order)}
+    adjacency = _adjacency(ir)
+
+    full: list[list[str]] = []
+    pieces: list[list[str]] = []
+    for component in _components(order, adjacency):
+        if len(component) <= max_entities:
+            pieces.append(component)
+            continue
+        for area in _grow(component, adjacency, index, max_entities):
+            (full if len(area) == max_entities else pieces).append(area)
+
+    # First-fit decreasing; the sort is stable, so equal sizes keep order
+    bins: list[list[str]] = []
+    for piece in sorted(pieces, key=len, reverse=True):
+        for area in bins:
+            if len(area) + len(piece) <= max_entities:
+                area.extend(piece)
+                break
+        else:
+            bins.append(list(piece))
+
+    areas = [sorted(area, key=index.__getitem__) for area in full + bins]
+    areas.sort(key=lambda area: index[area[0]])
+    return areas
@@ -0,0 +1,127 @@
+"""
+Site-wide registry of C4 elements, keyed by alias.
+
+C4 docs describe one model at several levels: the same Person, System
+and Container show up in Context, Container and Component diagrams on
+different pages. The plugin builds the registry once per build
+(on_files) from every C4 block on the site, so a diagram can relate to
+an element declared elsewhere by its alias alone:
+
+    C4Component
+      Component(auth, "Auth", "Go")
+      Rel(user, auth, "Signs in")      %% user: declared on the context page
+
+The C4 generator adds each such element from its registered declaration
+(label, shape, role) with the size measured at registration, instead of
+leaving the relationship dangling. Aliases declared in the diagram
+itself always win. The first declaration of an alias on the site is the
+one registered; later ones are only counted.
+
+Each block is parsed and measured once per build: the parsed, sized IR
+is kept under the block's text, and converting that text again (when
+the page renders) starts from a copy of it instead of parsing and
+measuring the labels a second time. Layout is not shared between
+diagrams; repeated layouts of one block come from the layout cache.
+
+The registry is off by default (plugin option c4_registry), since it
+changes what diagrams with dangling relationships show. It is
+in-process state like the layout cache, rebuilt (and cleared first) on
+every build, including `mkdocs serve` rebuilds.
+"""
+
+from __future__ import annotations
+
+from dataclasses import replace
+
+from .parsers import c4
+from .parsers.base import DiagramIR, DiagramNode, Source
+from .textmetrics import size_nodes
+
+_ELEMENTS: dict[str, DiagramNode] = {}
+# Stripped block text -> its parsed and sized IR
+_DIAGRAMS: dict[str, DiagramIR] = {}
+_STATS = {"sources": 0, "duplicates": 0, "reused": 0}
+
+
+def _copy_node(node: DiagramNode, **changes) -> DiagramNode:
+    return replace(node, fields=list(node.fields), methods=list(node.methods), **changes)
+
+
+def register_c4_source(source: Source) -> int:
+    """Register the elements declared in a C4 block. Returns how many
+    were new to the registry.
+
+    Text sources are also kept whole for registered_diagram().
+    """
+    ir = c4.parse(source)
+    size_nodes(ir)
+    ir.presized = {n.id for n in ir.nodes}
+    if isinstance(source, str):
+        _DIAGRAMS[source.strip()] = ir
+    _STATS["sources"] += 1
+    added = 0
+    for node in ir.nodes:
+        if node.id in _ELEMENTS:
+            _STATS["duplicates"] += 1
+            continue
+        _ELEMENTS[node.id] = _copy_node(node, parent_group=None, x=0.0, y=0.0)
+        added += 1
+    return added
+
+
+def registered_diagram(text: str) -> DiagramIR | None:
+    """A fresh copy of the parsed, sized IR registered for a block, if any."""
+    ir = _DIAGRAMS.get(text.strip())
+    if ir is None:
+        return None
+    _STATS["reused"] += 1
+    return replace(
+        ir,
+        nodes=[_copy_node(n) for n in ir.nodes],
+        edges=[replace(e, waypoints=[]) for e in ir.edges],
+        groups=[replace(g) for g in ir.groups],
+        presized=set(ir.presized),
+    )
+
+
+def registered_element(alias: str) -> DiagramNode | None:
+    """A fresh copy of the registered element for ``alias``, if any."""
+    node = _ELEMENTS.get(alias)
+    if node is None:
+        return None
+    return _copy_node(node)
+
+
+def add_referenced_elements(ir: DiagramIR) -> int:
+    """Add registered elements for relationship ends the diagram does not
+    declare itself, keeping their registered size. Returns the number of
+    elements added."""
+    if not _ELEMENTS:
+        return 0
+    known = {n.id for n in ir.nodes} | {g.id for g in ir.groups}
+    added = 0
+    for edge in ir.edges:
+        for alias in (edge.source, edge.target):
+            if alias in known:
+                continue
+            node = registered_element(alias)
+            if node is not None:
+                ir.nodes.append(node)
+                ir.presized.add(alias)
+                known.add(alias)
+                added += 1
+    return added
+
+
+def c4_registry_info() -> dict[str, int]:
+    """Return registered sources, elements, duplicate declarations and
+    how many conversions reused a registered diagram."""
+    return {**_STATS, "elements": len(_ELEMENTS)}
+
+
+def clear_c4_registry() -> None:
+    """Drop every registered element and reset the counters."""
+    _ELEMENTS.clear()
+    _DIAGRAMS.clear()
+    for key in _STATS:
+        _STATS[key] = 0
@@ -7,14 +7,60 @@ Usage:
     mermaid-to-drawio input.mmd --html             # outputs HTML div to stdout
     mermaid-to-drawio input.mmd --html -o out.html # saves HTML file
     cat input.mmd | mermaid-to-drawio -             # reads from stdin
+    mermaid-to-drawio c4.mmd --layout-engine force # force-directed layout
+    mermaid-to-drawio input.mmd --metrics          # layout report on stderr
+    mermaid-to-drawio c4.mmd --merge-edges         # one edge per node pair
+    mermaid-to-drawio big.mmd --collapse-groups 50 # collapse big subgraphs
+    mermaid-to-drawio input.mmd --html --minify    # smallest embed markup
+    mermaid-to-drawio erd.mmd --erd-render table   # one cell per entity
+    mermaid-to-drawio schema.sql --from ddl        # ERD from SQL DDL
+    mermaid-to-drawio migrations/*.sql --from ddl  # migrations, in order
+    mermaid-to-drawio schema.sql --from ddl --erd-areas 40  # page per area
+    mermaid-to-drawio spans.jsonl --from trace     # sequence from OTel spans
 """
 
 from __future__ import annotations
 
 import argparse
 import sys
+from typing import Iterator
 
-from .converter import mermaid_to_html, mermaid_to_xml
+from .converter import ir_to_xml, mermaid_to_ir
+from .encoding import encode_for_mxgraph, wrap_in_mxgraph_div
+from .importers import ddl, trace
+from .metrics import measure_layout
+from .options import ERD_RENDER_MODES, LAYOUT_ENGINES, configure
+from .parsers.base import DiagramIR, DiagramType
+
+
+def _read_lines(path: str) -> Iterator[str]:
+    """Lines of a file, or of stdin for "-", as they are read."""
+    if path == "-":
+        yield from sys.stdin
+        return
+    with open(path, encoding="utf-8") as f:
+        yield from f
+
+
+def _script_lines(paths: list[str]) -> Iterator[str]:
+    """Lines of several SQL files, each file ending its last statement."""
+    for path in paths:
+        yield from _read_lines(path)
+        yield ";"
+
+
+def _metrics_report(pages: list[tuple[str, DiagramIR]]) -> str:
+    """Layout metrics of the output, a section per page when it has several.
+
+    Pages are laid out independently, so their coordinates overlap and
+    the diagram as a whole cannot be measured.
+    """
+    if len(pages) == 1:
+        return measure_layout(pages[0][1]).summary()
+    return "\n\n".join(
+        f"page {number}/{len(pages)}: {name}\n{measure_layout(page).summary()}"
+        for number, (name, page) in enumerate(pages, start=1)
+    )
 
 
 def main() -> None:
@@ -24,7 +70,25 @@ def main() -> None:
     )
     parser.add_argument(
         "input",
-        help="Input .mmd file path, or '-' for stdin",
+        nargs="+",
+        help="Input file path, or '-' for stdin (--from ddl: several files, read in order)",
+    )
+    parser.add_argument(
+        "--from",
+        dest="source_format",
+        choices=("mermaid", "ddl", "trace"),
+        default="mermaid",
+        help=(
+            "Input format: Mermaid (default), SQL DDL imported as an ERD, or "
+            "OpenTelemetry JSON spans imported as a sequence diagram"
+        ),
+    )
+    parser.add_argument(
+        "--max-messages",
+        type=int,
+        default=trace.DEFAULT_TRACE_MESSAGES,
+        metavar="N",
+        help=f"Message budget for --from trace (default: {trace.DEFAULT_TRACE_MESSAGES})",
     )
     parser.add_argument(
         "-o", "--output",
@@ -35,21 +99,92 @@ def main() -> None:
         action="store_true",
         help="Output HTML embed div instead of raw XML",
     )
+    parser.add_argument(
+        "--layout-engine",
+        choices=LAYOUT_ENGINES,
+        help="Layout engine for node/edge diagrams (default: rank)",
+    )
+    merging = parser.add_mutually_exclusive_group()
+    merging.add_argument(
+        "--merge-edges",
+        action="store_true",
+        help="Merge duplicate source/target edges into one labelled cell",
+    )
+    merging.add_argument(
+        "--no-merge-edges",
+        action="store_true",
+        help="Keep duplicate source/target edges as separate cells (the default)",
+    )
+    parser.add_argument(
+        "--collapse-groups",
+        type=int,
+        metavar="N",
+        help="Emit subgraphs with more than N nodes as collapsed containers",
+    )
+    parser.add_argument(
+        "--erd-render",
+        choices=ERD_RENDER_MODES,
+        help="ERD entities as a cell per field (default) or one HTML-table cell",
+    )
+    parser.add_argument(
+        "--erd-areas",
+        type=int,
+        metavar="N",
+        help="Split ERDs with more than N entities into a page per subject area",
+    )
+    parser.add_argument(
+        "--minify",
+        action="store_true",
+        help="Minify XML: integer coordinates, no default attributes, short IDs",
+    )
+    parser.add_argument(
+        "--metrics",
+        action="store_true",
+        help="Print layout quality metrics (overlaps, crossings, area) to stderr",
+    )
 
     args = parser.parse_args()
+    if args.source_format != "ddl" and len(args.input) > 1:
+        parser.error("several input files need --from ddl")
+    if args.max_messages < 1:
+        parser.error("--max-messages must be positive")
+
+    overrides = {}
+    if args.layout_engine:
+        overrides["layout_engines"] = {t.value: args.layout_engine for t in DiagramType}
+    if args.merge_edges or args.no_merge_edges:
+        overrides["merge_edges"] = {t.value: args.merge_edges for t in DiagramType}
+    if args.collapse_groups is not None:
+        overrides["collapse_group_nodes"] = args.collapse_groups
+    if args.erd_render:
+        overrides["erd_render"] = args.erd_render
+    if args.erd_areas is not None:
+        overrides["erd_area_entities"] = args.erd_areas
+    if args.minify:
+        overrides["minify_xml"] = True
+    if overrides:
+        try:
+            configure(**overrides)
+        except ValueError as exc:
+            parser.error(str(exc))
 
-    # Read input
-    if args.input == "-":
-        text = sys.stdin.read()
+    # Parse the input as it streams in, a line at a time
+    if args.source_format == "ddl":
+        ir = ddl.parse(_script_lines(args.input))
+    elif args.source_format == "trace":
+        ir = trace.parse(_read_lines(args.input[0]), max_messages=args.max_messages)
     else:
-        with open(args.input, encoding="utf-8") as f:
-            text = f.read()
+        ir = mermaid_to_ir(_read_lines(args.input[0]))
 
-    # Convert
+    # Convert, keeping every laid-out page so each can be measured
+    pages: list[tuple[str, DiagramIR]] = []
+    result = ir_to_xml(ir, pages=pages)
     if args.html:
-        result = mermaid_to_html(text)
-    else:
-        result = mermaid_to_xml(text)
+        result = wrap_in_mxgraph_div(encode_for_mxgraph(result))
+
+    if args.metrics:
+        sys.stderr.write(_metrics_report(pages))
+        sys.stderr.write("\n")
 
     # Write output
     if args.output:
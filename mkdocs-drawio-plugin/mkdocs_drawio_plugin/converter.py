@@ -6,45 +6,66 @@ This is the main entry point for converting Mermaid text to draw.io HTML.
 
 from __future__ import annotations
 
-import re
+from itertools import chain
+from typing import Iterator
 
-from .parsers.base import DiagramIR, DiagramType
-from .parsers import flowchart, sequence, c4, erd, generic
+from .c4registry import registered_diagram
+from .parsers.base import DiagramIR, DiagramType, Source, source_lines
+from .parsers import flowchart, sequence, c4, erd, state, class_diagram, generic
 from .generators import flowchart as gen_flowchart
 from .generators import sequence as gen_sequence
 from .generators import c4 as gen_c4
 from .generators import erd as gen_erd
+from .generators import state as gen_state
+from .generators import class_diagram as gen_class
 from .generators import generic as gen_generic
 from .encoding import encode_for_mxgraph, wrap_in_mxgraph_div
 
 
-def detect_type(text: str) -> DiagramType:
-    """Detect the Mermaid diagram type from its first meaningful line."""
-    for line in text.strip().splitlines():
+def _statement_type(stripped: str) -> DiagramType:
+    """Diagram type named by a header statement."""
+    lower = stripped.lower()
+
+    if lower.startswith(("graph ", "flowchart ")):
+        return DiagramType.FLOWCHART
+    if lower == "sequencediagram":
+        return DiagramType.SEQUENCE
+    if lower.startswith("c4context"):
+        return DiagramType.C4_CONTEXT
+    if lower.startswith("c4container"):
+        return DiagramType.C4_CONTAINER
+    if lower.startswith("c4component"):
+        return DiagramType.C4_COMPONENT
+    if lower.startswith("c4"):
+        return DiagramType.C4_CONTEXT
+    if lower == "erdiagram":
+        return DiagramType.ERD
+    if lower in ("statediagram", "statediagram-v2"):
+        return DiagramType.STATE
+    if lower in ("classdiagram", "classdiagram-v2"):
+        return DiagramType.CLASS
+    return DiagramType.GENERIC
+
+
+def _peek_type(source: Source) -> tuple[DiagramType, Iterator[str]]:
+    """Detect the diagram type, returning it with every line unconsumed.
+
+    Only the lines up to the first meaningful one are read, so a stream
+    is parsed in the same single pass.
+    """
+    lines = source_lines(source)
+    peeked: list[str] = []
+    for line in lines:
+        peeked.append(line)
         stripped = line.strip()
-        if not stripped or stripped.startswith("%%"):
-            continue
-
-        lower = stripped.lower()
-
-        if lower.startswith(("graph ", "flowchart ")):
-            return DiagramType.FLOWCHART
-        if lower == "sequencediagram":
-            return DiagramType.SEQUENCE
-        if lower.startswith("c4context"):
-            return DiagramType.C4_CONTEXT
-        if lower.startswith("c4container"):
-            return DiagramType.C4_CONTAINER
-        if lower.startswith("c4component"):
-            return DiagramType.C4_COMPONENT
-        if lower.startswith("c4"):
-            return DiagramType.C4_CONTEXT
-        if lower == "erdiagram":
-            return DiagramType.ERD
-
-        break  # Only check first meaningful line
+        if stripped and not stripped.startswith("%%"):
+            return _statement_type(stripped), chain(peeked, lines)
+    return DiagramType.GENERIC, iter(peeked)
 
-    return DiagramType.GENERIC
+
+def detect_type(text: str) -> DiagramType:
+    """Detect the Mermaid diagram type from its first meaningful line."""
+    return _peek_type(text)[0]
 
 
 # Type → (parser, generator) dispatch
@@ -56,26 +77,50 @@ _DISPATCH = {
     DiagramType.C4_COMPONENT: (c4.parse, gen_c4.generate),
     DiagramType.C4_CODE: (c4.parse, gen_c4.generate),
     DiagramType.ERD: (erd.parse, gen_erd.generate),
+    DiagramType.STATE: (state.parse, gen_state.generate),
+    DiagramType.CLASS: (class_diagram.parse, gen_class.generate),
     DiagramType.GENERIC: (generic.parse, gen_generic.generate),
 }
 
 
-def mermaid_to_ir(text: str) -> DiagramIR:
-    """Parse Mermaid text into an intermediate representation."""
-    dtype = detect_type(text)
+def mermaid_to_ir(source: Source) -> DiagramIR:
+    """Parse Mermaid text, or an iterable of lines, into an intermediate
+    representation.
+
+    C4 blocks registered site-wide (see c4registry) are not parsed again.
+    """
+    if isinstance(source, str):
+        ir = registered_diagram(source)
+        if ir is not None:
+            return ir
+    dtype, lines = _peek_type(source)
     parser, _ = _DISPATCH[dtype]
-    return parser(text)
+    return parser(lines)
 
 
-def ir_to_xml(ir: DiagramIR) -> str:
-    """Generate draw.io XML from a DiagramIR."""
+# Generators that may split a diagram into several pages
+_PAGED_TYPES = frozenset({DiagramType.FLOWCHART, DiagramType.SEQUENCE, DiagramType.ERD})
+
+
+def ir_to_xml(ir: DiagramIR, pages: list[tuple[str, DiagramIR]] | None = None) -> str:
+    """Generate draw.io XML from a DiagramIR.
+
+    When given, ``pages`` receives (page name, laid-out IR) for every
+    page of the output, so each can be measured on its own; a
+    single-page diagram is ``ir`` itself, named by its title.
+    """
     _, generator = _DISPATCH[ir.diagram_type]
-    return generator(ir)
+    if pages is None:
+        return generator(ir)
+    xml = generator(ir, pages=pages) if ir.diagram_type in _PAGED_TYPES else generator(ir)
+    if not pages:
+        pages.append((ir.title, ir))
+    return xml
 
 
-def mermaid_to_xml(text: str) -> str:
-    """Convert Mermaid text to raw draw.io XML."""
-    ir = mermaid_to_ir(text)
+def mermaid_to_xml(source: Source) -> str:
+    """Convert Mermaid text (or lines) to raw draw.io XML."""
+    ir = mermaid_to_ir(source)
     return ir_to_xml(ir)
 
 
@@ -0,0 +1,69 @@
+"""
+Duplicate-edge merging.
+
+Generated flowcharts and C4 diagrams often repeat one source/target pair
+many times (a `Rel` per API call). Each copy is a separate cell that the
+viewer draws on top of the others. This pass keeps one edge per
+(source, target, edge type, style) and folds the others' labels into it,
+so the XML shrinks and the viewer draws each line once.
+
+Off by default; enabled per diagram type via ConvertOptions.merge_edges
+(the merge_edges plugin option, or --merge-edges in the CLI). Runs in
+auto_layout before layout so routing and the layout cache see the merged
+edges.
+"""
+
+from __future__ import annotations
+
+from .parsers.base import DiagramEdge, DiagramIR
+
+# Distinct labels listed on a merged edge before summarizing the rest
+MAX_MERGED_LABELS = 3
+
+
+def merged_label(labels: list[str], count: int) -> str:
+    """Label for ``count`` merged edges carrying ``labels`` (in order).
+
+    The count is always shown; distinct labels are listed a line each
+    with the count on a line of its own.
+    """
+    unique = list(dict.fromkeys(label for label in labels if label))
+    if not unique:
+        return f"×{count}"
+    if len(unique) == 1:
+        return f"{unique[0]} ×{count}"
+    shown = unique[:MAX_MERGED_LABELS]
+    if len(unique) > MAX_MERGED_LABELS:
+        shown.append(f"+{len(unique) - MAX_MERGED_LABELS} more")
+    shown.append(f"×{count}")
+    return "<br>".join(shown)
+
+
+def merge_duplicate_edges(ir: DiagramIR) -> int:
+    """Merge duplicate cell-ref edges in-place; return how many were removed.
+
+    The first edge of each duplicate set keeps its id and position in
+    ir.edges. Point-based (sequence) edges are never merged.
+    """
+    groups: dict[tuple, list[DiagramEdge]] = {}
+    kept: list[DiagramEdge] = []
+    for edge in ir.edges:
+        if edge.source_x is not None:
+            kept.append(edge)
+            continue
+        key = (edge.source, edge.target, edge.edge_type, edge.style_override)
+        bucket = groups.get(key)
+        if bucket is None:
+            groups[key] = [edge]
+            kept.append(edge)
+        else:
+            bucket.append(edge)
+
+    removed = len(ir.edges) - len(kept)
+    if not removed:
+        return 0
+    for bucket in groups.values():
+        if len(bucket) > 1:
+            bucket[0].label = merged_label([e.label for e in bucket], len(bucket))
+    ir.edges = kept
+    return removed
@@ -43,12 +43,16 @@ def wrap_in_mxgraph_div(encoded_xml: str) -> str:
     """Wrap encoded XML in a draw.io viewer div element.
 
     The div uses single-quoted data-mxgraph attribute containing JSON
-    with navigation, resize, fit, and toolbar options.
+    with navigation, resize, fit, and toolbar options. Multi-page
+    <mxfile> documents also get the viewer's page selector.
     """
+    toolbar = "zoom layers lightbox"
+    if encoded_xml.startswith("&lt;mxfile"):
+        toolbar = "pages " + toolbar
     return (
         '<div class="mxgraph" data-mxgraph=\''
         '{"nav":true,"resize":true,"fit":true,"center":true,'
-        '"toolbar":"zoom layers lightbox","page":0,'
+        f'"toolbar":"{toolbar}","page":0,'
         f'"xml":"{encoded_xml}"}}'
         "'></div>"
     )
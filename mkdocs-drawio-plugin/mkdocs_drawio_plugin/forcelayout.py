@@ -0,0 +1,252 @@
+"""
+Force-directed layout engine (Fruchterman–Reingold with Barnes–Hut).
+
+An alternative to the rank-based layout for small-world graphs such as
+C4 context diagrams, where ranking produces long crossing edges. Nodes
+repel each other and edges pull their endpoints together; repulsion is
+approximated with a Barnes–Hut quadtree, so each iteration costs
+O(n log n) instead of O(n^2).
+
+Results are deterministic: initial positions come from a seeded RNG and
+every loop runs in node order. After the simulation a spatial-index
+sweep pushes apart any node boxes that still overlap.
+"""
+
+from __future__ import annotations
+
+import random
+from math import sqrt
+
+from .parsers.base import DiagramEdge, DiagramNode
+from .spatial import SpatialIndex
+from . import styles
+
+DEFAULT_SEED = 42
+THETA = 1.0  # Barnes–Hut opening criterion (larger = coarser, faster)
+MIN_ITERATIONS = 40
+MAX_ITERATIONS = 300
+OVERLAP_SWEEPS = 8
+# Linear pull toward the centroid; keeps disconnected or leaf-heavy
+# graphs from drifting apart (cloud radius ~ k * sqrt(n / GRAVITY)).
+GRAVITY = 1.5
+
+_MAX_DEPTH = 24
+
+
+class _Quad:
+    """Quadtree cell holding either one body or four children."""
+
+    __slots__ = ("cx", "cy", "half", "mass", "mx", "my", "body", "children")
+
+    def __init__(self, cx: float, cy: float, half: float):
+        self.cx = cx
+        self.cy = cy
+        self.half = half
+        self.mass = 0
+        self.mx = 0.0  # mass-weighted sum of x (centre of mass * mass)
+        self.my = 0.0
+        self.body = -1
+        self.children: list[_Quad] | None = None
+
+    def insert(
+        self,
+        idx: int,
+        x: float,
+        y: float,
+        xs: list[float],
+        ys: list[float],
+        depth: int = 0,
+    ) -> None:
+        """Add body ``idx`` at (x, y); ``xs``/``ys`` locate resident bodies."""
+        quad = self
+        while True:
+            quad.mass += 1
+            quad.mx += x
+            quad.my += y
+            if quad.children is None:
+                if quad.body < 0 and quad.mass == 1:
+                    quad.body = idx
+                    return
+                if depth >= _MAX_DEPTH:
+                    return  # coincident points: keep aggregated mass only
+                # Split: push the resident body down one level
+                resident = quad.body
+                quad.body = -1
+                h = quad.half / 2
+                quad.children = [
+                    _Quad(quad.cx - h, quad.cy - h, h),
+                    _Quad(quad.cx + h, quad.cy - h, h),
+                    _Quad(quad.cx - h, quad.cy + h, h),
+                    _Quad(quad.cx + h, quad.cy + h, h),
+                ]
+                if resident >= 0:
+                    rx, ry = xs[resident], ys[resident]
+                    child = quad.children[(rx >= quad.cx) + 2 * (ry >= quad.cy)]
+                    child.insert(resident, rx, ry, xs, ys, depth + 1)
+            quad = quad.children[(x >= quad.cx) + 2 * (y >= quad.cy)]
+            depth += 1
+
+
+def _build_tree(xs: list[float], ys: list[float]) -> _Quad:
+    min_x, max_x = min(xs), max(xs)
+    min_y, max_y = min(ys), max(ys)
+    half = max(max_x - min_x, max_y - min_y) / 2 + 1.0
+    root = _Quad((min_x + max_x) / 2, (min_y + max_y) / 2, half)
+    for i in range(len(xs)):
+        root.insert(i, xs[i], ys[i], xs, ys)
+    return root
+
+
+def _repulsion(
+    i: int, x: float, y: float, root: _Quad, k2: float,
+) -> tuple[float, float]:
+    """Approximate total repulsive force on body i (magnitude k^2 / d)."""
+    fx = fy = 0.0
+    stack = [root]
+    theta2 = THETA * THETA
+    while stack:
+        quad = stack.pop()
+        mass = quad.mass
+        if quad.children is None and quad.body == i:
+            mass -= 1  # don't repel from itself
+        if mass <= 0:
+            continue
+
+        dx = x - quad.mx / quad.mass
+        dy = y - quad.my / quad.mass
+        d2 = dx * dx + dy * dy
+        if quad.children is not None:
+            size = 2 * quad.half
+            if size * size >= theta2 * d2:
+                stack.extend(quad.children)  # too close to approximate
+                continue
+
+        if d2 < 1e-6:
+            # Coincident points: nudge apart deterministically
+            dx, dy, d2 = 0.1 * (i % 7 - 3) + 0.05, 0.1, 0.02
+        scale = mass * k2 / d2  # (k^2 / d) along unit vector (dx, dy) / d
+        fx += dx * scale
+        fy += dy * scale
+    return fx, fy
+
+
+def _remove_overlaps(
+    nodes: list[DiagramNode], xs: list[float], ys: list[float],
+) -> None:
+    """Push overlapping boxes apart along the axis of least overlap."""
+    gap = styles.NODE_SPACING_H / 2
+    for _ in range(OVERLAP_SWEEPS):
+        index = SpatialIndex(
+            cell_size=max(max(n.width, n.height) for n in nodes) * 2,
+        )
+        for i, n in enumerate(nodes):
+            index.insert(
+                i, xs[i] - n.width / 2, ys[i] - n.height / 2,
+                n.width + gap, n.height + gap,
+            )
+        moved = False
+        for i, n in enumerate(nodes):
+            x0 = xs[i] - n.width / 2
+            y0 = ys[i] - n.height / 2
+            for j in sorted(index.query(x0, y0, x0 + n.width + gap, y0 + n.height + gap)):
+                if j <= i:
+                    continue
+                m = nodes[j]
+                over_x = (n.width + m.width) / 2 + gap - abs(xs[i] - xs[j])
+                over_y = (n.height + m.height) / 2 + gap - abs(ys[i] - ys[j])
+                if over_x <= 0 or over_y <= 0:
+                    continue
+                moved = True
+                if over_x < over_y:
+                    shift = over_x / 2 if xs[j] >= xs[i] else -over_x / 2
+                    xs[i] -= shift
+                    xs[j] += shift
+                else:
+                    shift = over_y / 2 if ys[j] >= ys[i] else -over_y / 2
+                    ys[i] -= shift
+                    ys[j] += shift
+        if not moved:
+            return
+
+
+def force_layout(
+    nodes: list[DiagramNode],
+    edges: list[DiagramEdge],
+    seed: int = DEFAULT_SEED,
+    iterations: int | None = None,
+) -> dict[str, tuple[float, float]]:
+    """Compute force-directed top-left positions for ``nodes``.
+
+    Positions are normalized so the bounding box starts at (0, 0).
+    """
+    n = len(nodes)
+    if n == 0:
+        return {}
+    if n == 1:
+        return {nodes[0].id: (0.0, 0.0)}
+
+    index = {node.id: i for i, node in enumerate(nodes)}
+    links = [
+        (index[e.source], index[e.target])
+        for e in edges
+        if e.source_x is None
+        and e.source in index and e.target in index and e.source != e.target
+    ]
+
+    # Ideal edge length: typical node extent plus the usual spacing
+    k = sum(max(nd.width, nd.height) for nd in nodes) / n + styles.NODE_SPACING_H
+    k2 = k * k
+
+    rng = random.Random(seed)
+    side = sqrt(n) * k
+    xs = [rng.uniform(0, side) for _ in range(n)]
+    ys = [rng.uniform(0, side) for _ in range(n)]
+
+    if iterations is None:
+        iterations = int(min(MAX_ITERATIONS, max(MIN_ITERATIONS, 3000 / sqrt(n))))
+    temperature = side / 10
+    cooling = temperature / (iterations + 1)
+
+    for _ in range(iterations):
+        root = _build_tree(xs, ys)
+        dxs = [0.0] * n
+        dys = [0.0] * n
+        for i in range(n):
+            dxs[i], dys[i] = _repulsion(i, xs[i], ys[i], root, k2)
+
+        cx = sum(xs) / n
+        cy = sum(ys) / n
+        for i in range(n):
+            dxs[i] -= GRAVITY * (xs[i] - cx)
+            dys[i] -= GRAVITY * (ys[i] - cy)
+
+        for a, b in links:
+            dx = xs[a] - xs[b]
+            dy = ys[a] - ys[b]
+            d = sqrt(dx * dx + dy * dy) or 0.01
+            pull = d / k  # (d^2 / k) along unit vector
+            dxs[a] -= dx * pull
+            dys[a] -= dy * pull
+            dxs[b] += dx * pull
+            dys[b] += dy * pull
+
+        for i in range(n):
+            dx, dy = dxs[i], dys[i]
+            length = sqrt(dx * dx + dy * dy)
+            if length > 0:
+                step = min(length, temperature) / length
+                xs[i] += dx * step
+                ys[i] += dy * step
+        temperature -= cooling
+
+    _remove_overlaps(nodes, xs, ys)
+
+    # Centres -> top-left corners, normalized to the origin
+    lefts = [xs[i] - nodes[i].width / 2 for i in range(n)]
+    tops = [ys[i] - nodes[i].height / 2 for i in range(n)]
+    min_x = min(lefts)
+    min_y = min(tops)
+    return {
+        nodes[i].id: (round(lefts[i] - min_x, 1), round(tops[i] - min_y, 1))
+        for i in range(n)
+    }
@@ -18,8 +18,25 @@ from ..parsers.base import (
     NodeShape,
     SequenceParticipant,
 )
+from ..minify import minify_model
+from ..options import get_options
+from ..stylesheet import compact_style
 from .. import styles
 
+# Shape -> style for nodes without a semantic role (default: compute)
+_SHAPE_STYLES = {
+    NodeShape.DIAMOND: styles.SHAPE_DECISION,
+    NodeShape.START_END: styles.SHAPE_START_END,
+    NodeShape.ERROR_END: styles.SHAPE_ERROR_END,
+    NodeShape.PARALLELOGRAM: styles.SHAPE_PARALLELOGRAM,
+    NodeShape.HEXAGON: styles.SHAPE_HEXAGON,
+    NodeShape.UML_CLASS: styles.SHAPE_UML_CLASS,
+    NodeShape.CYLINDER: styles.NODE_DATABASE,
+    NodeShape.PERSON: styles.NODE_PERSON,
+    NodeShape.CIRCLE: styles.SHAPE_START_END,
+    NodeShape.FORK_JOIN: styles.FORK_JOIN_BAR,
+}
+
 
 def _resolve_node_style(node: DiagramNode) -> str:
     """Resolve the style string for a node."""
@@ -27,27 +44,12 @@ def _resolve_node_style(node: DiagramNode) -> str:
         return node.style_override
 
     # Check semantic role first
-    if node.semantic_role and node.semantic_role in styles.NODE_STYLES:
-        return styles.NODE_STYLES[node.semantic_role]
-
-    # Map shape to style
-    shape_map = {
-        NodeShape.DIAMOND: styles.SHAPE_DECISION,
-        NodeShape.START_END: styles.SHAPE_START_END,
-        NodeShape.ERROR_END: styles.SHAPE_ERROR_END,
-        NodeShape.PARALLELOGRAM: styles.SHAPE_PARALLELOGRAM,
-        NodeShape.HEXAGON: styles.SHAPE_HEXAGON,
-        NodeShape.UML_CLASS: styles.SHAPE_UML_CLASS,
-        NodeShape.CYLINDER: styles.NODE_DATABASE,
-        NodeShape.PERSON: styles.NODE_PERSON,
-        NodeShape.CIRCLE: styles.SHAPE_START_END,
-    }
-
-    if node.shape in shape_map:
-        return shape_map[node.shape]
+    if node.semantic_role:
+        style = styles.NODE_STYLES.get(node.semantic_role)
+        if style is not None:
+            return style
 
-    # Default: compute style
-    return styles.NODE_COMPUTE
+    return _SHAPE_STYLES.get(node.shape, styles.NODE_COMPUTE)
 
 
 def _resolve_edge_style(edge: DiagramEdge) -> str:
@@ -59,6 +61,33 @@ def _resolve_edge_style(edge: DiagramEdge) -> str:
     return styles.EDGE_STYLES.get(type_key, styles.EDGE_SYNC)
 
 
+def _resolve_group_style(group: DiagramGroup) -> str:
+    """Resolve draw.io style for a group container."""
+    if group.style_override:
+        return group.style_override
+    return styles.GROUP_STYLES.get(group.group_type, styles.GROUP_SUCCESS)
+
+
+def groups_parents_first(groups: list[DiagramGroup]) -> list[DiagramGroup]:
+    """Order groups so every group follows its parent group.
+
+    draw.io resolves a cell's parent while decoding, so nested containers
+    must come after the container that holds them.
+    """
+    by_id = {g.id: g for g in groups}
+    emitted: set[str] = set()
+    ordered: list[DiagramGroup] = []
+    for group in groups:
+        chain: list[DiagramGroup] = []
+        current: DiagramGroup | None = group
+        while current is not None and current.id not in emitted:
+            emitted.add(current.id)  # also guards against parent cycles
+            chain.append(current)
+            current = by_id.get(current.parent_group or "")
+        ordered.extend(reversed(chain))
+    return ordered
+
+
 def build_vertex_cell(
     cell_id: str,
     value: str,
@@ -87,6 +116,21 @@ def build_vertex_cell(
     return cell
 
 
+def with_link(cell: Element, link: str) -> Element:
+    """Wrap a vertex cell in a UserObject carrying a click-through link.
+
+    draw.io stores links on a UserObject that owns the id and label; the
+    inner mxCell keeps style and geometry. ``data:page/id,<page id>``
+    links jump to another page of the same file.
+    """
+    obj = Element("UserObject")
+    obj.set("label", cell.attrib.pop("value", ""))
+    obj.set("link", link)
+    obj.set("id", cell.attrib.pop("id"))
+    obj.append(cell)
+    return obj
+
+
 def build_edge_cell(
     cell_id: str,
     value: str,
@@ -94,8 +138,13 @@ def build_edge_cell(
     source_id: str,
     target_id: str,
     parent: str = "1",
+    points: list[tuple[float, float]] | None = None,
 ) -> Element:
-    """Build an mxCell element for an edge using source/target cell IDs."""
+    """Build an mxCell element for an edge using source/target cell IDs.
+
+    Optional ``points`` are written as an ``<Array as="points">`` of
+    waypoints so the viewer follows the build-time route.
+    """
     cell = Element("mxCell")
     cell.set("id", cell_id)
     cell.set("value", value)
@@ -109,6 +158,14 @@ def build_edge_cell(
     geo.set("relative", "1")
     geo.set("as", "geometry")
 
+    if points:
+        array = SubElement(geo, "Array")
+        array.set("as", "points")
+        for px, py in points:
+            point = SubElement(array, "mxPoint")
+            point.set("x", str(px))
+            point.set("y", str(py))
+
     return cell
 
 
@@ -160,11 +217,21 @@ def build_group_cell(
     width: float,
     height: float,
     parent: str = "1",
+    alternate_bounds: tuple[float, float] | None = None,
 ) -> Element:
-    """Build an mxCell for a group/container."""
+    """Build an mxCell for a group/container.
+
+    With ``alternate_bounds`` (expanded width, height) the group is
+    emitted as a collapsed container: the geometry is the collapsed box
+    and the viewer swaps in the alternate bounds when it is expanded.
+    Child cells are kept but not drawn until then.
+    """
     cell = Element("mxCell")
     cell.set("id", cell_id)
     cell.set("value", value)
+    if alternate_bounds is not None:
+        style = style + "container=1;collapsible=1;"
+        cell.set("collapsed", "1")
     cell.set("style", style)
     cell.set("vertex", "1")
     cell.set("parent", parent)
@@ -175,16 +242,79 @@ def build_group_cell(
     geo.set("width", str(width))
     geo.set("height", str(height))
     geo.set("as", "geometry")
+    if alternate_bounds is not None:
+        alt = SubElement(geo, "mxRectangle")
+        alt.set("x", str(x))
+        alt.set("y", str(y))
+        alt.set("width", str(alternate_bounds[0]))
+        alt.set("height", str(alternate_bounds[1]))
+        alt.set("as", "alternateBounds")
 
     return cell
 
 
+def serialize(element: Element) -> str:
+    """Serialize a finished mxGraphModel/mxfile element to a string.
+
+    Every generator's output goes through here, so output profiles apply
+    in one place: with ConvertOptions.named_styles, registered style
+    strings are replaced by their stylesheet names; with
+    ConvertOptions.minify_xml, the minified profile (minify.py) is applied.
+    """
+    options = get_options()
+    if options.named_styles:
+        for cell in element.iter("mxCell"):
+            style = cell.get("style")
+            if style:
+                cell.set("style", compact_style(style))
+    if options.minify_xml:
+        minify_model(element)
+    return tostring(element, encoding="unicode")
+
+
+# Page of a multi-page <mxfile> that links to all the others
+OVERVIEW_PAGE_ID = "overview"
+
+_LINK_WIDTH = 160
+_LINK_HEIGHT = 20
+
+
+def add_overview_link(page: DiagramIR) -> None:
+    """Add a link back to the overview above the laid-out content."""
+    page.nodes.append(DiagramNode(
+        id="back_to_overview",
+        label="◀ Overview",
+        x=50, y=5, width=_LINK_WIDTH, height=_LINK_HEIGHT,
+        style_override=styles.TEXT_PAGE_LINK,
+        link=f"data:page/id,{OVERVIEW_PAGE_ID}",
+    ))
+
+
+def build_mxfile(pages: list[tuple[str, str, Element]]) -> str:
+    """Combine (page id, page name, mxGraphModel element) into an <mxfile>.
+
+    Pages are stored uncompressed; the viewer shows a page selector.
+    """
+    mxfile = Element("mxfile")
+    for page_id, name, model in pages:
+        diagram = SubElement(mxfile, "diagram")
+        diagram.set("id", page_id)
+        diagram.set("name", name)
+        diagram.append(model)
+    return serialize(mxfile)
+
+
 def ir_to_xml(ir: DiagramIR) -> str:
     """Convert a DiagramIR to mxGraphModel XML string.
 
     This is the default generator that handles most diagram types.
     Specialized generators (sequence, ERD) override this for type-specific logic.
     """
+    return serialize(ir_to_model(ir))
+
+
+def ir_to_model(ir: DiagramIR) -> Element:
+    """Build the <mxGraphModel> element for a DiagramIR (see ir_to_xml)."""
     root_elem = Element("mxGraphModel")
     root = SubElement(root_elem, "root")
 
@@ -196,13 +326,15 @@ def ir_to_xml(ir: DiagramIR) -> str:
     cell1.set("parent", "0")
 
     # Groups first (so they render behind nodes)
-    for group in ir.groups:
-        style = group.style_override or styles.GROUP_STYLES.get(
-            group.group_type, styles.GROUP_SUCCESS
-        )
+    group_ids = {g.id for g in ir.groups}
+    for group in groups_parents_first(ir.groups):
+        style = _resolve_group_style(group)
+        parent = group.parent_group if group.parent_group in group_ids else "1"
         cell = build_group_cell(
             group.id, group.label, style,
             group.x, group.y, group.width, group.height,
+            parent=parent,
+            alternate_bounds=group.alternate_bounds if group.collapsed else None,
         )
         root.append(cell)
 
@@ -215,6 +347,8 @@ def ir_to_xml(ir: DiagramIR) -> str:
             node.x, node.y, node.width, node.height,
             parent=parent,
         )
+        if node.link:
+            cell = with_link(cell, node.link)
         root.append(cell)
 
     # Sequence participants + lifelines
@@ -253,7 +387,8 @@ def ir_to_xml(ir: DiagramIR) -> str:
             cell = build_edge_cell(
                 edge.id, edge.label, style,
                 edge.source, edge.target,
+                points=edge.waypoints,
             )
         root.append(cell)
 
-    return tostring(root_elem, encoding="unicode")
+    return root_elem
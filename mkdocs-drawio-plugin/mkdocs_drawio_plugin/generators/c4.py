@@ -2,10 +2,13 @@
 C4 diagram generator — converts C4 DiagramIR to draw.io XML.
 
 Uses the base ir_to_xml with appropriate styling per C4 level.
+Relationship ends declared in another C4 block on the site are added
+from the site-wide registry (see c4registry).
 """
 
 from __future__ import annotations
 
+from ..c4registry import add_referenced_elements
 from ..parsers.base import DiagramIR
 from ..layout import auto_layout
 from .base import ir_to_xml
@@ -13,5 +16,6 @@ from .base import ir_to_xml
 
 def generate(ir: DiagramIR) -> str:
     """Generate draw.io XML from a C4 DiagramIR."""
+    add_referenced_elements(ir)
     auto_layout(ir)
     return ir_to_xml(ir)
@@ -0,0 +1,105 @@
+"""
+Class diagram generator — converts class DiagramIR to draw.io XML.
+
+Each class is a UML swimlane (SHAPE_UML_CLASS): the header holds the
+name (and «annotation»), followed by an attribute compartment, a rule,
+and an operation compartment, each row a child cell like the ERD field
+rows. Namespaces are groups and relationships use the UML edge styles
+(EDGE_INHERITANCE, EDGE_COMPOSITION, ...) through the shared edge
+resolution.
+"""
+
+from __future__ import annotations
+
+import html
+from dataclasses import replace
+from xml.etree.ElementTree import Element
+
+from ..parsers.base import DiagramIR, DiagramNode
+from ..layout import auto_layout
+from .. import styles
+from ..textmetrics import LABEL_PADDING_H, label_lines, measure_label, round_up, style_font
+from .base import build_vertex_cell, ir_to_model, serialize
+
+
+def _header_height(node: DiagramNode) -> float:
+    """Swimlane header height: one line, plus one per «annotation» line."""
+    extra = len(label_lines(node.label)) - 1
+    return styles.UML_HEADER_HEIGHT + extra * styles.UML_HEADER_LINE_HEIGHT
+
+
+def _compartment_height(rows: list[str]) -> float:
+    if not rows:
+        return styles.UML_EMPTY_COMPARTMENT_HEIGHT
+    return len(rows) * styles.UML_MEMBER_HEIGHT
+
+
+def _class_size(node: DiagramNode) -> tuple[float, float]:
+    """(width, height) fitting the header and the widest member row."""
+    header_font = style_font(styles.SHAPE_UML_CLASS)
+    member_font = style_font(styles.UML_MEMBER)
+    widest = measure_label(node.label, *header_font)[0]
+    for row in node.fields + node.methods:
+        widest = max(widest, measure_label(html.escape(row, quote=False), *member_font)[0])
+    width = max(float(styles.UML_CLASS_WIDTH), round_up(widest + 2 * LABEL_PADDING_H))
+    height = (
+        _header_height(node)
+        + _compartment_height(node.fields)
+        + styles.UML_DIVIDER_HEIGHT
+        + _compartment_height(node.methods)
+    )
+    return width, height
+
+
+def _build_class_cells(node: DiagramNode) -> list[Element]:
+    """Swimlane cell for a class, then its compartment rows."""
+    header = _header_height(node)
+    style = styles.SHAPE_UML_CLASS
+    if header != styles.UML_HEADER_HEIGHT:
+        style = style.replace(
+            f"startSize={styles.UML_HEADER_HEIGHT:g};", f"startSize={header:g};",
+        )
+    cells = [build_vertex_cell(
+        node.id, node.label, style,
+        node.x, node.y, node.width, node.height,
+        parent=node.parent_group or "1",
+    )]
+
+    def add_rows(rows: list[str], prefix: str, y: float) -> float:
+        for i, row in enumerate(rows):
+            cells.append(build_vertex_cell(
+                f"{node.id}_{prefix}{i}", html.escape(row, quote=False),
+                styles.UML_MEMBER, 0, y, node.width, styles.UML_MEMBER_HEIGHT,
+                parent=node.id,
+            ))
+            y += styles.UML_MEMBER_HEIGHT
+        return y if rows else y + styles.UML_EMPTY_COMPARTMENT_HEIGHT
+
+    y = add_rows(node.fields, "a", header)
+    cells.append(build_vertex_cell(
+        f"{node.id}_rule", "", styles.UML_DIVIDER,
+        0, y, node.width, styles.UML_DIVIDER_HEIGHT,
+        parent=node.id,
+    ))
+    add_rows(node.methods, "m", y + styles.UML_DIVIDER_HEIGHT)
+    return cells
+
+
+def generate(ir: DiagramIR) -> str:
+    """Generate draw.io XML from a class DiagramIR."""
+    for node in ir.nodes:
+        node.width, node.height = _class_size(node)
+
+    auto_layout(ir)
+
+    # Reserved cells, namespaces and relationships from the shared model;
+    # class cells go between the groups and the edges
+    model = ir_to_model(replace(ir, nodes=[]))
+    root = model.find("root")
+    position = 2 + len(ir.groups)
+    for node in ir.nodes:
+        for cell in _build_class_cells(node):
+            root.insert(position, cell)
+            position += 1
+
+    return serialize(model)
@@ -3,16 +3,44 @@ ERD generator — converts ERD DiagramIR to draw.io XML with UML class boxes.
 
 ERD entities use swimlane-style cells with a header row and field rows.
 Each field is a child cell inside the swimlane.
+
+With erd_render="table" each entity is instead a single cell whose label
+is an HTML table (header, field rows, key badges). Large schemas then
+need about one cell per table instead of one per column, which keeps the
+viewer's load time down. Geometry is identical in both renderings.
+
+ERDs with more entities than ConvertOptions.erd_area_entities are split
+into subject areas by relationship connectivity (see areas.py) and
+emitted as a multi-page <mxfile>: an overview with one linked
+placeholder per area, and a page per area. A relationship leaving an
+area ends in a linked stub entity pointing at the other area's page.
 """
 
 from __future__ import annotations
 
-from xml.etree.ElementTree import Element, SubElement, tostring
+import html
+import re
+from dataclasses import replace
+from xml.etree.ElementTree import Element, SubElement
 
-from ..parsers.base import DiagramIR, DiagramNode
+from ..areas import subject_areas
+from ..parsers.base import DiagramEdge, DiagramIR, DiagramNode
 from ..layout import auto_layout
+from ..options import get_options
 from .. import styles
-from .base import build_edge_cell, _resolve_edge_style
+from ..textmetrics import LABEL_PADDING_H, measure_label, round_up, style_font
+from .base import (
+    OVERVIEW_PAGE_ID,
+    add_overview_link,
+    build_edge_cell,
+    build_mxfile,
+    build_vertex_cell,
+    ir_to_model,
+    serialize,
+    with_link,
+    _resolve_edge_style,
+    _resolve_node_style,
+)
 
 
 def _build_entity_cells(
@@ -63,17 +91,81 @@ def _build_entity_cells(
         root.append(field_cell)
 
 
-def generate(ir: DiagramIR) -> str:
-    """Generate draw.io XML from an ERD DiagramIR."""
-    # Set entity dimensions based on field count
+# Key badge the parser appends to a field row ("id: int [PK]  comment")
+_BADGE_RE = re.compile(r" \[([A-Z]+)\]")
+
+
+def _table_label(node: DiagramNode, header_fill: str, border: str) -> str:
+    """HTML-table label for a single-cell entity."""
+    rows = [
+        f'<tr><td colspan="2" style="height:{styles.ERD_ENTITY_HEADER_HEIGHT - 1}px;'
+        f"background:{header_fill};border-bottom:1px solid {border};"
+        f'text-align:center;font-weight:bold;color:#000000">'
+        f"{html.escape(node.label, quote=False)}</td></tr>"
+    ]
+    for field_text in node.fields:
+        badge = ""
+        match = _BADGE_RE.search(field_text)
+        if match:
+            key = match.group(1)
+            color = styles.ERD_BADGE_COLORS.get(key, border)
+            badge = f'<b style="color:{color}">{key}</b>'
+            field_text = field_text[:match.start()] + field_text[match.end():]
+        rows.append(
+            f'<tr><td style="height:{styles.ERD_FIELD_HEIGHT}px;padding:0 4px">'
+            f"{html.escape(field_text, quote=False)}</td>"
+            f'<td style="padding:0 4px;text-align:right">{badge}</td></tr>'
+        )
+    return (
+        '<table style="width:100%;border-collapse:collapse">'
+        + "".join(rows)
+        + "</table>"
+    )
+
+
+def _build_entity_table(node: DiagramNode, root: Element) -> None:
+    """Build one HTML-table cell for an ERD entity."""
+    header_fill, border = styles.ERD_TABLE_COLORS.get(
+        node.store_type or "relational", styles.ERD_TABLE_COLORS["relational"]
+    )
+    cell = Element("mxCell")
+    cell.set("id", node.id)
+    cell.set("value", _table_label(node, header_fill, border))
+    cell.set("style", f"{styles.ERD_TABLE}strokeColor={border};")
+    cell.set("vertex", "1")
+    cell.set("parent", node.parent_group or "1")
+
+    geo = SubElement(cell, "mxGeometry")
+    geo.set("x", str(node.x))
+    geo.set("y", str(node.y))
+    geo.set("width", str(node.width))
+    geo.set("height", str(node.height))
+    geo.set("as", "geometry")
+    root.append(cell)
+
+
+def _entity_width(node: DiagramNode) -> float:
+    """Width that fits the entity name and its widest field row."""
+    header_font = style_font(styles.ERD_RELATIONAL)
+    field_font = style_font(styles.ERD_FIELD)
+    widest = measure_label(node.label, *header_font)[0]
+    for field_text in node.fields:
+        widest = max(widest, measure_label(field_text, *field_font)[0])
+    return max(
+        float(styles.ERD_ENTITY_WIDTH), round_up(widest + 2 * LABEL_PADDING_H),
+    )
+
+
+def _size_entities(ir: DiagramIR) -> None:
+    """Set entity dimensions based on field count and text width."""
     for node in ir.nodes:
-        node.width = styles.ERD_ENTITY_WIDTH
+        node.width = _entity_width(node)
         field_height = len(node.fields) * styles.ERD_FIELD_HEIGHT
         node.height = styles.ERD_ENTITY_HEADER_HEIGHT + max(field_height, 40)
 
-    auto_layout(ir)
 
-    # Build XML
+def _erd_model(ir: DiagramIR) -> Element:
+    """Build the <mxGraphModel> element for laid-out entities."""
     root_elem = Element("mxGraphModel")
     root = SubElement(root_elem, "root")
 
@@ -83,9 +175,20 @@ def generate(ir: DiagramIR) -> str:
     cell1.set("id", "1")
     cell1.set("parent", "0")
 
-    # Entities
+    # Entities; linked nodes (area stubs, back link) are plain cells
+    build_entity = (
+        _build_entity_table if get_options().erd_render == "table"
+        else _build_entity_cells
+    )
     for node in ir.nodes:
-        _build_entity_cells(node, root)
+        if node.link:
+            cell = build_vertex_cell(
+                node.id, node.label, _resolve_node_style(node),
+                node.x, node.y, node.width, node.height,
+            )
+            root.append(with_link(cell, node.link))
+        else:
+            build_entity(node, root)
 
     # Edges
     for edge in ir.edges:
@@ -93,7 +196,128 @@ def generate(ir: DiagramIR) -> str:
         cell = build_edge_cell(
             edge.id, edge.label, style,
             edge.source, edge.target,
+            points=edge.waypoints,
         )
         root.append(cell)
 
-    return tostring(root_elem, encoding="unicode")
+    return root_elem
+
+
+def _area_page_id(index: int) -> str:
+    return f"area-{index + 1}"
+
+
+def _hub(ir: DiagramIR, area: list[str]) -> DiagramNode:
+    """The area's entity with the most relationships inside the area."""
+    members = set(area)
+    links = dict.fromkeys(area, 0)
+    for e in ir.edges:
+        if e.source in members and e.target in members and e.source != e.target:
+            links[e.source] += 1
+            links[e.target] += 1
+    by_id = {n.id: n for n in ir.nodes}
+    return by_id[max(area, key=links.__getitem__)]
+
+
+def _overview_page(
+    ir: DiagramIR, areas: list[list[str]], names: list[str], owner: dict[str, int],
+) -> DiagramIR:
+    """One linked placeholder per area; relationships between two areas
+    become one edge labelled with their count."""
+    nodes = [
+        DiagramNode(
+            id=_area_page_id(i),
+            label=f"{name} ({len(area)} entities)",
+            style_override=styles.PAGE_PLACEHOLDER,
+            link=f"data:page/id,{_area_page_id(i)}",
+        )
+        for i, (area, name) in enumerate(zip(areas, names))
+    ]
+    counts: dict[tuple[int, int], int] = {}
+    for e in ir.edges:
+        pair = (owner.get(e.source), owner.get(e.target))
+        if None not in pair and pair[0] != pair[1]:
+            counts[pair] = counts.get(pair, 0) + 1
+    edges = [
+        DiagramEdge(
+            id=f"area_link_{n}",
+            source=_area_page_id(a),
+            target=_area_page_id(b),
+            label=f"{count} relationship{'s' if count > 1 else ''}",
+        )
+        for n, ((a, b), count) in enumerate(counts.items())
+    ]
+    return DiagramIR(
+        diagram_type=ir.diagram_type, title=ir.title, layout=ir.layout,
+        nodes=nodes, edges=edges,
+    )
+
+
+def _area_page(
+    ir: DiagramIR, areas: list[list[str]], index: int, owner: dict[str, int],
+) -> DiagramIR:
+    """Entities of one area; outside ends become linked stub entities."""
+    by_id = {n.id: n for n in ir.nodes}
+    nodes = [by_id[nid] for nid in areas[index]]
+
+    stubs: dict[str, DiagramNode] = {}
+
+    def endpoint(node_id: str) -> str:
+        if owner.get(node_id) == index:
+            return node_id
+        if node_id not in stubs:
+            other = owner.get(node_id)
+            node = by_id.get(node_id)
+            page_id = _area_page_id(other) if other is not None else OVERVIEW_PAGE_ID
+            stubs[node_id] = DiagramNode(
+                id=f"{node_id}__ref",
+                label=f"↗ {node.label if node else node_id}",
+                width=styles.ERD_ENTITY_WIDTH,
+                height=styles.ERD_ENTITY_HEADER_HEIGHT,
+                style_override=styles.PAGE_REFERENCE,
+                link=f"data:page/id,{page_id}",
+            )
+        return stubs[node_id].id
+
+    edges = [
+        replace(e, source=endpoint(e.source), target=endpoint(e.target), waypoints=[])
+        for e in ir.edges
+        if owner.get(e.source) == index or owner.get(e.target) == index
+    ]
+    return DiagramIR(
+        diagram_type=ir.diagram_type, title=ir.title, layout=ir.layout,
+        nodes=nodes + list(stubs.values()), edges=edges,
+    )
+
+
+def generate(ir: DiagramIR, pages: list[tuple[str, DiagramIR]] | None = None) -> str:
+    """Generate draw.io XML from an ERD DiagramIR.
+
+    Returns a multi-page <mxfile> when the ERD has more entities than the
+    configured area size and splits into at least two areas, otherwise a
+    single <mxGraphModel>. A ``pages`` list receives the (name, laid-out
+    IR) of every page of a multi-page file.
+    """
+    _size_entities(ir)
+
+    limit = get_options().erd_area_entities
+    areas = subject_areas(ir, limit) if limit and len(ir.nodes) > limit else []
+    if len(areas) < 2:
+        auto_layout(ir)
+        return serialize(_erd_model(ir))
+
+    owner = {nid: i for i, area in enumerate(areas) for nid in area}
+    names = [_hub(ir, area).label for area in areas]
+    overview = _overview_page(ir, areas, names, owner)
+    auto_layout(overview)
+    models = [(OVERVIEW_PAGE_ID, "Overview", ir_to_model(overview))]
+    laid_out = [("Overview", overview)]
+    for i, name in enumerate(names):
+        page = _area_page(ir, areas, i, owner)
+        auto_layout(page)
+        add_overview_link(page)
+        models.append((_area_page_id(i), name, _erd_model(page)))
+        laid_out.append((name, page))
+    if pages is not None:
+        pages.extend(laid_out)
+    return build_mxfile(models)
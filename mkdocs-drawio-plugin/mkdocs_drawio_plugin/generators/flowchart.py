@@ -3,16 +3,159 @@ Flowchart generator — converts flowchart DiagramIR to draw.io XML.
 
 Uses the base ir_to_xml function since flowcharts follow the standard
 node+edge pattern without special handling.
+
+Very large flowcharts (see ConvertOptions.flowchart_page_nodes) with
+several top-level subgraphs are emitted as a multi-page <mxfile>: an
+overview page where each subgraph is a linked placeholder, plus one page
+per subgraph holding its contents. Edges leaving a subgraph end in a
+linked reference to the page that holds the other end. The viewer only
+parses and renders the page being viewed.
 """
 
 from __future__ import annotations
 
-from ..parsers.base import DiagramIR
+from dataclasses import replace
+
+from ..parsers.base import DiagramEdge, DiagramGroup, DiagramIR, DiagramNode
+from ..edgemerge import merge_duplicate_edges
 from ..layout import auto_layout
-from .base import ir_to_xml
+from ..options import get_options
+from .. import styles
+from .base import OVERVIEW_PAGE_ID, add_overview_link, build_mxfile, ir_to_model, ir_to_xml
+
+
+def _page_id(group_id: str) -> str:
+    return f"page-{group_id}"
+
+
+def _top_level_owner(ir: DiagramIR) -> dict[str, str | None]:
+    """Map every node and group ID to its top-level subgraph (None if free)."""
+    parent = {g.id: g.parent_group for g in ir.groups}
+
+    def top_of(gid: str) -> str:
+        hops = 0  # guards against parent cycles
+        while parent[gid] in parent and hops <= len(parent):
+            gid, hops = parent[gid], hops + 1
+        return gid
+
+    owner: dict[str, str | None] = {gid: top_of(gid) for gid in parent}
+    for n in ir.nodes:
+        owner[n.id] = owner.get(n.parent_group) if n.parent_group else None
+    return owner
+
+
+def _overview_page(
+    ir: DiagramIR, top_groups: list[DiagramGroup], owner: dict[str, str | None],
+) -> DiagramIR:
+    """Free nodes plus one linked placeholder per top-level subgraph."""
+    counts: dict[str, int] = {}
+    for n in ir.nodes:
+        if owner[n.id] is not None:
+            counts[owner[n.id]] = counts.get(owner[n.id], 0) + 1
+
+    nodes = [replace(n, parent_group=None) for n in ir.nodes if owner[n.id] is None]
+    for g in top_groups:
+        nodes.append(DiagramNode(
+            id=g.id,
+            label=f"{g.label} ({counts.get(g.id, 0)} nodes)",
+            style_override=styles.PAGE_PLACEHOLDER,
+            link=f"data:page/id,{_page_id(g.id)}",
+        ))
+
+    edges = []
+    lifted = DiagramIR(diagram_type=ir.diagram_type)
+    for e in ir.edges:
+        source = owner.get(e.source) or e.source
+        target = owner.get(e.target) or e.target
+        if source == target and source != e.source:
+            continue  # internal to one subgraph
+        moved = replace(e, source=source, target=target, waypoints=[])
+        if (source, target) == (e.source, e.target):
+            edges.append(moved)
+        else:
+            lifted.edges.append(moved)
+    # Lifted edges summarize the links between subgraphs, so each pair is
+    # drawn once whether or not merge_edges is enabled
+    merge_duplicate_edges(lifted)
+    edges.extend(lifted.edges)
+    return DiagramIR(
+        diagram_type=ir.diagram_type, title=ir.title, layout=ir.layout,
+        nodes=nodes, edges=edges,
+    )
+
+
+def _subgraph_page(
+    ir: DiagramIR, gid: str, owner: dict[str, str | None],
+) -> DiagramIR:
+    """Contents of one top-level subgraph; outside ends become references."""
+    labels = {n.id: n.label for n in ir.nodes}
+
+    def lift(parent: str | None) -> str | None:
+        return None if parent == gid else parent
+
+    nodes = [
+        replace(n, parent_group=lift(n.parent_group))
+        for n in ir.nodes if owner[n.id] == gid
+    ]
+    groups = [
+        replace(g, parent_group=lift(g.parent_group))
+        for g in ir.groups if g.id != gid and owner.get(g.id) == gid
+    ]
+
+    refs: dict[str, DiagramNode] = {}
+
+    def endpoint(node_id: str) -> str:
+        if owner.get(node_id) == gid:
+            return node_id
+        if node_id not in refs:
+            other = owner.get(node_id)
+            refs[node_id] = DiagramNode(
+                id=f"{node_id}__ref",
+                label=f"↗ {labels.get(node_id, node_id)}",
+                style_override=styles.PAGE_REFERENCE,
+                link=f"data:page/id,{_page_id(other) if other else OVERVIEW_PAGE_ID}",
+            )
+        return refs[node_id].id
+
+    edges: list[DiagramEdge] = []
+    for e in ir.edges:
+        if owner.get(e.source) != gid and owner.get(e.target) != gid:
+            continue
+        edges.append(replace(
+            e, source=endpoint(e.source), target=endpoint(e.target), waypoints=[],
+        ))
+    return DiagramIR(
+        diagram_type=ir.diagram_type, title=ir.title, layout=ir.layout,
+        nodes=nodes + list(refs.values()), edges=edges, groups=groups,
+    )
+
+
+def generate(ir: DiagramIR, pages: list[tuple[str, DiagramIR]] | None = None) -> str:
+    """Generate draw.io XML from a flowchart DiagramIR.
 
+    Returns a multi-page <mxfile> when the flowchart has more nodes than
+    the configured page threshold and at least two top-level subgraphs,
+    otherwise a single <mxGraphModel>. A ``pages`` list receives the
+    (name, laid-out IR) of every page of a multi-page file.
+    """
+    threshold = get_options().flowchart_page_nodes
+    group_ids = {g.id for g in ir.groups}
+    top_groups = [g for g in ir.groups if g.parent_group not in group_ids]
+    if not threshold or len(ir.nodes) <= threshold or len(top_groups) < 2:
+        auto_layout(ir)
+        return ir_to_xml(ir)
 
-def generate(ir: DiagramIR) -> str:
-    """Generate draw.io XML from a flowchart DiagramIR."""
-    auto_layout(ir)
-    return ir_to_xml(ir)
+    owner = _top_level_owner(ir)
+    overview = _overview_page(ir, top_groups, owner)
+    auto_layout(overview)
+    models = [(OVERVIEW_PAGE_ID, "Overview", ir_to_model(overview))]
+    laid_out = [("Overview", overview)]
+    for group in top_groups:
+        page = _subgraph_page(ir, group.id, owner)
+        auto_layout(page)
+        add_overview_link(page)
+        models.append((_page_id(group.id), group.label, ir_to_model(page)))
+        laid_out.append((group.label, page))
+    if pages is not None:
+        pages.extend(laid_out)
+    return build_mxfile(models)
@@ -4,19 +4,134 @@ Sequence diagram generator — converts sequence DiagramIR to draw.io XML.
 CRITICAL: Message arrows use explicit sourcePoint/targetPoint coordinates,
 NOT source/target cell ID references. Using cell ID references causes
 arrows to connect to participant header boxes, producing broken diagrams.
+
+Long traces are split into pages (see ConvertOptions.sequence_page_messages)
+and emitted as a multi-page <mxfile>. Every page repeats the participant
+headers, blocks cut by a page break are drawn on both pages, and
+continuation links jump between neighbouring pages.
 """
 
 from __future__ import annotations
 
-from ..parsers.base import DiagramIR
+from dataclasses import replace
+
+from ..parsers.base import DiagramIR, DiagramNode
 from ..layout import layout_sequence
-from .base import ir_to_xml
+from ..options import get_options
+from .. import styles
+from .base import build_mxfile, ir_to_model, ir_to_xml
+
+_LINK_WIDTH = 200
+_LINK_HEIGHT = 20
+
 
+def _page_id(number: int) -> str:
+    return f"page-{number}"
+
+
+def _split_pages(ir: DiagramIR, per_page: int) -> list[DiagramIR]:
+    """Cut the message list into page-sized IRs.
+
+    Cell IDs get a per-page suffix after page 1, so every page is a
+    self-contained model. A block appears on each page holding one of its
+    messages (or a nested block's message); copies after the first are
+    labelled as continued.
+    """
+    parent = {g.id: g.parent_group for g in ir.groups}
+    groups = {g.id: g for g in ir.groups}
+    chunks = [ir.edges[i:i + per_page] for i in range(0, len(ir.edges), per_page)]
 
-def generate(ir: DiagramIR) -> str:
+    pages = []
+    seen_blocks: set[str] = set()
+    for number, chunk in enumerate(chunks, start=1):
+        suffix = "" if number == 1 else f"_p{number}"
+
+        present: list[str] = []
+        for edge in chunk:
+            gid = edge.parent_group
+            while gid in groups and gid not in present:
+                present.append(gid)
+                gid = parent[gid]
+        page_groups = []
+        for g in ir.groups:  # keep source order
+            if g.id not in present:
+                continue
+            label = f"{g.label} (continued)" if g.id in seen_blocks else g.label
+            page_groups.append(replace(
+                g,
+                id=g.id + suffix,
+                label=label,
+                parent_group=(g.parent_group + suffix) if g.parent_group else None,
+            ))
+        seen_blocks.update(present)
+
+        pages.append(DiagramIR(
+            diagram_type=ir.diagram_type,
+            title=ir.title,
+            layout=ir.layout,
+            participants=[replace(p, id=p.id + suffix) for p in ir.participants],
+            edges=[
+                replace(
+                    e,
+                    id=e.id + suffix,
+                    source=e.source + suffix,
+                    target=e.target + suffix,
+                    parent_group=(e.parent_group + suffix) if e.parent_group in groups else None,
+                )
+                for e in chunk
+            ],
+            groups=page_groups,
+        ))
+    return pages
+
+
+def _continuation_links(page: DiagramIR, number: int, total: int) -> None:
+    """Add links to the previous/next page, centred on the lifelines."""
+    left = page.participants[0].x
+    right = page.participants[-1].x + page.participants[-1].width
+    x = (left + right) / 2 - _LINK_WIDTH / 2
+    bottom = page.participants[0].lifeline_end_y
+    if number > 1:
+        page.nodes.append(DiagramNode(
+            id=f"continued_from_{number}",
+            label=f"▲ Continued from page {number - 1}",
+            x=x, y=5, width=_LINK_WIDTH, height=_LINK_HEIGHT,
+            style_override=styles.TEXT_PAGE_LINK,
+            link=f"data:page/id,{_page_id(number - 1)}",
+        ))
+    if number < total:
+        page.nodes.append(DiagramNode(
+            id=f"continued_on_{number}",
+            label=f"Continued on page {number + 1} ▼",
+            x=x, y=bottom + 10, width=_LINK_WIDTH, height=_LINK_HEIGHT,
+            style_override=styles.TEXT_PAGE_LINK,
+            link=f"data:page/id,{_page_id(number + 1)}",
+        ))
+
+
+def generate(ir: DiagramIR, pages: list[tuple[str, DiagramIR]] | None = None) -> str:
     """Generate draw.io XML from a sequence DiagramIR.
 
     Handles participant positioning, lifelines, and point-based message edges.
+    Returns a multi-page <mxfile> when the message count exceeds the
+    configured page size, otherwise a single <mxGraphModel>. A ``pages``
+    list receives the (name, laid-out IR) of every page of a multi-page
+    file.
     """
-    layout_sequence(ir)
-    return ir_to_xml(ir)
+    per_page = get_options().sequence_page_messages
+    if not per_page or len(ir.edges) <= per_page or not ir.participants:
+        layout_sequence(ir)
+        return ir_to_xml(ir)
+
+    split = _split_pages(ir, per_page)
+    models = []
+    for number, page in enumerate(split, start=1):
+        layout_sequence(page)
+        _continuation_links(page, number, len(split))
+        first = (number - 1) * per_page + 1
+        last = min(number * per_page, len(ir.edges))
+        name = f"Page {number} (messages {first}–{last})"
+        models.append((_page_id(number), name, ir_to_model(page)))
+        if pages is not None:
+            pages.append((name, page))
+    return build_mxfile(models)
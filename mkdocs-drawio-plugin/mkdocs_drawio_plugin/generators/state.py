@@ -0,0 +1,38 @@
+"""
+State diagram generator — converts state DiagramIR to draw.io XML.
+
+Uses the base ir_to_xml after giving pseudo-states their compact
+geometry: [*] circles, <<choice>> diamonds and <<fork>>/<<join>> bars
+(drawn across the flow direction).
+"""
+
+from __future__ import annotations
+
+from ..parsers.base import DiagramIR, LayoutDirection, NodeShape
+from ..layout import auto_layout
+from .. import styles
+from .base import ir_to_xml
+
+
+def _size_pseudo_states(ir: DiagramIR) -> None:
+    """Set the fixed sizes of unlabelled pseudo-states in-place."""
+    across = ir.layout == LayoutDirection.LR
+    for node in ir.nodes:
+        if node.label:
+            continue
+        if node.shape == NodeShape.START_END:
+            node.width = node.height = styles.STATE_PSEUDO_SIZE
+        elif node.shape == NodeShape.DIAMOND:
+            node.width = node.height = styles.STATE_CHOICE_SIZE
+        elif node.shape == NodeShape.FORK_JOIN:
+            node.width, node.height = styles.STATE_BAR_LENGTH, styles.STATE_BAR_THICKNESS
+            if across:
+                node.width, node.height = node.height, node.width
+                node.style_override = styles.FORK_JOIN_BAR + "direction=south;"
+
+
+def generate(ir: DiagramIR) -> str:
+    """Generate draw.io XML from a state DiagramIR."""
+    _size_pseudo_states(ir)
+    auto_layout(ir)
+    return ir_to_xml(ir)
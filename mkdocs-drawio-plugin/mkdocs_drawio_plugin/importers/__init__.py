@@ -0,0 +1 @@
+"""Importers that build DiagramIR from sources other than Mermaid."""
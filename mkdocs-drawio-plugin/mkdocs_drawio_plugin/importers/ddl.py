@@ -0,0 +1,488 @@
+"""
+SQL DDL importer — builds an ERD DiagramIR from schema dumps and migrations.
+
+Reads the script a line at a time and keeps only the schema, so
+multi-MB pg_dump / mysqldump output (including COPY data and INSERT
+statements, which are skipped as they stream past) needs no database
+and little memory. Migration files can be fed in order.
+
+Supported statements:
+  CREATE TABLE [IF NOT EXISTS] name ( columns and table constraints )
+  ALTER TABLE name ADD [COLUMN] ..., ADD [CONSTRAINT c] PRIMARY KEY (...),
+      ADD [CONSTRAINT c] FOREIGN KEY (...) REFERENCES t (...),
+      ADD [CONSTRAINT c] UNIQUE (...), DROP [COLUMN] name
+  CREATE [UNIQUE] INDEX ... ON name (...)
+  DROP TABLE [IF EXISTS] name, ...
+
+Columns become entity fields ("name: type [PK]", as in the erDiagram
+parser); a column shows one key badge, PK before FK before UK. Unique
+constraints and unique indexes mark their column UK only when they
+cover a single column. Each foreign key is an edge from the referenced
+table to the referencing one, labelled with the key columns and the
+cardinalities implied by their NOT NULL and unique constraints.
+
+Names may be quoted ("x", `x`, [x]) and schema-qualified. Table names
+match case-insensitively, and the default schemas (public, dbo, main)
+are dropped so "public.orders" and "orders" are the same table.
+Tables referenced but never created are added without fields.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Iterable, Iterator, Optional
+
+from ..parsers.base import (
+    DiagramEdge,
+    DiagramIR,
+    DiagramNode,
+    DiagramType,
+    EdgeType,
+    LayoutDirection,
+    NodeShape,
+    Source,
+    source_lines,
+)
+
+_DEFAULT_SCHEMAS = frozenset({"public", "dbo", "main"})
+
+# Statements whose text is kept; everything else is skipped while read
+_KEPT_STATEMENTS = frozenset({"CREATE", "ALTER", "DROP", "COPY"})
+_FIRST_WORD_RE = re.compile(r"\s*([A-Za-z]+)\W")
+
+# Outside strings and comments: the next token that changes the scan state
+_SPECIAL_RE = re.compile(r"--|/\*|'|\"|`|\$[A-Za-z_]*\$|;")
+# Rest of a single-quoted string, with '' and backslash escapes
+_SINGLE_QUOTE_END_RE = re.compile(r"(?:[^'\\]|\\.|'')*'")
+
+_COPY_FROM_STDIN_RE = re.compile(r"^\s*COPY\b.*\bFROM\s+STDIN\b", re.IGNORECASE | re.DOTALL)
+
+_IDENT = r'(?:"[^"]+"|`[^`]+`|\[[^\]]+\]|[\w$]+)'
+_NAME = rf"{_IDENT}(?:\s*\.\s*{_IDENT})*"
+_IDENT_PART_RE = re.compile(r'"([^"]+)"|`([^`]+)`|\[([^\]]+)\]|([\w$]+)')
+
+_CREATE_TABLE_RE = re.compile(
+    r"^CREATE\s+(?:OR\s+REPLACE\s+)?(?:(?:GLOBAL|LOCAL)\s+)?"
+    r"(?:(?:TEMP|TEMPORARY|UNLOGGED)\s+)?TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?"
+    rf"({_NAME})\s*\(",
+    re.IGNORECASE,
+)
+_ALTER_TABLE_RE = re.compile(
+    rf"^ALTER\s+TABLE\s+(?:IF\s+EXISTS\s+)?(?:ONLY\s+)?({_NAME})\s+(.*)$",
+    re.IGNORECASE | re.DOTALL,
+)
+_CREATE_INDEX_RE = re.compile(
+    r"^CREATE\s+(UNIQUE\s+)?(?:(?:CLUSTERED|NONCLUSTERED)\s+)?INDEX\s+"
+    r"(?:CONCURRENTLY\s+)?(?:IF\s+NOT\s+EXISTS\s+)?"
+    rf"(?:{_NAME}\s+)?ON\s+(?:ONLY\s+)?({_NAME})\s*(?:USING\s+\w+\s*)?\(",
+    re.IGNORECASE,
+)
+_DROP_TABLE_RE = re.compile(
+    rf"^DROP\s+TABLE\s+(?:IF\s+EXISTS\s+)?({_NAME}(?:\s*,\s*{_NAME})*)",
+    re.IGNORECASE,
+)
+
+# Table elements (CREATE TABLE body items and ALTER TABLE ADD actions)
+_CONSTRAINT_NAME_RE = re.compile(rf"^CONSTRAINT\s+{_IDENT}\s*", re.IGNORECASE)
+_PRIMARY_KEY_RE = re.compile(
+    r"^PRIMARY\s+KEY\s*(?:(?:CLUSTERED|NONCLUSTERED)\s+)?\(([^)]*)\)", re.IGNORECASE,
+)
+_FOREIGN_KEY_RE = re.compile(
+    rf"^FOREIGN\s+KEY\s*(?:{_IDENT}\s*)?\(([^)]*)\)\s*REFERENCES\s+({_NAME})",
+    re.IGNORECASE,
+)
+_UNIQUE_RE = re.compile(
+    rf"^UNIQUE\s*(?:(?:KEY|INDEX)\s+)?(?:{_IDENT}\s*)?\(([^)]*)\)", re.IGNORECASE,
+)
+# Elements without fields or relationships (plain indexes, checks, ...)
+_SKIPPED_ELEMENT_RE = re.compile(
+    rf"^(?:(?:(?:FULLTEXT|SPATIAL)\s+)?(?:KEY|INDEX)\s+(?:{_IDENT}\s*)?"
+    r"(?:USING\s+\w+\s*)?\(|CHECK\s*\(|EXCLUDE\b|LIKE\s|PERIOD\s+FOR\b)",
+    re.IGNORECASE,
+)
+_COLUMN_RE = re.compile(rf"^({_IDENT})\s*(.*)$", re.DOTALL)
+# Where a column's type ends and its constraints begin
+_TYPE_END_RE = re.compile(
+    r"\b(?:CONSTRAINT|NOT|NULL|DEFAULT|PRIMARY|REFERENCES|UNIQUE|CHECK|"
+    r"GENERATED|COLLATE|AUTO_INCREMENT|AUTOINCREMENT|COMMENT|IDENTITY)\b",
+    re.IGNORECASE,
+)
+_NOT_NULL_RE = re.compile(r"\bNOT\s+NULL\b", re.IGNORECASE)
+_INLINE_PRIMARY_RE = re.compile(r"\bPRIMARY\s+KEY\b", re.IGNORECASE)
+_INLINE_UNIQUE_RE = re.compile(r"\bUNIQUE\b", re.IGNORECASE)
+_INLINE_REFERENCES_RE = re.compile(rf"\bREFERENCES\s+({_NAME})", re.IGNORECASE)
+
+# ALTER TABLE actions
+_ADD_RE = re.compile(
+    r"^ADD\s+(COLUMN\s+)?(?:IF\s+NOT\s+EXISTS\s+)?(.*)$", re.IGNORECASE | re.DOTALL,
+)
+_DROP_COLUMN_RE = re.compile(
+    rf"^DROP\s+(?:COLUMN\s+)?(?:IF\s+EXISTS\s+)?({_IDENT})", re.IGNORECASE,
+)
+_TABLE_CONSTRAINT_RE = re.compile(r"^(?:CONSTRAINT|PRIMARY|FOREIGN|UNIQUE)\b", re.IGNORECASE)
+
+# Top-level structure of a statement: parentheses and commas outside quotes
+_NESTING_RE = re.compile(r"""[(),]|'[^']*'|"[^"]*"|`[^`]*`""")
+
+_BADGE_ORDER = ("PK", "FK", "UK")
+
+
+def _find_close(line: str, pos: int, close: str) -> int:
+    """Index just past the end of the open string or comment, or -1."""
+    if close == "'":
+        m = _SINGLE_QUOTE_END_RE.match(line, pos)
+        return m.end() if m else -1
+    end = line.find(close, pos)
+    return end + len(close) if end >= 0 else -1
+
+
+def _statements(lines: Iterable[str]) -> Iterator[str]:
+    """Top-level statements of a SQL script, without comments.
+
+    Only CREATE / ALTER / DROP / COPY statements are kept in memory; the
+    rest (INSERT data, SET, SELECT ...) is scanned for its end and
+    dropped. Data after COPY ... FROM stdin is skipped up to its "\\."
+    line, and a line holding only GO ends a statement (SQL Server).
+    """
+    parts: list[str] = []
+    keep: Optional[bool] = None  # undecided until the first word is read
+    close: Optional[str] = None  # what ends the open string or comment
+    copy_data = False
+
+    def add(text: str) -> None:
+        nonlocal keep
+        if keep is False or not text:
+            return
+        parts.append(text)
+        if keep is None:
+            m = _FIRST_WORD_RE.match("".join(parts))
+            if m is not None:
+                keep = m.group(1).upper() in _KEPT_STATEMENTS
+                if not keep:
+                    parts.clear()
+
+    def finish() -> Optional[str]:
+        nonlocal keep
+        text = "".join(parts) if keep is not False else ""
+        parts.clear()
+        keep = None
+        return text if text.strip() else None
+
+    for line in lines:
+        if copy_data:
+            copy_data = line.rstrip() != "\\."
+            continue
+        if close is None and line.strip().upper() == "GO":
+            text = finish()
+            if text is not None:
+                yield text
+            continue
+
+        pos = 0
+        while True:
+            if close is not None:
+                end = _find_close(line, pos, close)
+                if end < 0:
+                    if close != "*/":
+                        add(line[pos:] + "\n")
+                    break
+                add(line[pos:end] if close != "*/" else " ")
+                pos, close = end, None
+                continue
+
+            m = _SPECIAL_RE.search(line, pos)
+            if m is None:
+                add(line[pos:] + "\n")
+                break
+            add(line[pos:m.start()])
+            token = m.group()
+            pos = m.end()
+            if token == ";":
+                text = finish()
+                if text is not None:
+                    if _COPY_FROM_STDIN_RE.match(text):
+                        # Data rows follow on the next line
+                        copy_data = True
+                        break
+                    yield text
+            elif token == "--":
+                add("\n")
+                break
+            elif token == "/*":
+                close = "*/"
+            else:
+                add(token)
+                close = token
+
+    text = finish()
+    if text is not None and not _COPY_FROM_STDIN_RE.match(text):
+        yield text
+
+
+def _parenthesized(text: str, start: int) -> str:
+    """Contents of the parentheses opening at text[start]."""
+    depth = 0
+    for m in _NESTING_RE.finditer(text, start):
+        token = m.group()
+        if token == "(":
+            depth += 1
+        elif token == ")":
+            depth -= 1
+            if depth == 0:
+                return text[start + 1:m.start()]
+    return text[start + 1:]
+
+
+def _split_top_level(text: str) -> list[str]:
+    """Split on commas outside parentheses and quotes."""
+    items = []
+    depth = 0
+    begin = 0
+    for m in _NESTING_RE.finditer(text):
+        token = m.group()
+        if token == "(":
+            depth += 1
+        elif token == ")":
+            depth -= 1
+        elif token == "," and depth == 0:
+            items.append(text[begin:m.start()].strip())
+            begin = m.end()
+    items.append(text[begin:].strip())
+    return [item for item in items if item]
+
+
+def _name(text: str) -> str:
+    """Unquoted name, without a default schema."""
+    parts = [
+        next(g for g in m.groups() if g)
+        for m in _IDENT_PART_RE.finditer(text)
+    ]
+    if len(parts) > 1 and parts[0].lower() in _DEFAULT_SCHEMAS:
+        parts = parts[1:]
+    return ".".join(parts)
+
+
+def _column_names(text: str) -> list[str]:
+    """Column names of a "(a, b DESC, ...)" list."""
+    names = []
+    for item in text.split(","):
+        m = _IDENT_PART_RE.search(item)
+        if m is not None:
+            names.append(next(g for g in m.groups() if g))
+    return names
+
+
+class _Column:
+    __slots__ = ("name", "type", "keys", "not_null")
+
+    def __init__(self, name: str, type_: str):
+        self.name = name
+        self.type = type_
+        self.keys: set[str] = set()
+        self.not_null = False
+
+    def field(self) -> str:
+        """Field row text in the erDiagram parser's format."""
+        text = f"{self.name}: {self.type}" if self.type else self.name
+        for key in _BADGE_ORDER:
+            if key in self.keys:
+                return f"{text} [{key}]"
+        return text
+
+
+class _Table:
+    __slots__ = ("name", "columns")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.columns: dict[str, _Column] = {}
+
+    def column(self, name: str) -> Optional[_Column]:
+        return self.columns.get(name.lower())
+
+    def mark(self, names: list[str], key: str) -> None:
+        for name in names:
+            col = self.column(name)
+            if col is not None:
+                col.keys.add(key)
+                if key == "PK":
+                    col.not_null = True
+
+
+class _ForeignKey:
+    __slots__ = ("child", "parent", "columns")
+
+    def __init__(self, child: str, parent: str, columns: list[str]):
+        self.child = child
+        self.parent = parent
+        self.columns = columns
+
+
+class _Schema:
+    """Tables and foreign keys as the statements are applied."""
+
+    def __init__(self) -> None:
+        self.tables: dict[str, _Table] = {}
+        self.foreign_keys: list[_ForeignKey] = []
+        self.dropped: set[str] = set()
+        # Display name of every referenced table, in first-seen order
+        self.referenced: dict[str, str] = {}
+
+    def apply(self, statement: str) -> None:
+        text = " ".join(statement.split())
+        m = _CREATE_TABLE_RE.match(text)
+        if m is not None:
+            table = self.create_table(_name(m.group(1)))
+            for item in _split_top_level(_parenthesized(text, m.end() - 1)):
+                self.add_element(table, item)
+            return
+        m = _ALTER_TABLE_RE.match(text)
+        if m is not None:
+            table = self.table(_name(m.group(1)))
+            for action in _split_top_level(m.group(2)):
+                self.alter(table, action)
+            return
+        m = _CREATE_INDEX_RE.match(text)
+        if m is not None:
+            columns = _column_names(_parenthesized(text, m.end() - 1))
+            if m.group(1) and len(columns) == 1:
+                self.table(_name(m.group(2))).mark(columns, "UK")
+            return
+        m = _DROP_TABLE_RE.match(text)
+        if m is not None:
+            for name in _split_top_level(m.group(1)):
+                self.drop_table(_name(name))
+
+    def create_table(self, name: str) -> _Table:
+        key = name.lower()
+        if key in self.tables:
+            # Created again: its old foreign keys go with the old columns
+            self.foreign_keys = [fk for fk in self.foreign_keys if fk.child != key]
+        table = self.tables[key] = _Table(name)
+        self.dropped.discard(key)
+        return table
+
+    def table(self, name: str) -> _Table:
+        """Existing table, or a new one for ALTER / CREATE INDEX on a
+        table created outside the script."""
+        table = self.tables.get(name.lower())
+        return table if table is not None else self.create_table(name)
+
+    def drop_table(self, name: str) -> None:
+        key = name.lower()
+        if self.tables.pop(key, None) is not None:
+            self.dropped.add(key)
+            self.foreign_keys = [fk for fk in self.foreign_keys if fk.child != key]
+
+    def add_foreign_key(self, table: _Table, columns: list[str], parent: str) -> None:
+        table.mark(columns, "FK")
+        self.referenced.setdefault(parent.lower(), parent)
+        self.foreign_keys.append(_ForeignKey(table.name.lower(), parent.lower(), columns))
+
+    def add_element(self, table: _Table, item: str) -> None:
+        """Apply a column definition or table constraint."""
+        item = _CONSTRAINT_NAME_RE.sub("", item, count=1)
+        m = _PRIMARY_KEY_RE.match(item)
+        if m is not None:
+            table.mark(_column_names(m.group(1)), "PK")
+            return
+        m = _FOREIGN_KEY_RE.match(item)
+        if m is not None:
+            self.add_foreign_key(table, _column_names(m.group(1)), _name(m.group(2)))
+            return
+        m = _UNIQUE_RE.match(item)
+        if m is not None:
+            columns = _column_names(m.group(1))
+            if len(columns) == 1:
+                table.mark(columns, "UK")
+            return
+        if _SKIPPED_ELEMENT_RE.match(item):
+            return
+        self.add_column(table, item)
+
+    def add_column(self, table: _Table, definition: str) -> None:
+        m = _COLUMN_RE.match(definition)
+        if m is None:
+            return
+        name = _name(m.group(1))
+        rest = m.group(2)
+        end = _TYPE_END_RE.search(rest)
+        constraints = rest[end.start():] if end else ""
+        column = _Column(name, (rest[:end.start()] if end else rest).strip())
+        table.columns[name.lower()] = column
+        if _NOT_NULL_RE.search(constraints):
+            column.not_null = True
+        if _INLINE_PRIMARY_RE.search(constraints):
+            table.mark([name], "PK")
+        elif _INLINE_UNIQUE_RE.search(constraints):
+            table.mark([name], "UK")
+        ref = _INLINE_REFERENCES_RE.search(constraints)
+        if ref is not None:
+            self.add_foreign_key(table, [name], _name(ref.group(1)))
+
+    def alter(self, table: _Table, action: str) -> None:
+        m = _ADD_RE.match(action)
+        if m is not None:
+            if m.group(1) or not _TABLE_CONSTRAINT_RE.match(m.group(2)):
+                self.add_column(table, m.group(2))
+            else:
+                self.add_element(table, m.group(2))
+            return
+        m = _DROP_COLUMN_RE.match(action)
+        if m is not None and m.group(1).upper() != "CONSTRAINT":
+            table.columns.pop(_name(m.group(1)).lower(), None)
+
+    def edge(self, fk: _ForeignKey, index: int) -> DiagramEdge:
+        """Edge from the referenced table, with cardinalities."""
+        child = self.tables[fk.child]
+        columns = [child.column(name) for name in fk.columns]
+        known = [col for col in columns if col is not None]
+        required = bool(known) and all(col.not_null for col in known)
+        unique = len(known) == 1 and bool(known[0].keys & {"PK", "UK"})
+        names = ", ".join(col.name if col else name for col, name in zip(columns, fk.columns))
+        return DiagramEdge(
+            id=f"fk_{index}",
+            source=fk.parent,
+            target=fk.child,
+            label=f"{'1' if required else '0..1'}  {names}  {'0..1' if unique else '0..*'}",
+            edge_type=EdgeType.SYNC,
+        )
+
+    def to_ir(self) -> DiagramIR:
+        nodes = [
+            DiagramNode(
+                id=key,
+                label=table.name,
+                shape=NodeShape.UML_CLASS,
+                fields=[col.field() for col in table.columns.values()],
+                store_type="relational",
+            )
+            for key, table in self.tables.items()
+        ]
+        # Referenced tables the script never creates
+        for key, name in self.referenced.items():
+            if key not in self.tables and key not in self.dropped:
+                nodes.append(DiagramNode(
+                    id=key, label=name, shape=NodeShape.UML_CLASS,
+                    store_type="relational",
+                ))
+        edges = [
+            self.edge(fk, i)
+            for i, fk in enumerate(
+                fk for fk in self.foreign_keys if fk.parent not in self.dropped
+            )
+        ]
+        return DiagramIR(
+            diagram_type=DiagramType.ERD,
+            layout=LayoutDirection.LR,
+            nodes=nodes,
+            edges=edges,
+        )
+
+
+def parse(source: Source) -> DiagramIR:
+    """Build an ERD DiagramIR from SQL DDL (text or lines)."""
+    schema = _Schema()
+    for statement in _statements(source_lines(source)):
+        schema.apply(statement)
+    return schema.to_ir()
@@ -0,0 +1,489 @@
+"""
+Trace importer — builds a sequence DiagramIR from recorded OpenTelemetry spans.
+
+Reads OTLP-style JSON a line at a time: JSON Lines holding export
+batches ({"resourceSpans": [...]}, as the collector's file exporter
+writes them) or single span objects. When the first line opens a JSON
+value that it does not close, the file is read whole as one document
+(an export batch or an array of spans), so only line-delimited files
+stay within the memory bounds below. Other malformed lines, and spans
+with malformed fields, are skipped and counted in the diagram title.
+
+Each trace becomes a list of messages between services: a span whose
+service differs from its parent span's is a request from the parent's
+service (or from "Client" for root spans, and from "Unknown caller"
+when the parent span is missing) at the span's start, and a response
+(or error) at its end. Producer/consumer spans are one-way.
+Calls within a service are left out.
+
+Aggregation:
+  - Repeated runs of messages (up to _MAX_LOOP_BODY messages long) fold
+    into one loop block ("LOOP: ×3", "×2–8" over many traces).
+  - Traces with the same folded shape (loop counts aside) are counted
+    together; the diagram shows the most frequent shapes, each in a
+    block labelled with its share of traces, until max_messages is
+    reached. The top shape is truncated if it alone is over budget.
+
+Memory stays bounded for any number of spans: at most max_open_traces
+traces are assembled at once (the least recently updated is finished
+early when another arrives), a trace keeps at most max_trace_spans
+spans, and at most max_shapes distinct shapes are counted. The IDs of
+the last max_finished_traces finished traces are remembered, so spans
+arriving after their trace was finished are dropped rather than
+starting a new trace.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from collections import OrderedDict
+from typing import Any, Iterator, NamedTuple, Optional
+
+from ..parsers.base import (
+    DiagramEdge,
+    DiagramGroup,
+    DiagramIR,
+    DiagramType,
+    EdgeType,
+    LayoutDirection,
+    SequenceParticipant,
+    Source,
+    source_lines,
+)
+from ..parsers.sequence import _guess_role
+
+DEFAULT_TRACE_MESSAGES = 100
+DEFAULT_MAX_OPEN_TRACES = 1000
+DEFAULT_MAX_TRACE_SPANS = 10_000
+DEFAULT_MAX_SHAPES = 10_000
+DEFAULT_MAX_FINISHED_TRACES = 100_000
+
+_CLIENT = "Client"
+# Caller of a span whose parent span is not in the trace
+_UNKNOWN_CALLER = "Unknown caller"
+
+# Longest message run folded into a loop
+_MAX_LOOP_BODY = 8
+
+# OTLP span kinds: enum numbers and SPAN_KIND_* names
+_KINDS = {1: "internal", 2: "server", 3: "client", 4: "producer", 5: "consumer"}
+_ONE_WAY_KINDS = frozenset({"producer", "consumer"})
+_STATUS_ERROR = (2, "STATUS_CODE_ERROR", "ERROR")
+
+_PARTICIPANT_ID_RE = re.compile(r"\W")
+
+
+class _Span(NamedTuple):
+    span_id: str
+    parent_id: str
+    service: str
+    name: str
+    kind: str
+    start: int
+    end: int
+    error: bool
+
+
+# A message: (source service, target service, label, edge type)
+_Message = tuple[str, str, str, EdgeType]
+
+
+class _Loop(NamedTuple):
+    """A run of messages repeated back to back."""
+
+    repeats: int
+    body: tuple[_Message, ...]
+
+
+def _attributes(attrs: Any) -> dict[str, Any]:
+    """OTLP [{"key": k, "value": {"stringValue": v}}] or a plain dict."""
+    if isinstance(attrs, dict):
+        return attrs
+    out = {}
+    for attr in attrs or ():
+        value = attr.get("value")
+        if isinstance(value, dict):
+            value = next(iter(value.values()), None)
+        out[attr.get("key")] = value
+    return out
+
+
+def _service(resource: Any) -> Optional[str]:
+    if not isinstance(resource, dict):
+        return None
+    attrs = _attributes(resource.get("attributes", resource))
+    service = attrs.get("service.name")
+    return str(service) if service is not None else None
+
+
+def _kind(value: Any) -> str:
+    if isinstance(value, int):
+        return _KINDS.get(value, "internal")
+    return str(value or "internal").rsplit("_", 1)[-1].rsplit(".", 1)[-1].lower()
+
+
+def _span(raw: dict, service: Optional[str], arrival: int) -> Optional[tuple[_Span, str]]:
+    """(span, trace ID) from a span's OTLP JSON (camelCase or snake_case).
+
+    None when the span has no IDs; ValueError, TypeError or
+    AttributeError when a field has the wrong type.
+    """
+    trace_id = raw.get("traceId", raw.get("trace_id"))
+    span_id = raw.get("spanId", raw.get("span_id"))
+    if not trace_id or not span_id:
+        return None
+    parent_id = raw.get("parentSpanId", raw.get("parent_span_id")) or ""
+    if not all(isinstance(i, str) for i in (trace_id, span_id, parent_id)):
+        raise TypeError("span IDs must be strings")
+    status = raw.get("status") or {}
+    start = int(raw.get("startTimeUnixNano", raw.get("start_time_unix_nano")) or arrival)
+    end = int(raw.get("endTimeUnixNano", raw.get("end_time_unix_nano")) or start)
+    return _Span(
+        span_id=span_id,
+        parent_id=parent_id,
+        service=(
+            _service(raw.get("resource")) or raw.get("serviceName") or service or "unknown"
+        ),
+        name=str(raw.get("name") or ""),
+        kind=_kind(raw.get("kind")),
+        start=start,
+        end=end,
+        error=status.get("code", status.get("status_code")) in _STATUS_ERROR,
+    ), trace_id
+
+
+def _opens_document(line: str, exc: json.JSONDecodeError) -> bool:
+    """Whether a line that failed to parse starts a multi-line document."""
+    stripped = line.strip()
+    return stripped[:1] in ("{", "[") and exc.pos >= len(line.rstrip())
+
+
+def _documents(lines: Iterator[str], agg: _Aggregator) -> Iterator[Any]:
+    """JSON values of a JSON Lines file, or the one value of a JSON file.
+
+    Only a first line that opens an object or array and breaks off at
+    its end makes the file one document; other malformed lines are
+    skipped and counted in agg.bad_lines.
+    """
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            doc = json.loads(line)
+        except json.JSONDecodeError as exc:
+            if not _opens_document(line, exc):
+                agg.bad_lines += 1
+                break
+            # Not line-delimited: the whole file may be one document
+            rest = list(lines)
+            try:
+                doc = json.loads("\n".join([line, *rest]))
+            except json.JSONDecodeError:
+                agg.bad_lines += 1
+                lines = iter(rest)
+            else:
+                yield doc
+                return
+        else:
+            yield doc
+        break
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            doc = json.loads(line)
+        except json.JSONDecodeError:
+            agg.bad_lines += 1
+            continue
+        yield doc
+
+
+def _checked_span(
+    raw: Any, service: Optional[str], arrival: int, agg: _Aggregator
+) -> Optional[tuple[_Span, str]]:
+    """_span, or None (counted in agg.bad_spans) when a field is malformed."""
+    try:
+        return _span(raw, service, arrival)
+    except (ValueError, TypeError, AttributeError):
+        agg.bad_spans += 1
+        return None
+
+
+def _spans(lines: Iterator[str], agg: _Aggregator) -> Iterator[tuple[_Span, str]]:
+    """(span, trace ID) pairs in file order."""
+    arrival = 0
+    for doc in _documents(lines, agg):
+        batches = None
+        if isinstance(doc, dict):
+            batches = doc.get("resourceSpans", doc.get("resource_spans"))
+        if batches is None:
+            for raw in doc if isinstance(doc, list) else (doc,):
+                arrival += 1
+                parsed = _checked_span(raw, None, arrival, agg) if isinstance(raw, dict) else None
+                if parsed is not None:
+                    yield parsed
+            continue
+        for batch in batches:
+            service = _service(batch.get("resource"))
+            for scope in batch.get("scopeSpans", batch.get("scope_spans", ())):
+                for raw in scope.get("spans", ()):
+                    arrival += 1
+                    parsed = _checked_span(raw, service, arrival, agg)
+                    if parsed is not None:
+                        yield parsed
+
+
+def _messages(spans: list[_Span]) -> list[_Message]:
+    """Calls between services in time order."""
+    by_id = {s.span_id: s for s in spans}
+
+    def depth_of(span: _Span) -> int:
+        """Ancestors of a span within the trace (parent cycles cut off)."""
+        depth = 0
+        seen = {span.span_id}
+        while span.parent_id in by_id and span.parent_id not in seen:
+            span = by_id[span.parent_id]
+            seen.add(span.span_id)
+            depth += 1
+        return depth
+
+    events = []
+    for seq, span in enumerate(spans):
+        parent = by_id.get(span.parent_id)
+        if parent is not None:
+            caller = parent.service
+        else:
+            caller = _UNKNOWN_CALLER if span.parent_id else _CLIENT
+        if caller == span.service:
+            continue
+        d = depth_of(span)
+        request = (caller, span.service, span.name, EdgeType.SEQ_REQUEST)
+        events.append((span.start, 1, d, seq, request))
+        if span.kind not in _ONE_WAY_KINDS:
+            reply = ("error", EdgeType.SEQ_ERROR) if span.error else ("", EdgeType.SEQ_RESPONSE)
+            # A zero-length span (or one without timestamps) replies after
+            # its own request, not with the replies that precede it
+            kind = 2 if span.end <= span.start else 0
+            events.append((span.end, kind, -d, seq, (span.service, caller, *reply)))
+    # Same instant: replies before new requests, inner calls closest to
+    # their caller's request and reply, then file order
+    events.sort(key=lambda e: e[:4])
+    return [e[4] for e in events]
+
+
+def _fold(messages: list[_Message]) -> list:
+    """Messages with repeated runs folded into _Loop items."""
+    items: list = []
+    i, n = 0, len(messages)
+    while i < n:
+        for size in range(1, min(_MAX_LOOP_BODY, (n - i) // 2) + 1):
+            body = messages[i:i + size]
+            repeats = 1
+            while messages[i + repeats * size:i + (repeats + 1) * size] == body:
+                repeats += 1
+            if repeats > 1:
+                items.append(_Loop(repeats, tuple(body)))
+                i += repeats * size
+                break
+        else:
+            items.append(messages[i])
+            i += 1
+    return items
+
+
+class _Shape:
+    """Traces sharing one folded message sequence."""
+
+    __slots__ = ("items", "traces", "loop_ranges")
+
+    def __init__(self, items: list):
+        self.items = items
+        self.traces = 0
+        self.loop_ranges = [
+            [it.repeats, it.repeats] for it in items if isinstance(it, _Loop)
+        ]
+
+    @staticmethod
+    def key(items: list) -> tuple:
+        """The folded sequence without loop counts."""
+        return tuple(it.body if isinstance(it, _Loop) else it for it in items)
+
+    def add(self, items: list) -> None:
+        self.traces += 1
+        repeats = (it.repeats for it in items if isinstance(it, _Loop))
+        for bounds, count in zip(self.loop_ranges, repeats):
+            bounds[0] = min(bounds[0], count)
+            bounds[1] = max(bounds[1], count)
+
+    def message_count(self) -> int:
+        return sum(len(it.body) if isinstance(it, _Loop) else 1 for it in self.items)
+
+    def first_label(self) -> str:
+        first = self.items[0]
+        return (first.body[0] if isinstance(first, _Loop) else first)[2]
+
+
+class _Aggregator:
+    def __init__(
+        self,
+        max_open_traces: int,
+        max_trace_spans: int,
+        max_shapes: int,
+        max_finished_traces: int = DEFAULT_MAX_FINISHED_TRACES,
+    ):
+        self.max_open_traces = max_open_traces
+        self.max_trace_spans = max_trace_spans
+        self.max_shapes = max_shapes
+        self.max_finished_traces = max_finished_traces
+        self.open: OrderedDict[str, list[_Span]] = OrderedDict()
+        # Recently finished trace IDs (values unused), oldest first
+        self.finished: OrderedDict[str, None] = OrderedDict()
+        self.shapes: dict[tuple, _Shape] = {}
+        self.traces = 0
+        self.spans = 0
+        self.dropped_spans = 0
+        self.unshaped_traces = 0
+        self.bad_lines = 0
+        self.bad_spans = 0
+
+    def add(self, span: _Span, trace_id: str) -> None:
+        self.spans += 1
+        trace = self.open.get(trace_id)
+        if trace is None:
+            if trace_id in self.finished:
+                # Late span of a trace finished early: its spans so far
+                # are already counted, and a new trace would lack them
+                self.dropped_spans += 1
+                return
+            trace = self.open[trace_id] = []
+            if len(self.open) > self.max_open_traces:
+                self.finish(*self.open.popitem(last=False))
+        else:
+            self.open.move_to_end(trace_id)
+        if len(trace) < self.max_trace_spans:
+            trace.append(span)
+        else:
+            self.dropped_spans += 1
+
+    def finish(self, trace_id: str, spans: list[_Span]) -> None:
+        self.traces += 1
+        self.finished[trace_id] = None
+        if len(self.finished) > self.max_finished_traces:
+            self.finished.popitem(last=False)
+        items = _fold(_messages(spans))
+        if not items:
+            return
+        key = _Shape.key(items)
+        shape = self.shapes.get(key)
+        if shape is None:
+            if len(self.shapes) >= self.max_shapes:
+                self.unshaped_traces += 1
+                return
+            shape = self.shapes[key] = _Shape(items)
+        shape.add(items)
+
+    def close(self) -> None:
+        while self.open:
+            self.finish(*self.open.popitem(last=False))
+
+
+def _loop_label(bounds: list[int]) -> str:
+    low, high = bounds
+    return f"LOOP: ×{low}" if low == high else f"LOOP: ×{low}–{high}"
+
+
+def _build_ir(agg: _Aggregator, max_messages: int) -> DiagramIR:
+    participants: dict[str, SequenceParticipant] = {}
+    used_ids: set[str] = set()
+    edges: list[DiagramEdge] = []
+    groups: list[DiagramGroup] = []
+
+    def participant(service: str) -> str:
+        if service not in participants:
+            # Services differing only in punctuation ("web.api", "web-api")
+            # get numbered IDs; the generator adds "_lifeline" cells too
+            base = pid = _PARTICIPANT_ID_RE.sub("_", service)
+            n = 1
+            while pid in used_ids or f"{pid}_lifeline" in used_ids:
+                n += 1
+                pid = f"{base}_{n}"
+            used_ids.update((pid, f"{pid}_lifeline"))
+            participants[service] = SequenceParticipant(
+                id=pid, label=service, semantic_role=_guess_role(service),
+            )
+        return participants[service].id
+
+    def message(msg: _Message, group: str) -> None:
+        source, target, label, edge_type = msg
+        edges.append(DiagramEdge(
+            id=f"msg_{len(edges)}",
+            source=participant(source),
+            target=participant(target),
+            label=label,
+            edge_type=edge_type,
+            parent_group=group,
+        ))
+
+    budget = max_messages
+    shapes = sorted(agg.shapes.values(), key=lambda s: s.traces, reverse=True)
+    for number, shape in enumerate(shapes, start=1):
+        size = shape.message_count()
+        if size > budget and number > 1:
+            break
+        label = f"{shape.first_label()}: {shape.traces} of {agg.traces} traces"
+        if size > budget:
+            label += f" (first {budget} of {size} messages)"
+        gid = f"trace_{number}"
+        groups.append(DiagramGroup(id=gid, label=label, group_type="info"))
+
+        loops = iter(shape.loop_ranges)
+        for item in shape.items:
+            if budget <= 0:
+                break
+            if not isinstance(item, _Loop):
+                message(item, gid)
+                budget -= 1
+                continue
+            lid = f"loop_{len(groups)}"
+            groups.append(DiagramGroup(
+                id=lid, label=_loop_label(next(loops)),
+                group_type="warning", parent_group=gid,
+            ))
+            for msg in item.body[:budget]:
+                message(msg, lid)
+            budget -= min(len(item.body), budget)
+        if budget <= 0:
+            break
+
+    title = f"{agg.traces} traces, {agg.spans} spans"
+    if agg.dropped_spans:
+        title += f", {agg.dropped_spans} spans dropped"
+    if agg.bad_lines:
+        title += f", {agg.bad_lines} malformed lines skipped"
+    if agg.bad_spans:
+        title += f", {agg.bad_spans} malformed spans skipped"
+    return DiagramIR(
+        diagram_type=DiagramType.SEQUENCE,
+        title=title,
+        layout=LayoutDirection.TB,
+        participants=list(participants.values()),
+        edges=edges,
+        groups=groups,
+    )
+
+
+def parse(
+    source: Source,
+    max_messages: int = DEFAULT_TRACE_MESSAGES,
+    max_open_traces: int = DEFAULT_MAX_OPEN_TRACES,
+    max_trace_spans: int = DEFAULT_MAX_TRACE_SPANS,
+    max_shapes: int = DEFAULT_MAX_SHAPES,
+    max_finished_traces: int = DEFAULT_MAX_FINISHED_TRACES,
+) -> DiagramIR:
+    """Build a sequence DiagramIR from OTLP JSON spans (text or lines)."""
+    agg = _Aggregator(max_open_traces, max_trace_spans, max_shapes, max_finished_traces)
+    for span, trace_id in _spans(source_lines(source), agg):
+        agg.add(span, trace_id)
+    agg.close()
+    return _build_ir(agg, max_messages)
@@ -2,19 +2,41 @@
 Auto-layout engine for diagram IR.
 
 Assigns x/y positions to nodes based on layout direction and topology.
-Uses a simple rank-based approach with topological ordering.
+Uses a simple rank-based approach with topological ordering, or the
+force-directed engine (forcelayout) where configured per diagram type.
+Disconnected graphs are split into connected components, each laid out
+on its own (in worker processes for very large inputs) and then
+shelf-packed. Components that are rooted trees get a tidy tree layout
+(treelayout), and edgeless diagrams are simply placed on a grid.
+
+Groups (subgraphs, C4 boundaries) are laid out bottom-up as compound
+nodes: each group's members are placed as a unit, the group is sized to
+fit them, and the group then takes part in its parent's layout as a
+single box. Members keep coordinates relative to their group.
 """
 
 from __future__ import annotations
 
+import os
 from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
 
+from .edgemerge import merge_duplicate_edges
+from .forcelayout import force_layout
+from .layout_cache import layout_key, restore_layout, store_layout
+from .options import get_options
+from .packing import grid_pack, shelf_pack
 from .parsers.base import (
+    DiagramEdge,
+    DiagramGroup,
     DiagramIR,
     DiagramNode,
     LayoutDirection,
     SequenceParticipant,
 )
+from .routing import route_edges
+from .textmetrics import group_min_width, size_nodes
+from .treelayout import tree_children, tree_layout
 from . import styles
 
 
@@ -72,24 +94,331 @@ def _group_by_rank(
     return dict(sorted(layers.items()))
 
 
-def layout_nodes(ir: DiagramIR) -> None:
-    """Assign x/y positions to all nodes in-place.
+# Lay components out in worker processes only when the diagram is big
+# enough to amortize process start-up and pickling.
+PARALLEL_LAYOUT_MIN_NODES = 5000
+
+
+def _connected_components(
+    nodes: list[DiagramNode],
+    edges: list[DiagramEdge],
+) -> list[list[DiagramNode]]:
+    """Split nodes into weakly connected components (union-find).
+
+    Components are returned in order of their first node.
+    """
+    parent: dict[str, str] = {n.id: n.id for n in nodes}
+
+    def find(nid: str) -> str:
+        root = nid
+        while parent[root] != root:
+            root = parent[root]
+        while parent[nid] != root:
+            parent[nid], nid = root, parent[nid]
+        return root
+
+    def union(a: str, b: str) -> None:
+        ra, rb = find(a), find(b)
+        if ra != rb:
+            parent[rb] = ra
+
+    for e in edges:
+        if e.source_x is not None:
+            continue
+        if e.source in parent and e.target in parent:
+            union(e.source, e.target)
+
+    components: dict[str, list[DiagramNode]] = {}
+    for n in nodes:
+        components.setdefault(find(n.id), []).append(n)
+    return list(components.values())
+
+
+def _layout_component(
+    nodes: list[DiagramNode],
+    edges: list[DiagramEdge],
+    direction: LayoutDirection,
+    engine: str = "rank",
+) -> dict[str, tuple[float, float]]:
+    """Lay out one component at the origin; return node positions.
+
+    Module-level (and returning plain tuples) so it can run in a worker
+    process, where the node objects are copies.
+    """
+    if engine == "force":
+        return force_layout(nodes, edges)
+
+    tree = tree_children(nodes, edges)
+    if tree is not None:
+        return tree_layout(nodes, tree[0], tree[1], direction)
+
+    ranks = _topological_ranks(nodes, edges)
+    layers = _group_by_rank(nodes, ranks)
+    if direction == LayoutDirection.TB:
+        _layout_tb(layers, 0.0, 0.0)
+    else:
+        _layout_lr(layers, 0.0, 0.0)
+    return {n.id: (n.x, n.y) for n in nodes}
+
+
+def _layout_components(
+    components: list[list[DiagramNode]],
+    edges: list[DiagramEdge],
+    direction: LayoutDirection,
+    engine: str = "rank",
+) -> list[dict[str, tuple[float, float]]]:
+    """Lay out every component, in parallel for large diagrams."""
+    owner: dict[str, int] = {}
+    for idx, comp in enumerate(components):
+        for n in comp:
+            owner[n.id] = idx
+    comp_edges: list[list[DiagramEdge]] = [[] for _ in components]
+    for e in edges:
+        if e.source_x is not None or e.source not in owner:
+            continue
+        if owner[e.source] == owner.get(e.target):
+            comp_edges[owner[e.source]].append(e)
+
+    total = sum(len(c) for c in components)
+    workers = os.cpu_count() or 1
+    if total >= PARALLEL_LAYOUT_MIN_NODES and workers > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                return list(pool.map(
+                    _layout_component,
+                    components,
+                    comp_edges,
+                    [direction] * len(components),
+                    [engine] * len(components),
+                    chunksize=max(1, len(components) // (workers * 4)),
+                ))
+        except (OSError, RuntimeError):
+            pass  # no process support here: fall back to serial layout
+
+    return [
+        _layout_component(comp, es, direction, engine)
+        for comp, es in zip(components, comp_edges)
+    ]
+
+
+def _place_items(
+    items: list[DiagramNode],
+    edges: list[DiagramEdge],
+    direction: LayoutDirection,
+    engine: str,
+) -> tuple[dict[str, tuple[float, float]], float, float]:
+    """Lay out and pack ``items`` at the origin.
+
+    Returns (positions, content width, content height).
+    """
+    ids = {n.id for n in items}
+    if not any(
+        e.source_x is None and e.source in ids and e.target in ids
+        for e in edges
+    ):
+        sizes = [(n.width, n.height) for n in items]
+        offsets = grid_pack(sizes, gap=styles.NODE_SPACING_H)
+        placed = {n.id: off for n, off in zip(items, offsets)}
+        width = max(x + w for (x, _), (w, _) in zip(offsets, sizes))
+        height = max(y + h for (_, y), (_, h) in zip(offsets, sizes))
+        return placed, width, height
+
+    components = _connected_components(items, edges)
+    results = _layout_components(components, edges, direction, engine)
+
+    sizes = []
+    for comp, positions in zip(components, results):
+        sizes.append((
+            max(positions[n.id][0] + n.width for n in comp),
+            max(positions[n.id][1] + n.height for n in comp),
+        ))
+    offsets = shelf_pack(sizes, gap=styles.NODE_SPACING_H)
+
+    placed: dict[str, tuple[float, float]] = {}
+    width = height = 0.0
+    for comp, positions, (off_x, off_y), (w, h) in zip(
+        components, results, offsets, sizes,
+    ):
+        for n in comp:
+            x, y = positions[n.id]
+            placed[n.id] = (off_x + x, off_y + y)
+        width = max(width, off_x + w)
+        height = max(height, off_y + h)
+    return placed, width, height
+
+
+def _group_parents(groups: list[DiagramGroup]) -> dict[str, str | None]:
+    """Map group id -> parent group id, dropping unknown or cyclic parents."""
+    by_id = {g.id: g for g in groups}
+    parents: dict[str, str | None] = {}
+    for group in groups:
+        parent = group.parent_group if group.parent_group in by_id else None
+        parents[group.id] = parent
+    # Break cycles: walk each chain once, colouring visited groups
+    state: dict[str, int] = {}  # 1 = on current path, 2 = done
+    for group in groups:
+        path: list[str] = []
+        gid: str | None = group.id
+        while gid is not None and state.get(gid) is None:
+            state[gid] = 1
+            path.append(gid)
+            gid = parents[gid]
+        if gid is not None and state[gid] == 1:
+            parents[path[-1]] = None  # closing edge of the cycle
+        for pid in path:
+            state[pid] = 2
+    return parents
+
+
+def _layout_compound(ir: DiagramIR, engine: str) -> None:
+    """Bottom-up layout of nested groups.
+
+    Every container (each group, plus the diagram itself) is laid out once
+    with its direct members: nodes, and child groups as single boxes of
+    already-known size. Edges between different containers are lifted to
+    the pair of items that sit directly below their lowest common
+    container. Cost is linear in nodes plus groups (plus edges times
+    nesting depth).
+    """
+    parents = _group_parents(ir.groups)
+    groups = {g.id: g for g in ir.groups}
+    for group in ir.groups:
+        group.parent_group = parents[group.id]
+
+    # Container of every item (None = top level)
+    container: dict[str, str | None] = dict(parents)
+    for n in ir.nodes:
+        container[n.id] = n.parent_group if n.parent_group in groups else None
+
+    depth: dict[str | None, int] = {None: 0}
+
+    for gid in groups:
+        chain = []
+        while gid not in depth:
+            chain.append(gid)
+            gid = parents[gid]
+        d = depth[gid]
+        for g in reversed(chain):
+            d += 1
+            depth[g] = d
+
+    # Lift each edge to the members of the lowest common container
+    lifted: dict[str | None, list[DiagramEdge]] = defaultdict(list)
+    for e in ir.edges:
+        if e.source_x is not None:
+            continue
+        if e.source not in container or e.target not in container:
+            continue
+        a, b = e.source, e.target
+        ca, cb = container[a], container[b]
+        while depth[ca] > depth[cb]:
+            a, ca = ca, container[ca]
+        while depth[cb] > depth[ca]:
+            b, cb = cb, container[cb]
+        while ca != cb:
+            a, ca = ca, container[ca]
+            b, cb = cb, container[cb]
+        if a != b:
+            lifted[ca].append(DiagramEdge(id=e.id, source=a, target=b))
+
+    members: dict[str | None, list[str]] = defaultdict(list)
+    for group in ir.groups:
+        members[group.parent_group].append(group.id)
+    for n in ir.nodes:
+        members[container[n.id]].append(n.id)
+    nodes = {n.id: n for n in ir.nodes}
+
+    # Deepest groups first (bucketed by depth, no sort needed)
+    by_depth: list[list[str]] = [[] for _ in range(max(depth.values()) + 1)]
+    for gid in groups:
+        by_depth[depth[gid]].append(gid)
+    order: list[str | None] = [g for bucket in reversed(by_depth) for g in bucket]
+    order.append(None)
+
+    label_h = styles.GROUP_LABEL_HEIGHT
+    pad = styles.GROUP_PADDING
+    for cid in order:
+        ids = members.get(cid)
+        if not ids:
+            continue
+        items = []
+        for item_id in ids:
+            if item_id in nodes:
+                items.append(nodes[item_id])
+            else:
+                g = groups[item_id]
+                items.append(DiagramNode(
+                    id=g.id, label="", width=g.width, height=g.height,
+                ))
+        placed, width, height = _place_items(items, lifted[cid], ir.layout, engine)
+
+        if cid is None:
+            off_x, off_y = 50.0, 50.0
+        else:
+            group = groups[cid]
+            off_x, off_y = pad, pad + label_h
+            group.width = max(width + 2 * pad, group_min_width(group))
+            group.height = height + 2 * pad + label_h
+            if group.collapsed:
+                # Parent layout only needs room for the collapsed box
+                group.alternate_bounds = (group.width, group.height)
+                group.width = group_min_width(group)
+                group.height = styles.COLLAPSED_GROUP_HEIGHT
+
+        for item_id, (x, y) in placed.items():
+            target = nodes.get(item_id) or groups[item_id]
+            target.x = off_x + x
+            target.y = off_y + y
+
+
+def collapse_large_groups(ir: DiagramIR, threshold: int) -> None:
+    """Mark groups holding more than ``threshold`` nodes as collapsed.
+
+    Counts include nodes in nested groups. The label gets a node count so
+    the collapsed box summarizes what it hides. The compound layout then
+    reserves only the collapsed size in the parent, and the viewer draws
+    none of the hidden cells until the reader expands the group.
+    """
+    if threshold <= 0 or not ir.groups:
+        return
+    groups = {g.id: g for g in ir.groups}
+    counts: dict[str, int] = defaultdict(int)
+    for n in ir.nodes:
+        gid, hops = n.parent_group, 0
+        while gid in groups and hops <= len(groups):
+            counts[gid] += 1
+            gid, hops = groups[gid].parent_group, hops + 1
+    for group in ir.groups:
+        if counts[group.id] > threshold and not group.collapsed:
+            group.collapsed = True
+            group.label = f"{group.label} ({counts[group.id]} nodes)"
+
+
+def layout_nodes(ir: DiagramIR, engine: str | None = None) -> None:
+    """Assign x/y positions to all nodes (and groups) in-place.
 
     Modifies node.x and node.y based on layout direction and topology.
+    Each connected component is laid out independently with ``engine``
+    ("rank" or "force"; defaults to the configured engine for the diagram
+    type), then the component bounding boxes are shelf-packed. With groups
+    present, members are positioned relative to their group and each group
+    is sized to enclose them (see _layout_compound).
     """
     if not ir.nodes:
         return
 
-    ranks = _topological_ranks(ir.nodes, ir.edges)
-    layers = _group_by_rank(ir.nodes, ranks)
+    if engine is None:
+        engine = get_options().layout_engine(ir.diagram_type)
 
-    start_x = 50.0
-    start_y = 50.0
+    if ir.groups:
+        _layout_compound(ir, engine)
+        return
 
-    if ir.layout == LayoutDirection.TB:
-        _layout_tb(layers, start_x, start_y)
-    else:
-        _layout_lr(layers, start_x, start_y)
+    placed, _, _ = _place_items(ir.nodes, ir.edges, ir.layout, engine)
+    for n in ir.nodes:
+        x, y = placed[n.id]
+        n.x = 50.0 + x
+        n.y = 50.0 + y
 
 
 def _layout_tb(
@@ -141,6 +470,8 @@ def layout_sequence(ir: DiagramIR) -> None:
     """Layout sequence diagram participants and compute message positions.
 
     Sets participant x/y, lifeline endpoints, and updates edge coordinates.
+    Messages that open a block leave room for the block title above them,
+    and block frames (ir.groups) are fitted around their messages.
     """
     if not ir.participants:
         return
@@ -161,11 +492,14 @@ def layout_sequence(ir: DiagramIR) -> None:
         participant_centers[p.id] = center
         current_x += styles.SEQ_PARTICIPANT_SPACING
 
+    blocks = _SequenceBlocks(ir)
+
     # Compute message y positions
     lifeline_top = participant_y + styles.SEQ_PARTICIPANT_HEIGHT
     msg_y = lifeline_top + styles.SEQ_MESSAGE_Y_START
 
-    for edge in ir.edges:
+    for index, edge in enumerate(ir.edges):
+        msg_y += blocks.space_before(index)
         if edge.source_x is not None:
             # Already has coordinates — use them (but update y if not set)
             if edge.source_y == 0 and edge.target_y == 0:
@@ -184,47 +518,135 @@ def layout_sequence(ir: DiagramIR) -> None:
             edge.target_y = msg_y
             msg_y += styles.SEQ_MESSAGE_Y_SPACING
 
+    blocks.fit_frames()
+
     # Set lifeline end y to below last message
     lifeline_end = msg_y + 40
     for p in ir.participants:
         p.lifeline_end_y = lifeline_end
 
 
-def layout_groups(ir: DiagramIR) -> None:
-    """Compute group bounds to enclose their child nodes with padding."""
-    if not ir.groups:
-        return
+class _SequenceBlocks:
+    """Nesting and message spans of sequence blocks (alt, loop, ...).
 
-    for group in ir.groups:
-        children = [n for n in ir.nodes if n.parent_group == group.id]
-        if not children:
-            continue
-
-        min_x = min(n.x for n in children) - styles.GROUP_PADDING
-        min_y = min(n.y for n in children) - styles.GROUP_PADDING - 30  # room for label
-        max_x = max(n.x + n.width for n in children) + styles.GROUP_PADDING
-        max_y = max(n.y + n.height for n in children) + styles.GROUP_PADDING
-
-        group.x = min_x
-        group.y = min_y
-        group.width = max_x - min_x
-        group.height = max_y - min_y
+    A block spans from the first to the last message inside it or any
+    nested block. Blocks without messages are dropped from the IR.
+    """
 
-        # Convert child coordinates to relative (within group)
-        for child in children:
-            child.x -= min_x
-            child.y -= min_y
+    def __init__(self, ir: DiagramIR):
+        self.ir = ir
+        groups = {g.id: g for g in ir.groups}
+        self.parent = {
+            g.id: g.parent_group if g.parent_group in groups else None
+            for g in ir.groups
+        }
+        self.first: dict[str, int] = {}
+        self.last: dict[str, int] = {}
+        for index, edge in enumerate(ir.edges):
+            gid = edge.parent_group if edge.parent_group in groups else None
+            hops = 0
+            while gid is not None and hops <= len(groups):
+                self.first.setdefault(gid, index)
+                self.last[gid] = index
+                gid = self.parent[gid]
+                hops += 1
+        ir.groups = [g for g in ir.groups if g.id in self.first]
+
+        self.depth: dict[str, int] = {}
+        for g in ir.groups:
+            d, gid = 0, self.parent[g.id]
+            while gid is not None and d <= len(groups):
+                d, gid = d + 1, self.parent[gid]
+            self.depth[g.id] = d
+
+        # Blocks opened at / closed after each message, outermost first
+        self.opens: dict[int, list[str]] = defaultdict(list)
+        self.closes: dict[int, list[str]] = defaultdict(list)
+        for g in sorted(ir.groups, key=lambda g: self.depth[g.id]):
+            self.opens[self.first[g.id]].append(g.id)
+            self.closes[self.last[g.id]].append(g.id)
+
+    def space_before(self, index: int) -> float:
+        """Extra vertical space before message ``index``."""
+        return (
+            len(self.opens.get(index, ())) * styles.SEQ_BLOCK_LABEL_HEIGHT
+            + len(self.closes.get(index - 1, ())) * styles.SEQ_BLOCK_GAP
+        )
+
+    def fit_frames(self) -> None:
+        """Size every block around its messages and nested blocks."""
+        edges = self.ir.edges
+        bounds: dict[str, list[float]] = {}
+        # Deepest first so parents can enclose their children
+        for g in sorted(self.ir.groups, key=lambda g: -self.depth[g.id]):
+            first, last = self.first[g.id], self.last[g.id]
+            opened = self.opens[first]
+            closed = self.closes[last]
+            top = (
+                edges[first].source_y
+                - styles.SEQ_BLOCK_LABEL_HEIGHT * (len(opened) - opened.index(g.id))
+                - styles.SEQ_BLOCK_GAP / 2
+            )
+            bottom = (
+                edges[last].source_y
+                + styles.SEQ_BLOCK_GAP * (len(closed) - closed.index(g.id))
+            )
+            xs = [
+                x
+                for e in edges[first:last + 1]
+                for x in (e.source_x, e.target_x)
+                if x is not None
+            ]
+            x0 = min(xs) - styles.SEQ_BLOCK_PADDING
+            x1 = max(xs) + styles.SEQ_BLOCK_PADDING
+            box = bounds.get(g.id)  # already widened by nested blocks?
+            if box is not None:
+                x0, x1 = min(x0, box[0]), max(x1, box[2])
+            box = bounds[g.id] = [x0, top, x1, bottom]
+            parent = self.parent[g.id]
+            if parent is not None:
+                # Widen the parent so the child frame sits inside it
+                inset = styles.SEQ_BLOCK_GAP
+                pbox = bounds.setdefault(parent, [box[0] - inset, 0.0, box[2] + inset, 0.0])
+                pbox[0] = min(pbox[0], box[0] - inset)
+                pbox[2] = max(pbox[2], box[2] + inset)  # y set when visited
+
+        for g in self.ir.groups:
+            x0, y0, x1, y1 = bounds[g.id]
+            g.x, g.y, g.width, g.height = x0, y0, x1 - x0, y1 - y0
+        # Nested frames are stored relative to their parent frame
+        absolute = {g.id: (g.x, g.y) for g in self.ir.groups}
+        for g in self.ir.groups:
+            parent = self.parent[g.id]
+            g.parent_group = parent
+            if parent is not None:
+                g.x -= absolute[parent][0]
+                g.y -= absolute[parent][1]
 
 
 def auto_layout(ir: DiagramIR) -> None:
     """Full auto-layout pipeline for a diagram IR.
 
     Dispatches to the appropriate layout strategy based on diagram type.
+    Node/edge diagrams whose topology and node sizes match a previous run
+    reuse the cached geometry (see layout_cache). Duplicate edges are
+    merged and groups above the configured size collapsed first, where
+    enabled for the diagram type.
     """
     from .parsers.base import DiagramType
 
     if ir.diagram_type == DiagramType.SEQUENCE:
         layout_sequence(ir)
     else:
-        layout_nodes(ir)
-        layout_groups(ir)
+        options = get_options()
+        if options.merges_edges(ir.diagram_type):
+            merge_duplicate_edges(ir)
+        collapse_large_groups(ir, options.collapse_group_nodes)
+        size_nodes(ir)
+        engine = options.layout_engine(ir.diagram_type)
+        key = layout_key(ir, engine)
+        if restore_layout(key, ir):
+            return
+        layout_nodes(ir, engine)
+        route_edges(ir)
+        store_layout(key, ir)
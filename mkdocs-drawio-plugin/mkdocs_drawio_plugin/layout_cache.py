@@ -0,0 +1,156 @@
+"""
+Layout result cache keyed by graph topology.
+
+Most documentation edits only touch label text (typo fixes, renamed
+services), which leaves the graph's shape untouched. The cache key is a
+canonical hash of everything layout depends on — diagram type, direction,
+layout engine, node sizes, edge endpoints and group nesting — with
+labels and IDs excluded (nodes, edges and groups are identified by
+position), so a label-only edit reuses the stored positions, group bounds
+and waypoints.
+
+Label edits that change a node's measured size change the key, as they
+must: the old positions would no longer fit. Group titles are left out
+of the key; a cached layout whose group boxes are too narrow for the new
+titles counts as a miss instead.
+
+The cache is an in-process LRU (it survives `mkdocs serve` rebuilds) and
+can optionally be saved to / loaded from a JSON file between builds.
+Saved files carry LAYOUT_CACHE_VERSION; files written with another
+version are ignored, so layouts from older layout code are not reused.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from .parsers.base import DiagramIR
+from .textmetrics import group_min_width
+
+# Maximum number of distinct layouts kept in memory
+LAYOUT_CACHE_SIZE = 512
+# Bump whenever layout or routing output changes for the same key
+LAYOUT_CACHE_VERSION = 2
+
+_CACHE: OrderedDict[str, dict[str, Any]] = OrderedDict()
+_STATS = {"hits": 0, "misses": 0}
+
+
+def layout_key(ir: DiagramIR, engine: str = "rank") -> str:
+    """Canonical, label-free hash of the inputs that determine layout."""
+    node_index = {n.id: i for i, n in enumerate(ir.nodes)}
+    group_index = {g.id: i for i, g in enumerate(ir.groups)}
+
+    def endpoint(item_id: str) -> tuple[str, int] | None:
+        if item_id in node_index:
+            return ("n", node_index[item_id])
+        if item_id in group_index:
+            return ("g", group_index[item_id])
+        return None
+
+    canonical = (
+        ir.diagram_type.value,
+        ir.layout.value,
+        engine,
+        tuple(
+            (n.width, n.height, group_index.get(n.parent_group, -1))
+            for n in ir.nodes
+        ),
+        tuple(
+            (endpoint(e.source), endpoint(e.target))
+            for e in ir.edges
+            if e.source_x is None
+        ),
+        tuple(
+            (group_index.get(g.parent_group, -1), g.collapsed)
+            for g in ir.groups
+        ),
+    )
+    return hashlib.blake2b(repr(canonical).encode(), digest_size=16).hexdigest()
+
+
+def store_layout(key: str, ir: DiagramIR) -> None:
+    """Record the laid-out geometry of ``ir`` under ``key``."""
+    _CACHE[key] = {
+        "nodes": [(n.x, n.y) for n in ir.nodes],
+        "groups": [(g.x, g.y, g.width, g.height) for g in ir.groups],
+        "alternate_bounds": [g.alternate_bounds for g in ir.groups],
+        "waypoints": [
+            [tuple(p) for p in e.waypoints]
+            for e in ir.edges
+            if e.source_x is None
+        ],
+    }
+    _CACHE.move_to_end(key)
+    while len(_CACHE) > LAYOUT_CACHE_SIZE:
+        _CACHE.popitem(last=False)
+
+
+def restore_layout(key: str, ir: DiagramIR) -> bool:
+    """Apply cached geometry to ``ir``. Returns False on a cache miss."""
+    entry = _CACHE.get(key)
+    if entry is None or any(
+        width < group_min_width(group)
+        for group, (_, _, width, _) in zip(ir.groups, entry["groups"])
+    ):
+        _STATS["misses"] += 1
+        return False
+
+    _CACHE.move_to_end(key)
+    _STATS["hits"] += 1
+    for node, (x, y) in zip(ir.nodes, entry["nodes"]):
+        node.x, node.y = x, y
+    for group, (x, y, w, h) in zip(ir.groups, entry["groups"]):
+        group.x, group.y, group.width, group.height = x, y, w, h
+    for group, bounds in zip(ir.groups, entry.get("alternate_bounds", [])):
+        group.alternate_bounds = tuple(bounds) if bounds else None
+    cell_edges = [e for e in ir.edges if e.source_x is None]
+    for edge, points in zip(cell_edges, entry["waypoints"]):
+        edge.waypoints = [tuple(p) for p in points]
+    return True
+
+
+def cache_info() -> dict[str, int]:
+    """Return hit/miss counters and current size."""
+    return {**_STATS, "size": len(_CACHE)}
+
+
+def clear_layout_cache() -> None:
+    """Drop all cached layouts and reset the counters."""
+    _CACHE.clear()
+    _STATS["hits"] = 0
+    _STATS["misses"] = 0
+
+
+def load_layout_cache(path: str | Path) -> int:
+    """Merge layouts saved by save_layout_cache(). Returns entries loaded.
+
+    A missing or unreadable file, or one written with a different
+    LAYOUT_CACHE_VERSION, is treated as an empty cache.
+    """
+    try:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return 0
+    if not isinstance(data, dict) or data.get("version") != LAYOUT_CACHE_VERSION:
+        return 0
+    layouts = data.get("layouts")
+    if not isinstance(layouts, dict):
+        return 0
+    for key, entry in layouts.items():
+        _CACHE[key] = entry
+    while len(_CACHE) > LAYOUT_CACHE_SIZE:
+        _CACHE.popitem(last=False)
+    return len(layouts)
+
+
+def save_layout_cache(path: str | Path) -> None:
+    """Write the in-memory cache to ``path`` as JSON."""
+    dest = Path(path)
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    data = {"version": LAYOUT_CACHE_VERSION, "layouts": _CACHE}
+    dest.write_text(json.dumps(data), encoding="utf-8")
@@ -0,0 +1,271 @@
+"""
+Layout quality metrics for a laid-out DiagramIR.
+
+Gives an automated signal when a layout goes wrong: overlapping nodes,
+groups covering nodes that aren't their members, edges drawn through
+unrelated nodes, plus edge crossing count, canvas area and aspect ratio.
+
+Every check buckets boxes or segments in a SpatialIndex, so cost is
+linear in the size of the diagram (plus the pairs actually found) rather
+than quadratic. Works for any IR after auto_layout (or a generator) has
+run; group members may hold group-relative coordinates.
+
+Usage in tests and benchmarks:
+    metrics = measure_layout(ir)
+    assert not metrics.problems(), metrics.problems()
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+
+from .parsers.base import DiagramIR
+from .spatial import SpatialIndex
+
+Point = tuple[float, float]
+Segment = tuple[float, float, float, float]  # x0, y0, x1, y1
+
+_EPS = 1e-6
+
+
+@dataclass
+class LayoutMetrics:
+    """Measured quality of one laid-out diagram."""
+
+    node_count: int = 0
+    edge_count: int = 0
+    # (id, id) pairs of overlapping node boxes
+    overlaps: list[tuple[str, str]] = field(default_factory=list)
+    # (group id, node or group id) pairs: box inside a group it doesn't belong to
+    group_intrusions: list[tuple[str, str]] = field(default_factory=list)
+    # (edge id, node id) pairs: edge drawn through a node other than its ends
+    edge_node_crossings: list[tuple[str, str]] = field(default_factory=list)
+    edge_crossings: int = 0
+    width: float = 0.0
+    height: float = 0.0
+
+    @property
+    def area(self) -> float:
+        return self.width * self.height
+
+    @property
+    def aspect_ratio(self) -> float:
+        """Canvas width / height (0 for an empty diagram)."""
+        return self.width / self.height if self.height else 0.0
+
+    def problems(self) -> list[str]:
+        """Human-readable defects; empty when the layout is clean.
+
+        Edge crossings, area and aspect ratio are reported, not judged:
+        some crossings are unavoidable.
+        """
+        found = [f"nodes {a} and {b} overlap" for a, b in self.overlaps]
+        found.extend(
+            f"group {g} covers non-member {n}" for g, n in self.group_intrusions
+        )
+        found.extend(
+            f"edge {e} crosses node {n}" for e, n in self.edge_node_crossings
+        )
+        return found
+
+    def as_dict(self) -> dict:
+        data = asdict(self)
+        data["area"] = self.area
+        data["aspect_ratio"] = round(self.aspect_ratio, 3)
+        return data
+
+    def summary(self) -> str:
+        """One-block text report (used by the CLI's --metrics)."""
+        lines = [
+            f"nodes: {self.node_count}",
+            f"edges: {self.edge_count}",
+            f"overlaps: {len(self.overlaps)}",
+            f"group intrusions: {len(self.group_intrusions)}",
+            f"edge-node crossings: {len(self.edge_node_crossings)}",
+            f"edge crossings: {self.edge_crossings}",
+            f"canvas: {self.width:.0f} x {self.height:.0f} "
+            f"(area {self.area:.0f}, aspect {self.aspect_ratio:.2f})",
+        ]
+        lines.extend(f"problem: {p}" for p in self.problems())
+        return "\n".join(lines)
+
+
+def _cell_size(rects: dict[str, tuple[float, float, float, float]]) -> float:
+    if not rects:
+        return 1.0
+    avg = sum(max(w, h) for _, _, w, h in rects.values()) / len(rects)
+    return max(avg * 2, 1.0)
+
+
+def _find_overlaps(
+    rects: dict[str, tuple[float, float, float, float]],
+) -> list[tuple[str, str]]:
+    index = SpatialIndex(cell_size=_cell_size(rects))
+    order: dict[str, int] = {}
+    for i, (key, (x, y, w, h)) in enumerate(rects.items()):
+        index.insert(key, x, y, w, h)
+        order[key] = i
+    pairs = []
+    for key, (x, y, w, h) in rects.items():
+        for other in sorted(index.query(x, y, x + w, y + h), key=order.get):
+            if order[other] > order[key]:
+                pairs.append((key, other))
+    return pairs
+
+
+def _clips(seg: Segment, rect: tuple[float, float, float, float]) -> bool:
+    """True when the segment passes through the rect's interior (Liang–Barsky)."""
+    x0, y0, x1, y1 = seg
+    rx0, ry0, rx1, ry1 = rect
+    dx, dy = x1 - x0, y1 - y0
+    t0, t1 = 0.0, 1.0
+    for p, q in (
+        (-dx, x0 - rx0), (dx, rx1 - x0), (-dy, y0 - ry0), (dy, ry1 - y0),
+    ):
+        if abs(p) < _EPS:
+            if q <= _EPS:
+                return False  # parallel and outside (or on the border)
+            continue
+        t = q / p
+        if p < 0:
+            t0 = max(t0, t)
+        else:
+            t1 = min(t1, t)
+        if t0 >= t1 - _EPS:
+            return False
+    return True
+
+
+def _cross(a: Segment, b: Segment) -> bool:
+    """True when two segments intersect at a point interior to both."""
+    ax0, ay0, ax1, ay1 = a
+    bx0, by0, bx1, by1 = b
+
+    def orient(px, py, qx, qy, rx, ry):
+        return (qx - px) * (ry - py) - (qy - py) * (rx - px)
+
+    d1 = orient(bx0, by0, bx1, by1, ax0, ay0)
+    d2 = orient(bx0, by0, bx1, by1, ax1, ay1)
+    d3 = orient(ax0, ay0, ax1, ay1, bx0, by0)
+    d4 = orient(ax0, ay0, ax1, ay1, bx1, by1)
+    return (
+        ((d1 > _EPS and d2 < -_EPS) or (d1 < -_EPS and d2 > _EPS))
+        and ((d3 > _EPS and d4 < -_EPS) or (d3 < -_EPS and d4 > _EPS))
+    )
+
+
+def _edge_paths(
+    ir: DiagramIR,
+    rects: dict[str, tuple[float, float, float, float]],
+    hidden: dict[str, str],
+) -> list[tuple[str, tuple[str, str], list[Point]]]:
+    """Absolute polyline of every drawable edge: (id, endpoints, points).
+
+    Endpoints hidden in a collapsed group attach to the collapsed box.
+    """
+    paths = []
+    for e in ir.edges:
+        source = hidden.get(e.source, e.source)
+        target = hidden.get(e.target, e.target)
+        if e.source_x is not None:
+            start = (e.source_x, e.source_y or 0.0)
+            end = (e.target_x or 0.0, e.target_y or 0.0)
+        else:
+            src = rects.get(source)
+            tgt = rects.get(target)
+            if src is None or tgt is None or source == target:
+                continue
+            start = (src[0] + src[2] / 2, src[1] + src[3] / 2)
+            end = (tgt[0] + tgt[2] / 2, tgt[1] + tgt[3] / 2)
+        points = [start, *[tuple(p) for p in e.waypoints], end]
+        paths.append((e.id, (source, target), points))
+    return paths
+
+
+def measure_layout(ir: DiagramIR) -> LayoutMetrics:
+    """Compute quality metrics for an already laid-out IR."""
+    absolute = ir.absolute_rects()
+    hidden = ir.hidden_items()  # not drawn until their group is expanded
+    node_rects = {n.id: absolute[n.id] for n in ir.nodes if n.id not in hidden}
+    for p in ir.participants:
+        node_rects[p.id] = (p.x, p.y, p.width, p.height)
+
+    metrics = LayoutMetrics(node_count=len(node_rects), edge_count=len(ir.edges))
+    metrics.overlaps = _find_overlaps(node_rects)
+
+    # Groups covering boxes outside their subtree
+    parent_of = {g.id: g.parent_group for g in ir.groups}
+    parent_of.update({n.id: n.parent_group for n in ir.nodes})
+    group_rects = {g.id: absolute[g.id] for g in ir.groups if g.id not in hidden}
+    if group_rects:
+        index = SpatialIndex(cell_size=_cell_size({**node_rects, **group_rects}))
+        for key, (x, y, w, h) in {**node_rects, **group_rects}.items():
+            index.insert(key, x, y, w, h)
+        reported: set[tuple[str, str]] = set()
+        for gid, (x, y, w, h) in group_rects.items():
+            for other in sorted(index.query(x, y, x + w, y + h), key=str):
+                if other == gid or (other, gid) in reported:
+                    continue  # self, or a group pair already reported
+                # Members, nested members and enclosing groups are fine
+                related = False
+                for start, goal in ((other, gid), (gid, other)):
+                    cursor, hops = parent_of.get(start), 0
+                    while cursor is not None and hops <= len(parent_of):
+                        if cursor == goal:
+                            related = True
+                            break
+                        cursor, hops = parent_of.get(cursor), hops + 1
+                if not related:
+                    metrics.group_intrusions.append((gid, other))
+                    reported.add((gid, other))
+
+    # Edges: through-node hits and pairwise crossings
+    owners = set(hidden.values())
+    collapsed = {gid: rect for gid, rect in group_rects.items() if gid in owners}
+    paths = _edge_paths(ir, {**node_rects, **collapsed}, hidden)
+    node_index = SpatialIndex(cell_size=_cell_size(node_rects))
+    for key, (x, y, w, h) in node_rects.items():
+        node_index.insert(key, x, y, w, h)
+
+    seg_index = SpatialIndex(cell_size=_cell_size(node_rects))
+    segments: list[tuple[int, Segment]] = []
+    for path_no, (edge_id, ends, points) in enumerate(paths):
+        hit: set[str] = set()
+        for (x0, y0), (x1, y1) in zip(points, points[1:]):
+            seg = (x0, y0, x1, y1)
+            for nid in node_index.query(x0, y0, x1, y1) - set(ends):
+                rx, ry, rw, rh = node_rects[nid]
+                if _clips(seg, (rx, ry, rx + rw, ry + rh)):
+                    hit.add(nid)
+            seg_no = len(segments)
+            segments.append((path_no, seg))
+            seg_index.insert(
+                seg_no, min(x0, x1), min(y0, y1), abs(x1 - x0), abs(y1 - y0),
+            )
+        metrics.edge_node_crossings.extend((edge_id, nid) for nid in sorted(hit))
+
+    crossings = 0
+    for seg_no, (path_no, seg) in enumerate(segments):
+        x0, y0, x1, y1 = seg
+        # Pad the probe so axis-aligned segments still find each other
+        probe = seg_index.query(
+            min(x0, x1) - _EPS, min(y0, y1) - _EPS,
+            max(x0, x1) + _EPS, max(y0, y1) + _EPS,
+        )
+        for other in probe:
+            if other <= seg_no or segments[other][0] == path_no:
+                continue
+            if _cross(seg, segments[other][1]):
+                crossings += 1
+    metrics.edge_crossings = crossings
+
+    # Canvas extent (origin-independent)
+    boxes = list(node_rects.values()) + list(group_rects.values())
+    xs = [x for x, _, _, _ in boxes] + [x for _, _, pts in paths for x, _ in pts]
+    ys = [y for _, y, _, _ in boxes] + [y for _, _, pts in paths for _, y in pts]
+    x_ends = [x + w for x, _, w, _ in boxes] + xs
+    y_ends = [y + h for _, y, _, h in boxes] + ys
+    if xs:
+        metrics.width = max(x_ends) - min(xs)
+        metrics.height = max(y_ends) - min(ys)
+    return metrics
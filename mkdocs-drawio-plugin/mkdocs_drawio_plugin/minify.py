@@ -0,0 +1,86 @@
+"""
+Minified output profile for generated draw.io XML.
+
+Cell builders write what is convenient while generating: float
+coordinates ("50.0"), empty labels (value="") and readable IDs derived
+from Mermaid names ("Service_lifeline"). None of that changes what the
+viewer draws, but every embed carries it. minify_model() rewrites a
+finished mxGraphModel/mxfile element in place:
+
+- coordinates are rounded to whole pixels, and zero coordinates (the
+  mxGeometry/mxPoint default) are dropped;
+- empty value and style attributes are dropped (both default to empty);
+- cell IDs are renumbered in document order, per page, as short base-36
+  strings; parent/source/target references follow the new IDs. The
+  reserved root cells "0" and "1" keep their IDs.
+
+The output decodes to the same cells, hierarchy, styles and geometry
+(within rounding), so it renders the same.
+"""
+
+from __future__ import annotations
+
+from xml.etree.ElementTree import Element
+
+# Elements whose numeric attributes are coordinates, and those attributes
+_GEOMETRY_TAGS = frozenset({"mxGeometry", "mxPoint", "mxRectangle"})
+_COORDINATES = ("x", "y", "width", "height")
+# Attributes holding a cell ID
+_REFERENCES = ("parent", "source", "target")
+# IDs the mxGraphModel root cells always use
+_RESERVED_IDS = frozenset({"0", "1"})
+_DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+
+def compact_id(n: int) -> str:
+    """Base-36 representation of a non-negative integer."""
+    digits = []
+    while True:
+        n, r = divmod(n, 36)
+        digits.append(_DIGITS[r])
+        if n == 0:
+            return "".join(reversed(digits))
+
+
+def _minify_geometry(elem: Element) -> None:
+    for name in _COORDINATES:
+        value = elem.get(name)
+        if value is None:
+            continue
+        pixels = round(float(value))
+        if pixels == 0:
+            del elem.attrib[name]
+        else:
+            elem.set(name, str(pixels))
+
+
+def _renumber(model: Element) -> None:
+    """Give the cells of one mxGraphModel short, document-order IDs."""
+    mapping: dict[str, str] = {}
+    counter = len(_RESERVED_IDS)
+    for elem in model.iter():
+        cell_id = elem.get("id")
+        if cell_id is None or cell_id in _RESERVED_IDS or cell_id in mapping:
+            continue
+        mapping[cell_id] = compact_id(counter)
+        counter += 1
+    for elem in model.iter():
+        for name in ("id", *_REFERENCES):
+            value = elem.get(name)
+            if value in mapping:
+                elem.set(name, mapping[value])
+
+
+def minify_model(element: Element) -> Element:
+    """Apply the minified profile to an mxGraphModel or mxfile element."""
+    for elem in element.iter():
+        if elem.tag in _GEOMETRY_TAGS:
+            _minify_geometry(elem)
+        elif elem.tag == "mxCell":
+            for name in ("value", "style"):
+                if elem.get(name) == "":
+                    del elem.attrib[name]
+    models = [element] if element.tag == "mxGraphModel" else element.iter("mxGraphModel")
+    for model in models:
+        _renumber(model)
+    return element
@@ -0,0 +1,141 @@
+"""
+Conversion options shared by the plugin, the CLI and the pipeline.
+
+The SuperFences formatter is a plain module-level function, so the plugin
+cannot pass per-call arguments down to it. Instead the plugin (on_config)
+and the CLI call configure() once, and layout/generation code reads the
+active settings with get_options().
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields, replace
+from typing import Iterator
+
+from .parsers.base import DiagramType
+
+# Layout engines selectable per diagram type
+LAYOUT_ENGINES = ("rank", "force")
+
+# ERD entity renderings: one cell per field row, or one HTML-table cell
+ERD_RENDER_MODES = ("cells", "table")
+
+# Messages per page before a sequence diagram is split into pages
+DEFAULT_SEQUENCE_PAGE_MESSAGES = 200
+
+# Groups holding more nodes than this are emitted collapsed (0 = never)
+DEFAULT_COLLAPSE_GROUP_NODES = 0
+
+# Diagram types whose duplicate edges are merged unless configured
+# otherwise: none, since merging changes existing diagrams (labelled
+# branches such as `A -->|yes| B` and `A -->|no| B` become one edge)
+DEFAULT_MERGE_EDGE_TYPES: frozenset[str] = frozenset()
+
+
+@dataclass
+class ConvertOptions:
+    """Settings that change how diagrams are laid out and generated."""
+
+    # DiagramType value (e.g. "c4-context") -> layout engine name
+    layout_engines: dict[str, str] = field(default_factory=dict)
+    # Split sequence diagrams into pages of this many messages (0 = never)
+    sequence_page_messages: int = DEFAULT_SEQUENCE_PAGE_MESSAGES
+    # Split flowcharts with more nodes than this into one page per
+    # top-level subgraph plus an overview (0 = never)
+    flowchart_page_nodes: int = 0
+    # Collapse groups with more than this many nodes (0 = never)
+    collapse_group_nodes: int = DEFAULT_COLLAPSE_GROUP_NODES
+    # DiagramType value -> merge duplicate edges (overrides the default)
+    merge_edges: dict[str, bool] = field(default_factory=dict)
+    # Emit short stylesheet names instead of inline style strings; only
+    # valid where the stylesheet script (stylesheet.stylesheet_js) loads
+    named_styles: bool = False
+    # Whole-pixel coordinates, no default attributes, short cell IDs
+    minify_xml: bool = False
+    # ERD entity rendering, one of ERD_RENDER_MODES
+    erd_render: str = "cells"
+    # Split ERDs with more entities than this into subject areas of at
+    # most this many entities, a page each, plus an overview (0 = never)
+    erd_area_entities: int = 0
+
+    def layout_engine(self, diagram_type: DiagramType) -> str:
+        """Engine for a diagram type; rank layout unless configured."""
+        return self.layout_engines.get(diagram_type.value, "rank")
+
+    def merges_edges(self, diagram_type: DiagramType) -> bool:
+        """Whether duplicate edges are merged for a diagram type."""
+        return self.merge_edges.get(
+            diagram_type.value, diagram_type.value in DEFAULT_MERGE_EDGE_TYPES,
+        )
+
+    def validate(self) -> None:
+        """Raise ValueError for unknown names or out-of-range values."""
+        known_types = {t.value for t in DiagramType}
+        for dtype in self.merge_edges:
+            if dtype not in known_types:
+                raise ValueError(
+                    f"Unknown diagram type '{dtype}' in merge_edges "
+                    f"(expected one of: {', '.join(sorted(known_types))})"
+                )
+        for dtype, engine in self.layout_engines.items():
+            if dtype not in known_types:
+                raise ValueError(
+                    f"Unknown diagram type '{dtype}' in layout_engines "
+                    f"(expected one of: {', '.join(sorted(known_types))})"
+                )
+            if engine not in LAYOUT_ENGINES:
+                raise ValueError(
+                    f"Unknown layout engine '{engine}' for {dtype} "
+                    f"(expected one of: {', '.join(LAYOUT_ENGINES)})"
+                )
+        if self.erd_render not in ERD_RENDER_MODES:
+            raise ValueError(
+                f"Unknown erd_render '{self.erd_render}' "
+                f"(expected one of: {', '.join(ERD_RENDER_MODES)})"
+            )
+        for name in (
+            "sequence_page_messages", "flowchart_page_nodes", "collapse_group_nodes",
+            "erd_area_entities",
+        ):
+            if getattr(self, name) < 0:
+                raise ValueError(f"{name} must be 0 (off) or positive")
+
+
+_active = ConvertOptions()
+
+
+def get_options() -> ConvertOptions:
+    """Return the currently active options."""
+    return _active
+
+
+def configure(**overrides) -> ConvertOptions:
+    """Replace the active options with defaults plus ``overrides``.
+
+    Every call starts from defaults, so repeated builds (e.g. under
+    `mkdocs serve`) don't accumulate stale settings.
+    """
+    global _active
+    known = {f.name for f in fields(ConvertOptions)}
+    unknown = set(overrides) - known
+    if unknown:
+        raise TypeError(f"Unknown option(s): {', '.join(sorted(unknown))}")
+    options = ConvertOptions(**overrides)
+    options.validate()
+    _active = options
+    return options
+
+
+@contextmanager
+def overridden(**overrides) -> Iterator[ConvertOptions]:
+    """Temporarily apply ``overrides`` on top of the active options."""
+    global _active
+    previous = _active
+    options = replace(previous, **overrides)
+    options.validate()
+    _active = options
+    try:
+        yield options
+    finally:
+        _active = previous
@@ -0,0 +1,93 @@
+"""
+Rectangle packing for independently laid-out diagram pieces.
+
+Disconnected components are laid out on their own and then arranged on
+one canvas. The shelf packer (next-fit decreasing height) sorts boxes
+tallest-first and fills rows up to a target width chosen for a roughly
+landscape canvas, so the largest component lands top-left and isolated
+nodes tile into compact rows instead of one long line.
+
+Diagrams with no edges at all skip component detection and use
+grid_pack(), a single linear pass that keeps the boxes in source order.
+"""
+
+from __future__ import annotations
+
+from math import sqrt
+
+# Preferred canvas width / height ratio when choosing the row width
+TARGET_ASPECT = 1.6
+
+
+def shelf_pack(
+    sizes: list[tuple[float, float]],
+    gap: float,
+    max_width: float | None = None,
+) -> list[tuple[float, float]]:
+    """Pack (width, height) boxes into shelves.
+
+    Returns the top-left (x, y) offset of each box, in input order,
+    relative to the canvas origin. ``max_width`` defaults to a width that
+    makes the packed area close to TARGET_ASPECT, never narrower than the
+    widest box.
+    """
+    if not sizes:
+        return []
+
+    if max_width is None:
+        area = sum((w + gap) * (h + gap) for w, h in sizes)
+        max_width = sqrt(area * TARGET_ASPECT)
+    max_width = max(max_width, max(w for w, _ in sizes))
+
+    # Tallest first; ties keep input order so output is deterministic
+    order = sorted(range(len(sizes)), key=lambda i: -sizes[i][1])
+
+    positions: list[tuple[float, float]] = [(0.0, 0.0)] * len(sizes)
+    shelf_y = 0.0
+    shelf_height = 0.0
+    cursor_x = 0.0
+    for i in order:
+        width, height = sizes[i]
+        if cursor_x > 0 and cursor_x + width > max_width:
+            shelf_y += shelf_height + gap
+            cursor_x = 0.0
+            shelf_height = 0.0
+        positions[i] = (cursor_x, shelf_y)
+        cursor_x += width + gap
+        shelf_height = max(shelf_height, height)
+
+    return positions
+
+
+def grid_pack(
+    sizes: list[tuple[float, float]],
+    gap: float,
+) -> list[tuple[float, float]]:
+    """Arrange (width, height) boxes row-major in a grid, in input order.
+
+    The column count targets TARGET_ASPECT for the average box; each
+    column is as wide as its widest box and each row as tall as its
+    tallest, so mixed sizes line up without overlapping.
+    """
+    n = len(sizes)
+    if not n:
+        return []
+
+    avg_w = sum(w for w, _ in sizes) / n + gap
+    avg_h = sum(h for _, h in sizes) / n + gap
+    cols = max(1, min(n, round(sqrt(n * TARGET_ASPECT * avg_h / avg_w))))
+
+    col_widths = [0.0] * cols
+    row_heights = [0.0] * ((n + cols - 1) // cols)
+    for i, (w, h) in enumerate(sizes):
+        col_widths[i % cols] = max(col_widths[i % cols], w)
+        row_heights[i // cols] = max(row_heights[i // cols], h)
+
+    col_x = [0.0] * cols
+    for c in range(1, cols):
+        col_x[c] = col_x[c - 1] + col_widths[c - 1] + gap
+    row_y = [0.0] * len(row_heights)
+    for r in range(1, len(row_heights)):
+        row_y[r] = row_y[r - 1] + row_heights[r - 1] + gap
+
+    return [(col_x[i % cols], row_y[i // cols]) for i in range(n)]
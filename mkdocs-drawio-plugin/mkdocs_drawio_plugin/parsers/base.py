@@ -4,13 +4,19 @@ Intermediate Representation (IR) for parsed Mermaid diagrams.
 All parsers produce a DiagramIR that generators consume. This decouples
 parsing from XML generation — any parser can feed any generator as long
 as the IR contract is satisfied.
+
+LineDispatcher is the shared line classifier for the line-oriented
+parsers (sequence, C4, ERD). Parsers accept the whole source text or any
+iterable of lines (see read_header) and build the IR one line at a time.
 """
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
+from itertools import chain
+from typing import Iterable, Iterator, Optional, Union
 
 
 class DiagramType(Enum):
@@ -23,6 +29,8 @@ class DiagramType(Enum):
     C4_COMPONENT = "c4-component"
     C4_CODE = "c4-code"
     ERD = "erd"
+    STATE = "state"
+    CLASS = "class"
     GENERIC = "generic"
 
 
@@ -41,6 +49,7 @@ class NodeShape(Enum):
     UML_CLASS = "uml_class"
     START_END = "start_end"
     ERROR_END = "error_end"
+    FORK_JOIN = "fork_join"  # state <<fork>> / <<join>> bar
 
 
 class EdgeType(Enum):
@@ -59,6 +68,14 @@ class EdgeType(Enum):
     SEQ_REQUEST = "seq_request"
     SEQ_RESPONSE = "seq_response"
     SEQ_ERROR = "seq_error"
+    # Class-diagram relationships (the marker sits at the target end)
+    INHERITANCE = "inheritance"
+    REALIZATION = "realization"
+    COMPOSITION = "composition"
+    AGGREGATION = "aggregation"
+    ASSOCIATION = "association"
+    LINK = "link"
+    DASHED_LINK = "dashed_link"
 
 
 class LayoutDirection(Enum):
@@ -83,10 +100,14 @@ class DiagramNode:
     parent_group: Optional[str] = None
     # For UML class boxes / ERD entities
     fields: list[str] = field(default_factory=list)
+    # UML class operations (second compartment)
+    methods: list[str] = field(default_factory=list)
     # Arbitrary style override (if set, overrides semantic_role lookup)
     style_override: Optional[str] = None
     # Sub-type for ERD entities
     store_type: Optional[str] = None  # relational, nosql, cache, search
+    # Click-through target, e.g. "data:page/id,page-2" for a page link
+    link: Optional[str] = None
 
 
 @dataclass
@@ -103,6 +124,10 @@ class DiagramEdge:
     source_y: Optional[float] = None
     target_x: Optional[float] = None
     target_y: Optional[float] = None
+    # Orthogonal bend points (absolute x, y) set by routing.route_edges()
+    waypoints: list[tuple[float, float]] = field(default_factory=list)
+    # Innermost enclosing block (sequence alt/loop/... frames)
+    parent_group: Optional[str] = None
     # Arbitrary style override
     style_override: Optional[str] = None
 
@@ -118,6 +143,13 @@ class DiagramGroup:
     y: float = 0.0
     width: float = 600.0
     height: float = 200.0
+    # Enclosing group for nested subgraphs/boundaries (None = top level).
+    # After layout, x/y are relative to the parent group, like nodes.
+    parent_group: Optional[str] = None
+    # Emitted as a collapsed draw.io container: width/height are then the
+    # collapsed box and alternate_bounds the expanded (width, height).
+    collapsed: bool = False
+    alternate_bounds: Optional[tuple[float, float]] = None
     # For UML class/swimlane style groups
     style_override: Optional[str] = None
 
@@ -148,6 +180,9 @@ class DiagramIR:
     groups: list[DiagramGroup] = field(default_factory=list)
     # Sequence diagram specific
     participants: list[SequenceParticipant] = field(default_factory=list)
+    # IDs of nodes already sized to fit their label (e.g. taken from the
+    # C4 registry); textmetrics.size_nodes skips them
+    presized: set[str] = field(default_factory=set)
 
     def node_by_id(self, node_id: str) -> Optional[DiagramNode]:
         """Look up a node by its ID."""
@@ -156,12 +191,74 @@ class DiagramIR:
                 return n
         return None
 
+    def absolute_rects(self) -> dict[str, tuple[float, float, float, float]]:
+        """Absolute (x, y, width, height) of every node and group.
+
+        Group members store coordinates relative to their group (draw.io
+        child-cell semantics); this resolves the chain of parents.
+        """
+        groups = {g.id: g for g in self.groups}
+        origins: dict[str, tuple[float, float]] = {}
+
+        def origin(gid: Optional[str]) -> tuple[float, float]:
+            # Absolute top-left of group ``gid``'s coordinate space
+            chain: list[DiagramGroup] = []
+            seen: set[str] = set()
+            while gid in groups and gid not in origins and gid not in seen:
+                seen.add(gid)
+                chain.append(groups[gid])
+                gid = groups[gid].parent_group
+            base = origins.get(gid, (0.0, 0.0)) if gid is not None else (0.0, 0.0)
+            for g in reversed(chain):
+                base = (base[0] + g.x, base[1] + g.y)
+                origins[g.id] = base
+            return base
+
+        rects: dict[str, tuple[float, float, float, float]] = {}
+        for g in self.groups:
+            ox, oy = origin(g.parent_group)
+            rects[g.id] = (ox + g.x, oy + g.y, g.width, g.height)
+        for n in self.nodes:
+            ox, oy = origin(n.parent_group)
+            rects[n.id] = (ox + n.x, oy + n.y, n.width, n.height)
+        return rects
+
+    def hidden_items(self) -> dict[str, str]:
+        """Map nodes/groups inside a collapsed group to their outermost
+        collapsed ancestor (the box the viewer draws in their place)."""
+        parents = {g.id: g.parent_group for g in self.groups}
+        collapsed = {g.id for g in self.groups if g.collapsed}
+        if not collapsed:
+            return {}
+
+        def owner(gid: Optional[str]) -> Optional[str]:
+            found = None
+            hops = 0
+            while gid is not None and hops <= len(parents):
+                if gid in collapsed:
+                    found = gid
+                gid, hops = parents.get(gid), hops + 1
+            return found
+
+        hidden: dict[str, str] = {}
+        for g in self.groups:
+            top = owner(g.parent_group)
+            if top is not None:
+                hidden[g.id] = top
+        for n in self.nodes:
+            top = owner(n.parent_group)
+            if top is not None:
+                hidden[n.id] = top
+        return hidden
+
     def validate(self) -> list[str]:
         """Check IR invariants. Returns list of warning messages."""
         warnings = []
         node_ids = {n.id for n in self.nodes}
         participant_ids = {p.id for p in self.participants}
-        all_ids = node_ids | participant_ids
+        # Edges may also end on a group (e.g. a composite state)
+        group_ids = {g.id for g in self.groups}
+        all_ids = node_ids | participant_ids | group_ids
 
         if self.nodes and not self.edges:
             if len(self.nodes) > 1:
@@ -184,3 +281,84 @@ class DiagramIR:
                 )
 
         return warnings
+
+
+# Mermaid source: the whole text, or lines (a file object, a generator)
+Source = Union[str, Iterable[str]]
+
+
+def source_lines(source: Source) -> Iterator[str]:
+    """Lines of Mermaid source without their line endings.
+
+    Text is split once; an iterable is read lazily, a line at a time, so
+    parsing a file object never holds more than the current line.
+    """
+    if isinstance(source, str):
+        return iter(source.splitlines())
+    return (line.rstrip("\r\n") for line in source)
+
+
+def read_header(
+    source: Source, header_re: re.Pattern
+) -> tuple[Optional[re.Match], Iterator[str]]:
+    """Match the diagram header and return the body lines after it.
+
+    Blank and %% comment lines before the first statement are skipped.
+    If that statement is not a header, the match is None and the
+    statement stays the first body line.
+    """
+    lines = source_lines(source)
+    for line in lines:
+        stripped = line.strip()
+        if not stripped or stripped.startswith("%%"):
+            continue
+        m = header_re.match(stripped)
+        if m is not None:
+            return m, lines
+        return None, chain((line,), lines)
+    return None, lines
+
+
+# A named line pattern: (kind, compiled regex)
+LineRule = tuple[str, re.Pattern]
+
+
+class LineDispatcher:
+    """Classify stripped, non-empty lines by their first token.
+
+    Each keyword (case-insensitive) selects one rule; only its pattern
+    runs, followed by the fallback rules if it does not match. Lines whose
+    first token is not a keyword (message and relationship lines start
+    with a name) try the fallback rules alone, in order.
+
+        dispatcher = LineDispatcher(
+            {("participant", "actor"): ("participant", _PARTICIPANT_RE)},
+            fallback=[("message", _MESSAGE_RE)],
+        )
+        kind, match = dispatcher.match(stripped)  # (None, None): no rule
+    """
+
+    def __init__(
+        self,
+        keywords: dict[Union[str, tuple[str, ...]], LineRule],
+        fallback: Iterable[LineRule] = (),
+    ) -> None:
+        self.fallback: tuple[LineRule, ...] = tuple(fallback)
+        self.rules: dict[str, tuple[LineRule, ...]] = {}
+        for names, rule in keywords.items():
+            for name in (names,) if isinstance(names, str) else names:
+                self.rules[name.lower()] = (rule, *self.fallback)
+
+    def match(self, line: str) -> tuple[Optional[str], Optional[re.Match]]:
+        """(kind, match) of the first rule matching the line."""
+        # First token: everything up to whitespace or "(", so "Rel(a, b)"
+        # and "participant A" both yield their keyword
+        token = line.split(None, 1)[0] if line else ""
+        if "(" in token:
+            token = token.partition("(")[0]
+        rules = self.rules.get(token.lower(), self.fallback)
+        for kind, pattern in rules:
+            m = pattern.match(line)
+            if m is not None:
+                return kind, m
+        return None, None
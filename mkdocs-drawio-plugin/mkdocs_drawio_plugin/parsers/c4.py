@@ -31,7 +31,10 @@ from .base import (
     DiagramType,
     EdgeType,
     LayoutDirection,
+    LineDispatcher,
     NodeShape,
+    Source,
+    read_header,
 )
 
 # Header patterns
@@ -49,33 +52,48 @@ _HEADER_RE = re.compile(
 )
 
 # Element patterns — capture comma-separated args in parens
+_ELEMENTS = (
+    "Person", "Person_Ext", "System", "System_Ext", "SystemDb", "SystemQueue",
+    "Container", "ContainerDb", "ContainerQueue",
+    "Component", "ComponentDb", "ComponentQueue",
+)
 _ELEMENT_RE = re.compile(
-    r"^\s*(Person|Person_Ext|System|System_Ext|SystemDb|SystemQueue|"
-    r"Container|ContainerDb|ContainerQueue|"
-    r"Component|ComponentDb|ComponentQueue)"
+    rf"^\s*({'|'.join(_ELEMENTS)})"
     r"\s*\((.+)\)\s*$",
     re.IGNORECASE,
 )
 
 # Relationship patterns
+_RELS = ("Rel", "BiRel", "Rel_Back", "Rel_Neighbor", "Rel_D", "Rel_U", "Rel_L", "Rel_R")
 _REL_RE = re.compile(
-    r"^\s*(Rel|BiRel|Rel_Back|Rel_Neighbor|Rel_D|Rel_U|Rel_L|Rel_R)"
+    rf"^\s*({'|'.join(_RELS)})"
     r"\s*\((.+)\)\s*$",
     re.IGNORECASE,
 )
 
 # Boundary patterns
+_BOUNDARIES = ("Boundary", "System_Boundary", "Container_Boundary", "Enterprise_Boundary")
 _BOUNDARY_RE = re.compile(
-    r"^\s*(Boundary|System_Boundary|Container_Boundary|Enterprise_Boundary)"
-    r"\s*\(([^,]+),\s*(.+)\)\s*\{\s*$",
+    rf"^\s*({'|'.join(_BOUNDARIES)})"
+    r"\s*\(([^,]+),(.+)\)\s*\{\s*$",  # label blanks are stripped later
     re.IGNORECASE,
 )
 
 _BOUNDARY_END_RE = re.compile(r"^\s*\}\s*$")
 
 # UpdateRelStyle, UpdateElementStyle, etc. — skip these
+_STYLES = ("UpdateRelStyle", "UpdateElementStyle", "UpdateLayoutStyle")
 _STYLE_RE = re.compile(r"^\s*Update(Rel|Element|Layout)Style\s*\(", re.IGNORECASE)
 
+# Every C4 statement starts with its keyword
+_LINES = LineDispatcher({
+    _STYLES: ("style", _STYLE_RE),
+    _BOUNDARIES: ("boundary", _BOUNDARY_RE),
+    "}": ("boundary_end", _BOUNDARY_END_RE),
+    _ELEMENTS: ("element", _ELEMENT_RE),
+    _RELS: ("rel", _REL_RE),
+})
+
 
 def _split_args(args_str: str) -> list[str]:
     """Split comma-separated args, respecting quoted strings."""
@@ -143,20 +161,14 @@ def _element_to_node(elem_type: str, args: list[str]) -> DiagramNode:
     )
 
 
-def parse(text: str) -> DiagramIR:
-    """Parse a Mermaid C4 diagram into DiagramIR."""
-    lines = text.strip().splitlines()
-    if not lines:
-        return DiagramIR(diagram_type=DiagramType.C4_CONTEXT)
-
+def parse(source: Source) -> DiagramIR:
+    """Parse a Mermaid C4 diagram (text or lines) into DiagramIR."""
     # Detect diagram type from header
     diagram_type = DiagramType.C4_CONTEXT
-    start_line = 0
-    header_match = _HEADER_RE.match(lines[0])
+    header_match, lines = read_header(source, _HEADER_RE)
     if header_match:
         key = header_match.group(1).lower()
         diagram_type = _HEADER_MAP.get(key, DiagramType.C4_CONTEXT)
-        start_line = 1
 
     nodes: dict[str, DiagramNode] = {}
     edges: list[DiagramEdge] = []
@@ -165,42 +177,43 @@ def parse(text: str) -> DiagramIR:
     edge_counter = 0
     group_counter = 0
 
-    for line in lines[start_line:]:
+    for line in lines:
         stripped = line.strip()
 
         if not stripped or stripped.startswith("%%"):
             continue
 
+        kind, m = _LINES.match(stripped)
+
         # Skip style update directives
-        if _STYLE_RE.match(stripped):
+        if kind == "style":
             continue
 
         # Boundary start
-        b_match = _BOUNDARY_RE.match(stripped)
-        if b_match:
+        if kind == "boundary":
             group_counter += 1
-            alias = b_match.group(2).strip().strip("\"'")
-            label = b_match.group(3).strip().strip("\"'")
+            alias = m.group(2).strip().strip("\"'")
+            label = m.group(3).strip().strip("\"'")
             gid = f"boundary_{alias}"
             groups.append(DiagramGroup(
                 id=gid,
                 label=label,
                 group_type="info",
+                parent_group=boundary_stack[-1] if boundary_stack else None,
             ))
             boundary_stack.append(gid)
             continue
 
         # Boundary end
-        if _BOUNDARY_END_RE.match(stripped):
+        if kind == "boundary_end":
             if boundary_stack:
                 boundary_stack.pop()
             continue
 
         # Element
-        e_match = _ELEMENT_RE.match(stripped)
-        if e_match:
-            elem_type = e_match.group(1)
-            args = _split_args(e_match.group(2))
+        if kind == "element":
+            elem_type = m.group(1)
+            args = _split_args(m.group(2))
             node = _element_to_node(elem_type, args)
             if boundary_stack:
                 node.parent_group = boundary_stack[-1]
@@ -208,10 +221,9 @@ def parse(text: str) -> DiagramIR:
             continue
 
         # Relationship
-        r_match = _REL_RE.match(stripped)
-        if r_match:
-            rel_type = r_match.group(1).lower()
-            args = _split_args(r_match.group(2))
+        if kind == "rel":
+            rel_type = m.group(1).lower()
+            args = _split_args(m.group(2))
             if len(args) >= 2:
                 src = args[0]
                 tgt = args[1]
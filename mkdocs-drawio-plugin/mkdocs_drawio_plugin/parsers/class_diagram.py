@@ -0,0 +1,278 @@
+"""
+Mermaid class diagram parser.
+
+Handles `classDiagram` blocks with classes, members, annotations,
+namespaces, and relationships.
+
+Supported syntax:
+  class Animal
+  class Shape~T~ {
+      <<interface>>
+      +String name
+      +area() double
+  }
+  class Pet["Display label"]
+  Animal : +int age
+  Animal : +isMammal() bool
+  <<abstract>> Animal
+  namespace Zoo { class Keeper }
+  Animal <|-- Duck : inherits
+  Order "1" *-- "many" LineItem
+  direction LR
+
+Relationships (the UML marker ends up at the edge's target):
+  <|--  --|>   inheritance       <|..  ..|>   realization
+  *--   --*    composition       o--   --o    aggregation
+  <--   -->    association       <..   ..>    dependency
+  --           link              ..           dashed link
+
+Members containing "(" are methods, the rest attributes. Generic
+parameters written ~T~ are shown as <T>. Notes, styling and click lines
+are skipped.
+"""
+
+from __future__ import annotations
+
+import html
+import re
+
+from .base import (
+    DiagramEdge,
+    DiagramGroup,
+    DiagramIR,
+    DiagramNode,
+    DiagramType,
+    EdgeType,
+    LayoutDirection,
+    LineDispatcher,
+    NodeShape,
+    Source,
+    read_header,
+)
+
+_HEADER_RE = re.compile(r"^\s*classDiagram(?:-v2)?\s*$", re.IGNORECASE)
+
+# Relationship operator -> (edge type, marker on the left-hand class)
+_RELATIONS = {
+    "<|--": (EdgeType.INHERITANCE, True),
+    "--|>": (EdgeType.INHERITANCE, False),
+    "<|..": (EdgeType.REALIZATION, True),
+    "..|>": (EdgeType.REALIZATION, False),
+    "*--": (EdgeType.COMPOSITION, True),
+    "--*": (EdgeType.COMPOSITION, False),
+    "o--": (EdgeType.AGGREGATION, True),
+    "--o": (EdgeType.AGGREGATION, False),
+    "<--": (EdgeType.ASSOCIATION, True),
+    "-->": (EdgeType.ASSOCIATION, False),
+    "<..": (EdgeType.DEPENDENCY, True),
+    "..>": (EdgeType.DEPENDENCY, False),
+    "--": (EdgeType.LINK, False),
+    "..": (EdgeType.DASHED_LINK, False),
+}
+
+# A class name with optional ~generic~ parameters
+_CLASS_REF = r"(\w+)(?:~([^~]*)~)?"
+
+# Longest operators first, so "--|>" is not read as "--"
+_RELATION_OPS = "|".join(
+    re.escape(op) for op in sorted(_RELATIONS, key=len, reverse=True)
+)
+
+# Relationship: A ["card"] op ["card"] B [: label]
+_RELATION_RE = re.compile(
+    rf"^\s*{_CLASS_REF}\s*"
+    r'(?:"([^"]*)"\s*)?'
+    rf"({_RELATION_OPS})"
+    r'\s*(?:"([^"]*)"\s*)?'
+    rf"{_CLASS_REF}\s*(?::(.*))?$"
+)
+
+# Member added from outside the class: Animal : +int age
+_MEMBER_RE = re.compile(rf"^\s*{_CLASS_REF}\s*:(.*)$")
+
+# Class declaration: class Name[~T~]["Label"][:::css] [{]
+_CLASS_RE = re.compile(
+    rf"^\s*class\s+{_CLASS_REF}"
+    r'\s*(?:\["([^"]*)"\])?'
+    r"\s*(?::::\w+)?\s*(\{)?\s*$"
+)
+
+# Annotation: <<interface>> Name, or <<interface>> alone in a class body
+_ANNOTATION_RE = re.compile(r"^\s*<<([^>]+)>>\s*(\w+)?\s*$")
+
+_NAMESPACE_RE = re.compile(r"^\s*namespace\s+([\w.]+)\s*\{\s*$")
+_BLOCK_END_RE = re.compile(r"^\s*\}\s*$")
+_DIRECTION_RE = re.compile(r"^\s*direction\s+(TB|TD|BT|LR|RL)\s*$", re.IGNORECASE)
+
+_LINES = LineDispatcher(
+    {
+        "class": ("class", _CLASS_RE),
+        "namespace": ("namespace", _NAMESPACE_RE),
+        "}": ("end", _BLOCK_END_RE),
+        "direction": ("direction", _DIRECTION_RE),
+    },
+    fallback=[
+        ("annotation", _ANNOTATION_RE),
+        ("relation", _RELATION_RE),
+        ("member", _MEMBER_RE),
+    ],
+)
+
+
+def _generic(text: str) -> str:
+    """Mermaid ~T~ generic markers as <T>."""
+    if "~" not in text:
+        return text
+    parts = text.split("~")
+    out = parts[0]
+    for i, part in enumerate(parts[1:], 1):
+        out += ("<" if i % 2 else ">") + part
+    return out
+
+
+class _Class:
+    """A class as it is being read (label parts change until the end)."""
+
+    __slots__ = ("node", "name", "generic", "display", "annotation")
+
+    def __init__(self, node: DiagramNode):
+        self.node = node
+        self.name = node.id
+        self.generic: str | None = None
+        self.display: str | None = None
+        self.annotation: str | None = None
+
+    def add_member(self, text: str) -> None:
+        member = _generic(text.strip())
+        if not member:
+            return
+        if "(" in member:
+            self.node.methods.append(member)
+        else:
+            self.node.fields.append(member)
+
+    def finish(self) -> None:
+        """Set the HTML header label: optional «annotation» line, then name."""
+        title = self.display
+        if title is None:
+            title = self.name + (f"<{_generic(self.generic)}>" if self.generic else "")
+        label = html.escape(title, quote=False)
+        if self.annotation:
+            label = f"«{html.escape(self.annotation, quote=False)}»<br>{label}"
+        self.node.label = label
+
+
+def parse(source: Source) -> DiagramIR:
+    """Parse a Mermaid class diagram (text or lines) into DiagramIR."""
+    _, lines = read_header(source, _HEADER_RE)
+
+    layout = LayoutDirection.TB
+    classes: dict[str, _Class] = {}
+    edges: list[DiagramEdge] = []
+    groups: list[DiagramGroup] = []
+    namespace_stack: list[str] = []
+    # Class whose { ... } body is open
+    body: _Class | None = None
+
+    def ensure_class(name: str, generic: str | None = None) -> _Class:
+        cls = classes.get(name)
+        if cls is None:
+            cls = classes[name] = _Class(DiagramNode(
+                id=name,
+                label=name,
+                shape=NodeShape.UML_CLASS,
+                parent_group=namespace_stack[-1] if namespace_stack else None,
+            ))
+        if generic and not cls.generic:
+            cls.generic = generic
+        return cls
+
+    for line in lines:
+        stripped = line.strip()
+
+        if not stripped or stripped.startswith("%%"):
+            continue
+
+        # Inside a class body every line is a member, an annotation or "}"
+        if body is not None:
+            if _BLOCK_END_RE.match(stripped):
+                body = None
+                continue
+            m = _ANNOTATION_RE.match(stripped)
+            if m is not None and m.group(2) is None:
+                body.annotation = m.group(1).strip()
+            else:
+                body.add_member(stripped)
+            continue
+
+        kind, m = _LINES.match(stripped)
+
+        if kind == "relation":
+            (left, left_generic, left_card, op,
+             right_card, right, right_generic, label) = m.groups()
+            ensure_class(left, left_generic)
+            ensure_class(right, right_generic)
+            edge_type, marker_left = _RELATIONS[op]
+            source, target = (right, left) if marker_left else (left, right)
+            if marker_left:
+                left_card, right_card = right_card, left_card
+            # Cardinalities around the label, source side first
+            parts = [left_card, (label or "").strip(), right_card]
+            edges.append(DiagramEdge(
+                id=f"rel_{len(edges)}",
+                source=source,
+                target=target,
+                label="  ".join(p for p in parts if p),
+                edge_type=edge_type,
+            ))
+            continue
+
+        if kind == "member":
+            ensure_class(m.group(1), m.group(2)).add_member(m.group(3))
+            continue
+
+        if kind == "class":
+            name, generic, display, opens = m.groups()
+            cls = ensure_class(name, generic)
+            if display is not None:
+                cls.display = display
+            if opens:
+                body = cls
+            continue
+
+        if kind == "annotation":
+            if m.group(2):
+                ensure_class(m.group(2)).annotation = m.group(1).strip()
+            continue
+
+        if kind == "namespace":
+            gid = m.group(1)
+            groups.append(DiagramGroup(
+                id=gid,
+                label=gid,
+                group_type="info",
+                parent_group=namespace_stack[-1] if namespace_stack else None,
+            ))
+            namespace_stack.append(gid)
+            continue
+
+        if kind == "end":
+            if namespace_stack:
+                namespace_stack.pop()
+            continue
+
+        if kind == "direction":
+            direction = m.group(1).upper()
+            layout = LayoutDirection.LR if direction in ("LR", "RL") else LayoutDirection.TB
+            continue
+
+    for cls in classes.values():
+        cls.finish()
+
+    return DiagramIR(
+        diagram_type=DiagramType.CLASS,
+        layout=layout,
+        nodes=[cls.node for cls in classes.values()],
+        edges=edges,
+        groups=groups,
+    )
@@ -24,7 +24,10 @@ from .base import (
     DiagramType,
     EdgeType,
     LayoutDirection,
+    LineDispatcher,
     NodeShape,
+    Source,
+    read_header,
 )
 
 _HEADER_RE = re.compile(r"^\s*erDiagram\s*$", re.IGNORECASE)
@@ -55,9 +58,38 @@ _RELATIONSHIP_RE = re.compile(
     r"([|o{]{1,2})"                   # right cardinality
     r"\s+"
     r"([A-Za-z_][A-Za-z0-9_]*)"      # entity2
-    r'\s*:\s*"?([^"]*)"?\s*$'         # label
+    r"\s*:(.*)$"                      # label, see _relationship_label
 )
 
+# Entity blocks and relationships start with a name, so apart from "}"
+# lines are told apart by pattern; inside an entity block the remaining
+# lines are fields rather than relationships
+_LINES = LineDispatcher(
+    {"}": ("entity_end", _ENTITY_END_RE)},
+    fallback=[("entity_start", _ENTITY_START_RE), ("relationship", _RELATIONSHIP_RE)],
+)
+_ENTITY_LINES = LineDispatcher(
+    {"}": ("entity_end", _ENTITY_END_RE)},
+    fallback=[("entity_start", _ENTITY_START_RE), ("field", _FIELD_RE)],
+)
+
+
+def _relationship_label(text: str) -> str | None:
+    """Relationship label with optional quotes removed.
+
+    None when quotes appear inside the label. Done in Python rather than
+    in _RELATIONSHIP_RE, where optional quotes between blank runs made
+    malformed lines backtrack polynomially.
+    """
+    label = text.strip()
+    if label.startswith('"'):
+        label = label[1:]
+    if label.endswith('"'):
+        label = label[:-1]
+    if '"' in label:
+        return None
+    return label.strip()
+
 
 def _cardinality_label(markers: str) -> str:
     """Convert Mermaid cardinality markers to ERD notation."""
@@ -74,15 +106,9 @@ def _cardinality_label(markers: str) -> str:
     return marker_map.get(markers, markers)
 
 
-def parse(text: str) -> DiagramIR:
-    """Parse a Mermaid ERD into DiagramIR."""
-    lines = text.strip().splitlines()
-    if not lines:
-        return DiagramIR(diagram_type=DiagramType.ERD)
-
-    start_line = 0
-    if _HEADER_RE.match(lines[0]):
-        start_line = 1
+def parse(source: Source) -> DiagramIR:
+    """Parse a Mermaid ERD (text or lines) into DiagramIR."""
+    _, lines = read_header(source, _HEADER_RE)
 
     nodes: dict[str, DiagramNode] = {}
     edges: list[DiagramEdge] = []
@@ -90,21 +116,22 @@ def parse(text: str) -> DiagramIR:
     current_fields: list[str] = []
     edge_counter = 0
 
-    for line in lines[start_line:]:
+    for line in lines:
         stripped = line.strip()
 
         if not stripped or stripped.startswith("%%"):
             continue
 
+        kind, m = (_ENTITY_LINES if current_entity else _LINES).match(stripped)
+
         # Entity block start
-        entity_match = _ENTITY_START_RE.match(stripped)
-        if entity_match:
-            current_entity = entity_match.group(1)
+        if kind == "entity_start":
+            current_entity = m.group(1)
             current_fields = []
             continue
 
         # Entity block end
-        if _ENTITY_END_RE.match(stripped) and current_entity:
+        if kind == "entity_end" and current_entity:
             nodes[current_entity] = DiagramNode(
                 id=current_entity,
                 label=current_entity,
@@ -118,12 +145,11 @@ def parse(text: str) -> DiagramIR:
 
         # Field inside entity block
         if current_entity:
-            field_match = _FIELD_RE.match(stripped)
-            if field_match:
-                ftype = field_match.group(1)
-                fname = field_match.group(2)
-                constraint = field_match.group(3) or ""
-                comment = field_match.group(4) or ""
+            if kind == "field":
+                ftype = m.group(1)
+                fname = m.group(2)
+                constraint = m.group(3) or ""
+                comment = m.group(4) or ""
 
                 badge = f" [{constraint}]" if constraint else ""
                 desc = f"  {comment}" if comment else ""
@@ -131,13 +157,14 @@ def parse(text: str) -> DiagramIR:
             continue
 
         # Relationship
-        rel_match = _RELATIONSHIP_RE.match(stripped)
-        if rel_match:
-            entity1 = rel_match.group(1)
-            left_card = rel_match.group(2)
-            right_card = rel_match.group(4)
-            entity2 = rel_match.group(5)
-            label = rel_match.group(6).strip()
+        if kind == "relationship":
+            entity1 = m.group(1)
+            left_card = m.group(2)
+            right_card = m.group(4)
+            entity2 = m.group(5)
+            label = _relationship_label(m.group(6))
+            if label is None:
+                continue
 
             # Ensure entities exist even without field blocks
             if entity1 not in nodes:
@@ -4,12 +4,15 @@ Mermaid flowchart parser.
 Handles `graph TD`, `graph LR`, `flowchart TD`, `flowchart LR` diagrams.
 Parses node definitions, edge connections, and subgraphs.
 
-Uses regex-based line-by-line parsing — no external dependencies.
+Each line is read once: plain chains of links (by far the most common
+statement) take a regex fast path; other lines are split by a
+single-pass tokenizer (_TOKEN_RE) into node, "&", link and break tokens.
 """
 
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 
 from .base import (
     DiagramEdge,
@@ -20,6 +23,8 @@ from .base import (
     EdgeType,
     LayoutDirection,
     NodeShape,
+    Source,
+    read_header,
 )
 
 # Match the opening line: graph TD, graph LR, flowchart TD, etc.
@@ -27,12 +32,6 @@ _HEADER_RE = re.compile(
     r"^\s*(?:graph|flowchart)\s+(TD|TB|LR|RL|BT)\s*$", re.IGNORECASE
 )
 
-# Match subgraph start: subgraph Title
-_SUBGRAPH_RE = re.compile(r"^\s*subgraph\s+(.+)$", re.IGNORECASE)
-
-# Match subgraph end
-_SUBGRAPH_END_RE = re.compile(r"^\s*end\s*$", re.IGNORECASE)
-
 # Node shapes in Mermaid:
 #   id[label]        → rect
 #   id(label)        → rounded_rect
@@ -43,203 +42,397 @@ _SUBGRAPH_END_RE = re.compile(r"^\s*end\s*$", re.IGNORECASE)
 #   id{{label}}      → hexagon
 #   id[/label/]      → parallelogram
 #   id>label]        → flag (mapped to rect)
-
-# Edge patterns:
-#   --> solid arrow
-#   -.-> dotted arrow
-#   ==> thick arrow
-#   --- solid line (no arrow)
-#   -.- dotted line
-#   === thick line
-#   --text--> labeled solid arrow
-#   -.text.-> labeled dotted arrow
-#   ==text==> labeled thick arrow
-#   -->|text| labeled solid arrow (pipe style)
-
-_EDGE_RE = re.compile(
-    r"(\S+)"                    # source node ID
-    r"\s*"
-    r"("                        # edge operator
-    r"-->"                      # solid arrow
-    r"|==>"                     # thick arrow
-    r"|-\.->|\.->|-\.\.->|\.->" # dotted arrow variants
-    r"|---"                     # solid line
-    r"|===|-\.-"                # thick/dotted line
-    r"|--\s*[^-].*?-->"        # labeled: --text-->
-    r"|-\.\s*.*?\.\->"         # labeled: -.text.->
-    r"|==\s*.*?==>"            # labeled: ==text==>
-    r"|-->\|[^|]*\|"           # labeled: -->|text|
-    r")"
-    r"\s*"
-    r"(\S+)"                    # target node ID
+#
+# Edge operators:
+#   --> solid arrow        --- solid line         (more dashes: longer)
+#   -.-> dotted arrow      -.- dotted line
+#   ==> thick arrow        === thick line
+#   -- text -->  -. text .->  == text ==>   inline labels
+#   -->|text|  (any operator)               pipe label
+# A & B --> C & D connects every node on the left to every node on the right.
+
+# Shape openers, longest first, with the closers tried for each: a
+# longer opener only wins when its closer is present (e.g. "[(" without
+# ")]" falls back to "[ ]"). Each closer yields a shape and delimiter
+# width; unusual delimiters keep their inner brackets in the label, as
+# Mermaid's own fallbacks do. The label runs to the first closer.
+_SHAPES = {
+    "[[": (("]]", NodeShape.RECT, 1), ("]", NodeShape.RECT, 1)),
+    "[(": ((")]", NodeShape.CYLINDER, 2), ("]", NodeShape.RECT, 1)),
+    "[/": (("/]", NodeShape.PARALLELOGRAM, 2), ("]", NodeShape.RECT, 1)),
+    "[\\": (("\\]", NodeShape.RECT, 1), ("]", NodeShape.RECT, 1)),
+    "([": (("])", NodeShape.STADIUM, 2), (")", NodeShape.ROUNDED_RECT, 1)),
+    "((": (("))", NodeShape.CIRCLE, 2), (")", NodeShape.ROUNDED_RECT, 1)),
+    "{{": (("}}", NodeShape.HEXAGON, 2), ("}", NodeShape.DIAMOND, 1)),
+    "{": (("}", NodeShape.DIAMOND, 1),),
+    "[": (("]", NodeShape.RECT, 1),),
+    "(": ((")", NodeShape.ROUNDED_RECT, 1),),
+    ">": (("]", NodeShape.RECT, 1),),
+}
+
+# Whole-line statements: subgraph <label>, end, and %% comments. The
+# label keeps its trailing blanks here (stripped by the caller), so no
+# two quantifiers compete for the same characters.
+_LINE_RE = re.compile(
+    r"[ \t\r]*(?:(?i:subgraph)[ \t]+(.*)|((?i:end))[ \t\r]*|(%%).*)"
 )
 
-# Simpler two-pass approach: first extract node defs, then edges
-_NODE_DEF_RE = re.compile(
-    r"(?:^|\s)"
-    r"([A-Za-z_][A-Za-z0-9_]*)"  # node ID
-    r"("
-    r"\[\[.*?\]\]"      # double bracket (subroutine)
-    r"|\[\(.*?\)\]"     # [(label)] cylinder
-    r"|\[\[.*?\]\]"     # [[label]] subroutine
-    r"|\[/.*?/\]"       # [/label/] parallelogram
-    r"|\[\\.*?\\\]"     # [\label\] parallelogram alt
-    r"|\(\[.*?\]\)"     # ([label]) stadium
-    r"|\(\(.*?\)\)"     # ((label)) circle
-    r"|\{\{.*?\}\}"     # {{label}} hexagon
-    r"|\{.*?\}"         # {label} diamond
-    r"|\[.*?\]"         # [label] rect
-    r"|\(.*?\)"         # (label) rounded_rect
-    r"|>.*?\]"          # >label] flag
+# One token per match, anchored at the scan position: blanks are skipped
+# and the token is a node (ID plus optional shape opener), "&", a
+# complete operator with optional pipe label, an inline-label opener, or
+# any other character (a statement break). Closers are found with
+# _Closers rather than by the regex, so a line full of unclosed openers
+# is still scanned in linear time.
+_TOKEN_RE = re.compile(
+    r"[ \t\r]*(?:"
+    r"([A-Za-z_][A-Za-z0-9_]*)"
+    r"(" + "|".join(re.escape(opener) for opener in _SHAPES) + r")?"
+    r"|(&)"
+    r"|(-{2,}>|-{3,}|-\.+->?|={2,}>|={3,})"  # operator
+    r"(?:[ \t]*\|([^|\n]*)\|)?"              # pipe label
+    r"|(--|-\.|==)"                          # inline-label opener
+    r"|(.)"
     r")"
 )
+_CLASS_RE = re.compile(r":::[A-Za-z0-9_]+")  # class shorthand: A:::name
+_ID_GROUP = 1
+_OPENER_GROUP = 2
+_AND_GROUP = 3
+_OP_GROUP = 4
+_PIPE_GROUP = 5
+_INLINE_GROUP = 6
+
+# Fast path for the most common lines, plain chains of links ("A --> B",
+# "A[x] -->|y| B{z} --> C"). Labels here hold no brackets, so the shape
+# follows from the delimiters alone (_simple_shape); anything else goes
+# through _TOKEN_RE. _SIMPLE_CHAIN_RE captures the first link and the rest
+# of the chain, which _SIMPLE_STEP_RE splits into (operator, pipe label,
+# ID, shape) steps.
+_SIMPLE_ID = r"[A-Za-z_][A-Za-z0-9_]*"
+_SIMPLE_SHAPE = r"[\[({>][\[({/\\]?[^\[\](){}|\n]*[\])}/\\]?[\])}]"
+_SIMPLE_OP = r"-{2,}>|-{3,}|-\.+->?|={2,}>|={3,}"
+_SIMPLE_STEP = (
+    rf"[ \t\r]*({_SIMPLE_OP})(?:[ \t]*\|([^|\n]*)\|)?"
+    rf"[ \t\r]*({_SIMPLE_ID})({_SIMPLE_SHAPE})?"
+)
+_SIMPLE_CHAIN_RE = re.compile(
+    rf"[ \t\r]*({_SIMPLE_ID})({_SIMPLE_SHAPE})?{_SIMPLE_STEP}"
+    rf"((?:[ \t\r]*(?:{_SIMPLE_OP})(?:[ \t]*\|[^|\n]*\|)?"
+    rf"[ \t\r]*{_SIMPLE_ID}(?:{_SIMPLE_SHAPE})?)*)[ \t\r]*"
+)
+_SIMPLE_STEP_RE = re.compile(_SIMPLE_STEP)
+# (opener, closer) -> (shape, delimiter width), two-character pairs first
+_SIMPLE_SHAPES = {
+    ("[[", "]]"): (NodeShape.RECT, 1),
+    ("[(", ")]"): (NodeShape.CYLINDER, 2),
+    ("([", "])"): (NodeShape.STADIUM, 2),
+    ("((", "))"): (NodeShape.CIRCLE, 2),
+    ("{{", "}}"): (NodeShape.HEXAGON, 2),
+    ("{", "}"): (NodeShape.DIAMOND, 1),
+    ("[", "]"): (NodeShape.RECT, 1),
+    ("(", ")"): (NodeShape.ROUNDED_RECT, 1),
+    (">", "]"): (NodeShape.RECT, 1),
+}
+# Openers whose two-character form would be tried first by _TOKEN_RE
+_DOUBLE_OPENERS = frozenset(("[[", "[(", "[/", "[\\", "([", "((", "{{"))
+
+
+def _simple_shape(text: str) -> tuple[NodeShape, int] | None:
+    """Shape of a bracket-free fast-path label, or None when ambiguous."""
+    if len(text) >= 4:
+        found = _SIMPLE_SHAPES.get((text[:2], text[-2:]))
+        if found is not None:
+            return found
+    if text[:2] in _DOUBLE_OPENERS:
+        return None
+    return _SIMPLE_SHAPES.get((text[0], text[-1]))
+
+
+# Inline-label opener -> (closer, arrow type, line type)
+_INLINE_LABELS = {
+    "--": ("-->", EdgeType.SYNC, EdgeType.SYNC),
+    "-.": (".-", EdgeType.ASYNC, EdgeType.DEPENDENCY),
+    "==": ("==>", EdgeType.DATA_FLOW, EdgeType.DATA_FLOW),
+}
+
+
+@lru_cache(maxsize=None)
+def _operator_type(op: str) -> EdgeType:
+    """Edge type of a complete operator such as "-->", "-.-" or "===".
+
+    Dotted arrows are async, thick operators are data flow, solid arrows
+    are sync, and plain (arrowless) lines are dependencies.
+    """
+    if op[0] == "=":
+        return EdgeType.DATA_FLOW
+    if op[1] == ".":
+        return EdgeType.ASYNC if op[-1] == ">" else EdgeType.DEPENDENCY
+    return EdgeType.SYNC if op[-1] == ">" else EdgeType.DEPENDENCY
+
+
+def _sized_node(node_id: str, label: str, shape: NodeShape, group: str | None) -> DiagramNode:
+    """New node with the default dimensions for its shape."""
+    node = DiagramNode(id=node_id, label=label, shape=shape, parent_group=group)
+    if shape == NodeShape.DIAMOND:
+        node.width = 120
+        node.height = 80
+    elif shape == NodeShape.CIRCLE:
+        node.width = 80
+        node.height = 80
+    elif shape == NodeShape.START_END:
+        node.width = 100
+        node.height = 40
+    return node
+
+
+def _define_node(
+    nodes: dict[str, DiagramNode],
+    node_id: str,
+    label: str,
+    shape: NodeShape,
+    current_group: str | None,
+) -> None:
+    """Apply a shaped node definition such as ``A[label]``."""
+    node = nodes.get(node_id)
+    if node is None:
+        nodes[node_id] = _sized_node(node_id, label, shape, current_group)
+        return
+    # Update label if re-defined
+    node.label = label
+    node.shape = shape
+    if current_group:
+        node.parent_group = current_group
+
+
+def _add_edges(
+    nodes: dict[str, DiagramNode],
+    edges: list[DiagramEdge],
+    line_edges: list[tuple[str, str, str, EdgeType]],
+    current_group: str | None,
+) -> None:
+    """Add one line's edges; connected bare IDs become nodes."""
+    first_edge = len(edges)
+    for src_id, tgt_id, label, edge_type in line_edges:
+        if src_id not in nodes:
+            nodes[src_id] = DiagramNode(id=src_id, label=src_id, parent_group=current_group)
+        if tgt_id not in nodes:
+            nodes[tgt_id] = DiagramNode(id=tgt_id, label=tgt_id, parent_group=current_group)
+        edges.append(DiagramEdge(
+            id=f"e{first_edge + len(edges)}",
+            source=src_id,
+            target=tgt_id,
+            label=label,
+            edge_type=edge_type,
+        ))
+
+
+def _simple_chain(
+    m: re.Match,
+    nodes: dict[str, DiagramNode],
+    current_group: str | None,
+) -> list[tuple[str, str, str, EdgeType]] | None:
+    """Apply a _SIMPLE_CHAIN_RE match and return its edges.
+
+    Returns None, without changing anything, when a shape is ambiguous.
+    """
+    src_id, src_shape, op, pipe, tgt_id, tgt_shape, rest = m.groups()
+    steps = [("", "", src_id, src_shape), (op, pipe, tgt_id, tgt_shape)]
+    if rest:
+        steps.extend(_SIMPLE_STEP_RE.findall(rest))
+    definitions = []
+    for _, _, node_id, shape_text in steps:
+        if shape_text:
+            found = _simple_shape(shape_text)
+            if found is None:
+                return None
+            shape, width = found
+            definitions.append((node_id, shape_text[width:-width], shape))
+    for node_id, label, shape in definitions:
+        _define_node(nodes, node_id, label, shape, current_group)
+    line_edges = []
+    for (_, _, src_id, _), (op, pipe, tgt_id, _) in zip(steps, steps[1:]):
+        line_edges.append(
+            (src_id, tgt_id, pipe.strip() if pipe else "", _operator_type(op))
+        )
+    return line_edges
+
+
+class _Closers:
+    """First occurrence of a closing delimiter at or after a position.
+
+    The tokenizer only moves forward, so each result stays valid until the
+    scan passes it (and a missing closer stays missing): every closer is
+    searched for over each part of the line at most once.
+    """
+
+    def __init__(self, line: str) -> None:
+        self.line = line
+        self.found: dict[str, int] = {}
+
+    def find(self, closer: str, pos: int) -> int:
+        hit = self.found.get(closer)
+        if hit is None or 0 <= hit < pos:
+            hit = self.line.find(closer, pos)
+            self.found[closer] = hit
+        return hit
+
+
+def _scan_statements(
+    line: str,
+    nodes: dict[str, DiagramNode],
+    current_group: str | None,
+) -> list[tuple[str, str, str, EdgeType]]:
+    """Tokenize one line; apply its node definitions and return its edges.
+
+    Statements are node groups joined by links: in ``A & B --> C -->|x| D``
+    the groups [A, B], [C], [D] are joined by two links.
+    """
+    line_edges: list[tuple[str, str, str, EdgeType]] = []
+    # The node group being read, and the group and link waiting for it
+    current: list[str] = []
+    left: list[str] = []
+    link: tuple[str, EdgeType] | None = None
+    joined = False
+
+    def close_group() -> None:
+        if link is not None and current:
+            label, edge_type = link
+            for src_id in left:
+                for tgt_id in current:
+                    line_edges.append((src_id, tgt_id, label, edge_type))
+
+    match_at = _TOKEN_RE.match
+    match_class = _CLASS_RE.match
+    closers = _Closers(line)
+    pos, end = 0, len(line)
+    while pos < end:
+        m = match_at(line, pos)
+        if m is None:  # only trailing blanks left
+            break
+        pos = m.end()
+        kind = m.lastindex
+
+        if kind == _ID_GROUP or kind == _OPENER_GROUP:
+            node_id = m.group(_ID_GROUP)
+            if kind == _OPENER_GROUP:
+                start = m.start(_OPENER_GROUP)
+                pos = m.end(_ID_GROUP)  # no shape unless a closer is found
+                for closer, shape, width in _SHAPES[m.group(kind)]:
+                    # Openers are as long as their closers
+                    close = closers.find(closer, start + len(closer))
+                    if close >= 0:
+                        pos = close + len(closer)
+                        _define_node(
+                            nodes, node_id, line[start + width:pos - width],
+                            shape, current_group,
+                        )
+                        break
+            class_match = match_class(line, pos)
+            if class_match is not None:
+                pos = class_match.end()
+            if current and not joined:
+                # Two IDs in a row: a new statement starts
+                close_group()
+                left, link, current = [], None, [node_id]
+            else:
+                current.append(node_id)
+            joined = False
+            continue
 
-
-def _parse_node_shape(shape_str: str) -> tuple[str, NodeShape]:
-    """Extract label text and shape from a Mermaid node shape string."""
-    if shape_str.startswith("([") and shape_str.endswith("])"):
-        return shape_str[2:-2], NodeShape.STADIUM
-    if shape_str.startswith("[(") and shape_str.endswith(")]"):
-        return shape_str[2:-2], NodeShape.CYLINDER
-    if shape_str.startswith("((") and shape_str.endswith("))"):
-        return shape_str[2:-2], NodeShape.CIRCLE
-    if shape_str.startswith("{{") and shape_str.endswith("}}"):
-        return shape_str[2:-2], NodeShape.HEXAGON
-    if shape_str.startswith("{") and shape_str.endswith("}"):
-        return shape_str[1:-1], NodeShape.DIAMOND
-    if shape_str.startswith("[/") and shape_str.endswith("/]"):
-        return shape_str[2:-2], NodeShape.PARALLELOGRAM
-    if shape_str.startswith("[") and shape_str.endswith("]"):
-        return shape_str[1:-1], NodeShape.RECT
-    if shape_str.startswith("(") and shape_str.endswith(")"):
-        return shape_str[1:-1], NodeShape.ROUNDED_RECT
-    if shape_str.startswith(">") and shape_str.endswith("]"):
-        return shape_str[1:-1], NodeShape.RECT
-    return shape_str, NodeShape.ROUNDED_RECT
-
-
-def _classify_edge(operator: str) -> tuple[str, EdgeType]:
-    """Classify a Mermaid edge operator and extract any inline label."""
-    label = ""
-
-    # Extract label from -->|text| style
-    pipe_match = re.search(r"-->\|([^|]*)\|", operator)
-    if pipe_match:
-        return pipe_match.group(1).strip(), EdgeType.SYNC
-
-    # Extract label from --text--> style
-    labeled_solid = re.match(r"--\s*(.+?)\s*-->", operator)
-    if labeled_solid:
-        return labeled_solid.group(1).strip(), EdgeType.SYNC
-
-    # Extract label from -.text.-> style
-    labeled_dotted = re.match(r"-\.\s*(.+?)\s*\.->", operator)
-    if labeled_dotted:
-        return labeled_dotted.group(1).strip(), EdgeType.ASYNC
-
-    # Extract label from ==text==> style
-    labeled_thick = re.match(r"==\s*(.+?)\s*==>", operator)
-    if labeled_thick:
-        return labeled_thick.group(1).strip(), EdgeType.DATA_FLOW
-
-    # Simple operators
-    if "==>" in operator:
-        return "", EdgeType.DATA_FLOW
-    if ".->" in operator or "-.>" in operator:
-        return "", EdgeType.ASYNC
-    if "-->" in operator:
-        return "", EdgeType.SYNC
-    if "---" in operator:
-        return "", EdgeType.DEPENDENCY
-    if "===" in operator:
-        return "", EdgeType.DATA_FLOW
-    if "-.-" in operator:
-        return "", EdgeType.DEPENDENCY
-
-    return label, EdgeType.SYNC
-
-
-def parse(text: str) -> DiagramIR:
-    """Parse a Mermaid flowchart/graph into DiagramIR."""
-    lines = text.strip().splitlines()
-    if not lines:
-        return DiagramIR(diagram_type=DiagramType.FLOWCHART)
-
+        if kind == _OP_GROUP or kind == _PIPE_GROUP:
+            pipe = m.group(_PIPE_GROUP)
+            new_link = (
+                pipe.strip() if pipe else "",
+                _operator_type(m.group(_OP_GROUP)),
+            )
+        elif kind == _INLINE_GROUP:
+            closer, arrow, plain = _INLINE_LABELS[m.group(kind)]
+            close = closers.find(closer, pos)
+            if close < 0:
+                new_link = None
+            else:
+                label = line[pos:close].strip()
+                pos = close + len(closer)
+                edge_type = arrow
+                if closer == ".-":
+                    if line.startswith(">", pos):
+                        pos += 1
+                    else:
+                        edge_type = plain
+                new_link = (label, edge_type)
+        elif kind == _AND_GROUP:
+            joined = True
+            continue
+        else:
+            new_link = None
+
+        if new_link is not None and current:
+            close_group()
+            left, link, current = current, new_link, []
+        else:
+            # ";" or anything unparsable ends the statement
+            close_group()
+            left, link, current = [], None, []
+        joined = False
+
+    close_group()
+    return line_edges
+
+
+def parse(source: Source) -> DiagramIR:
+    """Parse a Mermaid flowchart/graph into DiagramIR.
+
+    `source` is the text or an iterable of lines. Each line is read
+    once. Plain chains of links take the fast path
+    (_simple_chain); other lines are scanned token by token
+    (_scan_statements). Shaped node definitions apply as they
+    are read; edges are added at the end of the line, creating any bare
+    IDs they connect.
+    """
     # Parse header for layout direction
     layout = LayoutDirection.TB
-    start_line = 0
-    header_match = _HEADER_RE.match(lines[0])
+    header_match, lines = read_header(source, _HEADER_RE)
     if header_match:
         direction = header_match.group(1).upper()
         if direction in ("LR", "RL"):
             layout = LayoutDirection.LR
-        start_line = 1
 
     nodes: dict[str, DiagramNode] = {}
     edges: list[DiagramEdge] = []
     groups: list[DiagramGroup] = []
+    group_stack: list[str] = []
     current_group: str | None = None
-    edge_counter = 0
     group_counter = 0
 
-    for line in lines[start_line:]:
-        stripped = line.strip()
-
-        # Skip empty lines and comments
-        if not stripped or stripped.startswith("%%"):
+    simple_chain = _SIMPLE_CHAIN_RE.fullmatch
+    line_statement = _LINE_RE.fullmatch
+    for line in lines:
+        line_edges = None
+        m = simple_chain(line)
+        if m is not None:
+            line_edges = _simple_chain(m, nodes, current_group)
+        if line_edges is None:
+            m = line_statement(line)
+            if m is None:
+                line_edges = _scan_statements(line, nodes, current_group)
+        if line_edges is not None:
+            _add_edges(nodes, edges, line_edges, current_group)
             continue
 
-        # Check subgraph
-        sg_match = _SUBGRAPH_RE.match(stripped)
-        if sg_match:
+        if m.lastindex == 1:
             group_counter += 1
             gid = f"group_{group_counter}"
             groups.append(DiagramGroup(
                 id=gid,
-                label=sg_match.group(1).strip(),
+                label=m.group(1).rstrip(" \t\r"),
+                parent_group=current_group,
             ))
+            group_stack.append(gid)
             current_group = gid
-            continue
-
-        if _SUBGRAPH_END_RE.match(stripped):
-            current_group = None
-            continue
-
-        # Extract node definitions from the line
-        for match in _NODE_DEF_RE.finditer(stripped):
-            node_id = match.group(1)
-            shape_str = match.group(2)
-            label, shape = _parse_node_shape(shape_str)
-
-            if node_id not in nodes:
-                node = DiagramNode(
-                    id=node_id,
-                    label=label,
-                    shape=shape,
-                    parent_group=current_group,
-                )
-                # Assign default dimensions by shape
-                if shape == NodeShape.DIAMOND:
-                    node.width = 120
-                    node.height = 80
-                elif shape == NodeShape.CIRCLE:
-                    node.width = 80
-                    node.height = 80
-                elif shape == NodeShape.START_END:
-                    node.width = 100
-                    node.height = 40
-                nodes[node_id] = node
-            else:
-                # Update label if re-defined
-                nodes[node_id].label = label
-                nodes[node_id].shape = shape
-                if current_group:
-                    nodes[node_id].parent_group = current_group
-
-        # Extract edges from the line
-        # Use a more flexible approach: split on edge operators
-        _parse_edges_from_line(stripped, nodes, edges, edge_counter, current_group)
-        edge_counter = len(edges)
+        elif m.lastindex == 2:
+            if group_stack:
+                group_stack.pop()
+            current_group = group_stack[-1] if group_stack else None
 
     return DiagramIR(
         diagram_type=DiagramType.FLOWCHART,
@@ -248,85 +441,3 @@ def parse(text: str) -> DiagramIR:
         edges=edges,
         groups=groups,
     )
-
-
-def _parse_edges_from_line(
-    line: str,
-    nodes: dict[str, DiagramNode],
-    edges: list[DiagramEdge],
-    start_counter: int,
-    current_group: str | None,
-) -> None:
-    """Extract edge connections from a line, handling chained edges."""
-    # Pattern: NodeA -->|label| NodeB --> NodeC
-    # We need to find all edge operators and their surrounding node IDs
-
-    # Split by common edge operators, keeping delimiters
-    edge_ops = re.compile(
-        r"(-->\|[^|]*\|"   # -->|label|
-        r"|--\s*\S+\s*-->" # --text-->
-        r"|==>"             # thick
-        r"|\.?-\.->|\.->|-\.\.->|\.->"  # dotted variants
-        r"|-->"             # solid
-        r"|---"             # line
-        r"|===|-\.-)"       # thick line / dotted line
-    )
-
-    parts = edge_ops.split(line)
-    # parts alternates: [before_op, op, between_op, op, after_op, ...]
-
-    if len(parts) < 3:
-        return  # No edge operators found
-
-    i = 0
-    while i < len(parts) - 2:
-        before = parts[i].strip()
-        operator = parts[i + 1]
-        after = parts[i + 2].strip()
-
-        # Extract node IDs from before/after text
-        src_id = _extract_node_id_end(before)
-        tgt_id = _extract_node_id_start(after)
-
-        if src_id and tgt_id:
-            # Ensure both nodes exist (create with default if not)
-            if src_id not in nodes:
-                nodes[src_id] = DiagramNode(
-                    id=src_id, label=src_id, parent_group=current_group,
-                )
-            if tgt_id not in nodes:
-                nodes[tgt_id] = DiagramNode(
-                    id=tgt_id, label=tgt_id, parent_group=current_group,
-                )
-
-            label, edge_type = _classify_edge(operator)
-            edge_id = f"e{start_counter + len(edges)}"
-            edges.append(DiagramEdge(
-                id=edge_id,
-                source=src_id,
-                target=tgt_id,
-                label=label,
-                edge_type=edge_type,
-            ))
-
-        i += 2  # Move past operator + next text segment
-
-
-def _extract_node_id_end(text: str) -> str | None:
-    """Extract the last node ID from text (before an edge operator)."""
-    # Remove any shape definitions to get bare ID
-    # Match the last word-like token
-    text = text.rstrip()
-    # Strip shape suffixes: [label], (label), {label}, etc.
-    text = re.sub(r"[\[\(\{<].*?[\]\)\}>]$", "", text).strip()
-    # Also handle ((label)), {{label}}, etc.
-    text = re.sub(r"[\[\(\{][\[\(\{].*?[\]\)\}][\]\)\}]$", "", text).strip()
-    match = re.search(r"([A-Za-z_][A-Za-z0-9_]*)$", text)
-    return match.group(1) if match else None
-
-
-def _extract_node_id_start(text: str) -> str | None:
-    """Extract the first node ID from text (after an edge operator)."""
-    text = text.lstrip()
-    match = re.match(r"([A-Za-z_][A-Za-z0-9_]*)", text)
-    return match.group(1) if match else None
@@ -12,29 +12,49 @@ from .base import (
     DiagramNode,
     DiagramType,
     NodeShape,
+    Source,
+    source_lines,
 )
 
+# Characters of source shown in the label
+_PREVIEW_CHARS = 200
 
-def parse(text: str) -> DiagramIR:
+
+def parse(source: Source) -> DiagramIR:
     """Parse unrecognized Mermaid syntax into a minimal DiagramIR.
 
-    Creates a single node containing the raw source text.
+    Creates a single node containing the start of the source; the rest
+    is only counted, so a long stream is never held in memory.
     """
-    # Try to extract the first line as a title
-    lines = text.strip().splitlines()
-    title = lines[0].strip() if lines else "Diagram"
+    head: list[str] = []
+    preview = ""
+    line_count = 0  # up to the last non-blank line
+    seen = 0
+    for line in source_lines(source):
+        blank = not line.strip()
+        if blank and not head:
+            continue
+        seen += 1
+        if not blank:
+            line_count = seen
+        if len(preview) <= _PREVIEW_CHARS:
+            head.append(line)
+            if not blank:
+                preview = "\n".join(head).strip()
+
+    # The first line is the title
+    title = head[0].strip() if head else "Diagram"
 
     # Truncate long content for the label
-    preview = text.strip()
-    if len(preview) > 200:
-        preview = preview[:200] + "..."
+    if len(preview) > _PREVIEW_CHARS:
+        preview = preview[:_PREVIEW_CHARS] + "..."
 
     node = DiagramNode(
         id="generic_1",
         label=preview.replace("\n", "&#xa;"),
         shape=NodeShape.RECT,
         width=400,
-        height=max(100, len(lines) * 16),
+        height=max(100, line_count * 16),
     )
 
     return DiagramIR(
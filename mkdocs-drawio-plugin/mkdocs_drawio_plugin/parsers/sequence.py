@@ -19,7 +19,10 @@ from .base import (
     DiagramType,
     EdgeType,
     LayoutDirection,
+    LineDispatcher,
     SequenceParticipant,
+    Source,
+    read_header,
 )
 
 # Header
@@ -37,10 +40,14 @@ _PARTICIPANT_RE = re.compile(
 #   A--xB: label    dashed cross
 #   A-)B: label     async
 #   A--)B: label    dashed async
+#
+# The sender runs up to the first arrow (a "-" that starts one ends it)
+# and the receiver up to the first ":", so each part has exactly one way
+# to match and a malformed line fails in linear time.
 _MESSAGE_RE = re.compile(
-    r"^\s*(\S+?)\s*"
+    r"^\s*((?:[^\s-]|-(?!-?(?:>>|x|\))))+)\s*"
     r"(->>|-->>|-x|--x|-\)|--\))"
-    r"\s*(\S+?)\s*:\s*(.+)$"
+    r"\s*([^\s:]+)\s*:\s*(.+)$"
 )
 
 # Blocks: alt, else, opt, loop, par, and, rect, note, end
@@ -52,7 +59,7 @@ _BLOCK_END_RE = re.compile(r"^\s*end\s*$", re.IGNORECASE)
 
 # Note
 _NOTE_RE = re.compile(
-    r"^\s*note\s+(left of|right of|over)\s+(\S+?)(?:,\s*(\S+?))?\s*:\s*(.+)$",
+    r"^\s*note\s+(left of|right of|over)\s+([^\s,:]+)(?:,\s*([^\s:]+))?\s*:\s*(.+)$",
     re.IGNORECASE,
 )
 
@@ -60,6 +67,31 @@ _NOTE_RE = re.compile(
 _ACTIVATE_RE = re.compile(r"^\s*activate\s+(\S+)\s*$", re.IGNORECASE)
 _DEACTIVATE_RE = re.compile(r"^\s*deactivate\s+(\S+)\s*$", re.IGNORECASE)
 
+# Keyword lines; anything else (a line starting with a participant name)
+# can only be a message
+_LINES = LineDispatcher(
+    {
+        ("participant", "actor"): ("participant", _PARTICIPANT_RE),
+        ("alt", "opt", "loop", "par", "rect", "critical"): ("block", _BLOCK_START_RE),
+        ("else", "and"): ("else", _BLOCK_ELSE_RE),
+        "end": ("end", _BLOCK_END_RE),
+        "note": ("note", _NOTE_RE),
+        "activate": ("activate", _ACTIVATE_RE),
+        "deactivate": ("deactivate", _DEACTIVATE_RE),
+    },
+    fallback=[("message", _MESSAGE_RE)],
+)
+
+# Block type -> group style
+_BLOCK_GROUP_TYPES = {
+    "alt": "warning",
+    "opt": "info",
+    "loop": "warning",
+    "par": "info",
+    "critical": "danger",
+    "rect": "success",
+}
+
 # Semantic role hints from participant names
 _ROLE_HINTS = {
     "client": "queue",       # orange
@@ -98,12 +130,8 @@ def _classify_arrow(arrow: str) -> EdgeType:
     return EdgeType.SEQ_REQUEST
 
 
-def parse(text: str) -> DiagramIR:
-    """Parse a Mermaid sequence diagram into DiagramIR."""
-    lines = text.strip().splitlines()
-    if not lines:
-        return DiagramIR(diagram_type=DiagramType.SEQUENCE)
-
+def parse(source: Source) -> DiagramIR:
+    """Parse a Mermaid sequence diagram (text or lines) into DiagramIR."""
     participants: dict[str, SequenceParticipant] = {}
     participant_order: list[str] = []
     edges: list[DiagramEdge] = []
@@ -112,9 +140,7 @@ def parse(text: str) -> DiagramIR:
     group_stack: list[str] = []
     group_counter = 0
 
-    start_line = 0
-    if _HEADER_RE.match(lines[0]):
-        start_line = 1
+    _, lines = read_header(source, _HEADER_RE)
 
     def _ensure_participant(pid: str, display: str | None = None) -> None:
         if pid not in participants:
@@ -127,27 +153,27 @@ def parse(text: str) -> DiagramIR:
         elif display:
             participants[pid].label = display
 
-    for line in lines[start_line:]:
+    for line in lines:
         stripped = line.strip()
 
         if not stripped or stripped.startswith("%%"):
             continue
 
+        kind, m = _LINES.match(stripped)
+
         # Participant declaration
-        p_match = _PARTICIPANT_RE.match(stripped)
-        if p_match:
-            pid = p_match.group(1)
-            display = p_match.group(2) or pid
+        if kind == "participant":
+            pid = m.group(1)
+            display = m.group(2) or pid
             _ensure_participant(pid, display)
             continue
 
         # Message
-        msg_match = _MESSAGE_RE.match(stripped)
-        if msg_match:
-            src = msg_match.group(1)
-            arrow = msg_match.group(2)
-            tgt = msg_match.group(3)
-            label = msg_match.group(4).strip()
+        if kind == "message":
+            src = m.group(1)
+            arrow = m.group(2)
+            tgt = m.group(3)
+            label = m.group(4).strip()
 
             _ensure_participant(src)
             _ensure_participant(tgt)
@@ -164,63 +190,49 @@ def parse(text: str) -> DiagramIR:
                 target=tgt,
                 label=label,
                 edge_type=edge_type,
+                parent_group=group_stack[-1] if group_stack else None,
             ))
             continue
 
         # Block start (alt, opt, loop, par, critical)
-        block_match = _BLOCK_START_RE.match(stripped)
-        if block_match:
-            block_type = block_match.group(1).lower()
-            block_label = block_match.group(2).strip()
+        if kind == "block":
+            block_type = m.group(1).lower()
+            block_label = m.group(2).strip()
             group_counter += 1
             gid = f"block_{group_counter}"
-
-            # Map block type to group style
-            type_map = {
-                "alt": "warning",
-                "opt": "info",
-                "loop": "warning",
-                "par": "info",
-                "critical": "danger",
-                "rect": "success",
-            }
             groups.append(DiagramGroup(
                 id=gid,
                 label=f"{block_type.upper()}: {block_label}",
-                group_type=type_map.get(block_type, "info"),
+                group_type=_BLOCK_GROUP_TYPES.get(block_type, "info"),
+                parent_group=group_stack[-1] if group_stack else None,
             ))
             group_stack.append(gid)
             continue
 
         # Block else/and
-        if _BLOCK_ELSE_RE.match(stripped):
+        if kind == "else":
             # For simplicity, treat else as a new group
             group_counter += 1
             gid = f"block_{group_counter}"
-            match = _BLOCK_ELSE_RE.match(stripped)
-            label = match.group(2).strip() if match.group(2) else "else"
+            label = m.group(2).strip() if m.group(2) else "else"
             groups.append(DiagramGroup(
                 id=gid,
                 label=label,
                 group_type="warning",
+                parent_group=group_stack[-2] if len(group_stack) > 1 else None,
             ))
             if group_stack:
                 group_stack[-1] = gid
             continue
 
         # Block end
-        if _BLOCK_END_RE.match(stripped):
+        if kind == "end":
             if group_stack:
                 group_stack.pop()
             continue
 
-        # Note (skip for now — could add as text labels later)
-        if _NOTE_RE.match(stripped):
-            continue
-
-        # Activate/deactivate (skip for now)
-        if _ACTIVATE_RE.match(stripped) or _DEACTIVATE_RE.match(stripped):
-            continue
+        # Note (skip for now — could add as text labels later) and
+        # activate/deactivate (skip for now) need no handling
 
     return DiagramIR(
         diagram_type=DiagramType.SEQUENCE,
@@ -0,0 +1,249 @@
+"""
+Mermaid state diagram parser.
+
+Handles `stateDiagram` and `stateDiagram-v2` blocks.
+
+Supported syntax:
+  direction LR
+  [*] --> Idle
+  Idle --> Running : start
+  Running --> [*]
+  Idle : Waiting for work
+  state "Long description" as Busy
+  state Running {
+      [*] --> Loading
+      Loading --> Ready
+      --
+      [*] --> Polling
+  }
+  state split <<fork>>
+  state merge <<join>>
+  state check <<choice>>
+  note right of Idle : text       (skipped, also multi-line notes)
+
+A description replaces the state's label, as in Mermaid; further
+descriptions of the same state add lines below it.
+
+Composite states become groups, so transitions may end on a group.
+Concurrent regions (separated by `--`) become one unlabelled, dashed
+group each inside their composite state. [*] is a start pseudo-state as
+a transition source and an end pseudo-state as a target, one pair per
+composite state or region (as in Mermaid).
+"""
+
+from __future__ import annotations
+
+import re
+
+from .base import (
+    DiagramEdge,
+    DiagramGroup,
+    DiagramIR,
+    DiagramNode,
+    DiagramType,
+    EdgeType,
+    LayoutDirection,
+    LineDispatcher,
+    NodeShape,
+    Source,
+    read_header,
+)
+
+_HEADER_RE = re.compile(r"^\s*stateDiagram(?:-v2)?\s*$", re.IGNORECASE)
+
+# A state ID or [*], with an optional ":::class" suffix (ignored)
+_STATE_REF = r"(\[\*\]|[\w-]+)(?::::[\w-]+)?"
+
+# Transition: A --> B [: label]
+_TRANSITION_RE = re.compile(
+    rf"^\s*{_STATE_REF}\s*-->\s*{_STATE_REF}\s*(?::(.*))?$"
+)
+
+# Description line: A : text
+_DESCRIPTION_RE = re.compile(r"^\s*([\w-]+)\s*:(.*)$")
+
+# State declaration:
+#   state Id / state "Label" as Id / state Id <<fork>> / state Id {
+_STATE_RE = re.compile(
+    r'^\s*state\s+(?:"([^"]*)"\s+as\s+)?([\w-]+)'
+    r"\s*(?:<<(fork|join|choice)>>)?\s*(\{)?\s*$",
+    re.IGNORECASE,
+)
+
+# Composite state end
+_STATE_END_RE = re.compile(r"^\s*\}\s*$")
+
+# Concurrent region separator inside a composite state
+_REGION_RE = re.compile(r"^\s*--\s*$")
+
+_DIRECTION_RE = re.compile(r"^\s*direction\s+(TB|TD|BT|LR|RL)\s*$", re.IGNORECASE)
+
+# Notes: one line with ":", otherwise running until "end note"
+_NOTE_RE = re.compile(r"^\s*note\s+(?:left|right)\s+of\s+[\w-]+\s*(:)?", re.IGNORECASE)
+_NOTE_END_RE = re.compile(r"^\s*end\s+note\s*$", re.IGNORECASE)
+
+_LINES = LineDispatcher(
+    {
+        "state": ("state", _STATE_RE),
+        "}": ("state_end", _STATE_END_RE),
+        "--": ("region", _REGION_RE),
+        "direction": ("direction", _DIRECTION_RE),
+        "note": ("note", _NOTE_RE),
+    },
+    fallback=[("transition", _TRANSITION_RE), ("description", _DESCRIPTION_RE)],
+)
+
+# <<stereotype>> -> shape of the pseudo-state
+_STEREOTYPE_SHAPES = {
+    "fork": NodeShape.FORK_JOIN,
+    "join": NodeShape.FORK_JOIN,
+    "choice": NodeShape.DIAMOND,
+}
+
+
+def parse(source: Source) -> DiagramIR:
+    """Parse a Mermaid state diagram (text or lines) into DiagramIR."""
+    _, lines = read_header(source, _HEADER_RE)
+
+    layout = LayoutDirection.TB
+    nodes: dict[str, DiagramNode] = {}
+    edges: list[DiagramEdge] = []
+    groups: dict[str, DiagramGroup] = {}
+    group_stack: list[str] = []
+    # Composite state -> number of its concurrent regions so far, and
+    # region group ID -> its composite state
+    regions: dict[str, int] = {}
+    region_of: dict[str, str] = {}
+    described: set[str] = set()
+    in_note = False
+
+    def scope() -> str | None:
+        return group_stack[-1] if group_stack else None
+
+    def ensure_state(sid: str, end: bool = False) -> str:
+        """ID of a state (or of the scope's [*] pseudo-state), created on
+        first use in the current composite state."""
+        if sid == "[*]":
+            kind = "end" if end else "start"
+            sid = f"{scope() or 'root'}__{kind}"
+            if sid not in nodes:
+                nodes[sid] = DiagramNode(
+                    id=sid, label="", shape=NodeShape.START_END,
+                    parent_group=scope(),
+                )
+        elif sid not in nodes and sid not in groups:
+            nodes[sid] = DiagramNode(id=sid, label=sid, parent_group=scope())
+        return sid
+
+    def new_region(composite: str) -> str:
+        regions[composite] = regions.get(composite, 0) + 1
+        rid = f"{composite}__region{regions[composite]}"
+        groups[rid] = DiagramGroup(
+            id=rid, label="", group_type="region", parent_group=composite,
+        )
+        region_of[rid] = composite
+        return rid
+
+    def start_region(stack: list[str]) -> None:
+        """Close the current region of the innermost composite state and
+        open the next; the first `--` moves what came before into region 1."""
+        if stack[-1] in region_of:
+            composite = region_of[stack.pop()]
+        else:
+            composite = stack[-1]
+            first = new_region(composite)
+            for item in (*nodes.values(), *groups.values()):
+                if item.parent_group == composite and item.id != first:
+                    item.parent_group = first
+        stack.append(new_region(composite))
+
+    for line in lines:
+        stripped = line.strip()
+
+        if in_note:
+            in_note = not _NOTE_END_RE.match(stripped)
+            continue
+
+        if not stripped or stripped.startswith("%%"):
+            continue
+
+        kind, m = _LINES.match(stripped)
+
+        if kind == "transition":
+            source_id = ensure_state(m.group(1))
+            target_id = ensure_state(m.group(2), end=True)
+            edges.append(DiagramEdge(
+                id=f"t_{len(edges)}",
+                source=source_id,
+                target=target_id,
+                label=(m.group(3) or "").strip(),
+                edge_type=EdgeType.SYNC,
+            ))
+            continue
+
+        if kind == "description":
+            sid = ensure_state(m.group(1))
+            text = m.group(2).strip()
+            if sid in nodes and text:
+                # The first description replaces the name, later ones
+                # add a line each
+                if sid in described:
+                    nodes[sid].label += f"<br>{text}"
+                else:
+                    nodes[sid].label = text
+                    described.add(sid)
+            continue
+
+        if kind == "state":
+            label, sid, stereotype, opens = m.groups()
+            if opens:
+                # Composite state: a group, replacing any plain state of
+                # the same ID created by an earlier transition
+                nodes.pop(sid, None)
+                groups[sid] = DiagramGroup(
+                    id=sid,
+                    label=label or sid,
+                    group_type="info",
+                    parent_group=scope(),
+                )
+                group_stack.append(sid)
+                continue
+            ensure_state(sid)
+            if sid in nodes:
+                if stereotype:
+                    nodes[sid].shape = _STEREOTYPE_SHAPES[stereotype.lower()]
+                    nodes[sid].label = ""
+                elif label:
+                    nodes[sid].label = label
+            continue
+
+        if kind == "region":
+            if group_stack:
+                start_region(group_stack)
+            continue
+
+        if kind == "state_end":
+            if group_stack and group_stack[-1] in region_of:
+                group_stack.pop()
+            if group_stack:
+                group_stack.pop()
+            continue
+
+        if kind == "direction":
+            # Only the top-level direction changes the layout
+            if not group_stack:
+                direction = m.group(1).upper()
+                layout = LayoutDirection.LR if direction in ("LR", "RL") else LayoutDirection.TB
+            continue
+
+        if kind == "note":
+            in_note = m.group(1) is None
+            continue
+
+    return DiagramIR(
+        diagram_type=DiagramType.STATE,
+        layout=layout,
+        nodes=list(nodes.values()),
+        edges=edges,
+        groups=list(groups.values()),
+    )
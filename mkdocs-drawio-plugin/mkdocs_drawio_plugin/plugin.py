@@ -6,6 +6,14 @@ Integration points:
    markdown processing and converts them to draw.io HTML in-place.
 2. on_post_build hook: copies viewer-static.min.js to the output directory.
 3. on_page_markdown hook: fallback to catch any unprocessed Mermaid blocks.
+4. on_config: applies conversion options and loads the optional layout
+   cache file (saved again in on_post_build).
+5. named_styles: cells reference a shared stylesheet, written once per
+   site by on_post_build and loaded ahead of the viewer JS.
+6. on_files: registers every C4 element declared on the site, so C4
+   diagrams can relate to elements declared on other pages by alias.
+7. Page front matter: a ``drawio:`` mapping overrides PAGE_OPTIONS for
+   the diagrams on that page, from on_page_markdown to on_page_content.
 """
 
 from __future__ import annotations
@@ -14,20 +22,52 @@ import logging
 import os
 import re
 import shutil
+from contextlib import ExitStack
 from pathlib import Path
 
 from mkdocs.config import config_options
 from mkdocs.config.base import Config
 from mkdocs.config.defaults import MkDocsConfig
+from mkdocs.exceptions import PluginError
 from mkdocs.plugins import BasePlugin
 from mkdocs.structure.files import Files
 from mkdocs.structure.pages import Page
 
-from .converter import mermaid_to_figure, mermaid_to_xml
+from .c4registry import c4_registry_info, clear_c4_registry, register_c4_source
+from .converter import detect_type, mermaid_to_figure, mermaid_to_xml
 from .encoding import encode_for_mxgraph, wrap_in_mxgraph_div
+from .layout_cache import load_layout_cache, save_layout_cache
+from .options import (
+    DEFAULT_COLLAPSE_GROUP_NODES,
+    DEFAULT_SEQUENCE_PAGE_MESSAGES,
+    configure,
+    overridden,
+)
+from .parsers.base import DiagramType
+from .stylesheet import stylesheet_js
 
 log = logging.getLogger("mkdocs.plugins.drawio")
 
+_C4_TYPES = frozenset({
+    DiagramType.C4_CONTEXT,
+    DiagramType.C4_CONTAINER,
+    DiagramType.C4_COMPONENT,
+    DiagramType.C4_CODE,
+})
+
+# Options a page may override in its front matter, e.g.
+#   drawio:
+#     collapse_group_nodes: 50
+PAGE_OPTIONS = frozenset({
+    "layout_engines",
+    "sequence_page_messages",
+    "flowchart_page_nodes",
+    "collapse_group_nodes",
+    "merge_edges",
+    "erd_render",
+    "erd_area_entities",
+})
+
 # Regex to find ```mermaid blocks in markdown (fallback for on_page_markdown)
 _MERMAID_FENCE_RE = re.compile(
     r"```mermaid\s*\n(.*?)```",
@@ -41,6 +81,37 @@ class DrawioConfig(Config):
     viewer_js = config_options.Type(str, default="js/viewer-static.min.js")
     save_drawio_files = config_options.Type(bool, default=True)
     drawio_output_dir = config_options.Type(str, default="drawio")
+    # JSON file for reusing layouts across builds ("" = in-memory only)
+    layout_cache_file = config_options.Type(str, default="")
+    # Per diagram type layout engine, e.g. {"c4-context": "force"}
+    layout_engines = config_options.Type(dict, default={})
+    # Messages per page before sequence diagrams are split (0 = never)
+    sequence_page_messages = config_options.Type(
+        int, default=DEFAULT_SEQUENCE_PAGE_MESSAGES,
+    )
+    # Flowcharts with more nodes than this get a page per top-level
+    # subgraph plus an overview (0 = never)
+    flowchart_page_nodes = config_options.Type(int, default=0)
+    # Subgraphs with more nodes than this start collapsed (0 = never)
+    collapse_group_nodes = config_options.Type(
+        int, default=DEFAULT_COLLAPSE_GROUP_NODES,
+    )
+    # Duplicate-edge merging per diagram type (off unless listed), e.g.
+    # {"flowchart": true, "c4-container": true}
+    merge_edges = config_options.Type(dict, default={})
+    # Reference styles by name from one site-wide stylesheet script
+    named_styles = config_options.Type(bool, default=False)
+    stylesheet_js = config_options.Type(str, default="js/drawio-styles.js")
+    # Minified embed XML (downloadable .drawio files stay readable)
+    minify_xml = config_options.Type(bool, default=False)
+    # ERD entities: "cells" (a cell per field) or "table" (one HTML-table cell)
+    erd_render = config_options.Type(str, default="cells")
+    # ERDs with more entities than this get a page per subject area plus
+    # an overview (0 = never)
+    erd_area_entities = config_options.Type(int, default=0)
+    # C4 diagrams may relate to elements declared in other C4 blocks
+    # (off by default: it changes diagrams with dangling relationships)
+    c4_registry = config_options.Type(bool, default=False)
 
 
 class DrawioPlugin(BasePlugin[DrawioConfig]):
@@ -49,6 +120,56 @@ class DrawioPlugin(BasePlugin[DrawioConfig]):
     def __init__(self):
         super().__init__()
         self._drawio_files: list[tuple[str, str]] = []  # (filename, xml)
+        # Front-matter overrides of the page being rendered
+        self._page_options = ExitStack()
+
+    def on_config(self, config: MkDocsConfig) -> MkDocsConfig:
+        """Apply conversion options and load previously saved layouts."""
+        try:
+            configure(
+                layout_engines=dict(self.config.layout_engines),
+                sequence_page_messages=self.config.sequence_page_messages,
+                flowchart_page_nodes=self.config.flowchart_page_nodes,
+                collapse_group_nodes=self.config.collapse_group_nodes,
+                merge_edges=dict(self.config.merge_edges),
+                named_styles=self.config.named_styles,
+                minify_xml=self.config.minify_xml,
+                erd_render=self.config.erd_render,
+                erd_area_entities=self.config.erd_area_entities,
+            )
+        except ValueError as exc:
+            raise PluginError(f"drawio: {exc}") from exc
+
+        if self.config.named_styles:
+            # Must run before the viewer script renders any diagram
+            config["extra_javascript"].insert(0, self.config.stylesheet_js)
+
+        cache_path = self._layout_cache_path(config)
+        if cache_path:
+            loaded = load_layout_cache(cache_path)
+            log.debug("Loaded %d cached layouts from %s", loaded, cache_path)
+        return config
+
+    def on_files(self, files: Files, config: MkDocsConfig) -> Files:
+        """Register the C4 elements declared anywhere on the site."""
+        clear_c4_registry()
+        if not self.config.c4_registry:
+            return files
+        for file in files.documentation_pages():
+            try:
+                markdown = Path(file.abs_src_path).read_text(encoding="utf-8")
+            except OSError:
+                continue
+            for match in _MERMAID_FENCE_RE.finditer(markdown):
+                block = match.group(1)
+                if detect_type(block) not in _C4_TYPES:
+                    continue
+                try:
+                    register_c4_source(block)
+                except Exception:
+                    log.exception("Failed to register C4 block on %s", file.src_path)
+        log.debug("C4 registry: %s", c4_registry_info())
+        return files
 
     def on_page_markdown(
         self, markdown: str, page: Page, config: MkDocsConfig, files: Files
@@ -57,7 +178,10 @@ class DrawioPlugin(BasePlugin[DrawioConfig]):
 
         This catches blocks that weren't handled by SuperFences (e.g., if
         SuperFences isn't configured, or for blocks in non-standard locations).
+        Also applies the page's ``drawio:`` front matter, which stays in
+        effect while SuperFences renders the page.
         """
+        self._apply_page_options(page)
 
         def _replace_mermaid(match: re.Match) -> str:
             mermaid_src = match.group(1).strip()
@@ -72,8 +196,36 @@ class DrawioPlugin(BasePlugin[DrawioConfig]):
 
         return _MERMAID_FENCE_RE.sub(_replace_mermaid, markdown)
 
+    def on_page_content(
+        self, html: str, page: Page, config: MkDocsConfig, files: Files
+    ) -> str:
+        """Restore the site-wide options once the page is rendered."""
+        self._page_options.close()
+        return html
+
+    def _apply_page_options(self, page: Page) -> None:
+        """Override PAGE_OPTIONS from the page's ``drawio:`` front matter."""
+        self._page_options.close()
+        overrides = page.meta.get("drawio")
+        if not overrides:
+            return
+        where = page.file.src_path
+        if not isinstance(overrides, dict):
+            raise PluginError(f"drawio: {where}: front matter 'drawio' must be a mapping")
+        unknown = set(overrides) - PAGE_OPTIONS
+        if unknown:
+            raise PluginError(
+                f"drawio: {where}: unknown page option(s) {', '.join(sorted(unknown))} "
+                f"(expected any of: {', '.join(sorted(PAGE_OPTIONS))})"
+            )
+        try:
+            self._page_options.enter_context(overridden(**overrides))
+        except ValueError as exc:
+            raise PluginError(f"drawio: {where}: {exc}") from exc
+
     def on_post_build(self, config: MkDocsConfig) -> None:
         """Copy viewer JS and .drawio files to the output directory."""
+        self._page_options.close()
         site_dir = Path(config["site_dir"])
 
         # Copy viewer JS if it exists
@@ -84,6 +236,11 @@ class DrawioPlugin(BasePlugin[DrawioConfig]):
             shutil.copy2(viewer_src, viewer_dest)
             log.info("Copied viewer JS to %s", viewer_dest)
 
+        if self.config.named_styles:
+            styles_dest = site_dir / self.config.stylesheet_js
+            styles_dest.parent.mkdir(parents=True, exist_ok=True)
+            styles_dest.write_text(stylesheet_js(), encoding="utf-8")
+
         # Write saved .drawio files
         if self.config.save_drawio_files and self._drawio_files:
             drawio_dir = site_dir / self.config.drawio_output_dir
@@ -93,6 +250,17 @@ class DrawioPlugin(BasePlugin[DrawioConfig]):
                 dest.write_text(xml, encoding="utf-8")
                 log.info("Saved %s", dest)
 
+        cache_path = self._layout_cache_path(config)
+        if cache_path:
+            save_layout_cache(cache_path)
+
+    def _layout_cache_path(self, config: MkDocsConfig) -> Path | None:
+        """Resolve layout_cache_file relative to the mkdocs.yml directory."""
+        if not self.config.layout_cache_file:
+            return None
+        project_root = Path(config["config_file_path"]).parent
+        return project_root / self.config.layout_cache_file
+
     def _find_viewer_js(self, config: MkDocsConfig) -> Path | None:
         """Locate viewer-static.min.js in custom_dir or docs_dir."""
         # Check custom_dir (overrides/) first
@@ -113,7 +281,10 @@ class DrawioPlugin(BasePlugin[DrawioConfig]):
     def _save_drawio(self, page: Page, mermaid_src: str) -> None:
         """Save a .drawio file for download."""
         try:
-            xml = mermaid_to_xml(mermaid_src)
+            # Downloads open outside the site and get edited by hand, so
+            # keep styles inline and IDs readable
+            with overridden(named_styles=False, minify_xml=False):
+                xml = mermaid_to_xml(mermaid_src)
             base = page.file.src_path.replace("/", "_").replace(".md", "")
             idx = len(self._drawio_files) + 1
             filename = f"{base}_{idx}.drawio"
@@ -0,0 +1,327 @@
+"""
+Build-time orthogonal edge routing.
+
+Runs after node layout and stores bend points on each DiagramEdge
+(``edge.waypoints``) so generators can write them into mxGeometry as an
+``<Array as="points">`` of mxPoint elements. Without waypoints the viewer
+draws edges straight between node centres and, on dense diagrams, through
+unrelated nodes.
+
+Routing works in a rank-aligned frame: for TB layouts edges leave the
+bottom of the source and enter the top of the target; LR layouts are
+handled by swapping axes on the way in and out. Obstacles are looked up
+in a SpatialIndex, so each candidate segment only inspects nearby nodes.
+Every leg of a route is checked against it; when neither a direct jog nor
+a side-lane detour is clear, a shortest-path search over the channels
+between nearby nodes finds one.
+"""
+
+from __future__ import annotations
+
+import heapq
+
+from .parsers.base import DiagramIR, LayoutDirection
+from .spatial import SpatialIndex
+from . import styles
+
+# Upper bound on lane shifts while searching for a free detour corridor
+_MAX_LANE_SHIFTS = 32
+# Largest number of nodes a fallback channel-grid search may consider
+_MAX_GRID_OBSTACLES = 120
+
+Point = tuple[float, float]
+Rect = tuple[float, float, float, float]  # x0, y0, x1, y1
+
+
+def _is_clear(
+    index: SpatialIndex,
+    x0: float, y0: float, x1: float, y1: float,
+    exclude: tuple[str, str],
+) -> bool:
+    """True when the segment (x0, y0)-(x1, y1) crosses no node but ``exclude``."""
+    hits = index.query(x0, y0, x1, y1)
+    return not (hits - set(exclude))
+
+
+def _find_lane(
+    index: SpatialIndex,
+    start_x: float,
+    y0: float,
+    y1: float,
+    exclude: tuple[str, str],
+    gap: float,
+    step: int = 1,
+) -> float:
+    """Find a vertical corridor clear between y0..y1, searching from ``start_x``.
+
+    Searches rightwards for ``step`` 1 and leftwards for -1.
+    """
+    lane = start_x
+    for _ in range(_MAX_LANE_SHIFTS):
+        hits = index.query(lane, y0, lane, y1) - set(exclude)
+        if not hits:
+            return lane
+        if step > 0:
+            lane = max(index.rect(h)[2] for h in hits) + gap / 2
+        else:
+            lane = min(index.rect(h)[0] for h in hits) - gap / 2
+    return lane
+
+
+def _path_clear(
+    index: SpatialIndex, points: list[Point], exclude: tuple[str, str],
+) -> bool:
+    """True when every leg of the polyline crosses no node but ``exclude``."""
+    return all(
+        _is_clear(index, x0, y0, x1, y1, exclude)
+        for (x0, y0), (x1, y1) in zip(points, points[1:])
+    )
+
+
+def _channels(borders: set[float], fixed: tuple[float, ...]) -> list[float]:
+    """Grid lines midway between consecutive obstacle borders, plus ``fixed``."""
+    ordered = sorted(borders)
+    lines = {(a + b) / 2 for a, b in zip(ordered, ordered[1:])}
+    lines.update(fixed)
+    return sorted(lines)
+
+
+def _search(
+    index: SpatialIndex,
+    window: Rect,
+    start: Point,
+    end: Point,
+    gap: float,
+) -> list[Point] | None:
+    """Shortest orthogonal path on the channel grid of one window.
+
+    The path leaves ``start`` downwards and enters ``end`` downwards
+    (the TB frame's bottom and top ports). Bends cost ``gap`` each, so
+    among equally short paths the one with fewest bends wins. Returns
+    the bend points, or None when the window holds no clear path.
+    """
+    wx0, wy0, wx1, wy1 = window
+    sx, sy = start
+    tx, ty = end
+    xs_borders = {wx0, wx1}
+    ys_borders = {wy0, wy1}
+    for key in index.query(*window):
+        x0, y0, x1, y1 = index.rect(key)
+        xs_borders.update((x0, x1))
+        ys_borders.update((y0, y1))
+    xs = _channels(xs_borders, (sx, tx))
+    ys = _channels(ys_borders, ())
+
+    def clear(x0: float, y0: float, x1: float, y1: float) -> bool:
+        return not index.query(x0, y0, x1, y1)
+
+    si = xs.index(sx)
+    ti = xs.index(tx)
+    sj = next((j for j, y in enumerate(ys) if y > sy), None)
+    tj = next((j for j in range(len(ys) - 1, -1, -1) if ys[j] < ty), None)
+    if sj is None or tj is None:
+        return None
+    if not clear(sx, sy, sx, ys[sj]) or not clear(tx, ys[tj], tx, ty):
+        return None
+
+    def estimate(i: int, j: int) -> float:
+        return abs(xs[i] - tx) + abs(ys[j] - ys[tj])
+
+    # State: (column, row, arrived vertically)
+    first = (si, sj, True)
+    cost = {first: ys[sj] - sy}
+    came: dict[tuple[int, int, bool], tuple[int, int, bool]] = {}
+    heap = [(cost[first] + estimate(si, sj), cost[first], first)]
+    while heap:
+        _, spent, state = heapq.heappop(heap)
+        if spent > cost[state]:
+            continue
+        i, j, vertical = state
+        if (i, j) == (ti, tj) and vertical:
+            points = []
+            while state in came:
+                points.append((xs[state[0]], ys[state[1]]))
+                state = came[state]
+            points.append((xs[state[0]], ys[state[1]]))
+            return _simplify([start, *reversed(points), end])[1:-1]
+        for ni, nj, moved_vertically in (
+            (i - 1, j, False), (i + 1, j, False), (i, j - 1, True), (i, j + 1, True),
+        ):
+            if not (0 <= ni < len(xs) and 0 <= nj < len(ys)):
+                continue
+            x0, y0, x1, y1 = xs[i], ys[j], xs[ni], ys[nj]
+            if not clear(x0, y0, x1, y1):
+                continue
+            step = abs(x1 - x0) + abs(y1 - y0)
+            if moved_vertically != vertical:
+                step += gap
+            nxt = (ni, nj, moved_vertically)
+            total = spent + step
+            if total < cost.get(nxt, float("inf")):
+                cost[nxt] = total
+                came[nxt] = state
+                heapq.heappush(heap, (total + estimate(ni, nj), total, nxt))
+    return None
+
+
+def _simplify(points: list[Point]) -> list[Point]:
+    """Drop points lying on a straight line between their neighbours."""
+    kept = [points[0]]
+    for here, after in zip(points[1:], points[2:]):
+        before = kept[-1]
+        if (before[0] == here[0] == after[0]) or (before[1] == here[1] == after[1]):
+            continue
+        kept.append(here)
+    kept.append(points[-1])
+    return kept
+
+
+def _grid_route(
+    index: SpatialIndex,
+    start: Point,
+    end: Point,
+    gap: float,
+    bounds: Rect,
+) -> list[Point] | None:
+    """Search ever larger windows around both ends for a clear path.
+
+    Gives up once the window covers the whole diagram or holds more than
+    _MAX_GRID_OBSTACLES nodes, keeping the search local and cheap.
+    """
+    pad = gap
+    while True:
+        window = (
+            min(start[0], end[0]) - pad,
+            min(start[1], end[1]) - pad,
+            max(start[0], end[0]) + pad,
+            max(start[1], end[1]) + pad,
+        )
+        if len(index.query(*window)) > _MAX_GRID_OBSTACLES:
+            return None
+        points = _search(index, window, start, end, gap)
+        if points is not None:
+            return points
+        if (
+            window[0] < bounds[0] and window[1] < bounds[1]
+            and window[2] > bounds[2] and window[3] > bounds[3]
+        ):
+            return None
+        pad *= 2
+
+
+def _route(
+    src: Rect,
+    tgt: Rect,
+    index: SpatialIndex,
+    exclude: tuple[str, str],
+    gap: float,
+    bounds: Rect,
+) -> list[Point]:
+    """Compute bend points for one edge in the TB frame.
+
+    ``bounds`` is the extent of every node, limiting the fallback search.
+    """
+    sx = (src[0] + src[2]) / 2
+    sy = src[3]
+    tx = (tgt[0] + tgt[2]) / 2
+    ty = tgt[1]
+
+    if ty >= sy:
+        # Forward edge: straight drop if aligned, else one horizontal jog
+        if abs(sx - tx) < 1 and _is_clear(index, sx, sy, sx, ty, exclude):
+            return []
+
+        candidates = [(sy + ty) / 2, sy + gap / 2, ty - gap / 2]
+        for my in candidates:
+            if not sy <= my <= ty:
+                continue
+            if (
+                _is_clear(index, sx, sy, sx, my, exclude)
+                and _is_clear(index, sx, my, tx, my, exclude)
+                and _is_clear(index, tx, my, tx, ty, exclude)
+            ):
+                return [(sx, my), (tx, my)]
+
+    # Back edge, or every direct jog is blocked: detour through a side
+    # lane, right of both ends first, then left
+    y_out = sy + gap / 2
+    y_in = ty - gap / 2
+    detours = []
+    for start_x, step in (
+        (max(src[2], tgt[2]) + gap / 2, 1),
+        (min(src[0], tgt[0]) - gap / 2, -1),
+    ):
+        lane = _find_lane(
+            index, start_x, min(y_out, y_in), max(y_out, y_in), exclude, gap, step,
+        )
+        points = [(sx, y_out), (lane, y_out), (lane, y_in), (tx, y_in)]
+        if _path_clear(index, [(sx, sy), *points, (tx, ty)], exclude):
+            return points
+        detours.append(points)
+
+    # The legs to and from the lane are blocked: search the channels
+    # between nearby nodes, and keep the right-hand detour if even that fails
+    points = _grid_route(index, (sx, sy), (tx, ty), gap, bounds)
+    return detours[0] if points is None else points
+
+
+def route_edges(ir: DiagramIR) -> None:
+    """Assign orthogonal waypoints to every cell-ref edge in-place.
+
+    Group members may hold group-relative coordinates; obstacles and
+    waypoints use absolute positions (edges are children of the root
+    cell). Nodes hidden in a collapsed group are represented by the
+    collapsed box. Point-based sequence edges and self-loops are left
+    untouched.
+    """
+    if not ir.nodes or not ir.edges:
+        return
+
+    swap = ir.layout == LayoutDirection.LR
+    absolute = ir.absolute_rects()
+    hidden = ir.hidden_items()
+    visible = [n.id for n in ir.nodes if n.id not in hidden]
+    visible.extend(g.id for g in ir.groups if g.collapsed and g.id not in hidden)
+    rects: dict[str, Rect] = {}
+    for item_id in visible:
+        x, y, w, h = absolute[item_id]
+        if swap:
+            rects[item_id] = (y, x, y + h, x + w)
+        else:
+            rects[item_id] = (x, y, x + w, y + h)
+    if not rects:
+        return
+
+    # Bucket size ~ twice the typical node extent keeps buckets small
+    avg_extent = sum(
+        max(x1 - x0, y1 - y0) for x0, y0, x1, y1 in rects.values()
+    ) / len(rects)
+    index = SpatialIndex(cell_size=max(avg_extent * 2, 1.0))
+    for nid, (x0, y0, x1, y1) in rects.items():
+        index.insert(nid, x0, y0, x1 - x0, y1 - y0)
+
+    gap = styles.NODE_SPACING_H if swap else styles.NODE_SPACING_V
+    bounds = (
+        min(r[0] for r in rects.values()),
+        min(r[1] for r in rects.values()),
+        max(r[2] for r in rects.values()),
+        max(r[3] for r in rects.values()),
+    )
+
+    for edge in ir.edges:
+        if edge.source_x is not None:
+            continue
+        source = hidden.get(edge.source, edge.source)
+        target = hidden.get(edge.target, edge.target)
+        edge.waypoints = []
+        if source == target:
+            continue
+        src = rects.get(source)
+        tgt = rects.get(target)
+        if src is None or tgt is None:
+            continue
+
+        points = _route(src, tgt, index, (source, target), gap, bounds)
+        if swap:
+            points = [(y, x) for x, y in points]
+        edge.waypoints = points
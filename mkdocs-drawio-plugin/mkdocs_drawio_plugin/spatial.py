@@ -0,0 +1,78 @@
+"""
+Uniform-grid spatial hash for rectangle lookups.
+
+Layout passes (edge routing, overlap checks) need "which boxes touch this
+region?" queries. Bucketing rectangles into fixed-size grid cells keeps each
+query proportional to the number of cells it covers plus the boxes found,
+so whole-diagram passes stay near-linear instead of O(n^2).
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from math import floor
+from typing import Hashable, Iterator
+
+
+class SpatialIndex:
+    """Grid-bucketed index of axis-aligned rectangles keyed by an ID."""
+
+    def __init__(self, cell_size: float = 200.0):
+        self.cell_size = float(cell_size)
+        self._cells: dict[tuple[int, int], list[Hashable]] = defaultdict(list)
+        self._rects: dict[Hashable, tuple[float, float, float, float]] = {}
+
+    def __len__(self) -> int:
+        return len(self._rects)
+
+    def _cell_range(
+        self, x0: float, y0: float, x1: float, y1: float,
+    ) -> Iterator[tuple[int, int]]:
+        size = self.cell_size
+        for i in range(floor(x0 / size), floor(x1 / size) + 1):
+            for j in range(floor(y0 / size), floor(y1 / size) + 1):
+                yield (i, j)
+
+    def insert(
+        self, key: Hashable, x: float, y: float, width: float, height: float,
+    ) -> None:
+        """Add a rectangle (top-left corner plus size) under ``key``."""
+        rect = (x, y, x + width, y + height)
+        self._rects[key] = rect
+        for cell in self._cell_range(*rect):
+            self._cells[cell].append(key)
+
+    def rect(self, key: Hashable) -> tuple[float, float, float, float]:
+        """Return the stored (x0, y0, x1, y1) bounds for ``key``."""
+        return self._rects[key]
+
+    def query(
+        self, x0: float, y0: float, x1: float, y1: float,
+    ) -> set[Hashable]:
+        """Return keys whose rectangles overlap the box x0..x1, y0..y1.
+
+        Overlap is strict: rectangles that merely share a border with the
+        box are not returned. Zero-width or zero-height boxes work as
+        segment probes.
+        """
+        if x0 > x1:
+            x0, x1 = x1, x0
+        if y0 > y1:
+            y0, y1 = y1, y0
+
+        found: set[Hashable] = set()
+        seen: set[Hashable] = set()
+        cells = self._cells
+        rects = self._rects
+        for cell in self._cell_range(x0, y0, x1, y1):
+            bucket = cells.get(cell)
+            if not bucket:
+                continue
+            for key in bucket:
+                if key in seen:
+                    continue
+                seen.add(key)
+                rx0, ry0, rx1, ry1 = rects[key]
+                if rx0 < x1 and x0 < rx1 and ry0 < y1 and y0 < ry1:
+                    found.add(key)
+        return found
@@ -155,6 +155,18 @@ SHAPE_UML_CLASS = (
     "fillColor=#F5F5F5;strokeColor=#999999;fontColor=#000000;"
 )
 
+# UML class compartments: one text row per attribute/operation, and the
+# rule between the two compartments
+UML_MEMBER = (
+    "text;html=1;align=left;verticalAlign=middle;spacingLeft=6;"
+    "fontSize=11;fontColor=#000000;fillColor=none;strokeColor=none;"
+)
+
+UML_DIVIDER = (
+    "line;html=1;strokeWidth=1;strokeColor=#999999;fillColor=none;"
+    "align=left;verticalAlign=middle;"
+)
+
 # ---------------------------------------------------------------------------
 # Edge styles — by interaction type
 # ---------------------------------------------------------------------------
@@ -229,6 +241,44 @@ EDGE_SEQ_ERROR = (
     "fontColor=#F44336;strokeColor=#F44336;endFill=1;"
 )
 
+# For class diagram relationships (UML end markers)
+EDGE_INHERITANCE = (
+    "endArrow=block;endFill=0;endSize=12;html=1;fontSize=11;"
+    "fontColor=#707070;strokeColor=#707070;edgeStyle=orthogonalEdgeStyle;"
+)
+
+EDGE_REALIZATION = (
+    "endArrow=block;endFill=0;endSize=12;html=1;fontSize=11;"
+    "fontColor=#707070;strokeColor=#707070;"
+    "dashed=1;dashPattern=8 4;edgeStyle=orthogonalEdgeStyle;"
+)
+
+EDGE_COMPOSITION = (
+    "endArrow=diamondThin;endFill=1;endSize=14;html=1;fontSize=11;"
+    "fontColor=#707070;strokeColor=#707070;edgeStyle=orthogonalEdgeStyle;"
+)
+
+EDGE_AGGREGATION = (
+    "endArrow=diamondThin;endFill=0;endSize=14;html=1;fontSize=11;"
+    "fontColor=#707070;strokeColor=#707070;edgeStyle=orthogonalEdgeStyle;"
+)
+
+EDGE_ASSOCIATION = (
+    "endArrow=open;endFill=0;html=1;fontSize=11;"
+    "fontColor=#707070;strokeColor=#707070;edgeStyle=orthogonalEdgeStyle;"
+)
+
+EDGE_LINK = (
+    "endArrow=none;html=1;fontSize=11;"
+    "fontColor=#707070;strokeColor=#707070;edgeStyle=orthogonalEdgeStyle;"
+)
+
+EDGE_DASHED_LINK = (
+    "endArrow=none;html=1;fontSize=11;"
+    "fontColor=#707070;strokeColor=#707070;"
+    "dashed=1;dashPattern=8 4;edgeStyle=orthogonalEdgeStyle;"
+)
+
 EDGE_STYLES = {
     "sync": EDGE_SYNC,
     "async": EDGE_ASYNC_RESPONSE,
@@ -242,6 +292,13 @@ EDGE_STYLES = {
     "seq_request": EDGE_SEQ_REQUEST,
     "seq_response": EDGE_SEQ_RESPONSE,
     "seq_error": EDGE_SEQ_ERROR,
+    "inheritance": EDGE_INHERITANCE,
+    "realization": EDGE_REALIZATION,
+    "composition": EDGE_COMPOSITION,
+    "aggregation": EDGE_AGGREGATION,
+    "association": EDGE_ASSOCIATION,
+    "link": EDGE_LINK,
+    "dashed_link": EDGE_DASHED_LINK,
 }
 
 # ---------------------------------------------------------------------------
@@ -295,11 +352,19 @@ GROUP_DANGER = (
     "spacingTop=8;spacingLeft=10;fontSize=14;fontStyle=1;fontColor=#F44336;"
 )
 
+# One concurrent region (`--`) of a composite state
+STATE_REGION = (
+    "rounded=0;whiteSpace=wrap;html=1;"
+    "fillColor=none;strokeColor=#2196F3;dashed=1;dashPattern=8 4;"
+    "verticalAlign=top;align=left;spacingTop=4;spacingLeft=6;"
+)
+
 GROUP_STYLES = {
     "success": GROUP_SUCCESS,
     "info": GROUP_INFO,
     "warning": GROUP_WARNING,
     "danger": GROUP_DANGER,
+    "region": STATE_REGION,
 }
 
 # ---------------------------------------------------------------------------
@@ -441,6 +506,26 @@ TEXT_LEGEND = (
     "align=left;verticalAlign=middle;"
 )
 
+TEXT_PAGE_LINK = (
+    "text;html=1;align=center;verticalAlign=middle;"
+    "strokeColor=none;fillColor=none;"
+    "fontSize=11;fontStyle=4;fontColor=#1565C0;"
+)
+
+# Multi-page flowcharts: a subgraph on the overview page, and a node on
+# another page at the end of an edge leaving the current one
+PAGE_PLACEHOLDER = (
+    "rounded=1;whiteSpace=wrap;html=1;"
+    "fillColor=#F5F5F5;strokeColor=#616161;"
+    "fontSize=12;fontStyle=5;fontColor=#1565C0;"
+)
+
+PAGE_REFERENCE = (
+    "rounded=1;dashed=1;whiteSpace=wrap;html=1;"
+    "fillColor=#FFFFFF;strokeColor=#9E9E9E;"
+    "fontSize=11;fontStyle=4;fontColor=#1565C0;"
+)
+
 TEXT_GROUP_LABEL = (
     "text;html=1;align=left;verticalAlign=middle;"
     "resizable=0;points=[];autosize=1;"
@@ -496,6 +581,30 @@ ERD_STYLES = {
     "search": ERD_SEARCH,
 }
 
+# Single-cell entities (erd_render="table"): the label is an HTML table
+ERD_TABLE = (
+    "shape=rect;html=1;whiteSpace=wrap;overflow=fill;"
+    "verticalAlign=top;align=left;spacing=0;"
+    "fillColor=#FFFFFF;fontSize=11;fontColor=#333333;"
+)
+
+# Store type -> (header fill, border) for table entities, as in ERD_STYLES
+ERD_TABLE_COLORS = {
+    "relational": ("#E3F2FD", "#438DD5"),
+    "nosql": ("#FFF3E0", "#E8A735"),
+    "cache": ("#E8F5E9", "#4CAF50"),
+    "search": ("#F3E5F5", "#7B1FA2"),
+}
+
+# Key badge colors in table entities
+ERD_BADGE_COLORS = {
+    "PK": "#F9A825",
+    "FK": "#438DD5",
+    "UK": "#7B1FA2",
+    "SK": "#4CAF50",
+    "GSI": "#E8A735",
+}
+
 # ---------------------------------------------------------------------------
 # CI/CD specific
 # ---------------------------------------------------------------------------
@@ -567,6 +676,22 @@ START_END_HEIGHT = 40
 NODE_SPACING_H = 60  # horizontal gap between nodes
 NODE_SPACING_V = 60  # vertical gap between nodes
 GROUP_PADDING = 40  # padding inside group boundaries
+GROUP_LABEL_HEIGHT = 30  # room for the group title above its members
+COLLAPSED_GROUP_HEIGHT = 50  # height of a collapsed group's summary box
+
+# State diagram geometry
+STATE_PSEUDO_SIZE = 30  # [*] start/end circles
+STATE_CHOICE_SIZE = 40  # <<choice>> diamond
+STATE_BAR_LENGTH = 120  # <<fork>>/<<join>> bar
+STATE_BAR_THICKNESS = 10
+
+# UML class geometry
+UML_CLASS_WIDTH = 160  # minimum; grows with the widest member
+UML_HEADER_HEIGHT = 26  # one-line class name (SHAPE_UML_CLASS startSize)
+UML_HEADER_LINE_HEIGHT = 16  # each extra header line (<<annotation>>)
+UML_MEMBER_HEIGHT = 20
+UML_DIVIDER_HEIGHT = 8
+UML_EMPTY_COMPARTMENT_HEIGHT = 8
 
 # Sequence diagram geometry
 SEQ_PARTICIPANT_WIDTH = 140
@@ -575,6 +700,9 @@ SEQ_PARTICIPANT_SPACING = 200  # center-to-center
 SEQ_MESSAGE_Y_SPACING = 40
 SEQ_MESSAGE_Y_START = 40  # below lifeline top
 SEQ_LIFELINE_START_Y = 80  # below participant box bottom
+SEQ_BLOCK_LABEL_HEIGHT = 20  # room above a block's first message for its title
+SEQ_BLOCK_PADDING = 20  # horizontal margin of a block frame around its lifelines
+SEQ_BLOCK_GAP = 10  # space below a block's last message (per nesting level)
 
 # ERD geometry
 ERD_ENTITY_WIDTH = 200
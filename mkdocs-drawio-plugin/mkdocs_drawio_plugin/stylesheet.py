@@ -0,0 +1,94 @@
+"""
+Named draw.io styles backed by one site-wide stylesheet.
+
+Every style constant in styles.py is registered under a short name
+(NODE_COMPUTE -> "m2dNodeCompute"). With named styles enabled, cells
+carry ``style="m2dNodeCompute"`` instead of the full 150+ character
+string; cell-specific additions stay inline after the name
+(``"m2dNodeCompute;fontStyle=1;"``), which draw.io merges on top.
+
+The names only resolve where the stylesheet is loaded: the plugin writes
+stylesheet_js() once per site and loads it before the viewer script.
+Downloadable .drawio files keep inline styles.
+"""
+
+from __future__ import annotations
+
+import json
+from functools import lru_cache
+
+from . import styles
+
+# Prefix that keeps our names clear of draw.io's built-in named styles
+STYLE_PREFIX = "m2d"
+
+
+def _style_name(constant: str) -> str:
+    return STYLE_PREFIX + "".join(part.title() for part in constant.split("_"))
+
+
+def _collect_styles() -> dict[str, str]:
+    """Name -> style string for every style constant in styles.py."""
+    named: dict[str, str] = {}
+    seen: set[str] = set()
+    for constant in vars(styles):  # definition order: originals before aliases
+        value = getattr(styles, constant)
+        if not constant.isupper() or not isinstance(value, str) or "=" not in value:
+            continue
+        if value in seen:
+            continue  # identical strings share the first name
+        seen.add(value)
+        named[_style_name(constant)] = value
+    return named
+
+
+# Precomputed lookup tables
+NAMED_STYLES: dict[str, str] = _collect_styles()
+_NAME_BY_STYLE: dict[str, str] = {v: k for k, v in NAMED_STYLES.items()}
+# Longest first, so the most specific registered prefix wins
+_PREFIXES: list[tuple[str, str]] = sorted(
+    ((v.rstrip(";"), k) for k, v in NAMED_STYLES.items()),
+    key=lambda item: -len(item[0]),
+)
+
+
+@lru_cache(maxsize=4096)
+def compact_style(style: str) -> str:
+    """Replace a registered style (or registered prefix) with its name.
+
+    Unregistered styles are returned unchanged.
+    """
+    name = _NAME_BY_STYLE.get(style)
+    if name is not None:
+        return name
+    for prefix, name in _PREFIXES:
+        if style.startswith(prefix) and style[len(prefix):len(prefix) + 1] == ";":
+            return name + style[len(prefix):]
+    return style
+
+
+def stylesheet_js() -> str:
+    """JavaScript that registers NAMED_STYLES with the draw.io viewer.
+
+    Must load before viewer-static.min.js: the viewer calls
+    window.onDrawioViewerLoad (instead of rendering straight away) when it
+    is defined, which lets us extend Graph.loadStylesheet first.
+    """
+    table = json.dumps(NAMED_STYLES, separators=(",", ":"), sort_keys=True)
+    return (
+        "(function () {\n"
+        f"  var STYLES = {table};\n"
+        "  var previous = window.onDrawioViewerLoad;\n"
+        "  window.onDrawioViewerLoad = function () {\n"
+        "    var load = Graph.prototype.loadStylesheet;\n"
+        "    Graph.prototype.loadStylesheet = function () {\n"
+        "      load.apply(this, arguments);\n"
+        "      var sheet = this.getStylesheet();\n"
+        "      for (var name in STYLES) {\n"
+        "        sheet.putCellStyle(name, sheet.getCellStyle(STYLES[name], {}));\n"
+        "      }\n"
+        "    };\n"
+        "    if (previous) { previous(); } else { GraphViewer.processElements(); }\n"
+        "  };\n"
+        "})();\n"
+    )
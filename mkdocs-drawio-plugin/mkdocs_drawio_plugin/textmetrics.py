@@ -0,0 +1,252 @@
+"""
+Text measurement for label-aware node sizing.
+
+Estimates rendered label size without a browser by summing per-glyph
+advance widths from the Helvetica AFM metrics (draw.io's default font).
+Width tables are precomputed for every font size used in styles.py and
+measurements are memoized per (label, font size, bold), so sizing a large
+diagram costs a dict lookup per repeated label.
+
+Labels are draw.io HTML labels: lines break on ``&#xa;``, ``<br>`` and
+real newlines; ``<b>``/``<strong>`` switch to bold metrics; other tags
+are ignored and entities are decoded before measuring.
+"""
+
+from __future__ import annotations
+
+import html
+import re
+import unicodedata
+from functools import lru_cache
+from itertools import repeat
+from math import ceil
+
+from .generators.base import _resolve_group_style, _resolve_node_style
+from .parsers.base import DiagramGroup, DiagramIR, DiagramNode, NodeShape
+from . import styles
+
+# draw.io defaults when a style omits fontSize / line height
+DEFAULT_FONT_SIZE = 11
+LINE_HEIGHT = 1.2
+
+# Room around the label inside the shape, and the widest a node may grow
+# before its label wraps (styles use whiteSpace=wrap).
+LABEL_PADDING_H = 12
+LABEL_PADDING_V = 8
+MAX_NODE_WIDTH = 320
+SIZE_STEP = 10  # round node sizes up to a tidy grid
+
+# Helvetica advance widths (1/1000 em) for ASCII 32..126, from the AFM files.
+_HELVETICA = (
+    278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+    1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+    333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+    556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584,
+)
+
+_HELVETICA_BOLD = (
+    278, 333, 474, 556, 556, 889, 722, 238, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 333, 333, 584, 584, 584, 611,
+    975, 722, 722, 722, 722, 667, 611, 778, 722, 278, 556, 722, 611, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 333, 278, 333, 584, 556,
+    333, 556, 611, 556, 611, 556, 333, 611, 611, 278, 278, 556, 278, 889, 611, 611,
+    611, 611, 389, 556, 333, 611, 556, 778, 556, 556, 500, 389, 280, 389, 584,
+)
+
+# Fallbacks for glyphs outside the table
+_AVG_WIDTH = 556
+_WIDE_WIDTH = 1000  # CJK and other full-width glyphs
+
+_LINE_BREAK_RE = re.compile(r"&#xa;|&#10;|<br\s*/?>|\n", re.IGNORECASE)
+_TAG_RE = re.compile(r"<(/?)([A-Za-z]+)[^>]*>")
+_FONT_SIZE_RE = re.compile(r"(?:^|;)fontSize=(\d+(?:\.\d+)?)")
+_FONT_STYLE_RE = re.compile(r"(?:^|;)fontStyle=(\d+)")
+
+_BOLD_TAGS = ("b", "strong")
+
+
+def _build_table(widths: tuple[int, ...], font_size: float) -> dict[str, float]:
+    scale = font_size / 1000
+    return {chr(32 + i): w * scale for i, w in enumerate(widths)}
+
+
+def _style_font_sizes() -> set[float]:
+    """Collect every fontSize= value used by the style constants."""
+    sizes = {float(DEFAULT_FONT_SIZE)}
+    for value in vars(styles).values():
+        if isinstance(value, str):
+            sizes.update(float(m) for m in _FONT_SIZE_RE.findall(value))
+    return sizes
+
+
+# (font_size, bold) -> {char: px width}, precomputed for styles.py sizes
+_TABLES: dict[tuple[float, bool], dict[str, float]] = {}
+for _size in _style_font_sizes():
+    _TABLES[(_size, False)] = _build_table(_HELVETICA, _size)
+    _TABLES[(_size, True)] = _build_table(_HELVETICA_BOLD, _size)
+
+
+def _table(font_size: float, bold: bool) -> dict[str, float]:
+    key = (float(font_size), bold)
+    table = _TABLES.get(key)
+    if table is None:
+        table = _build_table(_HELVETICA_BOLD if bold else _HELVETICA, key[0])
+        _TABLES[key] = table
+    return table
+
+
+def _run_width(text: str, font_size: float, bold: bool) -> float:
+    """Width in px of a single run of plain text."""
+    table = _table(font_size, bold)
+    if text.isascii():
+        return sum(map(table.get, text, repeat(_AVG_WIDTH * font_size / 1000)))
+
+    scale = font_size / 1000
+    total = 0.0
+    for ch in text:
+        w = table.get(ch)
+        if w is None:
+            wide = unicodedata.east_asian_width(ch) in ("W", "F")
+            w = (_WIDE_WIDTH if wide else _AVG_WIDTH) * scale
+        total += w
+    return total
+
+
+def _split_runs(line: str, bold: bool) -> list[tuple[str, bool]]:
+    """Split an HTML label line into (plain text, bold) runs."""
+    if "<" not in line:
+        return [(html.unescape(line), bold)]
+
+    runs: list[tuple[str, bool]] = []
+    pos = 0
+    for match in _TAG_RE.finditer(line):
+        if match.start() > pos:
+            runs.append((html.unescape(line[pos:match.start()]), bold))
+        if match.group(2).lower() in _BOLD_TAGS:
+            bold = not match.group(1)
+        pos = match.end()
+    if pos < len(line):
+        runs.append((html.unescape(line[pos:]), bold))
+    return runs
+
+
+def label_lines(label: str) -> list[str]:
+    """Split a draw.io label into its visual lines (before wrapping)."""
+    return _LINE_BREAK_RE.split(label)
+
+
+@lru_cache(maxsize=65536)
+def measure_label(
+    label: str, font_size: float = DEFAULT_FONT_SIZE, bold: bool = False,
+) -> tuple[float, float]:
+    """Return the unwrapped (width, height) of a label in px."""
+    if not label:
+        return 0.0, font_size * LINE_HEIGHT
+
+    if "&" not in label and "<" not in label and "\n" not in label:
+        return _run_width(label, font_size, bold), font_size * LINE_HEIGHT
+
+    lines = label_lines(label)
+    width = 0.0
+    for line in lines:
+        line_width = sum(
+            _run_width(text, font_size, run_bold)
+            for text, run_bold in _split_runs(line, bold)
+        )
+        width = max(width, line_width)
+    return width, len(lines) * font_size * LINE_HEIGHT
+
+
+@lru_cache(maxsize=65536)
+def measure_wrapped(
+    label: str,
+    max_width: float,
+    font_size: float = DEFAULT_FONT_SIZE,
+    bold: bool = False,
+) -> tuple[float, float]:
+    """Return (width, height) of a label word-wrapped to ``max_width`` px."""
+    width, height = measure_label(label, font_size, bold)
+    if width <= max_width:
+        return width, height
+
+    space = _run_width(" ", font_size, bold)
+    line_count = 0
+    widest = 0.0
+    for line in label_lines(label):
+        current = 0.0
+        line_count += 1
+        for text, run_bold in _split_runs(line, bold):
+            for word in text.split():
+                w = _run_width(word, font_size, run_bold)
+                if current and current + space + w > max_width:
+                    widest = max(widest, current)
+                    line_count += 1
+                    current = w
+                else:
+                    current += (space if current else 0.0) + w
+        widest = max(widest, current)
+    return min(widest, max_width), line_count * font_size * LINE_HEIGHT
+
+
+@lru_cache(maxsize=1024)
+def style_font(style: str) -> tuple[float, bool]:
+    """Extract (font size, bold) from a draw.io style string."""
+    size_match = _FONT_SIZE_RE.search(style)
+    style_match = _FONT_STYLE_RE.search(style)
+    size = float(size_match.group(1)) if size_match else float(DEFAULT_FONT_SIZE)
+    bold = bool(int(style_match.group(1)) & 1) if style_match else False
+    return size, bold
+
+
+def round_up(value: float) -> float:
+    """Round a size up to the SIZE_STEP grid."""
+    return float(ceil(value / SIZE_STEP) * SIZE_STEP)
+
+
+def fit_node(node: DiagramNode, style: str) -> tuple[float, float]:
+    """Compute the (width, height) a node needs to show its label.
+
+    Never returns less than the node's current size, so explicit or
+    shape-default dimensions act as a minimum. Unlabelled nodes (e.g.
+    state pseudo-states) keep their size.
+    """
+    if not node.label:
+        return node.width, node.height
+    font_size, bold = style_font(style)
+    text_w, text_h = measure_wrapped(
+        node.label, MAX_NODE_WIDTH - 2 * LABEL_PADDING_H, font_size, bold,
+    )
+    need_w = text_w + 2 * LABEL_PADDING_H
+    need_h = text_h + 2 * LABEL_PADDING_V
+
+    # Labels in non-rectangular shapes only get the inscribed area
+    if node.shape in (NodeShape.DIAMOND, NodeShape.HEXAGON):
+        need_w *= 1.5
+        need_h *= 1.5
+    elif node.shape == NodeShape.CIRCLE:
+        need_w = need_h = max(need_w, need_h) * 1.42
+
+    return (
+        max(node.width, round_up(need_w)),
+        max(node.height, round_up(need_h)),
+    )
+
+
+def group_min_width(group: DiagramGroup) -> float:
+    """Width a group needs to show its title, including side padding."""
+    font_size, bold = style_font(_resolve_group_style(group))
+    text_w, _ = measure_label(group.label, font_size, bold)
+    return round_up(text_w + 2 * styles.GROUP_PADDING)
+
+
+def size_nodes(ir: DiagramIR) -> None:
+    """Grow every node in-place so its label fits. Run before layout.
+
+    Nodes listed in ``ir.presized`` were measured before and are skipped.
+    """
+    for node in ir.nodes:
+        if node.id in ir.presized:
+            continue
+        node.width, node.height = fit_node(node, _resolve_node_style(node))
@@ -0,0 +1,205 @@
+"""
+Tidy tree layout (Reingold–Tilford, in Buchheim's linear-time form).
+
+Org charts, call trees and decision trees are forests; generic ranking
+places each rank left to right with no regard for subtrees, so siblings
+drift away from their parent. When a connected component is a rooted
+tree, the rank engine uses this layout instead: parents are centred over
+their children and subtrees are packed as close as their contours allow.
+
+Nodes may have different sizes. Separation between neighbours on a level
+is half of each node's breadth plus NODE_SPACING_H, and each level is as
+deep as its deepest node. All walks are iterative, so very deep trees do
+not hit Python's recursion limit.
+"""
+
+from __future__ import annotations
+
+from .parsers.base import DiagramEdge, DiagramNode, LayoutDirection
+from . import styles
+
+
+def tree_children(
+    nodes: list[DiagramNode],
+    edges: list[DiagramEdge],
+) -> tuple[int, list[list[int]]] | None:
+    """Return (root index, child lists) if the graph is a rooted tree.
+
+    A rooted tree has exactly one node without incoming edges, one
+    incoming edge on every other node, and n - 1 edges in total (which,
+    for a connected graph, rules out cycles). Children keep edge order.
+    Returns None for anything else.
+    """
+    n = len(nodes)
+    index = {node.id: i for i, node in enumerate(nodes)}
+    children: list[list[int]] = [[] for _ in range(n)]
+    has_parent = [False] * n
+    count = 0
+    for e in edges:
+        if e.source_x is not None:
+            continue
+        s = index.get(e.source)
+        t = index.get(e.target)
+        if s is None or t is None:
+            continue
+        if s == t or has_parent[t]:
+            return None
+        has_parent[t] = True
+        children[s].append(t)
+        count += 1
+    if count != n - 1:
+        return None
+    roots = [i for i in range(n) if not has_parent[i]]
+    if len(roots) != 1:
+        return None
+    return roots[0], children
+
+
+def tree_layout(
+    nodes: list[DiagramNode],
+    root: int,
+    children: list[list[int]],
+    direction: LayoutDirection,
+) -> dict[str, tuple[float, float]]:
+    """Lay out a rooted tree; return top-left positions at the origin.
+
+    ``root`` and ``children`` are as returned by tree_children().
+    """
+    n = len(nodes)
+    lr = direction == LayoutDirection.LR
+    # Breadth runs across a level, depth runs from parent to child
+    breadth = [nd.height if lr else nd.width for nd in nodes]
+    extent = [nd.width if lr else nd.height for nd in nodes]
+    gap = styles.NODE_SPACING_H
+
+    parent = [-1] * n
+    number = [0] * n  # position among siblings
+    for v in range(n):
+        for k, w in enumerate(children[v]):
+            parent[w] = v
+            number[w] = k
+
+    prelim = [0.0] * n
+    mod = [0.0] * n
+    shift = [0.0] * n
+    change = [0.0] * n
+    thread = [-1] * n
+    ancestor = list(range(n))
+    default_ancestor = [-1] * n  # per parent, while its children are walked
+
+    def left_sibling(v: int) -> int:
+        p = parent[v]
+        return children[p][number[v] - 1] if p >= 0 and number[v] > 0 else -1
+
+    def next_left(v: int) -> int:
+        return children[v][0] if children[v] else thread[v]
+
+    def next_right(v: int) -> int:
+        return children[v][-1] if children[v] else thread[v]
+
+    def dist(a: int, b: int) -> float:
+        return (breadth[a] + breadth[b]) / 2 + gap
+
+    def apportion(v: int, default: int) -> int:
+        w = left_sibling(v)
+        if w < 0:
+            return default
+        vip = vop = v
+        vim = w
+        vom = children[parent[v]][0]
+        sip, sop, sim, som = mod[vip], mod[vop], mod[vim], mod[vom]
+        while next_right(vim) >= 0 and next_left(vip) >= 0:
+            vim = next_right(vim)
+            vip = next_left(vip)
+            vom = next_left(vom)
+            vop = next_right(vop)
+            ancestor[vop] = v
+            move = (prelim[vim] + sim) - (prelim[vip] + sip) + dist(vim, vip)
+            if move > 0:
+                a = ancestor[vim]
+                if parent[a] != parent[v]:
+                    a = default
+                subtrees = number[v] - number[a]
+                change[v] -= move / subtrees
+                shift[v] += move
+                change[a] += move / subtrees
+                prelim[v] += move
+                mod[v] += move
+                sip += move
+                sop += move
+            sim += mod[vim]
+            sip += mod[vip]
+            som += mod[vom]
+            sop += mod[vop]
+        if next_right(vim) >= 0 and next_right(vop) < 0:
+            thread[vop] = next_right(vim)
+            mod[vop] += sim - sop
+        if next_left(vip) >= 0 and next_left(vom) < 0:
+            thread[vom] = next_left(vip)
+            mod[vom] += sip - som
+            default = v
+        return default
+
+    # First walk, post-order: each node is finished right after its
+    # subtree, then apportioned against its already-placed left siblings.
+    stack = [(root, False)]
+    while stack:
+        v, expanded = stack.pop()
+        if not expanded:
+            stack.append((v, True))
+            for w in reversed(children[v]):
+                stack.append((w, False))
+            continue
+
+        w = left_sibling(v)
+        if children[v]:
+            # Execute the shifts accumulated by apportioning the children
+            acc_shift = acc_change = 0.0
+            for c in reversed(children[v]):
+                prelim[c] += acc_shift
+                mod[c] += acc_shift
+                acc_change += change[c]
+                acc_shift += shift[c] + acc_change
+            midpoint = (prelim[children[v][0]] + prelim[children[v][-1]]) / 2
+            if w >= 0:
+                prelim[v] = prelim[w] + dist(w, v)
+                mod[v] = prelim[v] - midpoint
+            else:
+                prelim[v] = midpoint
+        elif w >= 0:
+            prelim[v] = prelim[w] + dist(w, v)
+
+        p = parent[v]
+        if p >= 0:
+            if number[v] == 0:
+                default_ancestor[p] = v
+            default_ancestor[p] = apportion(v, default_ancestor[p])
+
+    # Second walk: absolute breadth centres and depth levels
+    centre = [0.0] * n
+    level = [0] * n
+    stack2 = [(root, 0.0, 0)]
+    while stack2:
+        v, m, d = stack2.pop()
+        centre[v] = prelim[v] + m
+        level[v] = d
+        for c in children[v]:
+            stack2.append((c, m + mod[v], d + 1))
+
+    level_depth = [0.0] * (max(level) + 1)
+    for v in range(n):
+        level_depth[level[v]] = max(level_depth[level[v]], extent[v])
+    level_start = [0.0] * len(level_depth)
+    for d in range(1, len(level_depth)):
+        level_start[d] = level_start[d - 1] + level_depth[d - 1] + styles.NODE_SPACING_V
+
+    min_left = min(centre[v] - breadth[v] / 2 for v in range(n))
+    positions: dict[str, tuple[float, float]] = {}
+    for v in range(n):
+        across = centre[v] - breadth[v] / 2 - min_left
+        down = level_start[level[v]]
+        if lr:
+            positions[nodes[v].id] = (down, across)
+        else:
+            positions[nodes[v].id] = (across, down)
+    return positions
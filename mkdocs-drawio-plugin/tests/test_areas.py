@@ -0,0 +1,58 @@
+"""Tests for subject-area partitioning of entity graphs."""
+
+from mkdocs_drawio_plugin.areas import subject_areas
+from mkdocs_drawio_plugin.parsers.base import DiagramEdge, DiagramIR, DiagramNode, DiagramType
+
+
+def _ir(node_ids, links):
+    return DiagramIR(
+        diagram_type=DiagramType.ERD,
+        nodes=[DiagramNode(id=n, label=n) for n in node_ids],
+        edges=[DiagramEdge(id=f"e{i}", source=a, target=b) for i, (a, b) in enumerate(links)],
+    )
+
+
+def _star(hub, n):
+    return [f"{hub}{i}" for i in range(n)], [(hub, f"{hub}{i}") for i in range(1, n)]
+
+
+class TestSubjectAreas:
+    def test_every_entity_once(self):
+        nodes, links = _star("a", 10)
+        more, more_links = _star("b", 7)
+        areas = subject_areas(_ir(nodes + more + ["x"], links + more_links), 5)
+        flat = [n for area in areas for n in area]
+        assert sorted(flat) == sorted(nodes + more + ["x"])
+        assert all(len(area) <= 5 for area in areas)
+
+    def test_components_kept_whole(self):
+        a, a_links = _star("a", 4)
+        b, b_links = _star("b", 4)
+        areas = subject_areas(_ir(a + b, a_links + b_links), 4)
+        assert areas == [a, b]
+
+    def test_small_components_packed(self):
+        a, a_links = _star("a", 3)
+        areas = subject_areas(_ir(a + ["x", "y", "z"], a_links), 6)
+        assert areas == [a + ["x", "y", "z"]]
+
+    def test_split_follows_connectivity(self):
+        # Two dense clusters joined by a single relationship
+        left = [f"l{i}" for i in range(4)]
+        right = [f"r{i}" for i in range(4)]
+        links = [(a, b) for group in (left, right) for a in group for b in group if a < b]
+        links.append(("l0", "r0"))
+        areas = subject_areas(_ir(left + right, links), 4)
+        assert sorted(map(sorted, areas)) == [sorted(left), sorted(right)]
+
+    def test_input_order(self):
+        nodes, links = _star("a", 9)
+        areas = subject_areas(_ir(nodes, links), 3)
+        order = {n: i for i, n in enumerate(nodes)}
+        for area in areas:
+            assert area == sorted(area, key=order.__getitem__)
+        assert [order[area[0]] for area in areas] == sorted(order[area[0]] for area in areas)
+
+    def test_self_and_dangling_edges_ignored(self):
+        areas = subject_areas(_ir(["a", "b"], [("a", "a"), ("a", "missing")]), 1)
+        assert areas == [["a"], ["b"]]
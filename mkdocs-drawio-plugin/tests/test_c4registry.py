@@ -0,0 +1,178 @@
+"""Tests for the site-wide C4 element registry."""
+
+from mkdocs.structure.files import File, Files
+
+from mkdocs_drawio_plugin.c4registry import (
+    add_referenced_elements,
+    c4_registry_info,
+    clear_c4_registry,
+    register_c4_source,
+    registered_element,
+)
+from mkdocs_drawio_plugin.converter import mermaid_to_ir, mermaid_to_xml
+from mkdocs_drawio_plugin.plugin import DrawioPlugin
+from mkdocs_drawio_plugin.textmetrics import size_nodes
+
+
+CONTEXT = """C4Context
+  Person(user, "End User", "Uses the system")
+  System(shop, "Web Shop", "Sells things")
+  System_Ext(pay, "Payment Gateway", "Processes payments")
+  Rel(user, shop, "Buys from")
+  Rel(shop, pay, "Charges cards")
+"""
+
+COMPONENT = """C4Component
+  Component(cart, "Cart", "Go")
+  Component(checkout, "Checkout", "Go")
+  Rel(user, cart, "Adds items")
+  Rel(checkout, pay, "Charges cards")
+"""
+
+
+class TestRegistry:
+    def setup_method(self):
+        clear_c4_registry()
+
+    def teardown_method(self):
+        clear_c4_registry()
+
+    def test_registers_elements(self):
+        assert register_c4_source(CONTEXT) == 3
+        info = c4_registry_info()
+        assert info["elements"] == 3
+        assert info["sources"] == 1
+
+    def test_first_declaration_wins(self):
+        register_c4_source(CONTEXT)
+        added = register_c4_source(
+            'C4Context\n  Person(user, "Someone Else")\n'
+        )
+        assert added == 0
+        assert c4_registry_info()["duplicates"] == 1
+        assert "End User" in registered_element("user").label
+
+    def test_element_is_sized_and_detached(self):
+        register_c4_source(
+            'C4Context\n  System_Boundary(b, "Shop") {\n'
+            '    System(shop, "Web Shop with a rather long name")\n  }\n'
+        )
+        node = registered_element("shop")
+        assert node.parent_group is None
+        assert node.width > 160
+
+    def test_copies_are_independent(self):
+        register_c4_source(CONTEXT)
+        registered_element("user").label = "changed"
+        assert registered_element("user").label != "changed"
+
+    def test_unknown_alias(self):
+        assert registered_element("nope") is None
+
+
+class TestRegisteredDiagrams:
+    def setup_method(self):
+        clear_c4_registry()
+
+    def teardown_method(self):
+        clear_c4_registry()
+
+    def test_conversion_reuses_registered_ir(self):
+        register_c4_source(CONTEXT)
+        ir = mermaid_to_ir("\n" + CONTEXT + "\n")
+        assert {n.id for n in ir.nodes} == {"user", "shop", "pay"}
+        assert ir.presized == {"user", "shop", "pay"}
+        assert c4_registry_info()["reused"] == 1
+
+    def test_copies_are_independent(self):
+        register_c4_source(CONTEXT)
+        first = mermaid_to_ir(CONTEXT)
+        first.nodes[0].x = 500.0
+        first.edges[0].waypoints.append((1.0, 2.0))
+        second = mermaid_to_ir(CONTEXT)
+        assert second.nodes[0].x == 0.0
+        assert second.edges[0].waypoints == []
+
+    def test_presized_nodes_not_measured_again(self):
+        register_c4_source(CONTEXT)
+        ir = mermaid_to_ir(CONTEXT)
+        ir.nodes[0].width = 10.0
+        size_nodes(ir)
+        assert ir.nodes[0].width == 10.0
+
+    def test_same_xml_as_parsing(self):
+        expected = mermaid_to_xml(CONTEXT)
+        register_c4_source(CONTEXT)
+        assert mermaid_to_xml(CONTEXT) == expected
+
+
+class TestReferencedElements:
+    def setup_method(self):
+        clear_c4_registry()
+
+    def teardown_method(self):
+        clear_c4_registry()
+
+    def test_adds_undeclared_ends(self):
+        register_c4_source(CONTEXT)
+        ir = mermaid_to_ir(COMPONENT)
+        assert add_referenced_elements(ir) == 2
+        assert {n.id for n in ir.nodes} == {"cart", "checkout", "user", "pay"}
+        assert ir.presized == {"user", "pay"}
+
+    def test_local_declaration_wins(self):
+        register_c4_source(CONTEXT)
+        ir = mermaid_to_ir(COMPONENT + '  Person(user, "Shopper")\n')
+        add_referenced_elements(ir)
+        users = [n for n in ir.nodes if n.id == "user"]
+        assert len(users) == 1
+        assert "Shopper" in users[0].label
+
+    def test_empty_registry_is_a_no_op(self):
+        ir = mermaid_to_ir(COMPONENT)
+        assert add_referenced_elements(ir) == 0
+        assert len(ir.nodes) == 2
+
+    def test_xml_connects_registered_elements(self):
+        register_c4_source(CONTEXT)
+        xml = mermaid_to_xml(COMPONENT)
+        assert 'id="user"' in xml
+        assert "Payment Gateway" in xml
+
+
+class TestPluginOnFiles:
+    def setup_method(self):
+        clear_c4_registry()
+
+    def teardown_method(self):
+        clear_c4_registry()
+
+    def _files(self, tmp_path):
+        docs = tmp_path / "docs"
+        docs.mkdir()
+        (docs / "context.md").write_text(
+            f"# Context\n\n```mermaid\n{CONTEXT}```\n", encoding="utf-8",
+        )
+        (docs / "flow.md").write_text(
+            "```mermaid\ngraph TD\n  A --> B\n```\n", encoding="utf-8",
+        )
+        return Files([
+            File(name, str(docs), str(tmp_path / "site"), use_directory_urls=False)
+            for name in ("context.md", "flow.md")
+        ])
+
+    def _plugin(self, **options):
+        plugin = DrawioPlugin()
+        plugin.load_config(options)
+        return plugin
+
+    def test_registers_c4_blocks(self, tmp_path):
+        self._plugin(c4_registry=True).on_files(self._files(tmp_path), config=None)
+        info = c4_registry_info()
+        assert info["sources"] == 1
+        assert info["elements"] == 3
+
+    def test_off_by_default(self, tmp_path):
+        register_c4_source(CONTEXT)
+        self._plugin().on_files(self._files(tmp_path), config=None)
+        assert c4_registry_info()["elements"] == 0
@@ -1,5 +1,7 @@
 """Tests for the converter orchestrator."""
 
+import io
+
 from mkdocs_drawio_plugin.converter import (
     detect_type,
     mermaid_to_figure,
@@ -29,6 +31,13 @@ class TestDetectType:
     def test_erd(self):
         assert detect_type("erDiagram\n  A ||--o{ B : has") == DiagramType.ERD
 
+    def test_state(self):
+        assert detect_type("stateDiagram-v2\n  [*] --> A") == DiagramType.STATE
+        assert detect_type("stateDiagram\n  [*] --> A") == DiagramType.STATE
+
+    def test_class(self):
+        assert detect_type("classDiagram\n  A <|-- B") == DiagramType.CLASS
+
     def test_unknown_falls_to_generic(self):
         assert detect_type("pie\n  data") == DiagramType.GENERIC
 
@@ -102,3 +111,22 @@ class TestMermaidToIr:
         assert ir.diagram_type == DiagramType.SEQUENCE
         assert len(ir.participants) == 2
         assert len(ir.edges) == 1
+
+    def test_accepts_file_object(self):
+        text = "%% generated\nerDiagram\n  A {\n    int id PK\n  }\n  A ||--o{ B : has\n"
+        ir = mermaid_to_ir(io.StringIO(text))
+        assert ir.diagram_type == DiagramType.ERD
+        assert ir == mermaid_to_ir(text)
+
+    def test_accepts_line_generator(self):
+        lines = (f"  n{i} --> n{i + 1}\n" for i in range(100))
+        ir = mermaid_to_ir(line for part in (["graph LR\n"], lines) for line in part)
+        assert ir.diagram_type == DiagramType.FLOWCHART
+        assert len(ir.edges) == 100
+
+    def test_generic_stream_keeps_preview(self):
+        ir = mermaid_to_ir(io.StringIO("pie\n" + "  slice: 1\n" * 1000))
+        assert ir.diagram_type == DiagramType.GENERIC
+        assert ir.title == "pie"
+        assert ir.nodes[0].label.endswith("...")
+        assert ir.nodes[0].height == 1001 * 16
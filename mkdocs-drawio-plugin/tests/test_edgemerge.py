@@ -0,0 +1,100 @@
+"""Tests for duplicate-edge merging."""
+
+import pytest
+
+from mkdocs_drawio_plugin.converter import mermaid_to_xml
+from mkdocs_drawio_plugin.edgemerge import merge_duplicate_edges, merged_label
+from mkdocs_drawio_plugin.options import configure, get_options
+from mkdocs_drawio_plugin.parsers.base import (
+    DiagramEdge,
+    DiagramIR,
+    DiagramNode,
+    DiagramType,
+    EdgeType,
+)
+
+
+def _ir(edges):
+    return DiagramIR(
+        diagram_type=DiagramType.FLOWCHART,
+        nodes=[DiagramNode(id=n, label=n) for n in "ABC"],
+        edges=edges,
+    )
+
+
+@pytest.fixture(autouse=True)
+def _reset_options():
+    yield
+    configure()
+
+
+class TestMergedLabel:
+    def test_unlabelled(self):
+        assert merged_label(["", ""], 2) == "×2"
+
+    def test_same_label(self):
+        assert merged_label(["calls", "calls", ""], 3) == "calls ×3"
+
+    def test_distinct_labels_listed(self):
+        assert merged_label(["get", "post"], 2) == "get<br>post<br>×2"
+
+    def test_count_kept_with_unlabelled_copies(self):
+        assert merged_label(["get", "", "post"], 3) == "get<br>post<br>×3"
+
+    def test_long_label_lists_summarized(self):
+        labels = [f"op{i}" for i in range(5)]
+        assert merged_label(labels, 5) == "op0<br>op1<br>op2<br>+2 more<br>×5"
+
+
+class TestMergeDuplicateEdges:
+    def test_duplicates_collapse_into_first(self):
+        ir = _ir([
+            DiagramEdge(id="e1", source="A", target="B", label="get"),
+            DiagramEdge(id="e2", source="B", target="C"),
+            DiagramEdge(id="e3", source="A", target="B", label="put"),
+        ])
+        assert merge_duplicate_edges(ir) == 1
+        assert [e.id for e in ir.edges] == ["e1", "e2"]
+        assert ir.edges[0].label == "get<br>put<br>×2"
+
+    def test_direction_and_type_matter(self):
+        ir = _ir([
+            DiagramEdge(id="e1", source="A", target="B"),
+            DiagramEdge(id="e2", source="B", target="A"),
+            DiagramEdge(id="e3", source="A", target="B", edge_type=EdgeType.ASYNC),
+        ])
+        assert merge_duplicate_edges(ir) == 0
+        assert len(ir.edges) == 3
+
+    def test_point_edges_untouched(self):
+        ir = _ir([
+            DiagramEdge(id=f"m{i}", source="A", target="B", source_x=0.0, target_x=10.0)
+            for i in range(3)
+        ])
+        assert merge_duplicate_edges(ir) == 0
+
+
+class TestConfiguration:
+    def test_off_by_default(self):
+        options = get_options()
+        assert not any(options.merges_edges(t) for t in DiagramType)
+
+    def test_labelled_branches_kept_by_default(self):
+        xml = mermaid_to_xml("graph TD\n  A -->|yes| B\n  A -->|no| B\n")
+        assert xml.count('edge="1"') == 2
+
+    def test_enabled_per_type(self):
+        configure(merge_edges={"flowchart": True})
+        xml = mermaid_to_xml("graph TD\n  A --> B\n  A --> B\n  A --> B\n")
+        assert xml.count('edge="1"') == 1
+        assert "×3" in xml
+
+    def test_other_types_unaffected(self):
+        configure(merge_edges={"flowchart": True})
+        text = 'C4Container\n  Container(a, "A")\n  Container(b, "B")\n'
+        xml = mermaid_to_xml(text + '  Rel(a, b, "x")\n  Rel(a, b, "y")\n')
+        assert xml.count('edge="1"') == 2
+
+    def test_unknown_type_rejected(self):
+        with pytest.raises(ValueError):
+            configure(merge_edges={"nope": True})
@@ -86,3 +86,13 @@ class TestXmlToHtml:
         assert '<div class="mxgraph"' in result
         assert "&quot;" not in result
         assert "&lt;mxGraphModel&gt;" in result
+
+
+class TestPageToolbar:
+    def test_single_page_has_no_page_selector(self):
+        html = xml_to_html("<mxGraphModel><root /></mxGraphModel>")
+        assert '"toolbar":"zoom layers lightbox"' in html
+
+    def test_mxfile_gets_page_selector(self):
+        html = xml_to_html('<mxfile><diagram id="p1" name="1" /></mxfile>')
+        assert '"toolbar":"pages zoom layers lightbox"' in html
@@ -0,0 +1,108 @@
+"""Tests for the force-directed layout engine."""
+
+import pytest
+
+from mkdocs_drawio_plugin.converter import mermaid_to_ir
+from mkdocs_drawio_plugin.forcelayout import force_layout
+from mkdocs_drawio_plugin.layout import auto_layout
+from mkdocs_drawio_plugin.options import configure, get_options
+from mkdocs_drawio_plugin.parsers.base import DiagramEdge, DiagramNode, DiagramType
+
+
+def _star(n):
+    nodes = [DiagramNode(id=f"n{i}", label=f"n{i}") for i in range(n)]
+    edges = [
+        DiagramEdge(id=f"e{i}", source="n0", target=f"n{i}") for i in range(1, n)
+    ]
+    return nodes, edges
+
+
+def _boxes_overlap(nodes, pos):
+    for i, a in enumerate(nodes):
+        ax, ay = pos[a.id]
+        for b in nodes[i + 1:]:
+            bx, by = pos[b.id]
+            if (
+                ax < bx + b.width and bx < ax + a.width
+                and ay < by + b.height and by < ay + a.height
+            ):
+                return True
+    return False
+
+
+C4 = """C4Context
+  Person(user, "User")
+  System(sys, "System")
+  System_Ext(mail, "Mail")
+  System_Ext(pay, "Payments")
+  Rel(user, sys, "Uses")
+  Rel(sys, mail, "Sends")
+  Rel(sys, pay, "Charges")
+  Rel(pay, mail, "Receipts")
+"""
+
+
+class TestForceLayout:
+    def test_deterministic(self):
+        nodes, edges = _star(30)
+        assert force_layout(nodes, edges) == force_layout(nodes, edges)
+
+    def test_seed_changes_result(self):
+        nodes, edges = _star(30)
+        assert force_layout(nodes, edges, seed=1) != force_layout(nodes, edges, seed=2)
+
+    def test_no_overlaps(self):
+        nodes, edges = _star(40)
+        assert not _boxes_overlap(nodes, force_layout(nodes, edges))
+
+    def test_normalized_to_origin(self):
+        nodes, edges = _star(10)
+        pos = force_layout(nodes, edges)
+        assert min(x for x, _ in pos.values()) == 0
+        assert min(y for _, y in pos.values()) == 0
+
+    def test_connected_nodes_closer_than_unconnected(self):
+        nodes = [DiagramNode(id=n, label=n) for n in "ABCD"]
+        edges = [
+            DiagramEdge(id="e0", source="A", target="B"),
+            DiagramEdge(id="e1", source="C", target="D"),
+            DiagramEdge(id="e2", source="B", target="C"),
+        ]
+        pos = force_layout(nodes, edges)
+
+        def dist(a, b):
+            return ((pos[a][0] - pos[b][0]) ** 2 + (pos[a][1] - pos[b][1]) ** 2) ** 0.5
+
+        assert dist("A", "B") < dist("A", "D")
+
+    def test_trivial_inputs(self):
+        assert force_layout([], []) == {}
+        assert force_layout([DiagramNode(id="a", label="a")], []) == {"a": (0.0, 0.0)}
+
+
+class TestEngineSelection:
+    def teardown_method(self):
+        configure()
+
+    def test_default_is_rank(self):
+        assert get_options().layout_engine(DiagramType.C4_CONTEXT) == "rank"
+
+    def test_configured_per_type(self):
+        configure(layout_engines={"c4-context": "force"})
+        ranked = mermaid_to_ir(C4.replace("C4Context", "C4Container"))
+        forced = mermaid_to_ir(C4)
+        auto_layout(ranked)
+        auto_layout(forced)
+        assert [(n.x, n.y) for n in ranked.nodes] != [(n.x, n.y) for n in forced.nodes]
+
+    def test_unknown_engine_rejected(self):
+        with pytest.raises(ValueError):
+            configure(layout_engines={"c4-context": "spring"})
+
+    def test_unknown_type_rejected(self):
+        with pytest.raises(ValueError):
+            configure(layout_engines={"c5": "force"})
+
+    def test_unknown_option_rejected(self):
+        with pytest.raises(TypeError):
+            configure(no_such_option=True)
@@ -1,5 +1,7 @@
 """Tests for the base XML generator."""
 
+import xml.etree.ElementTree as ET
+
 from mkdocs_drawio_plugin.generators.base import (
     build_edge_cell,
     build_point_edge_cell,
@@ -8,6 +10,7 @@ from mkdocs_drawio_plugin.generators.base import (
 )
 from mkdocs_drawio_plugin.parsers.base import (
     DiagramEdge,
+    DiagramGroup,
     DiagramIR,
     DiagramNode,
     DiagramType,
@@ -109,3 +112,24 @@ class TestIrToXml:
         )
         warnings = ir.validate()
         assert any("0 edges" in w for w in warnings)
+
+
+class TestCollapsedGroupCell:
+    def test_collapsed_container_keeps_expanded_bounds(self):
+        ir = DiagramIR(
+            diagram_type=DiagramType.FLOWCHART,
+            nodes=[DiagramNode(id="A", label="A", parent_group="g")],
+            groups=[DiagramGroup(
+                id="g", label="G", width=120, height=50,
+                collapsed=True, alternate_bounds=(400.0, 300.0),
+            )],
+        )
+        root = ET.fromstring(ir_to_xml(ir))
+        cell = next(c for c in root.iter("mxCell") if c.get("id") == "g")
+        assert cell.get("collapsed") == "1"
+        assert "container=1" in cell.get("style")
+        alt = cell.find("mxGeometry/mxRectangle")
+        assert alt.get("as") == "alternateBounds"
+        assert (alt.get("width"), alt.get("height")) == ("400.0", "300.0")
+        child = next(c for c in root.iter("mxCell") if c.get("id") == "A")
+        assert child.get("parent") == "g"  # children are kept
@@ -0,0 +1,68 @@
+"""Tests for the class diagram generator."""
+
+import xml.etree.ElementTree as ET
+
+from mkdocs_drawio_plugin import styles
+from mkdocs_drawio_plugin.generators.class_diagram import generate
+from mkdocs_drawio_plugin.parsers.class_diagram import parse
+
+CLASSES = """classDiagram
+  namespace Model {
+    class Animal {
+      <<abstract>>
+      +String name
+      +speak() String
+    }
+  }
+  class Dog {
+    +fetch(List~Stick~ sticks)
+  }
+  Animal <|-- Dog
+  Dog *-- Tail
+"""
+
+
+def _cells(xml: str) -> list[ET.Element]:
+    return list(ET.fromstring(xml).iter("mxCell"))
+
+
+class TestClassDiagramGenerator:
+    def test_class_is_uml_swimlane(self):
+        cells = {c.get("id"): c for c in _cells(generate(parse(CLASSES)))}
+        assert cells["Dog"].get("style") == styles.SHAPE_UML_CLASS
+        assert cells["Animal"].get("parent") == "Model"
+        # Annotation line makes the header taller
+        style = cells["Animal"].get("style")
+        assert "startSize=42;" in style
+        assert style.count("startSize=") == 1
+
+    def test_compartments(self):
+        cells = {c.get("id"): c for c in _cells(generate(parse(CLASSES)))}
+        rows = [c for c in cells.values() if c.get("parent") == "Animal"]
+        assert [c.get("id") for c in rows] == ["Animal_a0", "Animal_rule", "Animal_m0"]
+        assert cells["Animal_a0"].get("value") == "+String name"
+        assert cells["Animal_rule"].get("style") == styles.UML_DIVIDER
+        y = [float(c.find("mxGeometry").get("y")) for c in rows]
+        assert y == sorted(y)
+        assert cells["Dog_m0"].get("value") == "+fetch(List&lt;Stick&gt; sticks)"
+
+    def test_relationship_styles(self):
+        cells = _cells(generate(parse(CLASSES)))
+        edges = {c.get("id"): c for c in cells if c.get("edge") == "1"}
+        assert edges["rel_0"].get("style") == styles.EDGE_INHERITANCE
+        assert (edges["rel_0"].get("source"), edges["rel_0"].get("target")) == ("Dog", "Animal")
+        assert edges["rel_1"].get("style") == styles.EDGE_COMPOSITION
+
+    def test_cells_precede_edges(self):
+        cells = _cells(generate(parse(CLASSES)))
+        kinds = ["edge" if c.get("edge") else "vertex" for c in cells[2:]]
+        assert kinds == sorted(kinds, key=lambda k: k == "edge")
+
+    def test_height_fits_compartments(self):
+        ir = parse(CLASSES)
+        generate(ir)
+        dog = ir.node_by_id("Dog")
+        assert dog.height == (
+            styles.UML_HEADER_HEIGHT + styles.UML_EMPTY_COMPARTMENT_HEIGHT
+            + styles.UML_DIVIDER_HEIGHT + styles.UML_MEMBER_HEIGHT
+        )
@@ -0,0 +1,126 @@
+"""Tests for the ERD generator's cell and table renderings."""
+
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from mkdocs_drawio_plugin.generators.erd import generate
+from mkdocs_drawio_plugin.options import configure
+from mkdocs_drawio_plugin.parsers.erd import parse
+
+ERD = """erDiagram
+  CUSTOMER {
+    int id PK "primary key"
+    string name
+    int address_id FK
+  }
+  ORDER {
+    int id PK
+    string note "a < b"
+  }
+  CUSTOMER ||--o{ ORDER : places
+"""
+
+
+@pytest.fixture(autouse=True)
+def _reset_options():
+    yield
+    configure()
+
+
+def _vertices(xml):
+    return {
+        c.get("id"): c for c in ET.fromstring(xml).iter("mxCell") if c.get("vertex")
+    }
+
+
+class TestTableRendering:
+    def test_one_cell_per_entity(self):
+        cells_xml = generate(parse(ERD))
+        configure(erd_render="table")
+        table_xml = generate(parse(ERD))
+        assert len(_vertices(cells_xml)) == 7  # 2 entities + 5 fields
+        assert set(_vertices(table_xml)) == {"CUSTOMER", "ORDER"}
+
+    def test_same_geometry_as_cells(self):
+        cells = _vertices(generate(parse(ERD)))
+        configure(erd_render="table")
+        tables = _vertices(generate(parse(ERD)))
+        for entity in ("CUSTOMER", "ORDER"):
+            assert cells[entity].find("mxGeometry").attrib == tables[entity].find("mxGeometry").attrib
+
+    def test_label_has_header_rows_and_badges(self):
+        configure(erd_render="table")
+        label = _vertices(generate(parse(ERD)))["CUSTOMER"].get("value")
+        assert label.startswith("<table")
+        assert label.count("<tr>") == 4
+        assert ">CUSTOMER</td>" in label
+        assert ">PK</b>" in label and ">FK</b>" in label
+        assert "[PK]" not in label
+
+    def test_field_text_is_escaped(self):
+        configure(erd_render="table")
+        label = _vertices(generate(parse(ERD)))["ORDER"].get("value")
+        assert "a &lt; b" in label
+
+    def test_unknown_mode_rejected(self):
+        with pytest.raises(ValueError, match="erd_render"):
+            configure(erd_render="grid")
+
+
+def _star_erd(hubs, spokes):
+    lines = ["erDiagram"]
+    for h in range(hubs):
+        for s in range(spokes):
+            lines.append(f"  H{h} ||--o{{ H{h}_S{s} : has")
+    lines.append("  H0 ||--o{ H1 : feeds")
+    return "\n".join(lines)
+
+
+def _pages(xml):
+    root = ET.fromstring(xml)
+    assert root.tag == "mxfile"
+    return {d.get("id"): d for d in root.iter("diagram")}
+
+
+def _links(page):
+    return {o.get("id"): o.get("link") for o in page.iter("UserObject")}
+
+
+class TestSubjectAreaPages:
+    def test_single_page_below_threshold(self):
+        configure(erd_area_entities=100)
+        assert generate(parse(_star_erd(2, 4))).startswith("<mxGraphModel")
+
+    def test_page_per_area(self):
+        configure(erd_area_entities=5)
+        pages = _pages(generate(parse(_star_erd(2, 4))))
+        assert list(pages) == ["overview", "area-1", "area-2"]
+        assert [d.get("name") for d in pages.values()] == ["Overview", "H0", "H1"]
+        area_1 = _vertices(ET.tostring(pages["area-1"].find("mxGraphModel")))
+        assert {"H0", "H0_S0", "H0_S3"} <= set(area_1)
+        assert "H1_S0" not in area_1
+
+    def test_overview_links_and_counts(self):
+        configure(erd_area_entities=5)
+        overview = _pages(generate(parse(_star_erd(2, 4))))["overview"]
+        assert _links(overview) == {
+            "area-1": "data:page/id,area-1",
+            "area-2": "data:page/id,area-2",
+        }
+        labels = [c.get("value") for c in overview.iter("mxCell") if c.get("edge")]
+        assert labels == ["1 relationship"]
+
+    def test_cross_area_stub_entities(self):
+        configure(erd_area_entities=5)
+        pages = _pages(generate(parse(_star_erd(2, 4))))
+        assert _links(pages["area-1"]) == {
+            "H1__ref": "data:page/id,area-2",
+            "back_to_overview": "data:page/id,overview",
+        }
+        assert "H0__ref" in _links(pages["area-2"])
+
+    def test_table_rendering_on_area_pages(self):
+        configure(erd_area_entities=5, erd_render="table")
+        page = _pages(generate(parse(_star_erd(2, 4))))["area-1"]
+        assert not any(c.get("id", "").endswith("_f0") for c in page.iter("mxCell"))
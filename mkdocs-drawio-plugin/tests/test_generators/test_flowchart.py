@@ -0,0 +1,86 @@
+"""Tests for the flowchart generator's multi-page output."""
+
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from mkdocs_drawio_plugin.generators.flowchart import generate
+from mkdocs_drawio_plugin.options import configure
+from mkdocs_drawio_plugin.parsers.flowchart import parse
+
+FLOWCHART = """graph TD
+  S[Start] --> A1
+  subgraph alpha
+    A1[Alpha one] --> A2[Alpha two]
+    A2 --> A3[Alpha three]
+  end
+  subgraph beta
+    B1[Beta one] --> B2[Beta two]
+  end
+  A3 --> B1
+  A2 --> B2
+"""
+
+
+@pytest.fixture(autouse=True)
+def _reset_options():
+    yield
+    configure()
+
+
+def _pages(xml):
+    root = ET.fromstring(xml)
+    assert root.tag == "mxfile"
+    return {d.get("id"): d for d in root.iter("diagram")}
+
+
+def _ids(page):
+    return {e.get("id") for e in page.iter() if e.get("id")} - {"0", "1"}
+
+
+def _links(page):
+    return {o.get("id"): o.get("link") for o in page.iter("UserObject")}
+
+
+class TestMultiPage:
+    def test_single_page_below_threshold(self):
+        configure(flowchart_page_nodes=100)
+        assert generate(parse(FLOWCHART)).startswith("<mxGraphModel")
+
+    def test_single_page_without_two_subgraphs(self):
+        configure(flowchart_page_nodes=1)
+        xml = generate(parse("graph TD\n  A --> B\n  B --> C"))
+        assert xml.startswith("<mxGraphModel")
+
+    def test_page_per_top_level_subgraph(self):
+        configure(flowchart_page_nodes=3)
+        pages = _pages(generate(parse(FLOWCHART)))
+        ir = parse(FLOWCHART)
+        alpha, beta = (g.id for g in ir.groups)
+        assert list(pages) == ["overview", f"page-{alpha}", f"page-{beta}"]
+        assert {"A1", "A2", "A3"} <= _ids(pages[f"page-{alpha}"])
+        assert "B1" not in _ids(pages[f"page-{alpha}"])
+
+    def test_overview_placeholders_link_to_pages(self):
+        configure(flowchart_page_nodes=3)
+        pages = _pages(generate(parse(FLOWCHART)))
+        alpha, beta = (g.id for g in parse(FLOWCHART).groups)
+        links = _links(pages["overview"])
+        assert links == {alpha: f"data:page/id,page-{alpha}", beta: f"data:page/id,page-{beta}"}
+        overview = pages["overview"]
+        assert "S" in _ids(overview) and "A1" not in _ids(overview)
+        # A3 -> B1 and A2 -> B2 lift to alpha -> beta (merged into one cell)
+        lifted = [
+            c for c in overview.iter("mxCell")
+            if c.get("source") == alpha and c.get("target") == beta
+        ]
+        assert len(lifted) == 1
+
+    def test_outside_ends_become_linked_references(self):
+        configure(flowchart_page_nodes=3)
+        pages = _pages(generate(parse(FLOWCHART)))
+        alpha, beta = (g.id for g in parse(FLOWCHART).groups)
+        links = _links(pages[f"page-{alpha}"])
+        assert links["S__ref"] == "data:page/id,overview"
+        assert links["B1__ref"] == f"data:page/id,page-{beta}"
+        assert links["back_to_overview"] == "data:page/id,overview"
@@ -0,0 +1,103 @@
+"""Tests for the sequence generator: block frames and pagination."""
+
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from mkdocs_drawio_plugin.generators.sequence import generate
+from mkdocs_drawio_plugin.layout import layout_sequence
+from mkdocs_drawio_plugin.options import configure
+from mkdocs_drawio_plugin.parsers.sequence import parse
+
+
+def _trace(messages, block_at=None):
+    lines = ["sequenceDiagram"]
+    for i in range(messages):
+        if i == block_at:
+            lines.append("  loop poll")
+        lines.append(f"  A->>B: m{i}")
+    if block_at is not None:
+        lines.append("  end")
+    return "\n".join(lines)
+
+
+@pytest.fixture(autouse=True)
+def _reset_options():
+    yield
+    configure()
+
+
+class TestBlockFrames:
+    def test_frame_encloses_its_messages(self):
+        ir = parse(_trace(6, block_at=2))
+        layout_sequence(ir)
+        (block,) = ir.groups
+        inside = ir.edges[2:]
+        assert all(block.y < e.source_y < block.y + block.height for e in inside)
+        assert ir.edges[1].source_y < block.y
+        assert block.x < min(inside[0].source_x, inside[0].target_x)
+
+    def test_nested_frame_relative_to_parent(self):
+        ir = parse(
+            "sequenceDiagram\n  loop outer\n    A->>B: a\n"
+            "    opt inner\n      B->>C: b\n    end\n  end\n"
+        )
+        layout_sequence(ir)
+        outer, inner = ir.groups
+        rects = ir.absolute_rects()
+        ox, oy, ow, oh = rects[outer.id]
+        ix, iy, iw, ih = rects[inner.id]
+        assert inner.parent_group == outer.id
+        assert ox < ix and ix + iw < ox + ow
+        assert oy < iy and iy + ih <= oy + oh
+
+    def test_empty_blocks_are_dropped(self):
+        ir = parse("sequenceDiagram\n  A->>B: x\n  opt nothing\n  end\n")
+        layout_sequence(ir)
+        assert ir.groups == []
+
+
+class TestPagination:
+    def test_short_trace_is_single_page(self):
+        assert generate(parse(_trace(10))).startswith("<mxGraphModel>")
+
+    def test_long_trace_split_into_pages(self):
+        configure(sequence_page_messages=10)
+        xml = generate(parse(_trace(25)))
+        root = ET.fromstring(xml)
+        assert root.tag == "mxfile"
+        pages = root.findall("diagram")
+        assert [p.get("id") for p in pages] == ["page-1", "page-2", "page-3"]
+        for page in pages:
+            values = [c.get("value") for c in page.iter("mxCell")]
+            assert values.count("A") == 1 and values.count("B") == 1  # headers repeat
+        messages = [
+            c for p in pages for c in p.iter("mxCell")
+            if (c.get("value") or "").startswith("m")
+        ]
+        assert len(messages) == 25
+
+    def test_continuation_links(self):
+        configure(sequence_page_messages=10)
+        root = ET.fromstring(generate(parse(_trace(25))))
+        pages = root.findall("diagram")
+        links = [[o.get("link") for o in p.iter("UserObject")] for p in pages]
+        assert links[0] == ["data:page/id,page-2"]
+        assert sorted(links[1]) == ["data:page/id,page-1", "data:page/id,page-3"]
+        assert links[2] == ["data:page/id,page-2"]
+
+    def test_block_split_across_pages(self):
+        configure(sequence_page_messages=10)
+        root = ET.fromstring(generate(parse(_trace(20, block_at=5))))
+        first, second = root.findall("diagram")
+        labels = lambda page: [c.get("value") for c in page.iter("mxCell")]  # noqa: E731
+        assert "LOOP: poll" in labels(first)
+        assert "LOOP: poll (continued)" in labels(second)
+
+    def test_disabled(self):
+        configure(sequence_page_messages=0)
+        assert generate(parse(_trace(300))).startswith("<mxGraphModel>")
+
+    def test_negative_page_size_rejected(self):
+        with pytest.raises(ValueError):
+            configure(sequence_page_messages=-1)
@@ -0,0 +1,60 @@
+"""Tests for the state diagram generator."""
+
+import xml.etree.ElementTree as ET
+
+from mkdocs_drawio_plugin import styles
+from mkdocs_drawio_plugin.generators.state import generate
+from mkdocs_drawio_plugin.parsers.state import parse
+
+STATE = """stateDiagram-v2
+  [*] --> Idle
+  Idle --> Work : go
+  state Work {
+    [*] --> Step
+    Step --> [*]
+  }
+  state split <<fork>>
+  Work --> split
+  split --> Done
+  Done --> [*]
+"""
+
+
+def _cells(xml: str) -> dict[str, ET.Element]:
+    return {c.get("id"): c for c in ET.fromstring(xml).iter("mxCell")}
+
+
+class TestStateGenerator:
+    def test_composite_state_is_container(self):
+        cells = _cells(generate(parse(STATE)))
+        assert cells["Step"].get("parent") == "Work"
+        assert cells["Work"].get("style") == styles.GROUP_INFO
+
+    def test_transitions_reach_composite_state(self):
+        cells = _cells(generate(parse(STATE)))
+        edge = next(c for c in cells.values() if c.get("value") == "go")
+        assert (edge.get("source"), edge.get("target")) == ("Idle", "Work")
+
+    def test_pseudo_state_geometry(self):
+        ir = parse(STATE)
+        cells = _cells(generate(ir))
+        assert cells["root__start"].get("style") == styles.SHAPE_START_END
+        start = ir.node_by_id("root__start")
+        assert start.width == start.height == styles.STATE_PSEUDO_SIZE
+        bar = ir.node_by_id("split")
+        assert (bar.width, bar.height) == (styles.STATE_BAR_LENGTH, styles.STATE_BAR_THICKNESS)
+
+    def test_fork_bar_turns_with_lr_layout(self):
+        ir = parse(STATE.replace("stateDiagram-v2\n", "stateDiagram-v2\n  direction LR\n"))
+        generate(ir)
+        bar = ir.node_by_id("split")
+        assert (bar.width, bar.height) == (styles.STATE_BAR_THICKNESS, styles.STATE_BAR_LENGTH)
+        assert "direction=south" in bar.style_override
+
+    def test_concurrent_regions_are_dashed_containers(self):
+        text = "stateDiagram-v2\n  state Keys {\n    A --> B\n    --\n    C --> D\n  }\n"
+        cells = _cells(generate(parse(text)))
+        for rid in ("Keys__region1", "Keys__region2"):
+            assert cells[rid].get("parent") == "Keys"
+            assert cells[rid].get("style") == styles.STATE_REGION
+        assert cells["C"].get("parent") == "Keys__region2"
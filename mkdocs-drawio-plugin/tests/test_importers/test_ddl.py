@@ -0,0 +1,164 @@
+"""Tests for the SQL DDL importer."""
+
+import sys
+
+from mkdocs_drawio_plugin import cli
+from mkdocs_drawio_plugin.importers.ddl import _statements, parse
+from mkdocs_drawio_plugin.parsers.base import DiagramType, LayoutDirection, NodeShape
+
+
+SCHEMA = """
+-- Customers and their orders
+CREATE TABLE public.customers (
+    id integer NOT NULL,
+    email character varying(255) NOT NULL,
+    note text DEFAULT 'a, b; c',
+    CONSTRAINT customers_pkey PRIMARY KEY (id)
+);
+
+CREATE TABLE orders (
+    id bigserial PRIMARY KEY,
+    customer_id integer NOT NULL REFERENCES customers (id),
+    total numeric(10, 2), /* before tax; in cents */
+    coupon_id integer
+);
+
+CREATE UNIQUE INDEX customers_email ON public.customers USING btree (email);
+ALTER TABLE ONLY public.orders
+    ADD CONSTRAINT orders_coupon_fk FOREIGN KEY (coupon_id) REFERENCES public.coupons (id);
+"""
+
+
+def _node(ir, nid):
+    return next(n for n in ir.nodes if n.id == nid)
+
+
+class TestStatements:
+    def test_split_on_semicolons(self):
+        assert [s.split()[0] for s in _statements(SCHEMA.splitlines())] == [
+            "CREATE", "CREATE", "CREATE", "ALTER",
+        ]
+
+    def test_semicolons_in_strings_and_dollar_quotes(self):
+        sql = [
+            "CREATE FUNCTION f() RETURNS int AS $body$ SELECT 1; $body$ LANGUAGE sql;",
+            "CREATE TABLE t (a text DEFAULT 'x;''y');",
+        ]
+        statements = list(_statements(sql))
+        assert len(statements) == 2
+        assert "'x;''y'" in statements[1]
+
+    def test_data_statements_skipped(self):
+        sql = [
+            "INSERT INTO t VALUES (1, 'CREATE TABLE x (a int);');",
+            "COPY public.t (a, b) FROM stdin;",
+            "1\tCREATE TABLE y (a int);",
+            "\\.",
+            "CREATE TABLE z (a int);",
+        ]
+        assert [s.strip() for s in _statements(sql)] == ["CREATE TABLE z (a int)"]
+
+    def test_go_separator(self):
+        sql = ["CREATE TABLE a (id int)", "GO", "CREATE TABLE b (id int)", "GO"]
+        assert len(list(_statements(sql))) == 2
+
+
+class TestDdlImporter:
+    def test_erd_ir(self):
+        ir = parse(SCHEMA)
+        assert ir.diagram_type == DiagramType.ERD
+        assert ir.layout == LayoutDirection.LR
+        assert [n.id for n in ir.nodes] == ["customers", "orders", "coupons"]
+        assert all(n.shape == NodeShape.UML_CLASS for n in ir.nodes)
+        assert not ir.validate()
+
+    def test_fields_and_badges(self):
+        ir = parse(SCHEMA)
+        assert _node(ir, "customers").fields == [
+            "id: integer [PK]",
+            "email: character varying(255) [UK]",
+            "note: text",
+        ]
+        assert _node(ir, "orders").fields == [
+            "id: bigserial [PK]",
+            "customer_id: integer [FK]",
+            "total: numeric(10, 2)",
+            "coupon_id: integer [FK]",
+        ]
+
+    def test_foreign_key_edges(self):
+        ir = parse(SCHEMA)
+        edges = [(e.source, e.target, e.label) for e in ir.edges]
+        assert edges == [
+            ("customers", "orders", "1  customer_id  0..*"),
+            ("coupons", "orders", "0..1  coupon_id  0..*"),
+        ]
+
+    def test_one_to_one(self):
+        ir = parse(
+            "CREATE TABLE users (id int PRIMARY KEY);\n"
+            "CREATE TABLE profiles (user_id int PRIMARY KEY REFERENCES users);\n"
+        )
+        assert ir.edges[0].label == "1  user_id  0..1"
+        assert _node(ir, "profiles").fields == ["user_id: int [PK]"]
+
+    def test_mysql_dump(self):
+        ir = parse(
+            "CREATE TABLE `items` (\n"
+            "  `id` int(11) NOT NULL AUTO_INCREMENT,\n"
+            "  `order_id` bigint DEFAULT NULL,\n"
+            "  PRIMARY KEY (`id`),\n"
+            "  KEY `ix_order` (`order_id`),\n"
+            "  CONSTRAINT `fk_order` FOREIGN KEY (`order_id`) REFERENCES `orders` (`id`)\n"
+            ") ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;\n"
+        )
+        assert _node(ir, "items").fields == ["id: int(11) [PK]", "order_id: bigint [FK]"]
+        assert (ir.edges[0].source, ir.edges[0].target) == ("orders", "items")
+
+    def test_names_match_case_insensitively(self):
+        ir = parse(
+            'CREATE TABLE "Users" (id int PRIMARY KEY);\n'
+            "CREATE TABLE posts (author int REFERENCES users (id));\n"
+        )
+        assert [n.label for n in ir.nodes] == ["Users", "posts"]
+        assert ir.edges[0].source == "users"
+
+    def test_other_schemas_kept(self):
+        ir = parse("CREATE TABLE billing.invoices (id int);\n")
+        assert ir.nodes[0].id == "billing.invoices"
+
+    def test_migrations(self):
+        ir = parse(
+            "CREATE TABLE a (id int PRIMARY KEY);\n"
+            "CREATE TABLE b (id int, legacy text);\n"
+            "ALTER TABLE b ADD COLUMN a_id int NOT NULL, DROP COLUMN legacy;\n"
+            "ALTER TABLE b ADD FOREIGN KEY (a_id) REFERENCES a (id);\n"
+            "CREATE TABLE c (b_id int REFERENCES b (id));\n"
+            "DROP TABLE IF EXISTS c;\n"
+        )
+        assert [n.id for n in ir.nodes] == ["a", "b"]
+        assert _node(ir, "b").fields == ["id: int", "a_id: int [FK]"]
+        assert [(e.source, e.target) for e in ir.edges] == [("a", "b")]
+
+    def test_composite_unique_not_marked(self):
+        ir = parse("CREATE TABLE t (a int, b int, UNIQUE (a, b));\n")
+        assert ir.nodes[0].fields == ["a: int", "b: int"]
+
+    def test_accepts_lines(self):
+        assert parse(iter(SCHEMA.splitlines(keepends=True))) == parse(SCHEMA)
+
+
+class TestCli:
+    def test_from_ddl(self, tmp_path, monkeypatch, capsys):
+        first = tmp_path / "001.sql"
+        first.write_text("CREATE TABLE a (id int PRIMARY KEY)\n", encoding="utf-8")
+        second = tmp_path / "002.sql"
+        second.write_text("CREATE TABLE b (a_id int REFERENCES a);\n", encoding="utf-8")
+        monkeypatch.setattr(
+            sys, "argv", ["mermaid-to-drawio", str(first), str(second), "--from", "ddl"],
+        )
+        cli.main()
+        out = capsys.readouterr().out
+        assert 'id="a"' in out
+        assert 'id="b"' in out
+        assert 'edge="1"' in out
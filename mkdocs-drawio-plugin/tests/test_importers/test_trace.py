@@ -0,0 +1,236 @@
+"""Tests for the OpenTelemetry trace importer."""
+
+import json
+import re
+import sys
+from itertools import chain
+
+from mkdocs_drawio_plugin import cli
+from mkdocs_drawio_plugin.converter import ir_to_xml
+from mkdocs_drawio_plugin.importers.trace import _Aggregator, _documents, _fold, _Loop, parse
+from mkdocs_drawio_plugin.parsers.base import DiagramType, EdgeType
+
+
+def _span(trace_id, span_id, name, start, end, parent="", **extra):
+    return {
+        "traceId": trace_id, "spanId": span_id, "parentSpanId": parent,
+        "name": name, "kind": 2,
+        "startTimeUnixNano": str(start), "endTimeUnixNano": str(end), **extra,
+    }
+
+
+def _batch(service, spans):
+    return json.dumps({"resourceSpans": [{
+        "resource": {"attributes": [
+            {"key": "service.name", "value": {"stringValue": service}},
+        ]},
+        "scopeSpans": [{"spans": spans}],
+    }]})
+
+
+def _checkout(trace_id, items=2, error=False):
+    """JSON Lines for one trace, children exported before their parent."""
+    inventory = [
+        _span(trace_id, f"{trace_id}-i{i}", "GET /item", 20 + 10 * i, 25 + 10 * i, f"{trace_id}-r")
+        for i in range(items)
+    ]
+    db = _span(
+        trace_id, f"{trace_id}-d", "INSERT", 200, 210, f"{trace_id}-r",
+        kind=3, status={"code": 2 if error else 0},
+    )
+    root = _span(trace_id, f"{trace_id}-r", "POST /checkout", 10, 300)
+    return [_batch("inventory", inventory), _batch("orders-db", [db]), _batch("frontend", [root])]
+
+
+def _messages(ir):
+    names = {p.id: p.label for p in ir.participants}
+    return [(names[e.source], names[e.target], e.label, e.edge_type) for e in ir.edges]
+
+
+class TestFold:
+    def test_repeated_runs(self):
+        a, b, c = ("A", "B", "x", None), ("B", "A", "", None), ("A", "C", "y", None)
+        assert _fold([c, a, b, a, b, a, b, c]) == [c, _Loop(3, (a, b)), c]
+
+    def test_no_repeats(self):
+        msgs = [("A", "B", str(i), None) for i in range(4)]
+        assert _fold(msgs) == msgs
+
+
+class TestTraceImporter:
+    def test_messages_in_time_order(self):
+        ir = parse("\n".join(_checkout("t1", items=1)))
+        assert ir.diagram_type == DiagramType.SEQUENCE
+        assert [p.label for p in ir.participants] == [
+            "Client", "frontend", "inventory", "orders-db",
+        ]
+        assert _messages(ir) == [
+            ("Client", "frontend", "POST /checkout", EdgeType.SEQ_REQUEST),
+            ("frontend", "inventory", "GET /item", EdgeType.SEQ_REQUEST),
+            ("inventory", "frontend", "", EdgeType.SEQ_RESPONSE),
+            ("frontend", "orders-db", "INSERT", EdgeType.SEQ_REQUEST),
+            ("orders-db", "frontend", "", EdgeType.SEQ_RESPONSE),
+            ("frontend", "Client", "", EdgeType.SEQ_RESPONSE),
+        ]
+
+    def test_errors(self):
+        ir = parse("\n".join(_checkout("t1", items=1, error=True)))
+        assert ("orders-db", "frontend", "error", EdgeType.SEQ_ERROR) in _messages(ir)
+
+    def test_internal_spans_skipped(self):
+        lines = [_batch("frontend", [
+            _span("t", "r", "POST /checkout", 0, 100),
+            _span("t", "v", "validate", 10, 20, "r", kind=1),
+        ])]
+        assert len(parse(lines).edges) == 2
+
+    def test_loops_folded_across_traces(self):
+        lines = _checkout("t1", items=3) + _checkout("t2", items=5)
+        ir = parse(lines)
+        labels = [g.label for g in ir.groups]
+        assert labels == ["POST /checkout: 2 of 2 traces", "LOOP: ×3–5"]
+        loop = ir.groups[1]
+        assert loop.parent_group == ir.groups[0].id
+        assert [e.label for e in ir.edges if e.parent_group == loop.id] == ["GET /item", ""]
+
+    def test_most_frequent_shape_first(self):
+        lines = _checkout("t1", error=True)
+        for n in range(3):
+            lines += _checkout(f"ok{n}")
+        ir = parse(lines)
+        traces = [g.label for g in ir.groups if g.parent_group is None]
+        assert traces == ["POST /checkout: 3 of 4 traces", "POST /checkout: 1 of 4 traces"]
+
+    def test_message_budget(self):
+        lines = _checkout("t1", error=True) + _checkout("t2")
+        ir = parse(lines, max_messages=6)
+        assert len(ir.edges) == 6
+        assert [g.label for g in ir.groups if g.parent_group is None] == [
+            "POST /checkout: 1 of 2 traces",
+        ]
+        truncated = parse(lines, max_messages=3)
+        assert len(truncated.edges) == 3
+        assert "(first 3 of 6 messages)" in truncated.groups[0].label
+
+    def test_bounded_open_traces(self):
+        # Interleaved traces finish early when the window is full; the
+        # rest of trace t1 arrives late and is dropped, not a new trace
+        lines = _checkout("t1")[:2] + _checkout("t2") + _checkout("t1")[2:]
+        ir = parse(lines, max_open_traces=1)
+        assert ir.title == "2 traces, 8 spans, 1 spans dropped"
+        assert parse(lines).title == "2 traces, 8 spans"
+
+    def test_traces_interleaved_beyond_cap(self):
+        # Children are exported before their parents, trace batches
+        # interleaved: t1 is finished early with its children only
+        traces = [_checkout(t) for t in ("t1", "t2", "t3")]
+        lines = [trace[k] for k in range(3) for trace in traces]
+        ir = parse(lines, max_open_traces=2)
+        assert ir.title == "3 traces, 12 spans, 2 spans dropped"
+        assert [g.label for g in ir.groups if g.parent_group is None] == [
+            "POST /checkout: 2 of 3 traces", "GET /item: 1 of 3 traces",
+        ]
+        callers = {source for source, _, _, kind in _messages(ir) if kind == EdgeType.SEQ_REQUEST}
+        assert callers == {"Client", "frontend", "Unknown caller"}
+        client_calls = {label for source, _, label, _ in _messages(ir) if source == "Client"}
+        assert client_calls == {"POST /checkout"}
+
+    def test_flat_spans_and_single_document(self):
+        spans = [
+            _span("t", "r", "GET /", 0, 10, serviceName="web"),
+            _span("t", "c", "query", 2, 5, "r", resource={"service.name": "db"}),
+        ]
+        as_lines = parse([json.dumps(s) for s in spans])
+        as_document = parse(json.dumps(spans, indent=2))
+        assert _messages(as_lines) == _messages(as_document)
+        assert [p.label for p in as_lines.participants] == ["Client", "web", "db"]
+
+    def test_untimed_spans_reply_after_request(self):
+        # Without timestamps every span is zero-length at its arrival
+        spans = [
+            {"traceId": "t", "spanId": "r", "name": "GET", "serviceName": "web"},
+            {"traceId": "t", "spanId": "c", "parentSpanId": "r", "name": "q",
+             "serviceName": "db"},
+        ]
+        assert _messages(parse([json.dumps(s) for s in spans])) == [
+            ("Client", "web", "GET", EdgeType.SEQ_REQUEST),
+            ("web", "Client", "", EdgeType.SEQ_RESPONSE),
+            ("web", "db", "q", EdgeType.SEQ_REQUEST),
+            ("db", "web", "", EdgeType.SEQ_RESPONSE),
+        ]
+
+    def test_zero_duration_spans_nest(self):
+        lines = [
+            _batch("db", [_span("t", "c", "q", 50, 50, "r")]),
+            _batch("web", [_span("t", "r", "GET", 50, 50)]),
+        ]
+        assert _messages(parse(lines)) == [
+            ("Client", "web", "GET", EdgeType.SEQ_REQUEST),
+            ("web", "db", "q", EdgeType.SEQ_REQUEST),
+            ("db", "web", "", EdgeType.SEQ_RESPONSE),
+            ("web", "Client", "", EdgeType.SEQ_RESPONSE),
+        ]
+
+    def test_malformed_lines_skipped(self):
+        lines = _checkout("t1", items=1)
+        lines.insert(1, '{"resourceSpans": [')
+        ir = parse(lines)
+        assert len(ir.edges) == 6
+        assert ir.title == "1 traces, 3 spans, 1 malformed lines skipped"
+
+    def test_malformed_first_line_skipped(self):
+        ir = parse(["not json"] + _checkout("t1", items=1))
+        assert len(ir.edges) == 6
+        assert ir.title.endswith(", 1 malformed lines skipped")
+
+    def test_malformed_first_line_keeps_streaming(self):
+        # Only a line opening an unclosed object or array reads the
+        # whole file; a bad first line otherwise leaves the rest unread
+        rest = iter(_checkout("t1", items=1))
+        agg = _Aggregator(10, 10, 10)
+        docs = _documents(chain(['{"traceId": "t1", "spa'], rest), agg)
+        assert "resourceSpans" in next(docs)
+        assert agg.bad_lines == 1
+        assert len(list(rest)) == 2
+
+    def test_truncated_first_line_falls_back_to_lines(self):
+        ir = parse(['{"resourceSpans": ['] + _checkout("t1", items=1))
+        assert len(ir.edges) == 6
+        assert ir.title.endswith(", 1 malformed lines skipped")
+
+    def test_malformed_timestamp_skipped(self):
+        lines = _checkout("t1", items=1)
+        lines.insert(0, _batch("web", [_span("t2", "x", "GET", "abc", 5)]))
+        ir = parse(lines)
+        assert len(ir.edges) == 6
+        assert ir.title == "1 traces, 3 spans, 1 malformed spans skipped"
+
+    def test_malformed_status_skipped(self):
+        bad = json.dumps(_span("t2", "x", "GET", 0, 5, status="OK", serviceName="web"))
+        ir = parse(_checkout("t1", items=1) + [bad])
+        assert len(ir.edges) == 6
+        assert ir.title.endswith(", 1 malformed spans skipped")
+
+    def test_participant_ids_unique(self):
+        # "web.api" and "web-api" both sanitize to web_api
+        lines = [
+            _batch("web.api", [_span("t", "r", "GET /", 0, 100)]),
+            _batch("web-api", [_span("t", "c", "GET /v2", 10, 20, "r")]),
+        ]
+        ir = parse(lines)
+        ids = [p.id for p in ir.participants]
+        assert ids == ["Client", "web_api", "web_api_2"]
+        assert ("web.api", "web-api", "GET /v2", EdgeType.SEQ_REQUEST) in _messages(ir)
+        cell_ids = re.findall(r'<mxCell id="([^"]+)"', ir_to_xml(ir))
+        assert len(cell_ids) == len(set(cell_ids))
+
+    def test_cli(self, tmp_path, monkeypatch, capsys):
+        src = tmp_path / "spans.jsonl"
+        src.write_text("\n".join(_checkout("t1")) + "\n", encoding="utf-8")
+        monkeypatch.setattr(
+            sys, "argv", ["mermaid-to-drawio", str(src), "--from", "trace", "--max-messages", "4"],
+        )
+        cli.main()
+        out = capsys.readouterr().out
+        assert "POST /checkout" in out
+        assert "inventory" in out
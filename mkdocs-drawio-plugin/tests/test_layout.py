@@ -0,0 +1,199 @@
+"""Tests for the auto-layout engine."""
+
+from mkdocs_drawio_plugin import layout
+from mkdocs_drawio_plugin.layout import auto_layout, layout_nodes
+from mkdocs_drawio_plugin.parsers.base import (
+    DiagramEdge,
+    DiagramGroup,
+    DiagramIR,
+    DiagramNode,
+    DiagramType,
+)
+
+
+def _ir(node_ids, edge_pairs, **kwargs):
+    return DiagramIR(
+        diagram_type=kwargs.pop("diagram_type", DiagramType.FLOWCHART),
+        nodes=[DiagramNode(id=n, label=n) for n in node_ids],
+        edges=[
+            DiagramEdge(id=f"e{i}", source=s, target=t)
+            for i, (s, t) in enumerate(edge_pairs)
+        ],
+        **kwargs,
+    )
+
+
+def _assert_no_overlaps(ir):
+    nodes = ir.nodes
+    for i, a in enumerate(nodes):
+        for b in nodes[i + 1:]:
+            assert not (
+                a.x < b.x + b.width and b.x < a.x + a.width
+                and a.y < b.y + b.height and b.y < a.y + a.height
+            ), f"{a.id} overlaps {b.id}"
+
+
+class TestComponentLayout:
+    def test_connected_graph_unchanged_origin(self):
+        ir = _ir(["A", "B"], [("A", "B")])
+        layout_nodes(ir)
+        assert (ir.nodes[0].x, ir.nodes[0].y) == (50.0, 50.0)
+        assert ir.nodes[1].y > ir.nodes[0].y
+
+    def test_isolated_nodes_packed_into_rows(self):
+        ir = _ir([f"T{i}" for i in range(16)], [], diagram_type=DiagramType.ERD)
+        layout_nodes(ir)
+        _assert_no_overlaps(ir)
+        assert len({n.y for n in ir.nodes}) > 1  # not one long rank-0 row
+
+    def test_components_do_not_overlap(self):
+        ir = _ir(
+            ["A", "B", "C", "X", "Y", "Z"],
+            [("A", "B"), ("B", "C"), ("X", "Y"), ("X", "Z")],
+        )
+        layout_nodes(ir)
+        _assert_no_overlaps(ir)
+
+    def test_components_ignore_group_membership(self):
+        ir = _ir(["A", "B", "C"], [])
+        ir.nodes[0].parent_group = "g"
+        ir.nodes[2].parent_group = "g"
+        comps = layout._connected_components(ir.nodes, ir.edges)
+        assert sorted(len(c) for c in comps) == [1, 1, 1]
+
+    def test_parallel_matches_serial(self, monkeypatch):
+        ids = [f"n{i}" for i in range(40)]
+        pairs = [(ids[i], ids[i + 1]) for i in range(0, 40, 2)]
+
+        serial = _ir(ids, pairs)
+        layout_nodes(serial)
+
+        monkeypatch.setattr(layout, "PARALLEL_LAYOUT_MIN_NODES", 1)
+        parallel = _ir(ids, pairs)
+        layout_nodes(parallel)
+
+        assert [(n.x, n.y) for n in serial.nodes] == [(n.x, n.y) for n in parallel.nodes]
+
+
+def _rects_overlap(a, b):
+    return (
+        a[0] < b[0] + b[2] and b[0] < a[0] + a[2]
+        and a[1] < b[1] + b[3] and b[1] < a[1] + a[3]
+    )
+
+
+def _inside(inner, outer):
+    return (
+        inner[0] >= outer[0] and inner[1] >= outer[1]
+        and inner[0] + inner[2] <= outer[0] + outer[2]
+        and inner[1] + inner[3] <= outer[1] + outer[3]
+    )
+
+
+class TestCompoundLayout:
+    def _nested_ir(self):
+        # outer contains A and inner; inner contains B and C; D is top-level
+        ir = _ir(
+            ["A", "B", "C", "D"],
+            [("A", "B"), ("B", "C"), ("D", "A"), ("D", "C")],
+            groups=[
+                DiagramGroup(id="outer", label="Outer"),
+                DiagramGroup(id="inner", label="Inner", parent_group="outer"),
+            ],
+        )
+        ir.nodes[0].parent_group = "outer"
+        ir.nodes[1].parent_group = "inner"
+        ir.nodes[2].parent_group = "inner"
+        return ir
+
+    def test_members_inside_their_groups(self):
+        ir = self._nested_ir()
+        layout_nodes(ir)
+        rects = ir.absolute_rects()
+        assert _inside(rects["inner"], rects["outer"])
+        assert _inside(rects["A"], rects["outer"])
+        assert _inside(rects["B"], rects["inner"])
+        assert _inside(rects["C"], rects["inner"])
+        assert not _rects_overlap(rects["D"], rects["outer"])
+        assert not _rects_overlap(rects["A"], rects["inner"])
+
+    def test_member_coordinates_are_relative(self):
+        ir = self._nested_ir()
+        layout_nodes(ir)
+        b = ir.nodes[1]
+        assert b.x >= 0 and b.y >= 0
+        assert b.x + b.width <= ir.groups[1].width
+        assert b.y + b.height <= ir.groups[1].height
+
+    def test_sibling_groups_do_not_overlap(self):
+        ir = _ir(
+            ["A", "B", "C", "D"],
+            [("A", "C"), ("B", "D")],
+            groups=[DiagramGroup(id="g1", label="G1"), DiagramGroup(id="g2", label="G2")],
+        )
+        ir.nodes[0].parent_group = "g1"
+        ir.nodes[1].parent_group = "g1"
+        ir.nodes[2].parent_group = "g2"
+        ir.nodes[3].parent_group = "g2"
+        layout_nodes(ir)
+        rects = ir.absolute_rects()
+        assert not _rects_overlap(rects["g1"], rects["g2"])
+
+    def test_group_fits_long_title(self):
+        ir = _ir(["A"], [], groups=[DiagramGroup(id="g", label="W" * 60)])
+        ir.nodes[0].parent_group = "g"
+        layout_nodes(ir)
+        assert ir.groups[0].width > ir.nodes[0].width + 400
+
+    def test_parent_cycle_is_broken(self):
+        ir = _ir(
+            ["A"], [],
+            groups=[
+                DiagramGroup(id="g1", label="G1", parent_group="g2"),
+                DiagramGroup(id="g2", label="G2", parent_group="g1"),
+            ],
+        )
+        ir.nodes[0].parent_group = "g1"
+        layout_nodes(ir)
+        assert None in {g.parent_group for g in ir.groups}
+
+
+class TestCollapsedGroups:
+    def _big_group_ir(self, members):
+        ids = [f"m{i}" for i in range(members)]
+        ir = _ir(
+            ids + ["out"],
+            list(zip(ids, ids[1:])) + [("out", "m0")],
+            groups=[DiagramGroup(id="g", label="Big")],
+        )
+        for n in ir.nodes[:-1]:
+            n.parent_group = "g"
+        return ir
+
+    def test_groups_above_threshold_collapse(self):
+        ir = self._big_group_ir(12)
+        layout.collapse_large_groups(ir, 10)
+        (group,) = ir.groups
+        assert group.collapsed
+        assert group.label == "Big (12 nodes)"
+
+    def test_groups_at_threshold_stay_expanded(self):
+        ir = self._big_group_ir(10)
+        layout.collapse_large_groups(ir, 10)
+        assert not ir.groups[0].collapsed
+
+    def test_collapsed_box_reserves_small_area(self):
+        ir = self._big_group_ir(12)
+        layout.collapse_large_groups(ir, 10)
+        layout_nodes(ir)
+        group = ir.groups[0]
+        assert group.height == layout.styles.COLLAPSED_GROUP_HEIGHT
+        expanded_w, expanded_h = group.alternate_bounds
+        assert expanded_h > group.height
+        assert set(ir.hidden_items()) == {f"m{i}" for i in range(12)}
+
+    def test_off_by_default(self):
+        ir = self._big_group_ir(300)
+        auto_layout(ir)
+        assert not ir.groups[0].collapsed
+        assert ir.groups[0].label == "Big"
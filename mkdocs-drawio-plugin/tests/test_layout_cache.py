@@ -0,0 +1,129 @@
+"""Tests for the topology-keyed layout cache."""
+
+import json
+
+from mkdocs_drawio_plugin import layout_cache
+from mkdocs_drawio_plugin.converter import mermaid_to_ir
+from mkdocs_drawio_plugin.layout import auto_layout
+from mkdocs_drawio_plugin.layout_cache import cache_info, clear_layout_cache, layout_key
+from mkdocs_drawio_plugin.parsers.base import (
+    DiagramEdge,
+    DiagramGroup,
+    DiagramIR,
+    DiagramNode,
+    DiagramType,
+)
+
+
+FLOW = """graph TD
+  A[Start] --> B{Valid?}
+  B -->|Yes| C[Process]
+  B -->|No| D[Reject]
+"""
+
+
+def _laid_out(text):
+    ir = mermaid_to_ir(text)
+    auto_layout(ir)
+    return ir
+
+
+class TestLayoutKey:
+    def test_labels_excluded(self):
+        a = mermaid_to_ir(FLOW)
+        b = mermaid_to_ir(FLOW.replace("Reject", "Refuse"))
+        assert layout_key(a) == layout_key(b)
+
+    def test_topology_included(self):
+        a = mermaid_to_ir(FLOW)
+        b = mermaid_to_ir(FLOW + "  D --> A\n")
+        assert layout_key(a) != layout_key(b)
+
+    def test_sizes_included(self):
+        a = mermaid_to_ir(FLOW)
+        b = mermaid_to_ir(FLOW)
+        b.nodes[0].width += 40
+        assert layout_key(a) != layout_key(b)
+
+    def test_group_endpoints_distinguished(self):
+        def ir_to(target):
+            return DiagramIR(
+                diagram_type=DiagramType.FLOWCHART,
+                nodes=[
+                    DiagramNode(id="A", label="A", parent_group="G1"),
+                    DiagramNode(id="B", label="B", parent_group="G2"),
+                    DiagramNode(id="C", label="C"),
+                ],
+                edges=[DiagramEdge(id="e0", source="C", target=target)],
+                groups=[DiagramGroup(id="G1", label="G1"), DiagramGroup(id="G2", label="G2")],
+            )
+
+        assert layout_key(ir_to("G1")) != layout_key(ir_to("G2"))
+
+    def test_direction_included(self):
+        a = mermaid_to_ir(FLOW)
+        b = mermaid_to_ir(FLOW.replace("graph TD", "graph LR"))
+        assert layout_key(a) != layout_key(b)
+
+
+class TestCacheReuse:
+    def setup_method(self):
+        clear_layout_cache()
+
+    def test_label_only_edit_hits_cache(self):
+        first = _laid_out(FLOW)
+        second = _laid_out(FLOW.replace("Process", "Handle"))
+        assert cache_info()["hits"] == 1
+        assert [(n.x, n.y) for n in first.nodes] == [(n.x, n.y) for n in second.nodes]
+        assert [e.waypoints for e in first.edges] == [e.waypoints for e in second.edges]
+
+    def test_topology_change_misses(self):
+        _laid_out(FLOW)
+        _laid_out(FLOW + "  C --> D\n")
+        assert cache_info()["hits"] == 0
+        assert cache_info()["misses"] == 2
+
+    def test_group_geometry_restored(self):
+        text = "graph TD\n  subgraph API\n    A --> B\n  end\n  B --> C"
+        first = _laid_out(text)
+        second = _laid_out(text.replace("API", "Gateway"))
+        g1, g2 = first.groups[0], second.groups[0]
+        assert (g1.x, g1.y, g1.width, g1.height) == (g2.x, g2.y, g2.width, g2.height)
+        assert cache_info()["hits"] == 1
+
+    def test_group_title_wider_than_cached_box_misses(self):
+        text = "graph TD\n  subgraph API\n    A --> B\n  end\n  B --> C"
+        first = _laid_out(text)
+        second = _laid_out(text.replace("API", "Public gateway for every external client"))
+        assert cache_info()["hits"] == 0
+        assert second.groups[0].width > first.groups[0].width
+
+    def test_lru_eviction(self, monkeypatch):
+        monkeypatch.setattr(layout_cache, "LAYOUT_CACHE_SIZE", 2)
+        for n in range(3, 6):
+            chain = " --> ".join(f"N{i}" for i in range(n))
+            _laid_out(f"graph TD\n  {chain}")
+        assert cache_info()["size"] == 2
+
+    def test_save_and_load_roundtrip(self, tmp_path):
+        _laid_out(FLOW)
+        path = tmp_path / "cache" / "layout.json"
+        layout_cache.save_layout_cache(path)
+        clear_layout_cache()
+        assert layout_cache.load_layout_cache(path) == 1
+        _laid_out(FLOW.replace("Start", "Begin"))
+        assert cache_info()["hits"] == 1
+
+    def test_load_ignores_other_version(self, tmp_path):
+        _laid_out(FLOW)
+        path = tmp_path / "layout.json"
+        layout_cache.save_layout_cache(path)
+        data = json.loads(path.read_text(encoding="utf-8"))
+        data["version"] = layout_cache.LAYOUT_CACHE_VERSION - 1
+        path.write_text(json.dumps(data), encoding="utf-8")
+        clear_layout_cache()
+        assert layout_cache.load_layout_cache(path) == 0
+        assert cache_info()["size"] == 0
+
+    def test_load_missing_file(self, tmp_path):
+        assert layout_cache.load_layout_cache(tmp_path / "nope.json") == 0
@@ -0,0 +1,149 @@
+"""Tests for layout quality metrics."""
+
+import sys
+
+from mkdocs_drawio_plugin import cli
+from mkdocs_drawio_plugin.converter import ir_to_xml, mermaid_to_ir
+from mkdocs_drawio_plugin.metrics import measure_layout
+from mkdocs_drawio_plugin.options import configure
+from mkdocs_drawio_plugin.parsers.base import (
+    DiagramEdge,
+    DiagramGroup,
+    DiagramIR,
+    DiagramNode,
+    DiagramType,
+)
+
+
+def _node(nid, x, y, w=100, h=50, group=None):
+    return DiagramNode(id=nid, label=nid, x=x, y=y, width=w, height=h, parent_group=group)
+
+
+def _ir(nodes, edges=(), groups=()):
+    return DiagramIR(
+        diagram_type=DiagramType.FLOWCHART,
+        nodes=list(nodes),
+        edges=list(edges),
+        groups=list(groups),
+    )
+
+
+class TestOverlaps:
+    def test_overlapping_nodes_reported(self):
+        m = measure_layout(_ir([_node("A", 0, 0), _node("B", 50, 20), _node("C", 300, 0)]))
+        assert m.overlaps == [("A", "B")]
+        assert m.problems() == ["nodes A and B overlap"]
+
+    def test_touching_nodes_do_not_overlap(self):
+        m = measure_layout(_ir([_node("A", 0, 0), _node("B", 100, 0)]))
+        assert m.overlaps == []
+
+
+class TestGroupIntrusions:
+    def test_non_member_inside_group(self):
+        group = DiagramGroup(id="g", label="G", x=0, y=0, width=400, height=200)
+        nodes = [_node("A", 20, 40, group="g"), _node("B", 200, 40)]
+        m = measure_layout(_ir(nodes, groups=[group]))
+        assert m.group_intrusions == [("g", "B")]
+
+    def test_nested_members_are_fine(self):
+        groups = [
+            DiagramGroup(id="outer", label="O", x=0, y=0, width=500, height=300),
+            DiagramGroup(id="inner", label="I", x=20, y=40, width=200, height=150,
+                         parent_group="outer"),
+        ]
+        m = measure_layout(_ir([_node("A", 20, 40, group="inner")], groups=groups))
+        assert m.group_intrusions == []
+        assert m.problems() == []
+
+
+class TestEdges:
+    def test_edge_through_node(self):
+        nodes = [_node("A", 0, 0), _node("B", 200, 0), _node("C", 400, 0)]
+        m = measure_layout(_ir(nodes, [DiagramEdge(id="e", source="A", target="C")]))
+        assert m.edge_node_crossings == [("e", "B")]
+
+    def test_waypoints_avoid_node(self):
+        nodes = [_node("A", 0, 0), _node("B", 200, 0), _node("C", 400, 0)]
+        edge = DiagramEdge(
+            id="e", source="A", target="C",
+            waypoints=[(50, 100), (450, 100)],
+        )
+        assert measure_layout(_ir(nodes, [edge])).edge_node_crossings == []
+
+    def test_crossing_count(self):
+        nodes = [
+            _node("A", 0, 0), _node("B", 300, 300),
+            _node("C", 300, 0), _node("D", 0, 300),
+        ]
+        edges = [
+            DiagramEdge(id="e1", source="A", target="B"),
+            DiagramEdge(id="e2", source="C", target="D"),
+        ]
+        assert measure_layout(_ir(nodes, edges)).edge_crossings == 1
+
+    def test_shared_endpoint_is_not_crossing(self):
+        nodes = [_node("A", 0, 0), _node("B", 300, 0), _node("C", 0, 300)]
+        edges = [
+            DiagramEdge(id="e1", source="A", target="B"),
+            DiagramEdge(id="e2", source="A", target="C"),
+        ]
+        assert measure_layout(_ir(nodes, edges)).edge_crossings == 0
+
+
+class TestCanvas:
+    def test_area_and_aspect(self):
+        m = measure_layout(_ir([_node("A", 50, 50), _node("B", 250, 50)]))
+        assert (m.width, m.height) == (300, 50)
+        assert m.area == 15000
+        assert m.aspect_ratio == 6.0
+
+
+class TestLaidOutDiagrams:
+    def test_nested_subgraphs_are_clean(self):
+        ir = mermaid_to_ir(
+            "graph TD\n"
+            "  subgraph Outer\n    A --> B\n"
+            "    subgraph Inner\n      C --> D\n    end\n  end\n"
+            "  X --> A\n  X --> C\n"
+        )
+        ir_to_xml(ir)
+        m = measure_layout(ir)
+        assert not m.overlaps
+        assert not m.group_intrusions
+
+    def test_cli_prints_metrics(self, tmp_path, monkeypatch, capsys):
+        src = tmp_path / "d.mmd"
+        src.write_text("graph TD\n  A --> B\n", encoding="utf-8")
+        monkeypatch.setattr(sys, "argv", ["mermaid-to-drawio", str(src), "--metrics"])
+        cli.main()
+        captured = capsys.readouterr()
+        assert "<mxGraphModel>" in captured.out
+        assert "overlaps: 0" in captured.err
+
+    def test_cli_prints_metrics_per_page(self, tmp_path, monkeypatch, capsys):
+        # Two subject areas: each page is laid out on its own, so the
+        # diagram as a whole would report overlaps that no page has
+        lines = ["erDiagram"]
+        for area in ("A", "B"):
+            for i in range(3):
+                lines.append(f"  {area}{i} ||--o{{ {area}{i + 1} : has")
+        src = tmp_path / "d.mmd"
+        src.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        monkeypatch.setattr(
+            sys, "argv", ["mermaid-to-drawio", str(src), "--metrics", "--erd-areas", "4"],
+        )
+        try:
+            cli.main()
+        finally:
+            configure()
+        err = capsys.readouterr().err
+        assert "page 1/3: Overview" in err
+        assert "page 3/3:" in err
+        assert err.count("overlaps: 0") == 3
+
+    def test_single_page_is_the_diagram(self):
+        ir = mermaid_to_ir("graph TD\n  A --> B\n")
+        pages = []
+        ir_to_xml(ir, pages=pages)
+        assert pages == [(ir.title, ir)]
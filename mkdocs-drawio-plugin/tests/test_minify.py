@@ -0,0 +1,104 @@
+"""Tests for the minified XML output profile."""
+
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from mkdocs_drawio_plugin.converter import mermaid_to_xml
+from mkdocs_drawio_plugin.minify import compact_id
+from mkdocs_drawio_plugin.options import configure
+
+DIAGRAMS = {
+    "flowchart": """graph LR
+  subgraph api[API]
+    A[Gateway] --> B{Auth?}
+  end
+  B -->|yes| C[(Orders DB)]
+  B -->|no| D[Reject]
+""",
+    "sequence": """sequenceDiagram
+  participant C as Client
+  participant S as Server
+  C->>S: GET /items
+  loop every page
+    S-->>C: 200 OK
+  end
+""",
+    "c4": """C4Container
+  Person(user, "User")
+  Container(web, "Web App", "React")
+  ContainerDb(db, "Database", "Postgres")
+  Rel(user, web, "Uses")
+  Rel(web, db, "Reads")
+""",
+    "erd": """erDiagram
+  CUSTOMER ||--o{ ORDER : places
+  CUSTOMER {
+    string name
+  }
+""",
+}
+
+
+@pytest.fixture(autouse=True)
+def _reset_options():
+    yield
+    configure()
+
+
+def _canonical(xml: str) -> list:
+    """What the viewer decodes: cells by position, with resolved references."""
+    pages = []
+    for model in ET.fromstring(xml).iter("mxGraphModel"):
+        cells = [e for e in model.iter() if e.get("id") is not None]
+        index = {c.get("id"): i for i, c in enumerate(cells)}
+        decoded = []
+        for cell in cells:
+            inner = cell if cell.tag == "mxCell" else cell.find("mxCell")
+            refs = tuple(index.get(cell.get(a) or inner.get(a)) for a in ("parent", "source", "target"))
+            attrs = {
+                k: v for k, v in {**inner.attrib, **cell.attrib}.items()
+                if k not in ("id", "parent", "source", "target")
+            }
+            attrs.setdefault("value", "")
+            attrs.setdefault("style", "")
+            geometry = [
+                (g.tag, g.get("as"), tuple(round(float(g.get(k, 0))) for k in ("x", "y", "width", "height")))
+                for g in inner.iter() if g.tag in ("mxGeometry", "mxPoint", "mxRectangle")
+            ]
+            decoded.append((refs, sorted(attrs.items()), geometry))
+        pages.append(decoded)
+    return pages
+
+
+class TestCompactId:
+    def test_base36(self):
+        assert [compact_id(n) for n in (0, 9, 10, 35, 36)] == ["0", "9", "a", "z", "10"]
+
+
+class TestMinifiedOutput:
+    @pytest.mark.parametrize("name", sorted(DIAGRAMS))
+    def test_decodes_to_same_diagram(self, name):
+        full = mermaid_to_xml(DIAGRAMS[name])
+        configure(minify_xml=True)
+        minified = mermaid_to_xml(DIAGRAMS[name])
+        assert _canonical(minified) == _canonical(full)
+        assert len(minified) < len(full)
+
+    def test_multi_page_ids_are_per_page(self):
+        configure(sequence_page_messages=2)
+        text = "sequenceDiagram\n" + "\n".join(f"  A->>B: m{i}" for i in range(5))
+        full = mermaid_to_xml(text)
+        configure(sequence_page_messages=2, minify_xml=True)
+        minified = mermaid_to_xml(text)
+        assert _canonical(minified) == _canonical(full)
+        assert "data:page/id,page-2" in minified
+
+    def test_profile_details(self):
+        configure(minify_xml=True)
+        xml = mermaid_to_xml(DIAGRAMS["sequence"])
+        assert 'value=""' not in xml
+        assert ".0\"" not in xml
+        assert "_lifeline" not in xml
+        assert '<mxCell id="0" />' in xml
+        assert 'id="1" parent="0"' in xml
@@ -0,0 +1,64 @@
+"""Tests for the shelf and grid packers."""
+
+from mkdocs_drawio_plugin.packing import grid_pack, shelf_pack
+
+
+def _overlaps(a, b):
+    (ax, ay, aw, ah), (bx, by, bw, bh) = a, b
+    return ax < bx + bw and bx < ax + aw and ay < by + bh and by < ay + ah
+
+
+class TestShelfPack:
+    def test_empty(self):
+        assert shelf_pack([], gap=10) == []
+
+    def test_single_box_at_origin(self):
+        assert shelf_pack([(100, 50)], gap=10) == [(0.0, 0.0)]
+
+    def test_no_overlaps(self):
+        sizes = [(160, 80)] * 12 + [(400, 300), (200, 120)]
+        positions = shelf_pack(sizes, gap=20)
+        boxes = [(x, y, w, h) for (x, y), (w, h) in zip(positions, sizes)]
+        for i, a in enumerate(boxes):
+            for b in boxes[i + 1:]:
+                assert not _overlaps(a, b)
+
+    def test_tallest_box_first(self):
+        positions = shelf_pack([(100, 50), (100, 300)], gap=10)
+        assert positions[1] == (0.0, 0.0)
+
+    def test_many_small_boxes_form_rows(self):
+        positions = shelf_pack([(100, 100)] * 25, gap=0)
+        rows = {y for _, y in positions}
+        cols = {x for x, _ in positions}
+        assert len(rows) > 1
+        assert len(cols) > 1
+
+    def test_respects_max_width(self):
+        positions = shelf_pack([(100, 100)] * 4, gap=0, max_width=200)
+        assert max(x for x, _ in positions) + 100 <= 200
+
+
+class TestGridPack:
+    def test_empty(self):
+        assert grid_pack([], gap=10) == []
+
+    def test_keeps_input_order_row_major(self):
+        positions = grid_pack([(100, 50)] * 9, gap=10)
+        assert positions[0] == (0.0, 0.0)
+        assert positions[1][1] == 0.0 and positions[1][0] > 0
+        assert [y for _, y in positions] == sorted(y for _, y in positions)
+
+    def test_mixed_sizes_do_not_overlap(self):
+        sizes = [(80 + 37 * (i % 5), 40 + 23 * (i % 3)) for i in range(30)]
+        positions = grid_pack(sizes, gap=20)
+        boxes = [(x, y, w, h) for (x, y), (w, h) in zip(positions, sizes)]
+        for i, a in enumerate(boxes):
+            for b in boxes[i + 1:]:
+                assert not _overlaps(a, b)
+
+    def test_roughly_landscape(self):
+        positions = grid_pack([(100, 100)] * 100, gap=0)
+        width = max(x for x, _ in positions) + 100
+        height = max(y for _, y in positions) + 100
+        assert 1.0 <= width / height <= 2.5
@@ -0,0 +1,97 @@
+"""Tests for the shared line dispatcher and source readers."""
+
+import io
+import re
+
+from mkdocs_drawio_plugin.parsers.base import LineDispatcher, read_header, source_lines
+
+_WORD_RE = re.compile(r"^participant\s+(\S+)$", re.IGNORECASE)
+_CALL_RE = re.compile(r"^Rel\s*\((.+)\)$", re.IGNORECASE)
+_MESSAGE_RE = re.compile(r"^(\S+?)->>(\S+?):(.*)$")
+
+DISPATCHER = LineDispatcher(
+    {
+        ("participant", "actor"): ("participant", _WORD_RE),
+        "rel": ("rel", _CALL_RE),
+    },
+    fallback=[("message", _MESSAGE_RE)],
+)
+
+
+class TestLineDispatcher:
+    def test_keyword_selects_rule(self):
+        kind, m = DISPATCHER.match("participant Alice")
+        assert kind == "participant"
+        assert m.group(1) == "Alice"
+
+    def test_keywords_are_case_insensitive(self):
+        assert DISPATCHER.match("PARTICIPANT Alice")[0] == "participant"
+
+    def test_token_ends_at_parenthesis(self):
+        kind, m = DISPATCHER.match("Rel(a, b)")
+        assert kind == "rel"
+        assert m.group(1) == "a, b"
+
+    def test_other_lines_use_fallback(self):
+        kind, m = DISPATCHER.match("A->>B: hi")
+        assert kind == "message"
+        assert m.group(2) == "B"
+
+    def test_failed_keyword_rule_falls_back(self):
+        kind, _ = DISPATCHER.match("actor->>B: hi")
+        assert kind == "message"
+        kind, _ = DISPATCHER.match("participant->>B: hi")
+        assert kind == "message"
+
+    def test_only_selected_rule_runs(self):
+        # "actor" selects the participant rule, which rejects a two-word
+        # name; the "rel" rule is never tried
+        assert DISPATCHER.match("actor Rel(a, b) x") == (None, None)
+
+    def test_no_match(self):
+        assert DISPATCHER.match("something else") == (None, None)
+
+
+_HEADER_RE = re.compile(r"^graph\s+(TD|LR)$")
+
+
+class TestSourceLines:
+    def test_text_and_stream_agree(self):
+        text = "graph TD\r\n  A --> B\n\nC\n"
+        assert list(source_lines(text)) == list(source_lines(io.StringIO(text)))
+        assert list(source_lines(text)) == ["graph TD", "  A --> B", "", "C"]
+
+    def test_stream_is_read_lazily(self):
+        read = []
+
+        def lines():
+            for line in ("graph TD\n", "A --> B\n"):
+                read.append(line)
+                yield line
+
+        it = source_lines(lines())
+        assert read == []
+        assert next(it) == "graph TD"
+        assert read == ["graph TD\n"]
+
+
+class TestReadHeader:
+    def test_header_consumed(self):
+        m, lines = read_header("graph LR\nA --> B", _HEADER_RE)
+        assert m.group(1) == "LR"
+        assert list(lines) == ["A --> B"]
+
+    def test_leading_blanks_and_comments_skipped(self):
+        m, lines = read_header(io.StringIO("\n%% c\n  graph TD\nA\n"), _HEADER_RE)
+        assert m.group(1) == "TD"
+        assert list(lines) == ["A"]
+
+    def test_missing_header_keeps_first_statement(self):
+        m, lines = read_header("\n  A --> B\nC", _HEADER_RE)
+        assert m is None
+        assert list(lines) == ["  A --> B", "C"]
+
+    def test_empty_source(self):
+        m, lines = read_header(["\n", "  \n"], _HEADER_RE)
+        assert m is None
+        assert list(lines) == []
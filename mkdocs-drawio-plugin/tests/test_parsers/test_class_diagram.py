@@ -0,0 +1,110 @@
+"""Tests for the class diagram parser."""
+
+from mkdocs_drawio_plugin.parsers.base import (
+    DiagramType,
+    EdgeType,
+    LayoutDirection,
+    NodeShape,
+)
+from mkdocs_drawio_plugin.parsers.class_diagram import parse
+
+
+class TestClassDiagramParser:
+    def test_class_body_members(self):
+        text = """classDiagram
+  class Animal {
+    +String name
+    -int age
+    +eat(food) void
+    +sleep()
+  }
+"""
+        ir = parse(text)
+        assert ir.diagram_type == DiagramType.CLASS
+        assert ir.layout == LayoutDirection.TB
+        animal = ir.nodes[0]
+        assert animal.shape == NodeShape.UML_CLASS
+        assert animal.fields == ["+String name", "-int age"]
+        assert animal.methods == ["+eat(food) void", "+sleep()"]
+
+    def test_members_outside_body(self):
+        ir = parse("classDiagram\n  Animal : +int age\n  Animal : +isMammal() bool")
+        animal = ir.node_by_id("Animal")
+        assert animal.fields == ["+int age"]
+        assert animal.methods == ["+isMammal() bool"]
+
+    def test_annotation_and_generic_label(self):
+        text = """classDiagram
+  class Repo~T~ {
+    <<interface>>
+    +find(id) List~T~
+  }
+  <<abstract>> Base
+  class Pet["Family pet"]
+"""
+        ir = parse(text)
+        assert ir.node_by_id("Repo").label == "«interface»<br>Repo&lt;T&gt;"
+        assert ir.node_by_id("Repo").methods == ["+find(id) List<T>"]
+        assert ir.node_by_id("Base").label == "«abstract»<br>Base"
+        assert ir.node_by_id("Pet").label == "Family pet"
+
+    def test_relationship_types(self):
+        text = """classDiagram
+  A <|-- B
+  C --|> D
+  E ..|> F
+  G *-- H
+  I o-- J
+  K --> L
+  M ..> N
+  O -- P
+  Q .. R
+"""
+        ir = parse(text)
+        assert [(e.source, e.target, e.edge_type) for e in ir.edges] == [
+            ("B", "A", EdgeType.INHERITANCE),
+            ("C", "D", EdgeType.INHERITANCE),
+            ("E", "F", EdgeType.REALIZATION),
+            ("H", "G", EdgeType.COMPOSITION),
+            ("J", "I", EdgeType.AGGREGATION),
+            ("K", "L", EdgeType.ASSOCIATION),
+            ("M", "N", EdgeType.DEPENDENCY),
+            ("O", "P", EdgeType.LINK),
+            ("Q", "R", EdgeType.DASHED_LINK),
+        ]
+
+    def test_cardinality_and_label(self):
+        ir = parse('classDiagram\n  Order "1" *-- "many" Item : contains')
+        edge = ir.edges[0]
+        # Marker on Order, so the edge runs Item -> Order
+        assert (edge.source, edge.target) == ("Item", "Order")
+        assert edge.label == "many  contains  1"
+
+    def test_namespace_is_group(self):
+        text = """classDiagram
+  namespace Shapes {
+    class Circle {
+      +radius
+    }
+    class Square
+  }
+  Circle <|-- Ring
+"""
+        ir = parse(text)
+        assert [g.id for g in ir.groups] == ["Shapes"]
+        assert ir.node_by_id("Circle").parent_group == "Shapes"
+        assert ir.node_by_id("Square").parent_group == "Shapes"
+        assert ir.node_by_id("Ring").parent_group is None
+
+    def test_direction_and_skipped_lines(self):
+        text = """classDiagram
+  direction LR
+  note for A "a: note"
+  style A fill:#f9f
+  classDef hot fill:#f00
+  A --> B
+"""
+        ir = parse(text)
+        assert ir.layout == LayoutDirection.LR
+        assert [n.id for n in ir.nodes] == ["A", "B"]
+        assert all(not n.fields for n in ir.nodes)
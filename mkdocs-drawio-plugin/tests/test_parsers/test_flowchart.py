@@ -51,6 +51,15 @@ class TestFlowchartParser:
         assert len(ir.edges) >= 1
         assert ir.edges[0].edge_type == EdgeType.ASYNC
 
+    def test_dotted_edge_with_pipe_label(self):
+        # The regex-per-pass parser dropped these edges altogether
+        ir = parse('graph TD\n  PW -.->|"returns"| WA\n  PW -.->|parses| SP')
+        assert [(e.source, e.target, e.edge_type) for e in ir.edges] == [
+            ("PW", "WA", EdgeType.ASYNC),
+            ("PW", "SP", EdgeType.ASYNC),
+        ]
+        assert [e.label for e in ir.edges] == ['"returns"', "parses"]
+
     def test_thick_edge(self):
         ir = parse("graph TD\n  A ==> B")
         assert len(ir.edges) >= 1
@@ -86,3 +95,47 @@ class TestFlowchartParser:
         ir = parse("")
         assert ir.diagram_type == DiagramType.FLOWCHART
         assert len(ir.nodes) == 0
+
+    def test_chained_edges(self):
+        ir = parse("graph TD\n  A[Start] --> B{Check} -.-> C")
+        assert [(e.source, e.target) for e in ir.edges] == [("A", "B"), ("B", "C")]
+        assert [e.edge_type for e in ir.edges] == [EdgeType.SYNC, EdgeType.ASYNC]
+        assert {n.id: n.shape for n in ir.nodes}["B"] == NodeShape.DIAMOND
+
+    def test_ampersand_groups(self):
+        ir = parse("graph TD\n  A & B --> C & D")
+        pairs = {(e.source, e.target) for e in ir.edges}
+        assert pairs == {("A", "C"), ("A", "D"), ("B", "C"), ("B", "D")}
+
+    def test_inline_labels(self):
+        ir = parse("graph TD\n  A -- two words --> B\n  A -. later .-> C\n  A == bulk ==> D")
+        edges = {e.target: e for e in ir.edges}
+        assert edges["B"].label == "two words"
+        assert edges["C"].edge_type == EdgeType.ASYNC
+        assert edges["D"].label == "bulk"
+        assert edges["D"].edge_type == EdgeType.DATA_FLOW
+
+    def test_long_operator_with_pipe_label(self):
+        ir = parse("graph TD\n  A ---->|No| B")
+        assert ir.edges[0].label == "No"
+
+    def test_operator_inside_label(self):
+        ir = parse("graph TD\n  A[a --> b] --> C")
+        assert {n.id: n.label for n in ir.nodes}["A"] == "a --> b"
+        assert [(e.source, e.target) for e in ir.edges] == [("A", "C")]
+
+    def test_class_shorthand(self):
+        ir = parse("graph TD\n  A:::hot --> B")
+        assert [(e.source, e.target) for e in ir.edges] == [("A", "B")]
+
+    def test_shape_on_edge_target(self):
+        ir = parse("graph TD\n  A-->B[Target]")
+        assert {n.id: n.label for n in ir.nodes}["B"] == "Target"
+
+    def test_fast_path_matches_tokenizer(self):
+        """Shapes the fast path can't classify fall back to the tokenizer."""
+        ir = parse("graph TD\n  A[/x] --> B[y/]\n  C[(db)] --> D((c))")
+        shapes = {n.id: (n.shape, n.label) for n in ir.nodes}
+        assert shapes["A"] == (NodeShape.PARALLELOGRAM, "x] --> B[y")
+        assert shapes["C"] == (NodeShape.CYLINDER, "db")
+        assert shapes["D"] == (NodeShape.CIRCLE, "c")
@@ -0,0 +1,58 @@
+"""Tests for parser time on pathological input lines."""
+
+import time
+
+import pytest
+
+from mkdocs_drawio_plugin.parsers import c4, erd, flowchart, sequence
+
+# Line length, and a bound that linear parsing meets with a wide margin
+# while a quadratic regex (seconds at this length) does not
+LENGTH = 20_000
+BOUND_S = 0.5
+
+CASES = [
+    (flowchart.parse, "graph TD\n" + "A[" * (LENGTH // 2)),
+    (flowchart.parse, "graph TD\n" + "A((" * (LENGTH // 3)),
+    (flowchart.parse, "graph TD\nA " + "-- " * (LENGTH // 3)),
+    (flowchart.parse, "graph TD\nsubgraph a" + " " * LENGTH + "b"),
+    (sequence.parse, "sequenceDiagram\nA" + "->>A" * (LENGTH // 4)),
+    (sequence.parse, "sequenceDiagram\nnote over " + "a," * (LENGTH // 2)),
+    (c4.parse, "C4Context\nBoundary(a," + " " * LENGTH + "x"),
+    (erd.parse, "erDiagram\nA ||--o{ B :" + " " * LENGTH + 'x"y'),
+]
+
+
+@pytest.mark.parametrize("parse,text", CASES)
+def test_pathological_line_is_fast(parse, text):
+    t0 = time.perf_counter()
+    parse(text)
+    assert time.perf_counter() - t0 < BOUND_S
+
+
+class TestLinearPatterns:
+    """The linear rewrites keep the results of the old patterns."""
+
+    def test_subgraph_label_trailing_blanks(self):
+        ir = flowchart.parse("graph TD\n  subgraph Backend  \t\n    A --> B\n  end")
+        assert ir.groups[0].label == "Backend"
+
+    def test_unclosed_shape_breaks_statement(self):
+        ir = flowchart.parse("graph TD\n  A[(x --> B")
+        assert [(e.source, e.target) for e in ir.edges] == [("x", "B")]
+
+    def test_fallback_closer(self):
+        ir = flowchart.parse("graph TD\n  A[(db] --> B")
+        assert {n.id: n.label for n in ir.nodes}["A"] == "(db"
+
+    def test_message_sender_with_hyphen(self):
+        ir = sequence.parse("sequenceDiagram\n  web-app-->>api: call")
+        assert (ir.edges[0].source, ir.edges[0].target) == ("web-app", "api")
+
+    def test_erd_label_quotes(self):
+        ir = erd.parse('erDiagram\n  A ||--o{ B : "places"\n  A ||--|| C : owns')
+        assert [e.label for e in ir.edges] == ["1  places  0..*", "1  owns  1"]
+
+    def test_erd_label_inner_quote_rejected(self):
+        ir = erd.parse('erDiagram\n  A ||--o{ B : a"b')
+        assert ir.edges == []
@@ -82,6 +82,23 @@ class TestSequenceParser:
         assert len(ir.groups) >= 1
         assert any("LOOP" in g.label for g in ir.groups)
 
+    def test_nested_blocks_record_parents(self):
+        text = """sequenceDiagram
+  loop retry
+    A->>B: try
+    alt ok
+      B-->>A: done
+    else fail
+      B-xA: error
+    end
+  end
+"""
+        ir = parse(text)
+        loop, alt, fail = ir.groups
+        assert alt.parent_group == loop.id
+        assert fail.parent_group == loop.id
+        assert [e.parent_group for e in ir.edges] == [loop.id, alt.id, fail.id]
+
     def test_semantic_role_guessing(self):
         text = """sequenceDiagram
   Client->>Server: request
@@ -97,3 +114,15 @@ class TestSequenceParser:
         ir = parse("")
         assert ir.diagram_type == DiagramType.SEQUENCE
         assert len(ir.participants) == 0
+
+    def test_else_branch_label(self):
+        text = """sequenceDiagram
+  alt ok
+    A->>B: yes
+  else failure
+    A->>B: no
+  end
+"""
+        ir = parse(text)
+        assert [g.label for g in ir.groups] == ["ALT: ok", "failure"]
+        assert ir.edges[1].parent_group == ir.groups[1].id
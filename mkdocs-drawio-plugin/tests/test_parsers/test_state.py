@@ -0,0 +1,155 @@
+"""Tests for the state diagram parser."""
+
+from mkdocs_drawio_plugin.parsers.base import (
+    DiagramType,
+    LayoutDirection,
+    NodeShape,
+)
+from mkdocs_drawio_plugin.parsers.state import parse
+
+
+class TestStateParser:
+    def test_basic_transitions(self):
+        ir = parse("stateDiagram-v2\n  [*] --> Idle\n  Idle --> Busy : start\n  Busy --> [*]\n")
+        assert ir.diagram_type == DiagramType.STATE
+        assert ir.layout == LayoutDirection.TB
+        ids = [n.id for n in ir.nodes]
+        assert ids == ["root__start", "Idle", "Busy", "root__end"]
+        assert [(e.source, e.target, e.label) for e in ir.edges] == [
+            ("root__start", "Idle", ""),
+            ("Idle", "Busy", "start"),
+            ("Busy", "root__end", ""),
+        ]
+
+    def test_pseudo_states_are_start_end(self):
+        ir = parse("stateDiagram\n  [*] --> A\n  A --> [*]")
+        start, _, end = ir.nodes
+        assert start.shape == end.shape == NodeShape.START_END
+        assert start.label == end.label == ""
+
+    def test_composite_state_is_group(self):
+        text = """stateDiagram-v2
+  [*] --> Active
+  state Active {
+    [*] --> Loading
+    Loading --> Ready
+    state Inner {
+      X --> Y
+    }
+  }
+  Active --> Done
+"""
+        ir = parse(text)
+        groups = {g.id: g for g in ir.groups}
+        assert set(groups) == {"Active", "Inner"}
+        assert groups["Inner"].parent_group == "Active"
+        # The plain state created by the first transition became the group
+        assert ir.node_by_id("Active") is None
+        assert ir.node_by_id("Active__start").parent_group == "Active"
+        assert ir.node_by_id("Loading").parent_group == "Active"
+        assert ir.node_by_id("X").parent_group == "Inner"
+        assert ir.node_by_id("Done").parent_group is None
+        assert ir.validate() == []
+
+    def test_labels_and_descriptions(self):
+        text = """stateDiagram-v2
+  state "Waiting for input" as Wait
+  Idle : Nothing to do
+  Idle : Sleeping
+  state "Big task" as Task {
+    A --> B
+  }
+"""
+        ir = parse(text)
+        assert ir.node_by_id("Wait").label == "Waiting for input"
+        assert ir.node_by_id("Idle").label == "Nothing to do<br>Sleeping"
+        assert ir.groups[0].label == "Big task"
+
+    def test_description_replaces_name(self):
+        ir = parse("stateDiagram-v2\n  [*] --> s1\n  s1 : Waiting\n")
+        assert ir.node_by_id("s1").label == "Waiting"
+
+    def test_concurrent_regions_are_groups(self):
+        text = """stateDiagram-v2
+  [*] --> Active
+  state Active {
+    [*] --> NumLockOff
+    NumLockOff --> NumLockOn
+    --
+    [*] --> CapsLockOff
+    CapsLockOff --> CapsLockOn
+  }
+  Active --> Done
+"""
+        ir = parse(text)
+        groups = {g.id: g for g in ir.groups}
+        assert set(groups) == {"Active", "Active__region1", "Active__region2"}
+        for rid in ("Active__region1", "Active__region2"):
+            assert groups[rid].parent_group == "Active"
+            assert groups[rid].group_type == "region"
+            assert groups[rid].label == ""
+        assert ir.node_by_id("NumLockOn").parent_group == "Active__region1"
+        assert ir.node_by_id("CapsLockOn").parent_group == "Active__region2"
+        # Each region has its own start pseudo-state
+        starts = [e.source for e in ir.edges if e.target in ("NumLockOff", "CapsLockOff")]
+        assert starts == ["Active__start", "Active__region2__start"]
+        assert ir.node_by_id("Active__start").parent_group == "Active__region1"
+        assert ir.node_by_id("Done").parent_group is None
+        assert ir.validate() == []
+
+    def test_regions_inside_nested_composite(self):
+        text = """stateDiagram-v2
+  state Outer {
+    state Inner {
+      A --> B
+      --
+      C --> D
+    }
+    Inner --> E
+  }
+"""
+        ir = parse(text)
+        assert ir.node_by_id("C").parent_group == "Inner__region2"
+        assert ir.node_by_id("E").parent_group == "Outer"
+        assert {g.id: g.parent_group for g in ir.groups}["Inner"] == "Outer"
+
+    def test_stereotypes(self):
+        text = """stateDiagram-v2
+  state fork_state <<fork>>
+  state join_state <<join>>
+  state if_state <<choice>>
+"""
+        ir = parse(text)
+        shapes = [n.shape for n in ir.nodes]
+        assert shapes == [NodeShape.FORK_JOIN, NodeShape.FORK_JOIN, NodeShape.DIAMOND]
+        assert all(n.label == "" for n in ir.nodes)
+
+    def test_direction(self):
+        ir = parse("stateDiagram-v2\n  direction LR\n  A --> B")
+        assert ir.layout == LayoutDirection.LR
+
+    def test_nested_direction_ignored(self):
+        ir = parse("stateDiagram-v2\n  state C {\n    direction LR\n    A --> B\n  }")
+        assert ir.layout == LayoutDirection.TB
+
+    def test_notes_skipped(self):
+        text = """stateDiagram-v2
+  A --> B
+  note right of A : inline
+  note left of B
+    A --> C
+  end note
+  B --> D
+"""
+        ir = parse(text)
+        assert [n.id for n in ir.nodes] == ["A", "B", "D"]
+        assert len(ir.edges) == 2
+
+    def test_class_suffix_ignored(self):
+        ir = parse("stateDiagram-v2\n  A:::hot --> B:::cold")
+        assert [n.id for n in ir.nodes] == ["A", "B"]
+
+    def test_empty(self):
+        ir = parse("")
+        assert ir.diagram_type == DiagramType.STATE
+        assert ir.nodes == []
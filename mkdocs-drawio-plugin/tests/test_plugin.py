@@ -1,7 +1,13 @@
 """End-to-end integration tests for the plugin pipeline."""
 
+from types import SimpleNamespace
+
+import pytest
+from mkdocs.exceptions import PluginError
+
 from mkdocs_drawio_plugin.converter import mermaid_to_figure, mermaid_to_html, mermaid_to_xml
-from mkdocs_drawio_plugin.plugin import mermaid_fence_format
+from mkdocs_drawio_plugin.options import get_options
+from mkdocs_drawio_plugin.plugin import DrawioPlugin, mermaid_fence_format
 
 
 class TestEndToEndFlowchart:
@@ -146,3 +152,34 @@ class TestSuperFencesFormatter:
         )
         # Should either produce a figure or a code block fallback
         assert "<" in result  # Some HTML output
+
+
+class TestPageOptions:
+    def _page(self, **meta):
+        return SimpleNamespace(meta=meta, file=SimpleNamespace(src_path="big.md"))
+
+    def test_front_matter_applies_while_page_renders(self):
+        plugin = DrawioPlugin()
+        page = self._page(drawio={"collapse_group_nodes": 50})
+        plugin.on_page_markdown("", page, None, None)
+        assert get_options().collapse_group_nodes == 50
+        plugin.on_page_content("", page, None, None)
+        assert get_options().collapse_group_nodes == 0
+
+    def test_next_page_starts_from_site_options(self):
+        plugin = DrawioPlugin()
+        plugin.on_page_markdown("", self._page(drawio={"collapse_group_nodes": 50}), None, None)
+        plugin.on_page_markdown("", self._page(), None, None)
+        assert get_options().collapse_group_nodes == 0
+
+    def test_unknown_page_option_rejected(self):
+        plugin = DrawioPlugin()
+        with pytest.raises(PluginError, match="minify_xml"):
+            plugin.on_page_markdown("", self._page(drawio={"minify_xml": True}), None, None)
+
+    def test_invalid_value_rejected(self):
+        plugin = DrawioPlugin()
+        with pytest.raises(PluginError, match="big.md"):
+            plugin.on_page_markdown(
+                "", self._page(drawio={"collapse_group_nodes": -1}), None, None,
+            )
@@ -0,0 +1,160 @@
+"""Tests for build-time orthogonal edge routing."""
+
+import random
+
+import pytest
+
+from mkdocs_drawio_plugin.converter import mermaid_to_ir, mermaid_to_xml
+from mkdocs_drawio_plugin.layout import auto_layout
+from mkdocs_drawio_plugin.layout_cache import clear_layout_cache
+from mkdocs_drawio_plugin.metrics import measure_layout
+from mkdocs_drawio_plugin.parsers.base import (
+    DiagramEdge,
+    DiagramIR,
+    DiagramNode,
+    DiagramType,
+    LayoutDirection,
+)
+from mkdocs_drawio_plugin.routing import route_edges
+
+
+def _segments(points):
+    return list(zip(points, points[1:]))
+
+
+def _crosses(seg, node):
+    """True if an axis-aligned segment passes through a node's interior."""
+    (x0, y0), (x1, y1) = seg
+    lo_x, hi_x = sorted((x0, x1))
+    lo_y, hi_y = sorted((y0, y1))
+    right = node.x + node.width
+    bottom = node.y + node.height
+    overlaps_x = lo_x < right and node.x < hi_x or node.x < lo_x == hi_x < right
+    overlaps_y = lo_y < bottom and node.y < hi_y or node.y < lo_y == hi_y < bottom
+    return overlaps_x and overlaps_y
+
+
+class TestRouteEdges:
+    def test_aligned_nodes_need_no_waypoints(self):
+        ir = DiagramIR(
+            diagram_type=DiagramType.FLOWCHART,
+            nodes=[
+                DiagramNode(id="A", label="A", x=50, y=50),
+                DiagramNode(id="B", label="B", x=50, y=190),
+            ],
+            edges=[DiagramEdge(id="e0", source="A", target="B")],
+        )
+        route_edges(ir)
+        assert ir.edges[0].waypoints == []
+
+    def test_offset_nodes_get_orthogonal_jog(self):
+        ir = DiagramIR(
+            diagram_type=DiagramType.FLOWCHART,
+            nodes=[
+                DiagramNode(id="A", label="A", x=50, y=50),
+                DiagramNode(id="B", label="B", x=270, y=190),
+            ],
+            edges=[DiagramEdge(id="e0", source="A", target="B")],
+        )
+        route_edges(ir)
+        points = ir.edges[0].waypoints
+        assert len(points) == 2
+        # Every segment is axis-aligned
+        for (x0, y0), (x1, y1) in _segments(points):
+            assert x0 == x1 or y0 == y1
+
+    def test_routes_around_blocking_node(self):
+        # C sits directly between A and B
+        a = DiagramNode(id="A", label="A", x=50, y=50)
+        c = DiagramNode(id="C", label="C", x=50, y=190)
+        b = DiagramNode(id="B", label="B", x=50, y=330)
+        ir = DiagramIR(
+            diagram_type=DiagramType.FLOWCHART,
+            nodes=[a, c, b],
+            edges=[DiagramEdge(id="e0", source="A", target="B")],
+        )
+        route_edges(ir)
+        points = ir.edges[0].waypoints
+        assert len(points) == 4
+        full = [(130, 130)] + points + [(130, 330)]
+        for seg in _segments(full):
+            assert not _crosses(seg, c)
+
+    def test_lr_layout_swaps_axes(self):
+        ir = DiagramIR(
+            diagram_type=DiagramType.FLOWCHART,
+            layout=LayoutDirection.LR,
+            nodes=[
+                DiagramNode(id="A", label="A", x=50, y=50),
+                DiagramNode(id="B", label="B", x=270, y=190),
+            ],
+            edges=[DiagramEdge(id="e0", source="A", target="B")],
+        )
+        route_edges(ir)
+        (x0, y0), (x1, y1) = ir.edges[0].waypoints
+        # First bend leaves A horizontally at its vertical centre
+        assert y0 == 90
+        assert x0 == x1
+
+    def test_self_loop_skipped(self):
+        ir = DiagramIR(
+            diagram_type=DiagramType.FLOWCHART,
+            nodes=[DiagramNode(id="A", label="A")],
+            edges=[DiagramEdge(id="e0", source="A", target="A")],
+        )
+        route_edges(ir)
+        assert ir.edges[0].waypoints == []
+
+
+class TestRoutedXml:
+    def test_waypoints_emitted_as_points_array(self):
+        xml = mermaid_to_xml("graph TD\n  A --> B\n  A --> C")
+        assert '<Array as="points">' in xml
+        assert "<mxPoint" in xml
+
+
+def _grouped_flowchart(seed):
+    """Random flowchart with a few subgraphs and back edges."""
+    rng = random.Random(seed)
+    n = rng.randint(6, 16)
+    ids = [f"n{i}" for i in range(n)]
+    rng.shuffle(ids)
+    groups = rng.randint(1, 3)
+    chunks = [ids[i::groups + 1] for i in range(groups + 1)]
+    lines = [rng.choice(["graph TD", "graph LR"])]
+    for g, chunk in enumerate(chunks[:-1]):
+        lines.append(f"  subgraph g{g}[Group {g}]")
+        lines.extend(f"    {nid}[Node {nid}]" for nid in chunk)
+        lines.append("  end")
+    lines.extend(f"  {nid}[Node {nid}]" for nid in chunks[-1])
+    for _ in range(rng.randint(n, 2 * n)):
+        a, b = rng.sample(range(n), 2)
+        lines.append(f"  n{a} --> n{b}")
+    return "\n".join(lines)
+
+
+class TestRoutedLayouts:
+    def test_detour_legs_avoid_nodes(self):
+        # Back edge A -> B; C sits beside and below A, across the leg
+        # that leaves A for the side lane
+        a = DiagramNode(id="A", label="A", x=50, y=190)
+        b = DiagramNode(id="B", label="B", x=50, y=50)
+        c = DiagramNode(id="C", label="C", x=220, y=280)
+        ir = DiagramIR(
+            diagram_type=DiagramType.FLOWCHART,
+            nodes=[a, b, c],
+            edges=[DiagramEdge(id="e0", source="A", target="B")],
+        )
+        route_edges(ir)
+        points = ir.edges[0].waypoints
+        full = [(130, 270)] + points + [(130, 50)]
+        for seg in _segments(full):
+            assert not _crosses(seg, c)
+            assert seg[0][0] == seg[1][0] or seg[0][1] == seg[1][1]
+
+    @pytest.mark.parametrize("seed", range(60))
+    def test_grouped_flowcharts_have_no_edge_node_crossings(self, seed):
+        clear_layout_cache()
+        ir = mermaid_to_ir(_grouped_flowchart(seed))
+        auto_layout(ir)
+        assert measure_layout(ir).edge_node_crossings == []
@@ -0,0 +1,36 @@
+"""Tests for the grid spatial index."""
+
+from mkdocs_drawio_plugin.spatial import SpatialIndex
+
+
+class TestSpatialIndex:
+    def test_query_finds_overlapping_rect(self):
+        index = SpatialIndex(cell_size=50)
+        index.insert("a", 0, 0, 100, 100)
+        index.insert("b", 300, 300, 50, 50)
+        assert index.query(50, 50, 60, 60) == {"a"}
+        assert index.query(310, 310, 400, 400) == {"b"}
+
+    def test_touching_border_is_not_overlap(self):
+        index = SpatialIndex(cell_size=50)
+        index.insert("a", 0, 0, 100, 100)
+        assert index.query(100, 0, 200, 100) == set()
+
+    def test_segment_probe(self):
+        index = SpatialIndex(cell_size=50)
+        index.insert("a", 100, 0, 100, 100)
+        # Vertical segment through the box
+        assert index.query(150, -50, 150, 500) == {"a"}
+        # Horizontal segment passing below it
+        assert index.query(0, 120, 400, 120) == set()
+
+    def test_reversed_coordinates(self):
+        index = SpatialIndex(cell_size=50)
+        index.insert("a", 0, 0, 100, 100)
+        assert index.query(60, 60, 40, 40) == {"a"}
+
+    def test_negative_coordinates(self):
+        index = SpatialIndex(cell_size=50)
+        index.insert("a", -120, -80, 40, 40)
+        assert index.query(-100, -70, -90, -60) == {"a"}
+        assert len(index) == 1
@@ -0,0 +1,65 @@
+"""Tests for named styles and the shared stylesheet."""
+
+import pytest
+
+from mkdocs_drawio_plugin import styles
+from mkdocs_drawio_plugin.converter import mermaid_to_xml
+from mkdocs_drawio_plugin.options import configure, get_options, overridden
+from mkdocs_drawio_plugin.stylesheet import (
+    NAMED_STYLES,
+    compact_style,
+    stylesheet_js,
+)
+
+FLOWCHART = """graph TD
+  A[Start] --> B{Check}
+  B -->|yes| C[Done]
+  B -->|no| D[(Store)]
+"""
+
+
+@pytest.fixture(autouse=True)
+def _reset_options():
+    yield
+    configure()
+
+
+class TestCompactStyle:
+    def test_names_are_prefixed_and_distinct(self):
+        assert all(name.startswith("m2d") for name in NAMED_STYLES)
+        assert len(set(NAMED_STYLES.values())) == len(NAMED_STYLES)
+
+    def test_exact_match_becomes_name(self):
+        assert compact_style(styles.NODE_COMPUTE) == "m2dNodeCompute"
+
+    def test_registered_prefix_keeps_additions(self):
+        style = styles.NODE_COMPUTE.rstrip(";") + ";fontStyle=1;fontSize=11;"
+        assert compact_style(style) == "m2dNodeCompute;fontStyle=1;fontSize=11;"
+
+    def test_unknown_style_unchanged(self):
+        assert compact_style("rounded=1;fillColor=#123456;") == "rounded=1;fillColor=#123456;"
+
+
+class TestNamedOutput:
+    def test_off_by_default(self):
+        xml = mermaid_to_xml(FLOWCHART)
+        assert "m2d" not in xml
+
+    def test_named_output_is_smaller(self):
+        inline = mermaid_to_xml(FLOWCHART)
+        configure(named_styles=True)
+        named = mermaid_to_xml(FLOWCHART)
+        assert 'style="m2dNodeCompute"' in named
+        assert len(named) < len(inline)
+
+    def test_overridden_restores_previous(self):
+        configure(named_styles=True)
+        with overridden(named_styles=False):
+            assert "m2d" not in mermaid_to_xml(FLOWCHART)
+        assert get_options().named_styles
+
+    def test_script_registers_every_name(self):
+        js = stylesheet_js()
+        assert "onDrawioViewerLoad" in js
+        assert "putCellStyle" in js
+        assert all(name in js for name in NAMED_STYLES)
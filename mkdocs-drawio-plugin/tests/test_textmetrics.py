@@ -0,0 +1,94 @@
+"""Tests for label measurement and node sizing."""
+
+from mkdocs_drawio_plugin.converter import mermaid_to_ir
+from mkdocs_drawio_plugin.layout import auto_layout
+from mkdocs_drawio_plugin.parsers.base import DiagramNode, NodeShape
+from mkdocs_drawio_plugin.textmetrics import (
+    MAX_NODE_WIDTH,
+    fit_node,
+    measure_label,
+    measure_wrapped,
+    style_font,
+)
+from mkdocs_drawio_plugin import styles
+
+
+class TestMeasureLabel:
+    def test_width_scales_with_font_size(self):
+        w11, _ = measure_label("Payment Service", 11)
+        w22, _ = measure_label("Payment Service", 22)
+        assert abs(w22 - 2 * w11) < 1e-6
+
+    def test_bold_is_wider(self):
+        assert measure_label("Orders", 12, True)[0] > measure_label("Orders", 12)[0]
+
+    def test_narrow_glyphs_narrower_than_wide(self):
+        assert measure_label("iiii", 12)[0] < measure_label("MMMM", 12)[0]
+
+    def test_c4_multiline_label(self):
+        label = "<b>API</b>&#xa;[Python]&#xa;Handles all public requests"
+        width, height = measure_label(label, 12)
+        assert height == 3 * 12 * 1.2
+        # Widest line is the description, not the markup
+        assert width == measure_label("Handles all public requests", 12)[0]
+
+    def test_bold_tag_uses_bold_metrics(self):
+        plain = measure_label("Orders", 12)[0]
+        tagged = measure_label("<b>Orders</b>", 12)[0]
+        assert tagged == measure_label("Orders", 12, True)[0]
+        assert tagged > plain
+
+    def test_entities_decoded(self):
+        assert measure_label("a &amp; b", 12) == measure_label("a & b", 12)
+
+    def test_wide_glyph_fallback(self):
+        assert measure_label("漢字", 10)[0] == 20.0
+
+
+class TestMeasureWrapped:
+    def test_short_label_not_wrapped(self):
+        assert measure_wrapped("Short", 200, 12) == measure_label("Short", 12)
+
+    def test_long_label_wraps(self):
+        label = "a fairly long description " * 6
+        width, height = measure_wrapped(label, 200, 12)
+        assert width <= 200
+        assert height > 12 * 1.2
+
+
+class TestFitNode:
+    def test_style_font(self):
+        assert style_font(styles.NODE_COMPUTE) == (12.0, False)
+        assert style_font(styles.SHAPE_UML_CLASS) == (11.0, True)
+
+    def test_short_label_keeps_default_size(self):
+        node = DiagramNode(id="a", label="A")
+        assert fit_node(node, styles.NODE_COMPUTE) == (160.0, 80.0)
+
+    def test_long_label_grows_node(self):
+        node = DiagramNode(id="a", label="Customer Notification Dispatcher Service")
+        width, _ = fit_node(node, styles.NODE_COMPUTE)
+        assert width > 160
+        assert width <= MAX_NODE_WIDTH
+
+    def test_diamond_gets_extra_room(self):
+        label = "Is the payment authorised?"
+        rect = fit_node(DiagramNode(id="a", label=label, width=0, height=0), styles.NODE_COMPUTE)
+        diamond = fit_node(
+            DiagramNode(id="b", label=label, shape=NodeShape.DIAMOND, width=0, height=0),
+            styles.NODE_COMPUTE,
+        )
+        assert diamond[0] > rect[0]
+
+
+class TestSizingInLayout:
+    def test_nodes_sized_before_layout(self):
+        ir = mermaid_to_ir(
+            "graph LR\n"
+            "  A[Customer Notification Dispatcher Service] --> B[Done]"
+        )
+        auto_layout(ir)
+        a, b = ir.nodes
+        assert a.width > 160
+        # B is placed after A's grown width, so they don't overlap
+        assert b.x >= a.x + a.width
@@ -0,0 +1,121 @@
+"""Tests for the tidy tree layout."""
+
+import random
+
+from mkdocs_drawio_plugin import styles
+from mkdocs_drawio_plugin.layout import layout_nodes
+from mkdocs_drawio_plugin.parsers.base import (
+    DiagramEdge,
+    DiagramIR,
+    DiagramNode,
+    DiagramType,
+    LayoutDirection,
+)
+from mkdocs_drawio_plugin.treelayout import tree_children, tree_layout
+
+
+def _graph(node_ids, edge_pairs):
+    nodes = [DiagramNode(id=n, label=n) for n in node_ids]
+    edges = [
+        DiagramEdge(id=f"e{i}", source=s, target=t)
+        for i, (s, t) in enumerate(edge_pairs)
+    ]
+    return nodes, edges
+
+
+def _random_tree(n, seed=0, max_children=4):
+    rng = random.Random(seed)
+    ids = [f"n{i}" for i in range(n)]
+    pairs = []
+    fanout = [0] * n
+    for i in range(1, n):
+        while True:
+            p = rng.randrange(i)
+            if fanout[p] < max_children:
+                break
+        fanout[p] += 1
+        pairs.append((ids[p], ids[i]))
+    nodes, edges = _graph(ids, pairs)
+    for k, node in enumerate(nodes):
+        node.width = 60 + 40 * (k % 4)
+    return nodes, edges
+
+
+def _layout(nodes, edges, direction=LayoutDirection.TB):
+    root, children = tree_children(nodes, edges)
+    positions = tree_layout(nodes, root, children, direction)
+    for node in nodes:
+        node.x, node.y = positions[node.id]
+    return {n.id: n for n in nodes}
+
+
+class TestDetection:
+    def test_tree(self):
+        nodes, edges = _graph("ABCD", [("A", "B"), ("A", "C"), ("C", "D")])
+        root, children = tree_children(nodes, edges)
+        assert root == 0
+        assert children[0] == [1, 2]
+
+    def test_diamond_is_not_tree(self):
+        nodes, edges = _graph("ABCD", [("A", "B"), ("A", "C"), ("B", "D"), ("C", "D")])
+        assert tree_children(nodes, edges) is None
+
+    def test_cycle_is_not_tree(self):
+        nodes, edges = _graph("ABC", [("A", "B"), ("B", "C"), ("C", "A")])
+        assert tree_children(nodes, edges) is None
+
+    def test_self_loop_is_not_tree(self):
+        nodes, edges = _graph("AB", [("A", "B"), ("B", "B")])
+        assert tree_children(nodes, edges) is None
+
+
+class TestTreeLayout:
+    def test_parent_centred_over_children(self):
+        by_id = _layout(*_graph("ABCD", [("A", "B"), ("A", "C"), ("A", "D")]))
+        a, b, d = by_id["A"], by_id["B"], by_id["D"]
+        centre = lambda n: n.x + n.width / 2  # noqa: E731
+        assert abs(centre(a) - (centre(b) + centre(d)) / 2) < 1e-6
+        assert b.y == a.y + a.height + styles.NODE_SPACING_V
+
+    def test_random_trees_do_not_overlap(self):
+        for seed in range(5):
+            nodes, edges = _random_tree(300, seed)
+            by_id = _layout(nodes, edges)
+            rows: dict[float, list] = {}
+            for n in by_id.values():
+                rows.setdefault(n.y, []).append(n)
+            for row in rows.values():
+                row.sort(key=lambda n: n.x)
+                for left, right in zip(row, row[1:]):
+                    assert left.x + left.width + styles.NODE_SPACING_H <= right.x + 1e-6
+
+    def test_deep_chain_is_iterative(self):
+        ids = [f"n{i}" for i in range(5000)]
+        by_id = _layout(*_graph(ids, list(zip(ids, ids[1:]))))
+        assert by_id["n4999"].y > by_id["n0"].y
+        assert by_id["n4999"].x == by_id["n0"].x
+
+    def test_lr_direction_swaps_axes(self):
+        by_id = _layout(
+            *_graph("ABC", [("A", "B"), ("A", "C")]), direction=LayoutDirection.LR,
+        )
+        assert by_id["B"].x > by_id["A"].x
+        assert by_id["B"].y != by_id["C"].y
+
+
+class TestLayoutIntegration:
+    def test_forest_components_use_tree_layout(self):
+        nodes, edges = _graph(
+            ["R", "A", "B", "S", "C"], [("R", "A"), ("R", "B"), ("S", "C")],
+        )
+        ir = DiagramIR(diagram_type=DiagramType.FLOWCHART, nodes=nodes, edges=edges)
+        layout_nodes(ir)
+        r, a, b = nodes[0], nodes[1], nodes[2]
+        assert abs((r.x + r.width / 2) - ((a.x + b.x + b.width) / 2)) < 1e-6
+
+    def test_edgeless_diagram_keeps_source_order(self):
+        nodes, _ = _graph([f"T{i}" for i in range(9)], [])
+        ir = DiagramIR(diagram_type=DiagramType.ERD, nodes=nodes)
+        layout_nodes(ir)
+        assert (nodes[0].x, nodes[0].y) == (50.0, 50.0)
+        assert nodes[1].x > nodes[0].x and nodes[1].y == nodes[0].y